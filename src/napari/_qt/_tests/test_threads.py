@@ -51,3 +51,25 @@ def test_waiting_on_no_request(monkeypatch, qtbot):
     status_checker.terminate()
 
     qtbot.wait_until(lambda: status_checker.isFinished())
+
+
+def test_no_emit_stale(monkeypatch):
+    """Statuses for outdated cursor positions should not be emitted."""
+    model = ViewerModel()
+    model.mouse_over_canvas = True
+    status_checker = StatusChecker(model)
+    emit = MagicMock()
+    monkeypatch.setattr(status_checker, 'status_and_tooltip_changed', emit)
+
+    status_checker.calculate_status()
+    emit.assert_called_once_with(('Ready', ''))
+
+    # the cursor moved right after a status was sent
+    status_checker.trigger_status_update()
+    status_checker.calculate_status()
+    emit.assert_called_once()
+
+    # but the status is still updated regularly if the cursor keeps moving
+    status_checker._last_emit -= status_checker.max_stale_interval
+    status_checker.calculate_status()
+    assert emit.call_count == 2
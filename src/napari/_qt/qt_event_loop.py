@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING
 from warnings import warn
 
 from qtpy import PYQT5
-from qtpy.QtCore import QDir, QRectF, QSize, Qt
+from qtpy.QtCore import QDir, QRectF, QSize, Qt, QTimer
 from qtpy.QtGui import QIcon, QPainter, QPixmap
 from qtpy.QtSvg import QSvgRenderer
 from qtpy.QtWidgets import QApplication, QWidget
@@ -26,6 +26,7 @@ from napari.resources._icons import _theme_path
 from napari.settings import get_settings
 from napari.utils import config, perf
 from napari.utils._logging import register_logger_to_napari_handler
+from napari.utils.events._coalescing import set_coalescing_scheduler
 from napari.utils.logo import get_logo_path
 from napari.utils.notifications import (
     notification_manager,
@@ -35,6 +36,7 @@ from napari.utils.perf import perf_config
 from napari.utils.theme import _themes, get_system_theme
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from pathlib import Path
 
     from IPython import InteractiveShell
@@ -119,6 +121,11 @@ def _focus_changed(old: QWidget | None, new: QWidget | None):
             notification.timer_stop()
 
 
+def _schedule_on_qt_loop(delay: float, callback: Callable[[], None]) -> None:
+    """Call ``callback`` from the Qt event loop after ``delay`` seconds."""
+    QTimer.singleShot(max(round(delay * 1000), 0), callback)
+
+
 def get_qapp(
     *,
     app_name: str | None = None,
@@ -289,6 +296,9 @@ def get_qapp(
 
         app.focusChanged.connect(_focus_changed)
 
+        # deliver events of rate limited callbacks from the Qt event loop
+        set_coalescing_scheduler(_schedule_on_qt_loop)
+
     _app_ref = app  # prevent garbage collection
 
     # Add the dispatcher attribute to the application to be able to dispatch
@@ -16,7 +16,7 @@ from typing import (
 from weakref import WeakSet, ref
 
 import numpy as np
-from qtpy.QtCore import QCoreApplication, QObject, Qt, QUrl
+from qtpy.QtCore import QCoreApplication, QObject, Qt, QTimer, QUrl
 from qtpy.QtGui import (
     QGuiApplication,
     QImage,
@@ -39,13 +39,14 @@ from napari._qt.widgets.qt_viewer_dock_widget import QtViewerDockWidget
 from napari._qt.widgets.qt_welcome import QtWelcomeWidget
 from napari._vispy.utils.qt_font import QtFontManager
 from napari.components.camera import Camera
-from napari.components.layerlist import LayerList
 from napari.errors import MultipleReaderError, ReaderPluginError
 from napari.layers.base.base import Layer
 from napari.plugins import _npe2
 from napari.settings import get_settings
 from napari.settings._application import DaskSettings
 from napari.utils import config, perf, resize_dask_cache
+from napari.utils._shared_memory import SharedMemoryArray
+from napari.utils._streaming import StreamingArray
 from napari.utils.action_manager import action_manager
 from napari.utils.geometry import get_center_bbox
 from napari.utils.history import (
@@ -63,7 +64,7 @@ from napari.utils.notifications import show_info
 from napari._vispy import VispyCanvas, create_vispy_layer  # isort:skip
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator, Sequence
+    from collections.abc import Callable, Iterator, Sequence
     from types import FrameType
 
     from napari_console import QtConsole
@@ -82,6 +83,11 @@ if TYPE_CHECKING:
     from napari.components import ViewerModel
     from napari.utils.events import Event
 
+# The interval between polls of shared memory data, about one frame.
+SHARED_DATA_POLL_INTERVAL_MS = 16
+# The layer data which is polled for changes made outside of napari.
+_POLLED_DATA_TYPES = (SharedMemoryArray, StreamingArray)
+
 _LayerTypeName = Literal[
     'graph',
     'image',
@@ -229,6 +235,12 @@ class QtViewer(QSplitter):
             self._on_active_change
         )
 
+        # Poll the data of layers which other processes or threads change,
+        # once per frame, while there are such layers.
+        self._shared_data_timer = QTimer(self)
+        self._shared_data_timer.setInterval(SHARED_DATA_POLL_INTERVAL_MS)
+        self._shared_data_timer.timeout.connect(self._poll_shared_data)
+
         self.viewer.layers.events.inserted.connect(self._on_add_layer_change)
 
         self.setAcceptDrops(True)
@@ -238,7 +250,9 @@ class QtViewer(QSplitter):
 
         # Create the experimental RemoteManager for the monitor.
         self._remote_manager = _create_remote_manager(
-            self.viewer.layers, self._qt_poll
+            self.viewer,
+            self._qt_poll,
+            screenshot=lambda: self.screenshot(flash=False),
         )
 
         # bind shortcuts stored in settings last.
@@ -616,6 +630,7 @@ class QtViewer(QSplitter):
                 # Update the layer slice state to temporarily support behavior
                 # that depends on it.
                 layer._slicing_state._update_slice_response(response)  # type: ignore[attr-defined]
+                perf.slicing_stats.responded(layer)
                 # Update the layer's loaded state before everything else,
                 # because they may rely on its updated value.
                 layer._slicing_state._update_loaded_slice_id(
@@ -722,6 +737,26 @@ class QtViewer(QSplitter):
 
         self.canvas.add_layer_visual_mapping(layer, vispy_layer)
 
+        if isinstance(layer.data, _POLLED_DATA_TYPES):
+            self._shared_data_timer.start()
+
+    def _poll_shared_data(self) -> None:
+        """Display the changes other processes made to shared memory data.
+
+        Polling emits the ``changed`` events of shared memory data, and the
+        ``appended`` events of streaming data, which the layers handle by
+        refreshing the changed regions or the appended frames.
+        """
+        shared = [
+            layer.data
+            for layer in self.viewer.layers
+            if isinstance(layer.data, _POLLED_DATA_TYPES)
+        ]
+        if not shared:
+            self._shared_data_timer.stop()
+        for data in shared:
+            data.poll()
+
     def _remove_invalid_chars(self, selected_layer_name: str) -> str:
         """Removes invalid characters from selected layer name to suggest a filename.
 
@@ -1357,6 +1392,8 @@ class QtViewer(QSplitter):
         # or Abort trap. (calling stop() when no animation is occurring is also
         # not a problem)
         self.dims.stop()
+        if self._remote_manager is not None:
+            self._remote_manager.close()
         self.canvas.delete()
         if self._console is not None:
             self._console.close()
@@ -1536,16 +1573,20 @@ def _create_qt_poll(parent: QObject, camera: Camera) -> QtPoll | None:
 
 
 def _create_remote_manager(
-    layers: LayerList, qt_poll: QtPoll | None
+    viewer: ViewerModel,
+    qt_poll: QtPoll | None,
+    screenshot: Callable[[], np.ndarray] | None = None,
 ) -> RemoteManager | None:
     """Create and return a RemoteManager instance, if we need one.
 
     Parameters
     ----------
-    layers : LayersList
-        The viewer's layers.
+    viewer : ViewerModel
+        The viewer.
     qt_poll : QtPoll
         The viewer's QtPoll instance.
+    screenshot : callable, optional
+        Returns a screenshot of the canvas, for clients.
     """
     if not config.monitor:
         return None  # Not using the monitor at all
@@ -1562,7 +1603,7 @@ def _create_remote_manager(
 
     # Create the remote manager and have monitor call its process_command()
     # method to execute commands from clients.
-    manager = RemoteManager(layers)
+    manager = RemoteManager(viewer, screenshot)
 
     # RemoteManager will process incoming command from the monitor.
     monitor.run_command_event.connect(manager.process_command)
@@ -1573,6 +1614,10 @@ def _create_remote_manager(
     qt_poll.events.poll.connect(manager.on_poll)
     qt_poll.events.poll.connect(monitor.on_poll)
 
+    # Clients send commands at any time, so keep polling. The monitor
+    # handles every poll, so polling never stops once started.
+    qt_poll.wake_up()
+
     return manager
 
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 from threading import Event
+from time import perf_counter
 from typing import TYPE_CHECKING
 from weakref import ref
 
@@ -28,7 +29,10 @@ class StatusChecker(QThread):
 
     Because the thread runs a single infinite while loop, the updates are
     naturally throttled since they can only be sent at the rate which updates
-    can be computed, but no faster.
+    can be computed, but no faster. If the cursor moves while a status is
+    computed, the computation is abandoned and restarted at the new
+    position, unless no status was sent for ``max_stale_interval`` seconds
+    (so that the status still updates while the cursor moves continuously).
 
     Attributes
     ----------
@@ -42,6 +46,11 @@ class StatusChecker(QThread):
         the status checker thread.
         After _terminate is set to True, no more status updates are sent.
         Default: False.
+    _last_emit : float
+        The ``time.perf_counter`` value of the last status update sent.
+    max_stale_interval : float
+        Maximum time in seconds during which computations for outdated
+        cursor positions are abandoned.
     viewer_ref : weakref.ref[napari.viewer.ViewerModel]
         A weak reference to the viewer which is providing status updates.
         We keep a weak reference to the viewer so the status checker thread
@@ -54,6 +63,8 @@ class StatusChecker(QThread):
     # viewer and the status checker thread for cursor events and related status
     status_and_tooltip_changed = Signal(object)
 
+    max_stale_interval = 0.1
+
     def __init__(self, viewer: ViewerModel, parent: QObject | None = None):
         super().__init__(parent=parent)
         self.viewer_ref = ref(viewer)
@@ -61,6 +72,7 @@ class StatusChecker(QThread):
         self._need_status_update.clear()
         self._terminate = False
         self._allow_start = True
+        self._last_emit = float('-inf')
         self.setObjectName('StatusChecker')
 
     def trigger_status_update(self) -> None:
@@ -71,6 +83,18 @@ class StatusChecker(QThread):
         """
         self._need_status_update.set()
 
+    def is_stale(self) -> bool:
+        """Whether the status being computed should be discarded.
+
+        This is the case if the thread is terminating, or if the cursor
+        moved since the computation started and a status was sent less than
+        ``max_stale_interval`` seconds ago.
+        """
+        return self._terminate or (
+            self._need_status_update.is_set()
+            and perf_counter() - self._last_emit < self.max_stale_interval
+        )
+
     def close_terminate(self) -> None:
         """Close the status checker thread.
 
@@ -114,8 +138,8 @@ class StatusChecker(QThread):
     def calculate_status(self) -> None:
         """Calculate the status and emit the signal.
 
-        If the viewer is not available, do nothing. Otherwise,
-        emit the signal that the status has changed.
+        If the viewer is not available, or the computation is stale,
+        do nothing. Otherwise, emit the signal that the status has changed.
         """
         viewer = self.viewer_ref()
         if viewer is None:
@@ -123,7 +147,7 @@ class StatusChecker(QThread):
 
         try:
             # Calculate the status change from cursor's movement
-            res = viewer._calc_status_from_cursor()
+            res = viewer._calc_status_from_cursor(is_stale=self.is_stale)
         except Exception as e:  # pragma: no cover # noqa: BLE001
             # Our codebase is not threadsafe. It is possible that an
             # ViewerModel or Layer state is changed while we are trying to
@@ -133,7 +157,12 @@ class StatusChecker(QThread):
             # and a notification is sent.
             notification_manager.dispatch(Notification.from_exception(e))
             return
+        if res is None or self.is_stale():
+            # the cursor is not over the canvas, or it moved and the status
+            # at the new position will be computed next
+            return
         # Emit the signal with the updated status
+        self._last_emit = perf_counter()
         self.status_and_tooltip_changed.emit(res)
 
 
@@ -58,7 +58,10 @@ class QtDims(QWidget):
         # Update the number of sliders now that the dims have been added
         self._update_nsliders()
         self.dims.events.ndim.connect(self._update_nsliders)
-        self.dims.events.current_step.connect(self._update_slider)
+        # during playback or scrubbing, only the latest position is shown
+        self.dims.events.current_step.connect(
+            self._update_slider, max_rate='frame'
+        )
         self.dims.events.range.connect(self._update_range)
         self.dims.events.ndisplay.connect(self._update_display)
         self.dims.events.order.connect(self._update_display)
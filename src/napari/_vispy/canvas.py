@@ -35,6 +35,7 @@ from napari.utils.interactions import (
     mouse_wheel_callbacks,
 )
 from napari.utils.notifications import show_warning
+from napari.utils.perf import slicing_stats
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterator
@@ -708,6 +709,9 @@ class VispyCanvas:
         -------
         None
         """
+        # the canvas was drawn with the slices uploaded since the last draw
+        slicing_stats.drawn()
+
         # this updates camera zooms and overlay positions if necessary
         # (usually after grid mode enable when viewboxes are still degenerate)
         if not np.allclose(
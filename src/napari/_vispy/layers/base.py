@@ -10,6 +10,7 @@ from vispy.visuals.transforms import MatrixTransform
 from napari._vispy.utils.gl import BLENDING_MODES, get_max_texture_sizes
 from napari.layers import Layer
 from napari.utils.events import disconnect_events
+from napari.utils.perf import slicing_stats
 
 if TYPE_CHECKING:
     from vispy.scene import VisualNode
@@ -75,7 +76,7 @@ class VispyBaseLayer(ABC, Generic[_L]):
         ) = get_max_texture_sizes()
 
         self.layer.events.refresh.connect(self._on_refresh_change)
-        self.layer.events.set_data.connect(self._on_data_change)
+        self.layer.events.set_data.connect(self._on_set_data)
         self.layer.events.visible.connect(self._on_visible_change)
         self.layer.events.opacity.connect(self._on_opacity_change)
         self.layer.events.blending.connect(self._on_blending_change)
@@ -152,6 +153,10 @@ class VispyBaseLayer(ABC, Generic[_L]):
         self.node.order = order
         self._on_blending_change()
 
+    def _on_set_data(self):
+        with slicing_stats.timing(self.layer, 'upload'):
+            self._on_data_change()
+
     @abstractmethod
     def _on_data_change(self):
         raise NotImplementedError
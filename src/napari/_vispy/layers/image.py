@@ -132,6 +132,9 @@ class VispyImageLayer(VispyScalarFieldBaseLayer):
     ) -> None:
         # Track order to detect transpose/roll. Needs to be set before super().__init__()
         self._last_order = None
+        # mapping of the displayed slice to its texture, which clims are
+        # mapped with
+        self._texture_mapping = None
 
         super().__init__(
             layer,
@@ -163,6 +166,13 @@ class VispyImageLayer(VispyScalarFieldBaseLayer):
         self.reset()
         self._on_data_change()
 
+    def _on_data_change(self) -> None:
+        super()._on_data_change()
+        mapping = self.layer._slice.texture_mapping
+        if mapping != self._texture_mapping:
+            self._texture_mapping = mapping
+            self._on_contrast_limits_change()
+
     def _on_axis_order_change(self, event=None) -> None:
         # Detect if order changed (transpose or roll)
         current_order = self.layer._slice_input.order
@@ -200,9 +210,16 @@ class VispyImageLayer(VispyScalarFieldBaseLayer):
                 self.node.minip_cutoff = None
 
     def _on_contrast_limits_change(self) -> None:
-        self.node.clim = _coerce_contrast_limits(
-            self.layer.contrast_limits
-        ).contrast_limits
+        if self._texture_mapping is not None:
+            # mapped slices are displayed in the units of their texture, so
+            # that clims are only shader uniforms, see `Image._texture_mapping`
+            self.node.clim = tuple(
+                self._texture_mapping.to_texture(self.layer.contrast_limits)
+            )
+        else:
+            self.node.clim = _coerce_contrast_limits(
+                self.layer.contrast_limits
+            ).contrast_limits
         # cutoffs must be updated after clims, so we can set them to the new values
         self._update_mip_minip_cutoff()
         # iso also may depend on contrast limit values
@@ -224,6 +241,10 @@ class VispyImageLayer(VispyScalarFieldBaseLayer):
                 self.node.threshold = (self.layer.iso_threshold - cmin) / (
                     cmax - cmin
                 )
+            elif self._texture_mapping is not None:
+                self.node.threshold = float(
+                    self._texture_mapping.to_texture(self.layer.iso_threshold)
+                )
             else:
                 self.node.threshold = self.layer.iso_threshold
 
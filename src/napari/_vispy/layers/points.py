@@ -38,7 +38,9 @@ class VispyPointsLayer(VispyBaseLayer):
         self.layer.events.face_color.connect(self._on_data_change)
         self.layer._face.events.colors.connect(self._on_data_change)
         self.layer._face.events.color_properties.connect(self._on_data_change)
-        self.layer.events.highlight.connect(self._on_highlight_change)
+        self.layer.events.highlight.connect(
+            self._on_highlight_change, max_rate='frame'
+        )
         self.layer.text.events.connect(self._on_text_change)
         self.layer.events.shading.connect(self._on_shading_change)
         self.layer.events.antialiasing.connect(self._on_antialiasing_change)
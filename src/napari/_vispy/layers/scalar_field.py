@@ -13,6 +13,7 @@ from napari._vispy.utils.gl import fix_data_dtype
 from napari._vispy.visuals.labels import LabelNode
 from napari._vispy.visuals.volume import Volume as VolumeNode
 from napari.layers._scalar_field.scalar_field import ScalarFieldBase
+from napari.utils.perf import add_counter_event
 
 if TYPE_CHECKING:
     from vispy.scene import Node
@@ -55,6 +56,11 @@ class VispyScalarFieldBaseLayer(VispyBaseLayer[ScalarFieldBase]):
 
         self._array_like = True
         self._data = np.empty(0)
+        # slices that don't fit in a texture are reduced by the layer when
+        # slicing, see `downsample_texture` for the fallback
+        self.layer._set_max_texture_sizes(
+            self.MAX_TEXTURE_SIZE_2D, self.MAX_TEXTURE_SIZE_3D
+        )
 
         self.layer.events.rendering.connect(self._on_rendering_change)
         self.layer.events.depiction.connect(self._on_depiction_change)
@@ -112,6 +118,9 @@ class VispyScalarFieldBaseLayer(VispyBaseLayer[ScalarFieldBase]):
         self._data = self.layer._data_view
 
         data = fix_data_dtype(self.layer._data_view)
+        if data is not self.layer._data_view:
+            # slices are usually converted for textures when slicing
+            add_counter_event('upload_bytes_copied', image=data.nbytes)
         ndisplay = self.layer._slice_input.ndisplay
 
         node = self._layer_node.get_node(
@@ -194,6 +203,10 @@ class VispyScalarFieldBaseLayer(VispyBaseLayer[ScalarFieldBase]):
     ) -> np.ndarray:
         """Downsample data based on maximum allowed texture size.
 
+        Slices are reduced to fit in textures by the layer when slicing, so
+        this only strides through data that was sliced before the texture
+        sizes were known to the layer.
+
         Parameters
         ----------
         data : array
@@ -207,11 +220,12 @@ class VispyScalarFieldBaseLayer(VispyBaseLayer[ScalarFieldBase]):
             Data that now fits inside texture.
         """
         if np.any(np.greater(data.shape, MAX_TEXTURE_SIZE)):
-            if self.layer.multiscale:
+            ndisplay = self.layer._slice_input.ndisplay
+            if self.layer.multiscale and ndisplay == 2:
                 raise ValueError(
                     f'Shape of individual tiles in multiscale {data.shape} cannot '
                     f'exceed GL_MAX_TEXTURE_SIZE {MAX_TEXTURE_SIZE}. Rendering is '
-                    f'currently in {self.layer._slice_input.ndisplay}D mode.'
+                    f'currently in {ndisplay}D mode.'
                 )
             warnings.warn(
                 f'data shape {data.shape} exceeds GL_MAX_TEXTURE_SIZE {MAX_TEXTURE_SIZE}'
@@ -221,9 +235,15 @@ class VispyScalarFieldBaseLayer(VispyBaseLayer[ScalarFieldBase]):
             downsample = np.ceil(
                 np.divide(data.shape, MAX_TEXTURE_SIZE)
             ).astype(int)
+            # in 3D, a multiscale level is already downsampled from level 0
+            level_scale = (
+                self.layer.downsample_factors[self.layer.data_level]
+                if self.layer.multiscale
+                else np.ones(self.layer.ndim)
+            )
             scale = np.ones(self.layer.ndim)
             for i, d in enumerate(self.layer._slice_input.displayed):
-                scale[d] = downsample[i]
+                scale[d] = level_scale[d] * downsample[i]
 
             # tile2data is a ScaleTransform thus is has a .scale attribute, but
             # mypy cannot know this.
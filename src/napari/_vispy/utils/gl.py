@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from contextlib import contextmanager
 from functools import lru_cache
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING
 
 import numpy as np
 import numpy.typing as npt
@@ -12,14 +12,12 @@ from vispy.app import Canvas
 from vispy.gloo import gl
 from vispy.gloo.context import get_current_canvas
 
+from napari.layers._scalar_field._texture import TEXTURE_DTYPES, texture_dtype
+
 if TYPE_CHECKING:
     from collections.abc import Generator
 
-texture_dtypes = [
-    np.dtype(np.uint8),
-    np.dtype(np.uint16),
-    np.dtype(np.float32),
-]
+texture_dtypes = list(TEXTURE_DTYPES)
 
 
 @contextmanager
@@ -99,22 +97,11 @@ def fix_data_dtype(data: npt.NDArray) -> npt.NDArray:
     if dtype in texture_dtypes:
         return data
 
-    try:
-        dtype_ = cast(
-            'type[np.unsignedinteger[Any] | np.floating[Any]]',
-            {
-                'i': np.float32,
-                'f': np.float32,
-                'u': np.uint16,
-                'b': np.uint8,
-            }[dtype.kind],
-        )
-        if dtype_ == np.uint16 and dtype.itemsize > 2:
-            dtype_ = np.float32
-    except KeyError as e:  # not an int or float
+    dtype_ = texture_dtype(dtype)
+    if dtype_ is None:  # not an int or float
         raise TypeError(
             f'type {dtype} not allowed for texture; must be one of {set(texture_dtypes)}'
-        ) from e
+        )
     return data.astype(dtype_)
 
 
@@ -0,0 +1,48 @@
+from napari.utils.events import EventEmitter
+
+
+def empty(event):
+    pass
+
+
+class Listener:
+    def on_event(self, event):
+        pass
+
+
+class EventEmitterSuite:
+    """Benchmarks for emitting events through an EventEmitter."""
+
+    params = [0, 1, 10]
+    param_names = ['n_callbacks']
+
+    def setup(self, n_callbacks):
+        self.function_emitter = EventEmitter(type_name='function')
+        self.method_emitter = EventEmitter(type_name='method')
+        # keep the listeners alive, the emitter only holds weak references
+        self.listeners = [Listener() for _ in range(n_callbacks)]
+        for i, listener in enumerate(self.listeners):
+            self.function_emitter.connect(lambda event, i=i: empty(event))
+            self.method_emitter.connect(listener.on_event)
+
+    def time_emit_functions(self, n_callbacks):
+        """Time to emit 1000 events to function callbacks."""
+        for _ in range(1000):
+            self.function_emitter(value=1)
+
+    def time_emit_methods(self, n_callbacks):
+        """Time to emit 1000 events to weakly referenced methods."""
+        for _ in range(1000):
+            self.method_emitter(value=1)
+
+    def time_emit_blocked(self, n_callbacks):
+        """Time to emit 1000 events to a blocked emitter."""
+        with self.method_emitter.blocker():
+            for _ in range(1000):
+                self.method_emitter(value=1)
+
+
+if __name__ == '__main__':
+    from utils import run_benchmark
+
+    run_benchmark()
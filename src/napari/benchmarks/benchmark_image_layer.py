@@ -8,6 +8,8 @@ import numpy as np
 
 from napari.layers import Image
 
+from .utils import Skip, track_layer_nbytes
+
 
 class Image2DSuite:
     """Benchmarks for the Image layer with 2D data."""
@@ -113,6 +115,131 @@ class Image3DSuite:
         return self.data
 
 
+class RGBMultiscalePanSuite:
+    """Benchmarks for panning across a multiscale RGB image in 2D.
+
+    The data is a chunked (like the JPEG tiles of a slide scan) uint8 RGB
+    pyramid, and the view is panned by one tile at a time at full
+    resolution.
+    """
+
+    params = [(512, 1024), ('numpy', 'dask')]
+    param_names = ['view_size', 'backend']
+
+    def setup(self, view_size, backend):
+        import dask.array as da
+
+        size = 16384
+        tile = 512
+        rng = np.random.default_rng(0)
+        levels = []
+        while size >= tile:
+            level = da.from_array(
+                rng.integers(0, 255, (tile, tile, 3), dtype=np.uint8),
+                chunks=(tile, tile, 3),
+            )
+            # tiles are repeated, to create large levels cheaply
+            n = size // tile
+            level = da.tile(level, (n, n, 1)).rechunk((tile, tile, 3))
+            if backend == 'numpy':
+                level = level.compute()
+            levels.append(level)
+            size //= 2
+        self.layer = Image(levels, rgb=True, multiscale=True)
+        self.view_size = view_size
+        self.tile = tile
+        self._pan(0)
+
+    def _pan(self, offset):
+        corners = np.array(
+            [[offset, offset], [offset + self.view_size] * 2], dtype=float
+        )
+        self.layer._update_draw(1.0, corners, (self.view_size,) * 2)
+
+    def time_pan(self, view_size, backend):
+        """Time to pan the view by one tile along the diagonal, 16 times."""
+        for step in range(1, 17):
+            self._pan(step * self.tile)
+
+    def time_pan_back_and_forth(self, view_size, backend):
+        """Time to pan back and forth over the same tiles, 16 times."""
+        for step in range(16):
+            self._pan((step % 2) * self.tile)
+
+    track_view_nbytes = track_layer_nbytes('view')
+    track_caches_nbytes = track_layer_nbytes('caches')
+
+
+class ImageMemorySuite:
+    """Memory used by the Image layer with 2D data."""
+
+    param_names = ['n', 'dtype']
+    params = ([2**i for i in range(10, 15, 2)], ['uint8', 'float64'])
+    skip_params = Skip(if_in_pr=lambda n, dtype: n > 2**10)
+
+    def setup(self, n, dtype):
+        rng = np.random.default_rng(0)
+        self.data = (rng.random((n, n)) * 255).astype(dtype)
+        self.layer = Image(self.data)
+
+    def peakmem_create_layer(self, *_):
+        """Peak memory used to create the layer."""
+        Image(self.data)
+
+    def peakmem_set_view_slice(self, *_):
+        """Peak memory used to set the view slice."""
+        self.layer._slicing_state._set_view_slice()
+
+    track_total_nbytes = track_layer_nbytes()
+    track_data_nbytes = track_layer_nbytes('data')
+    track_view_nbytes = track_layer_nbytes('view')
+
+
+class ImageStreamingSuite:
+    """Benchmarks for appending frames to an Image layer in a viewer."""
+
+    param_names = ['n']
+    params = [2**i for i in range(9, 12)]
+    skip_params = Skip(if_in_pr=lambda n: n > 2**9)
+
+    def setup(self, n):
+        from napari.components import ViewerModel
+        from napari.utils._streaming import StreamingArray
+
+        rng = np.random.default_rng(0)
+        self.frame = rng.integers(0, 4096, (n, n), dtype=np.uint16)
+        self.viewer = ViewerModel()
+        self.stream = StreamingArray((n, n), np.uint16, max_frames=10)
+        self.stream.append(self.frame)
+        self.viewer.add_image(self.stream, contrast_limits=(0, 4095))
+        self.data = self.stream[:1]
+        self.layer = self.viewer.add_image(
+            self.data, contrast_limits=(0, 4095)
+        )
+
+    def time_append_frame(self, n):
+        """Time to append a frame, which the viewer follows."""
+        self.stream.append(self.frame)
+        self.stream.poll()
+
+    def time_append_frame_out_of_view(self, n):
+        """Time to append a frame, while viewing the first frame."""
+        self.viewer.dims.set_current_step(0, 0)
+        self.stream.append(self.frame)
+        self.stream.poll()
+
+    def time_replace_data(self, n):
+        """Time to replace the data with one more frame."""
+        self.data = np.concatenate([self.data, self.frame[None]])
+        self.layer.data = self.data
+
+    def peakmem_append_frames(self, n):
+        """Peak memory used to append 20 frames, twice the frames kept."""
+        for _ in range(20):
+            self.stream.append(self.frame)
+            self.stream.poll()
+
+
 if __name__ == '__main__':
     from utils import run_benchmark
 
@@ -1,12 +1,58 @@
 import subprocess
 import sys
 
+from napari.utils.perf._import_time import import_time
+
+# creating a viewer model with an image layer, without Qt
+VIEWER_MODEL_STATEMENT = (
+    'import numpy as np; '
+    'from napari.components import ViewerModel; '
+    'ViewerModel().add_image(np.zeros((8, 64, 64)))'
+)
+
 
 class ImportTimeSuite:
     def time_import(self):
         cmd = [sys.executable, '-c', 'import napari']
         subprocess.run(cmd, stderr=subprocess.PIPE)
 
+    def time_import_viewer_model(self):
+        cmd = [sys.executable, '-c', VIEWER_MODEL_STATEMENT]
+        subprocess.run(cmd, stderr=subprocess.PIPE)
+
+
+class ImportTimeByModuleSuite:
+    """Cumulative import time of modules when creating a viewer model.
+
+    Heavy optional dependencies should take 0 ms, as they are only imported
+    once they are used.
+    """
+
+    param_names = ['module']
+    params = [
+        'napari',
+        'napari.components',
+        'napari.layers',
+        'pint',
+        'dask',
+        'pandas',
+        'scipy',
+        'skimage',
+        'xarray',
+        'numba',
+        'vispy',
+    ]
+
+    timeout = 120
+
+    def setup_cache(self):
+        return import_time(VIEWER_MODEL_STATEMENT).cumulative_us
+
+    def track_cumulative_import_time(self, cumulative_us, module):
+        return cumulative_us.get(module, 0) / 1000
+
+    track_cumulative_import_time.unit = 'ms'
+
 
 if __name__ == '__main__':
     from utils import run_benchmark
@@ -0,0 +1,57 @@
+# See "Writing benchmarks" in the asv docs for more information.
+# https://asv.readthedocs.io/en/latest/writing_benchmarks.html
+# or the napari documentation on benchmarking
+# https://github.com/napari/napari/blob/main/docs/BENCHMARKS.md
+from .replay import BACKENDS, SCENARIOS, InteractionReplay
+from .utils import Skip
+
+
+class InteractionReplaySuite:
+    """Benchmarks replaying whole interactions with a headless viewer."""
+
+    param_names = ['scenario', 'backend']
+    params = (list(SCENARIOS), list(BACKENDS))
+
+    # dask arrays can't be painted, so the labels would be the same
+    skip_params = Skip(
+        always=lambda scenario, backend: (
+            backend == 'dask' and scenario == 'brush_paint'
+        )
+    )
+
+    # interactions change the viewer, e.g. painting labels, so each one is
+    # replayed once on a new viewer
+    number = 1
+    timeout = 300
+
+    def setup(self, scenario, backend):
+        self.viewer, self.events = SCENARIOS[scenario](backend)
+        self.replay = InteractionReplay(self.viewer)
+
+    def time_replay(self, *_):
+        """Time to replay all the events of the interaction."""
+        self.replay.replay(self.events)
+
+    def track_p50_latency(self, *_):
+        """Median latency of the events of the interaction."""
+        return self._percentile(50)
+
+    def track_p95_latency(self, *_):
+        """95th percentile latency of the events of the interaction."""
+        return self._percentile(95)
+
+    track_p50_latency.unit = 'ms'
+    track_p95_latency.unit = 'ms'
+
+    def _percentile(self, percent):
+        report = self.replay.replay(self.events)
+        return max(
+            histogram.percentile(percent) * 1e-6
+            for histogram in report.latencies.values()
+        )
+
+
+if __name__ == '__main__':
+    from utils import run_benchmark
+
+    run_benchmark()
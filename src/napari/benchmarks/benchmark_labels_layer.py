@@ -12,7 +12,7 @@ from napari.components.dims import Dims
 from napari.layers import Labels
 from napari.utils.colormaps import DirectLabelColormap
 
-from .utils import Skip, labeled_particles
+from .utils import Skip, labeled_particles, track_layer_nbytes
 
 MAX_VAL = 2**23
 
@@ -225,6 +225,43 @@ class Labels3DSuite:
         return self.data
 
 
+class LabelsMemorySuite:
+    """Memory used by the Labels layer, including its undo history."""
+
+    param_names = ['n', 'dtype']
+    params = ([2**i for i in range(6, 11, 2)], [np.uint8, np.int32])
+    skip_params = Skip(if_in_pr=lambda n, dtype: n > 2**6)
+
+    def setup(self, n, dtype):
+        self.data = labeled_particles(
+            (16, n, n), dtype=dtype, n=int(np.log2(n) ** 2), seed=1
+        )
+        self.layer = Labels(self.data)
+        self.layer.brush_size = max(n // 16, 1)
+        self._paint_strokes(n)
+
+    def _paint_strokes(self, n):
+        for label, z in enumerate(range(0, 16, 4), start=1):
+            self.layer.paint_polygon(
+                [(z, 0, 0), (z, n - 1, n // 2), (z, n // 2, n - 1)], label
+            )
+            for x in np.linspace(0, n - 1, num=10):
+                self.layer.paint((z, x, n - 1 - x), label)
+
+    def peakmem_create_layer(self, *_):
+        """Peak memory used to create the layer."""
+        Labels(self.data)
+
+    def peakmem_paint(self, n, dtype):
+        """Peak memory used to paint strokes, recorded for undo."""
+        self._paint_strokes(n)
+
+    track_total_nbytes = track_layer_nbytes()
+    track_data_nbytes = track_layer_nbytes('data')
+    track_view_nbytes = track_layer_nbytes('view')
+    track_undo_nbytes = track_layer_nbytes('undo')
+
+
 if __name__ == '__main__':
     from utils import run_benchmark
 
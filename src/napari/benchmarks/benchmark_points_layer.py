@@ -11,7 +11,7 @@ import napari
 from napari.components import Dims
 from napari.layers import Points
 
-from .utils import Skip
+from .utils import Skip, track_layer_nbytes
 
 NAPARI_0_4_19 = parse_version(napari.__version__) <= parse_version('0.4.19')
 
@@ -168,6 +168,33 @@ class PointsToMaskSuite:
         self.layer.to_mask(shape=mask_shape)
 
 
+class PointsMemorySuite:
+    """Memory used by the Points layer, e.g. with a million points."""
+
+    params = [2**i for i in range(10, 21, 5)]
+    skip_params = Skip(if_in_pr=lambda n: n > 2**10)
+
+    def setup(self, n):
+        rng = np.random.default_rng(0)
+        self.data = rng.random((n, 3))
+        self.features = {'value': rng.random(n)}
+        self.layer = Points(self.data, features=self.features)
+
+    def peakmem_create_layer(self, n):
+        """Peak memory used to create the layer."""
+        Points(self.data, features=self.features)
+
+    def peakmem_add(self, n):
+        """Peak memory used to double the number of points."""
+        self.layer.add(self.data)
+
+    track_total_nbytes = track_layer_nbytes()
+    track_data_nbytes = track_layer_nbytes('data')
+    track_attributes_nbytes = track_layer_nbytes('attributes')
+    track_features_nbytes = track_layer_nbytes('features')
+    track_view_nbytes = track_layer_nbytes('view')
+
+
 if __name__ == '__main__':
     from utils import run_benchmark
 
@@ -288,6 +288,67 @@ class QtImageRenderingSuite:
         self.layer.gamma = 1.3
 
 
+class QtImageContrastDragSuite:
+    """Benchmarks for dragging the contrast limits slider of an image.
+
+    Contrast limits changes only update the shader of the layer, whatever
+    the dtype of the data: dragging the slider must not slice the layer
+    again, nor upload its texture.
+    """
+
+    viewer: napari.Viewer
+    layer: napari.layers.Image
+    steps: list[tuple[float, float]]
+
+    params = ['uint8', 'uint16', 'int32', 'float32', 'float64', 'float64e39']
+
+    def setup(self, dtype):
+        _ = QApplication.instance() or QApplication([])
+        rng = np.random.default_rng(0)
+        if dtype == 'float64e39':
+            # out of the float32 range, so rescaled for display
+            dtype, scale = 'float64', 1e39
+        elif np.issubdtype(dtype, np.integer):
+            scale = np.iinfo(dtype).max
+        else:
+            scale = 2**12
+        data = (rng.random((2048, 2048)) * scale).astype(dtype)
+        self.viewer = napari.Viewer()
+        self.layer = self.viewer.add_image(data)
+        low, high = self.layer.contrast_limits_range
+        self.steps = [
+            (low + (high - low) * i / 100, high - (high - low) * i / 100)
+            for i in range(1, 41)
+        ]
+
+    def teardown(self, dtype):
+        self.viewer.close()
+
+    def time_drag_contrast(self, dtype):
+        """Time to drag the contrast limits slider."""
+        for contrast_limits in self.steps:
+            self.layer.contrast_limits = contrast_limits
+
+    def track_drag_contrast_slices(self, dtype):
+        """Number of slices and texture uploads while dragging contrast."""
+        events = [self.layer.events.set_data, self.layer.events.reload]
+        count = 0
+
+        def _count(event):
+            nonlocal count
+            count += 1
+
+        for event in events:
+            event.connect(_count)
+        try:
+            self.time_drag_contrast(dtype)
+        finally:
+            for event in events:
+                event.disconnect(_count)
+        assert count == 0, f'dragging contrast sliced {count} times'
+        return count
+
+
 class QtVolumeRenderingSuite:
     """Benchmarks for a single image layer in the viewer."""
 
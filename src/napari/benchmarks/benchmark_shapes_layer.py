@@ -30,9 +30,9 @@ if TYPE_CHECKING:
     from collections.abc import Callable
 
 try:
-    from .utils import Skip
+    from .utils import Skip, track_layer_nbytes
 except ImportError:
-    from napari.benchmarks.utils import Skip
+    from napari.benchmarks.utils import Skip, track_layer_nbytes
 
 try:
     from napari.utils.triangulation_backend import TriangulationBackend
@@ -940,6 +940,30 @@ def polygons_with_holes(n_shapes=5_000, n_points=32) -> list[np.ndarray]:
     )
 
 
+class ShapesMemorySuite:
+    """Memory used by the Shapes layer, including its triangle meshes."""
+
+    params = [2**i for i in range(6, 13, 3)]
+    skip_params = Skip(if_in_pr=lambda n_shapes: n_shapes > 2**6)
+
+    def setup(self, n_shapes):
+        rng = np.random.default_rng(0)
+        centers = 1000 * rng.random((n_shapes, 1, 2))
+        angles = np.linspace(0, 2 * np.pi, 12, endpoint=False)
+        circle = np.stack([np.cos(angles), np.sin(angles)], axis=1)
+        self.data = list(centers + 10 * circle)
+        self.layer = Shapes(self.data, shape_type='polygon')
+
+    def peakmem_create_layer(self, *_):
+        """Peak memory used to create the layer."""
+        Shapes(self.data, shape_type='polygon')
+
+    track_total_nbytes = track_layer_nbytes()
+    track_data_nbytes = track_layer_nbytes('data')
+    track_mesh_nbytes = track_layer_nbytes('mesh')
+    track_attributes_nbytes = track_layer_nbytes('attributes')
+
+
 if __name__ == '__main__':
     from utils import run_benchmark
 
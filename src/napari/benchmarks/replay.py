@@ -0,0 +1,424 @@
+"""Headless replay of viewer interactions, to benchmark their latency.
+
+The asv suites measure individual layer methods. This module measures whole
+interactions (scrubbing dims, panning and zooming multiscale data, painting
+labels, dragging points) on a ``ViewerModel`` without a Qt canvas or a GPU:
+
+* an interaction is recorded as a list of :class:`InteractionEvent`, which
+  can be saved to and loaded from JSON;
+* :class:`InteractionReplay` applies each event to the viewer, then does
+  what the canvas does when it is drawn (updating the visible region of
+  each layer from the camera), and records the latency of each event in a
+  histogram per kind of event;
+* :data:`SCENARIOS` build viewers with synthetic numpy, dask or zarr data,
+  along with the events of typical interactions.
+
+Slicing is synchronous, so the latency of an event includes all the slicing
+it triggers. The slicing statistics of ``napari.utils.perf`` are recorded
+during the replay and added to its report.
+
+Run a scenario, or a saved recording of a scenario, from the command line::
+
+    python -m napari.benchmarks.replay dims_scrub --backend zarr
+    python -m napari.benchmarks.replay dims_scrub --events events.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from collections import defaultdict
+from dataclasses import dataclass, field
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from napari.components import ViewerModel
+from napari.utils._proxies import ReadOnlyWrapper
+from napari.utils.interactions import (
+    mouse_move_callbacks,
+    mouse_press_callbacks,
+    mouse_release_callbacks,
+)
+from napari.utils.perf import LatencyHistogram, slicing_stats
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+#: Array backends of the synthetic datasets.
+BACKENDS = ('numpy', 'dask', 'zarr')
+
+
+@dataclass(frozen=True)
+class InteractionEvent:
+    """One step of an interaction.
+
+    Parameters
+    ----------
+    kind : str
+        The kind of event, one of:
+
+        * 'set_point': move the dims slider ``axis`` to ``value``;
+        * 'camera': set the camera ``center`` and/or ``zoom``;
+        * 'mouse': press, drag or release the mouse (``type`` is
+          'mouse_press', 'mouse_move' or 'mouse_release') at ``position``,
+          in world coordinates, over the layer ``layer``.
+    args : dict
+        The arguments of the event.
+    """
+
+    kind: str
+    args: dict[str, Any] = field(default_factory=dict)
+
+
+def save_events(events: Sequence[InteractionEvent], path: str) -> None:
+    """Save ``events`` to a JSON file."""
+    with open(path, 'w') as outf:
+        json.dump(
+            [{'kind': event.kind, 'args': event.args} for event in events],
+            outf,
+            indent=1,
+        )
+
+
+def load_events(path: str) -> list[InteractionEvent]:
+    """Load the events saved to a JSON file with :func:`save_events`."""
+    with open(path) as inf:
+        return [InteractionEvent(**event) for event in json.load(inf)]
+
+
+@dataclass
+class _MouseEvent:
+    """The attributes of a canvas mouse event that layer callbacks use."""
+
+    type: str
+    position: tuple[float, ...]
+    is_dragging: bool = False
+    dims_displayed: tuple[int, ...] = (0, 1)
+    dims_point: tuple[float, ...] = ()
+    view_direction: tuple[float, ...] | None = None
+    up_direction: tuple[float, ...] | None = None
+    pos: tuple[int, int] = (0, 0)
+    button: int = 1
+    modifiers: tuple[str, ...] = ()
+    handled: bool = False
+
+
+@dataclass
+class ReplayReport:
+    """Latencies of the replayed events.
+
+    Attributes
+    ----------
+    latencies : dict of str to LatencyHistogram
+        The latency of the events of each kind, in nanoseconds.
+    slicing : dict
+        The summary of the slicing statistics of each layer, see
+        ``napari.utils.perf.SlicingStats.summary``.
+    """
+
+    latencies: dict[str, LatencyHistogram] = field(
+        default_factory=lambda: defaultdict(LatencyHistogram)
+    )
+    slicing: dict[str, Any] = field(default_factory=dict)
+
+    def summary(self) -> dict[str, Any]:
+        """Count, mean, max and percentiles of the latencies, in ms."""
+        return {
+            'latency_ms': {
+                kind: histogram.summary()
+                for kind, histogram in self.latencies.items()
+            },
+            'slicing': self.slicing,
+        }
+
+
+class InteractionReplay:
+    """Replays events against a viewer, without a canvas.
+
+    Parameters
+    ----------
+    viewer : ViewerModel
+        The viewer to interact with. Its ``canvas.size`` is the size of the
+        simulated canvas.
+    """
+
+    def __init__(self, viewer: ViewerModel) -> None:
+        self.viewer = viewer
+        self._handlers: dict[str, Callable[[dict[str, Any]], None]] = {
+            'set_point': self._set_point,
+            'camera': self._camera,
+            'mouse': self._mouse,
+        }
+
+    def replay(self, events: Sequence[InteractionEvent]) -> ReplayReport:
+        """Apply ``events`` in order and report their latencies.
+
+        The slicing statistics recorded before are cleared.
+        """
+        report = ReplayReport()
+        was_enabled = slicing_stats.enabled
+        slicing_stats.clear()
+        slicing_stats.enable()
+        try:
+            with self.viewer._layer_slicer.force_sync():
+                self.draw()
+                for event in events:
+                    start_ns = perf_counter_ns()
+                    self._handlers[event.kind](event.args)
+                    self.draw()
+                    report.latencies[event.kind].add(
+                        perf_counter_ns() - start_ns
+                    )
+        finally:
+            report.slicing = slicing_stats.summary()
+            if not was_enabled:
+                slicing_stats.disable()
+        return report
+
+    def draw(self) -> None:
+        """Update the layers for the camera, as drawing the canvas does."""
+        viewer = self.viewer
+        height, width = viewer.canvas.size
+        camera = viewer.scene.camera
+        ndisplay = viewer.dims.ndisplay
+        half_size = np.array([height, width][-ndisplay:]) / 2 / camera.zoom
+        center = np.asarray(camera.center)[-ndisplay:]
+        corners = np.tile(np.asarray(viewer.dims.point, dtype=float), (2, 1))
+        displayed = list(viewer.dims.displayed)
+        corners[0, displayed] = center - half_size
+        corners[1, displayed] = center + half_size
+        slicing_stats.drawn()
+        for layer in viewer.layers:
+            nd = len(layer._slice_input.displayed)
+            layer._update_draw(
+                scale_factor=1 / camera.zoom,
+                corner_pixels_displayed=corners[:, displayed[-nd:]],
+                shape_threshold=(height, width),
+            )
+
+    def _set_point(self, args: dict[str, Any]) -> None:
+        self.viewer.dims.set_point(args['axis'], args['value'])
+
+    def _camera(self, args: dict[str, Any]) -> None:
+        camera = self.viewer.scene.camera
+        with camera.batched_update():
+            if 'center' in args:
+                camera.center = args['center']
+            if 'zoom' in args:
+                camera.zoom = args['zoom']
+
+    def _mouse(self, args: dict[str, Any]) -> None:
+        viewer = self.viewer
+        layer = viewer.layers[args['layer']]
+        position = tuple(args['position'])
+        event = ReadOnlyWrapper(
+            _MouseEvent(
+                type=args['type'],
+                position=position,
+                is_dragging=args['type'] == 'mouse_move',
+                dims_displayed=tuple(viewer.dims.displayed),
+                dims_point=position,
+            )
+        )
+        callbacks = {
+            'mouse_press': mouse_press_callbacks,
+            'mouse_move': mouse_move_callbacks,
+            'mouse_release': mouse_release_callbacks,
+        }
+        callbacks[args['type']](layer, event)
+
+
+def _mouse_stroke(
+    layer: str, positions: Sequence[Sequence[float]]
+) -> list[InteractionEvent]:
+    """Events pressing at the first position, dragging through the others."""
+    types = (
+        ['mouse_press']
+        + ['mouse_move'] * (len(positions) - 2)
+        + ['mouse_release']
+    )
+    return [
+        InteractionEvent(
+            'mouse',
+            {
+                'layer': layer,
+                'type': type_,
+                'position': [float(p) for p in position],
+            },
+        )
+        for type_, position in zip(types, positions, strict=True)
+    ]
+
+
+def synthetic_array(
+    shape: tuple[int, ...],
+    chunks: tuple[int, ...],
+    backend: str,
+    dtype: Any = np.uint16,
+    seed: int = 0,
+) -> Any:
+    """Random data with the given shape, chunks and array backend.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        The shape of the array.
+    chunks : tuple of int
+        The chunks of dask and zarr arrays.
+    backend : {'numpy', 'dask', 'zarr'}
+        The array type. zarr arrays are stored in memory.
+    dtype : dtype
+        An integer dtype.
+    seed : int
+        The seed of the random values.
+
+    Returns
+    -------
+    array-like
+        The array.
+    """
+    if backend == 'dask':
+        import dask.array as da
+
+        return da.random.default_rng(seed).integers(
+            0, 1000, shape, dtype=dtype, chunks=chunks
+        )
+    data = np.random.default_rng(seed).integers(0, 1000, shape, dtype=dtype)
+    if backend == 'numpy':
+        return data
+    if backend == 'zarr':
+        import zarr
+
+        return zarr.array(data, chunks=chunks)
+    raise ValueError(f'unknown backend: {backend}')
+
+
+def _dims_scrub(backend: str) -> tuple[ViewerModel, list[InteractionEvent]]:
+    """Scrub back and forth through the planes of a 3D image."""
+    viewer = ViewerModel()
+    viewer.add_image(
+        synthetic_array((64, 512, 512), (1, 256, 256), backend), name='image'
+    )
+    planes = list(range(64)) + list(range(63, -1, -1))
+    return viewer, [
+        InteractionEvent('set_point', {'axis': 0, 'value': z}) for z in planes
+    ]
+
+
+def _multiscale_pan_zoom(
+    backend: str,
+) -> tuple[ViewerModel, list[InteractionEvent]]:
+    """Zoom in on a multiscale image, pan across it, and zoom out again."""
+    viewer = ViewerModel()
+    size = 8192
+    levels = [
+        synthetic_array((size >> i, size >> i), (256, 256), backend, seed=i)
+        for i in range(5)
+    ]
+    viewer.add_image(levels, multiscale=True, name='image')
+    viewer.reset_view()
+    center = np.array(viewer.scene.camera.center[-2:])
+    zoom = viewer.scene.camera.zoom
+    events = [
+        InteractionEvent('camera', {'zoom': zoom * 2**i}) for i in range(6)
+    ]
+    # pan by half the canvas at each step, at full resolution
+    step = np.array(viewer.canvas.size) / 2 / (zoom * 2**5)
+    for i in range(1, 17):
+        events.append(
+            InteractionEvent(
+                'camera', {'center': (center + i * step).tolist()}
+            )
+        )
+    events.extend(
+        InteractionEvent('camera', {'zoom': zoom * 2**i})
+        for i in range(4, -1, -1)
+    )
+    return viewer, events
+
+
+def _brush_paint(backend: str) -> tuple[ViewerModel, list[InteractionEvent]]:
+    """Paint a stroke across a plane of 3D labels."""
+    viewer = ViewerModel()
+    data = np.zeros((16, 1024, 1024), dtype=np.uint32)
+    if backend == 'zarr':
+        import zarr
+
+        data = zarr.array(data, chunks=(1, 256, 256))
+    elif backend == 'dask':
+        # dask arrays can't be painted, the labels are loaded in memory
+        data = np.asarray(data)
+    layer = viewer.add_labels(data, name='labels')
+    layer.mode = 'paint'
+    layer.brush_size = 20
+    layer.selected_label = 2
+    t = np.linspace(0, 1, 50)
+    positions = np.stack(
+        [np.full_like(t, 8), 100 + 800 * t, 512 + 300 * np.sin(6 * t)],
+        axis=1,
+    )
+    return viewer, _mouse_stroke('labels', positions)
+
+
+def _point_drag(backend: str) -> tuple[ViewerModel, list[InteractionEvent]]:
+    """Drag a point of a large points layer over an image."""
+    viewer = ViewerModel()
+    viewer.add_image(
+        synthetic_array((1024, 1024), (256, 256), backend), name='image'
+    )
+    rng = np.random.default_rng(0)
+    points = rng.uniform(0, 1024, (10_000, 2))
+    points[0] = (100, 100)
+    layer = viewer.add_points(points, size=5, name='points')
+    layer.mode = 'select'
+    t = np.linspace(0, 1, 50)[:, np.newaxis]
+    positions = (100, 100) + t * (800, 600)
+    return viewer, _mouse_stroke('points', positions)
+
+
+#: Functions building a viewer with synthetic data of a given backend, and
+#: the events of an interaction with it.
+SCENARIOS: dict[
+    str, Callable[[str], tuple[ViewerModel, list[InteractionEvent]]]
+] = {
+    'dims_scrub': _dims_scrub,
+    'multiscale_pan_zoom': _multiscale_pan_zoom,
+    'brush_paint': _brush_paint,
+    'point_drag': _point_drag,
+}
+
+
+def main(args: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description='Replay an interaction with a headless napari viewer '
+        'and print the latency of its events as JSON.'
+    )
+    parser.add_argument('scenario', choices=sorted(SCENARIOS))
+    parser.add_argument('--backend', choices=BACKENDS, default='numpy')
+    parser.add_argument(
+        '--events',
+        help='JSON file of events to replay instead of those of the '
+        'scenario. Written first if it does not exist.',
+    )
+    parser.add_argument('--output', help='Write the report to this file.')
+    parsed = parser.parse_args(args)
+
+    viewer, events = SCENARIOS[parsed.scenario](parsed.backend)
+    if parsed.events is not None:
+        try:
+            events = load_events(parsed.events)
+        except FileNotFoundError:
+            save_events(events, parsed.events)
+    summary = InteractionReplay(viewer).replay(events).summary()
+    text = json.dumps(summary, indent=2)
+    if parsed.output is None:
+        print(text)  # noqa: T201
+    else:
+        with open(parsed.output, 'w') as outf:
+            outf.write(text)
+
+
+if __name__ == '__main__':
+    main()
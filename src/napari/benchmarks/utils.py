@@ -143,6 +143,37 @@ def _update_data_with_mask(data, struct, out=None):
         return out
 
 
+def track_layer_nbytes(category: str | None = None) -> Callable[..., float]:
+    """Make an asv ``track_`` benchmark of the memory of ``self.layer``.
+
+    Parameters
+    ----------
+    category : str, optional
+        The category of ``Layer._memory_report()`` to track, e.g. 'data'.
+        By default, the sum of all categories.
+
+    Returns
+    -------
+    Callable
+        The benchmark, to assign to a ``track_<category>_nbytes`` attribute
+        of a suite.
+    """
+
+    def track(self, *_):
+        if not hasattr(self.layer, '_memory_report'):
+            # napari versions without memory reports
+            return float('nan')
+        report = self.layer._memory_report()
+        if category is None:
+            return sum(report.values())
+        return report.get(category, 0)
+
+    track.__name__ = f'track_{category or "total"}_nbytes'
+    track.__doc__ = f'Bytes of {category or "all categories"} in memory.'
+    track.unit = 'bytes'
+    return track
+
+
 def _smallest_dtype(n: int) -> np.dtype:
     """Find the smallest dtype that can hold n values."""
     for dtype in [np.uint8, np.uint16, np.uint32, np.uint64]:
@@ -10,6 +10,7 @@ import weakref
 from concurrent.futures import Executor, Future, ThreadPoolExecutor, wait
 from contextlib import contextmanager
 from threading import RLock
+from time import perf_counter_ns
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -19,7 +20,9 @@ from typing import (
 
 from napari.layers import Layer
 from napari.settings import get_settings
+from napari.utils._buffer_pool import BufferPool
 from napari.utils.events.event import EmitterGroup, Event
+from napari.utils.perf import add_counter_event, slicing_stats
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -109,6 +112,9 @@ class _LayerSlicer:
         _lock_futures_dicts : threading.RLock
             lock to guard against concurrent changes to `_layers_to_task`
             and `_task_to_requests` when finding, adding, or removing tasks
+        _buffer_pool : BufferPool
+            arrays that the slices of all the layers draw their output from,
+            given back once the canvas no longer displays them
         """
         self.events = EmitterGroup(source=self, ready=Event)
         self._executor: Executor = ThreadPoolExecutor(max_workers=1)
@@ -120,6 +126,7 @@ class _LayerSlicer:
             Future, dict[weakref.ReferenceType[Layer], _SliceRequest]
         ] = {}
         self._lock_futures_dicts = RLock()
+        self._buffer_pool = BufferPool()
 
     @contextmanager
     def force_sync(self):
@@ -205,7 +212,11 @@ class _LayerSlicer:
         )
         if existing_task := self._find_existing_task(layers):
             logger.debug('Cancelling task %s', id(existing_task))
-            existing_task.cancel()
+            with self._lock_futures_dicts:
+                # the requests are forgotten when the task is cancelled
+                cancelled = self._task_to_requests.get(existing_task, {})
+            if existing_task.cancel():
+                self._count_cancelled(cancelled)
 
         # Not all layer types will initially be asynchronously sliceable.
         # The following logic gives us a way to handle those in the short
@@ -214,6 +225,8 @@ class _LayerSlicer:
         requests: dict[weakref.ref, _SliceRequest] = {}
         sync_layers = []
         for layer in layers:
+            layer._slicing_state._buffer_pool = self._buffer_pool
+            slicing_stats.request(layer)
             # Slicing of non-visible layers is handled differently by sync
             # and async slicing. For async, we do not make request since a
             # later change to visibility triggers slicing. For sync, we want
@@ -231,6 +244,7 @@ class _LayerSlicer:
                 weak_layer = weakref.ref(layer)
                 requests[weak_layer] = request
                 layer._slicing_state._set_unloaded_slice_id(request.id)
+                slicing_stats.count('queued', layer=layer)
             else:
                 logger.debug('Sync slicing for %s', layer)
                 sync_layers.append(layer)
@@ -239,7 +253,9 @@ class _LayerSlicer:
         task = None
         if len(requests) > 0:
             logger.debug('Submitting task %s', id(task))
-            task = self._executor.submit(self._slice_layers, requests)
+            task = self._executor.submit(
+                self._slice_layers, requests, perf_counter_ns()
+            )
             # Store task before adding done callback to ensure there is always
             # a task to remove in the done callback.
             with self._lock_futures_dicts:
@@ -253,6 +269,8 @@ class _LayerSlicer:
                 dims=dims,
                 force=force,
             )
+        if sync_layers:
+            self._add_buffer_pool_counter()
 
         return task
 
@@ -265,10 +283,13 @@ class _LayerSlicer:
         """
         logger.debug('_LayerSlicer.shutdown')
         self._executor.shutdown(wait=True, cancel_futures=True)
+        self._buffer_pool.clear()
         self.events.disconnect()
         self.events.ready.disconnect()
 
-    def _slice_layers(self, requests: dict) -> dict:
+    def _slice_layers(
+        self, requests: dict, submitted_ns: int | None = None
+    ) -> dict:
         """
         Iterates through a dictionary of request objects and call the slice
         on each individual layer. Can be called from the main or slicing thread.
@@ -277,16 +298,42 @@ class _LayerSlicer:
         ----------
         requests: dict[Layer, SliceRequest]
             Dictionary of request objects to be used for constructing the slice
+        submitted_ns: int or None
+            perf_counter_ns() when the requests were submitted, to record
+            how long they were queued
 
         Returns
         -------
         dict[Layer, SliceResponse]: which contains the results of the slice
         """
         logger.debug('_LayerSlicer._slice_layers: %s', requests)
-        result = {layer: request() for layer, request in requests.items()}
+        started_ns = perf_counter_ns()
+        result = {}
+        for weak_layer, request in requests.items():
+            layer = weak_layer()
+            if submitted_ns is not None:
+                slicing_stats.add_latency(
+                    layer, 'queue', submitted_ns, started_ns
+                )
+            with slicing_stats.slicing(layer):
+                result[weak_layer] = request()
+        self._add_buffer_pool_counter()
         self.events.ready(value=result)
         return result
 
+    def _add_buffer_pool_counter(self) -> None:
+        """Report the statistics of the buffer pool to perfmon."""
+        add_counter_event('buffer_pool', **self._buffer_pool.stats())
+
+    @staticmethod
+    def _count_cancelled(requests: dict) -> None:
+        """Record cancelled ``requests`` in the slicing stats."""
+        if not slicing_stats.enabled:
+            return
+        for weak_layer in requests:
+            if layer := weak_layer():
+                slicing_stats.count('cancelled', layer=layer)
+
     def _on_slice_done(self, task: Future[dict]) -> None:
         """
         This is the "done_callback" which is added to each task.
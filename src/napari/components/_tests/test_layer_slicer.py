@@ -360,7 +360,7 @@ def test_submit_with_one_3d_image(layer_slicer):
         future = layer_slicer.submit(layers=[layer], dims=dims)
         assert not future.done()
     layer_result = _wait_for_response(future)[layer]
-    np.testing.assert_equal(layer_result.image.view, data[2, :, :])
+    np.testing.assert_equal(layer_result.image.raw, data[2, :, :])
 
 
 def test_submit_with_3d_labels(layer_slicer):
@@ -380,7 +380,7 @@ def test_submit_with_3d_labels(layer_slicer):
         assert not future.done()
 
     layer_result = _wait_for_response(future)[layer]
-    np.testing.assert_equal(layer_result.image.view, data[2, :, :])
+    np.testing.assert_equal(layer_result.image.raw, data[2, :, :])
 
 
 def test_submit_with_one_3d_points(layer_slicer):
@@ -407,6 +407,57 @@ def test_submit_with_one_3d_points(layer_slicer):
         assert not future.done()
 
 
+def test_slices_reuse_buffer_pool():
+    layer_slicer = _LayerSlicer()
+    image = Image(np.random.default_rng(0).random((4, 6, 5)))
+    labels = Labels(np.arange(120, dtype=np.int32).reshape(4, 6, 5))
+    points = Points(np.random.default_rng(0).random((20, 3)) * 4)
+    layers = [image, labels, points]
+    dims = Dims(ndim=3, ndisplay=2, range=((0, 4, 1), (0, 6, 1), (0, 5, 1)))
+    for point in range(4):
+        dims.point = (point, 0, 0)
+        layer_slicer.submit(layers=layers, dims=dims)
+        np.testing.assert_array_equal(
+            image._slice.image.raw, image.data[point]
+        )
+        np.testing.assert_array_equal(
+            labels._slice.image.raw, labels.data[point]
+        )
+        # the canvas is drawn with the new slices
+        for layer in layers:
+            layer._update_draw(1, np.array([[0, 0], [6, 5]]), (6, 5))
+    for layer in layers:
+        assert layer._slicing_state._buffer_pool is layer_slicer._buffer_pool
+    # the arrays of replaced slices are reused once they are not drawn
+    stats = layer_slicer._buffer_pool.stats()
+    assert stats['reused'] > stats['allocated']
+    layer_slicer.shutdown()
+
+
+def test_displayed_buffers_are_not_shared_before_draw():
+    layer_slicer = _LayerSlicer()
+    data = np.random.default_rng(0).random((4, 6, 5))
+    first, second = Image(data), Image(data)
+    dims = Dims(ndim=3, ndisplay=2, range=((0, 4, 1), (0, 6, 1), (0, 5, 1)))
+    dims.point = (1, 0, 0)
+    layer_slicer.submit(layers=[first, second], dims=dims)
+    displayed = first._data_view
+    dims.point = (2, 0, 0)
+    layer_slicer.submit(layers=[first], dims=dims)
+    # the canvas may still display the replaced view of the first layer
+    layer_slicer.submit(layers=[second], dims=dims)
+    assert second._data_view is not displayed
+    np.testing.assert_array_equal(displayed, data[1].astype(np.float32))
+
+    # once drawn, the view is reused by the slices of any layer
+    first._update_draw(1, np.array([[0, 0], [6, 5]]), (6, 5))
+    dims.point = (3, 0, 0)
+    layer_slicer.submit(layers=[second], dims=dims)
+    assert second._data_view is displayed
+    layer_slicer.shutdown()
+    assert len(layer_slicer._buffer_pool) == 0
+
+
 def test_submit_after_shutdown_raises():
     layer_slicer = _LayerSlicer()
     layer_slicer._force_sync = False
@@ -8,7 +8,7 @@ import pytest
 from pint import get_application_registry
 
 from napari.components import LayerList
-from napari.layers import Image
+from napari.layers import Image, Points
 from napari.layers.utils._link_layers import get_linked_layers, layer_is_linked
 
 REG = get_application_registry()
@@ -649,6 +649,25 @@ def test_extent_world():
     )
 
 
+def test_extent_world_cached_per_layer():
+    """Test extents of layers are only converted again when they change."""
+    image = Image(np.zeros((5, 5)), scale=(2, 2), units=('nm', 'nm'))
+    points = Points([[0, 0], [3, 4]], units=('um', 'um'))
+    ll = LayerList([image, points])
+    npt.assert_allclose(ll._extent_world, ((0, 0), (3000, 4000)))
+    cached = ll._cached_extents[points]
+
+    # clearing an extent which doesn't change reuses its conversion
+    points.refresh()
+    ll._clean_cache()
+    npt.assert_allclose(ll._extent_world, ((0, 0), (3000, 4000)))
+    assert ll._cached_extents[points].world is cached.world
+    assert ll._cached_extents[points].version == points._extent_version
+
+    points.add([[-1, 6]])
+    npt.assert_allclose(ll._extent_world, ((-1000, 0), (3000, 6000)))
+
+
 def test_default_extent_world():
     """Test default extent after adding layers."""
     ll = LayerList()
@@ -0,0 +1,233 @@
+import sys
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from napari.components import ViewerModel
+from napari.components.experimental.monitor import monitor
+from napari.components.experimental.remote import (
+    RemoteClient,
+    RemoteError,
+    RemoteManager,
+)
+
+SCREENSHOT = np.arange(2 * 3 * 4, dtype=np.uint8).reshape(2, 3, 4)
+
+CLIENT_SCRIPT = """
+import numpy as np
+from napari.components.experimental.remote import RemoteClient
+
+with RemoteClient.from_env() as client:
+    layer = client.add_labels(np.zeros((8, 8), dtype=np.int32), name='remote')
+    layer.data[2:4, 2:4] = 5
+    layer.refresh()
+    client.call('refresh_layer', {'name': 'remote'})
+"""
+
+
+def _poll(manager):
+    """Poll like QtPoll does, once per frame."""
+    monitor._api.poll()
+    manager.on_poll(None)
+
+
+def _serve(manager, client_function, timeout=30):
+    """Run a client function in a thread, while napari polls its commands."""
+    result = {}
+
+    def _run():
+        try:
+            result['value'] = client_function()
+        except Exception as e:  # noqa: BLE001
+            result['error'] = e
+
+    thread = threading.Thread(target=_run)
+    thread.start()
+    deadline = time.monotonic() + timeout
+    while thread.is_alive() and time.monotonic() < deadline:
+        _poll(manager)
+        time.sleep(0.005)
+    thread.join(timeout=1)
+    if 'error' in result:
+        raise result['error']
+    return result['value']
+
+
+@pytest.fixture
+def remote():
+    """A viewer with a remote manager, and a client connected to it."""
+    assert monitor.start({'clients': []})
+    viewer = ViewerModel()
+    manager = RemoteManager(viewer, screenshot=lambda: SCREENSHOT)
+    monitor.run_command_event.connect(manager.process_command)
+    client = RemoteClient(monitor.address[1])
+    yield viewer, manager, client
+    client.close()
+    manager.close()
+    monitor.run_command_event.disconnect(manager.process_command)
+    monitor.stop()
+
+
+def test_add_layers_without_copy(remote):
+    viewer, manager, client = remote
+    image = _serve(
+        manager, lambda: client.add_image(np.zeros((4, 5)), name='img')
+    )
+    assert image.name == 'img'
+    labels = _serve(
+        manager, lambda: client.add_labels(np.zeros((4, 5), dtype=np.uint16))
+    )
+    points = _serve(manager, lambda: client.add_points([[1.0, 2.0]]))
+    assert [layer.name for layer in viewer.layers] == [
+        'img',
+        labels.name,
+        points.name,
+    ]
+
+    # the client writes into the memory napari maps
+    image.data[1, 2] = 3
+    labels.data[0, 0] = 7
+    points.data[0] = [3, 4]
+    assert viewer.layers['img'].data[1, 2] == 3
+    assert viewer.layers[labels.name].data[0, 0] == 7
+    np.testing.assert_array_equal(viewer.layers[points.name].data, [[3, 4]])
+    assert viewer.layers[labels.name].data.dtype == np.uint16
+
+    image.refresh()
+    _poll(manager)
+    assert client.layers()['img'] == {
+        'type': 'image',
+        'ndim': 2,
+        'visible': True,
+    }
+
+    _serve(manager, lambda: client.remove_layer('img'))
+    assert 'img' not in viewer.layers
+
+
+def test_command_errors(remote):
+    _viewer, manager, client = remote
+    with pytest.raises(RemoteError, match='KeyError'):
+        _serve(manager, lambda: client.remove_layer('missing'))
+    with pytest.raises(RemoteError, match='surface'):
+        _serve(
+            manager,
+            lambda: client.call(
+                'add_layer', {'layer_type': 'surface', 'data': None}
+            ),
+        )
+    with pytest.raises(TimeoutError):
+        client.call('remove_layer', {'name': 'missing'}, timeout=0.01)
+
+    # unknown and private methods are not commands
+    client.send('close')
+    client.send('_shared')
+    _poll(manager)
+    assert manager._commands._shared == {}
+
+
+def test_subscribe_events(remote):
+    viewer, manager, client = remote
+    viewer.add_image(np.zeros((3, 4, 5)))
+    client.subscribe('dims', 'layers')
+    _poll(manager)
+    assert client.get_event(timeout=5)['type'] == 'dims'
+    assert client.get_event(timeout=5) == {
+        'type': 'layers',
+        'value': ['Image'],
+    }
+
+    viewer.dims.set_current_step(0, 2)
+    viewer.dims.set_current_step(0, 1)
+    viewer.scene.camera.zoom = 2
+    _poll(manager)
+    # one event per frame, with the last state
+    event = client.get_event(timeout=5)
+    assert event['type'] == 'dims'
+    assert event['value']['current_step'][0] == 1
+    assert client.get_event(timeout=0.1) is None
+
+    client.unsubscribe('dims')
+    client.subscribe('camera')
+    _poll(manager)
+    assert client.get_event(timeout=5)['value']['zoom'] == 2
+    viewer.dims.set_current_step(0, 0)
+    _poll(manager)
+    assert client.get_event(timeout=0.1) is None
+
+
+def test_clients_receive_their_messages(remote):
+    viewer, manager, client = remote
+    other = RemoteClient(monitor.address[1])
+    try:
+        other.subscribe('layers')
+        _poll(manager)
+        assert other.get_event(timeout=5)['value'] == []
+
+        # both clients use request id 1, but only receive their own reply
+        client.send('remove_layer', {'name': 'missing', 'request_id': 1})
+        layer = _serve(
+            manager,
+            lambda: other.add_labels(np.zeros((4, 4), dtype=np.uint8)),
+        )
+        assert layer.name in viewer.layers
+        client._receive(timeout=5)
+        assert 'KeyError' in client._replies[1]['error']
+
+        # events only go to the clients which subscribed to them
+        _poll(manager)
+        assert other.get_event(timeout=5)['value'] == [layer.name]
+        assert client.get_event(timeout=0.1) is None
+
+        other.close()
+        _poll(manager)
+        assert manager._messages._subscribed == {}
+    finally:
+        other.close()
+
+
+def test_frame_time_is_not_queued(remote):
+    _viewer, manager, client = remote
+    for _ in range(5):
+        _poll(manager)
+    assert client._messages.qsize() == 0
+    assert client._napari_data.get('frame_time')['delta_ms'] >= 0
+
+
+def test_screenshot(remote):
+    _viewer, manager, client = remote
+    screenshot = _serve(manager, client.screenshot)
+    np.testing.assert_array_equal(screenshot, SCREENSHOT)
+    _poll(manager)
+    # the client released the shared memory once it copied the screenshot
+    assert manager._commands._shared == {}
+
+
+def test_screenshot_without_canvas(remote):
+    _viewer, manager, client = remote
+    manager._commands._screenshot = None
+    with pytest.raises(RemoteError, match='no canvas'):
+        _serve(manager, client.screenshot)
+
+
+@pytest.mark.slow
+def test_client_process():
+    """A client process started by the monitor adds a layer."""
+    assert monitor.start({'clients': [[sys.executable, '-c', CLIENT_SCRIPT]]})
+    viewer = ViewerModel()
+    manager = RemoteManager(viewer)
+    monitor.run_command_event.connect(manager.process_command)
+    try:
+        deadline = time.monotonic() + 60
+        while time.monotonic() < deadline and not (
+            'remote' in viewer.layers
+            and viewer.layers['remote'].data[2, 2] == 5
+        ):
+            _poll(manager)
+            time.sleep(0.01)
+        assert viewer.layers['remote'].data[2, 2] == 5
+    finally:
+        monitor.run_command_event.disconnect(manager.process_command)
+        monitor.stop()
@@ -18,6 +18,7 @@ from napari.layers.shapes._tests.conftest import (
     ten_four_corner,  # noqa: F401
 )  # import to not put this data in top level conftest.py
 from napari.settings import get_settings
+from napari.utils._streaming import StreamingArray
 from napari.utils.colormaps import AVAILABLE_COLORMAPS, Colormap
 from napari.utils.events.event import WarningEmitter
 
@@ -391,7 +392,7 @@ def test_swappable_dims():
     image_data = np.random.random((7, 12, 10, 15))
     image_name = viewer.add_image(image_data).name
     assert np.array_equal(
-        viewer.layers[image_name]._data_view, image_data[3, 5, :, :]
+        viewer.layers[image_name]._slice.image.raw, image_data[3, 5, :, :]
     )
 
     points_data = np.random.randint(6, size=(10, 4))
@@ -412,7 +413,7 @@ def test_swappable_dims():
     viewer.dims.order = [0, 2, 1, 3]
     assert viewer.dims.order == (0, 2, 1, 3)
     assert np.array_equal(
-        viewer.layers[image_name]._data_view, image_data[3, :, 4, :]
+        viewer.layers[image_name]._slice.image.raw, image_data[3, :, 4, :]
     )
     assert np.array_equal(
         viewer.layers[labels_name]._slice.image.raw, labels_data[3, :, 4, :]
@@ -470,6 +471,48 @@ def test_add_remove_layer_dims_change():
     assert viewer.dims.ndim == 2
 
 
+def test_dims_change_submits_one_slice_request(monkeypatch):
+    """Test that one dims change results in a single slice request."""
+    viewer = ViewerModel()
+    viewer.add_image(np.zeros((10, 15, 20)))
+    submitted = []
+    monkeypatch.setattr(
+        viewer._layer_slicer,
+        'submit',
+        lambda **kwargs: submitted.append(kwargs),
+    )
+
+    # point also changes current_step
+    viewer.dims.set_point(0, 3)
+    assert len(submitted) == 1
+
+    submitted.clear()
+    with viewer.dims.batched_update():
+        viewer.dims.set_point(0, 5)
+        viewer.dims.margin_left = (1, 0, 0)
+        viewer.dims.margin_right = (1, 0, 0)
+    assert len(submitted) == 1
+
+    submitted.clear()
+    viewer.dims.axis_labels = ('z', 'y', 'x')
+    assert not submitted
+
+
+def test_layers_batch_defers_dims_events():
+    """Test that dims events are emitted once a layer list batch ends."""
+    viewer = ViewerModel()
+    viewer.add_image(np.zeros((10, 15, 20)))
+    viewer.add_image(np.zeros((5, 10, 15, 20)))
+    ndims = []
+    viewer.dims.events.ndim.connect(lambda e: ndims.append(e.value))
+
+    viewer.layers.clear()
+
+    assert viewer.dims.ndim == 2
+    assert ndims == [2]
+    assert not viewer._dims_batches
+
+
 @pytest.mark.parametrize('data', good_layer_data)
 def test_add_layer_from_data(data):
     # make sure adding valid layer data calls the proper corresponding add_*
@@ -1078,6 +1121,20 @@ def test_get_status_text():
     assert viewer.tooltip.text == '0\na: 1'
 
 
+def test_get_status_text_stale():
+    """Test that a stale status computation is abandoned."""
+    viewer = ViewerModel(ndisplay=2)
+    viewer.mouse_over_canvas = True
+    viewer.add_image(np.zeros((10, 10)))
+    viewer.add_labels(np.zeros((10, 10), dtype='uint8'))
+    assert viewer._calc_status_from_cursor(is_stale=lambda: True) is None
+    viewer.layers.select_all()
+    assert viewer._calc_status_from_cursor(is_stale=lambda: True) is None
+    assert viewer._calc_status_from_cursor(is_stale=lambda: False) == (
+        viewer._calc_status_from_cursor()
+    )
+
+
 def test_reset_view():
     """Test camera angle behavior after a viewer reset."""
     viewer = ViewerModel(ndisplay=3)
@@ -1377,3 +1434,28 @@ def test_dims_axis_labels_default_when_all_layers_default():
 
     layer0.axis_labels = ['-4', '-3', '-2', '-1']
     assert viewer.dims.axis_labels == ('-4', '-3', '-2', '-1')  # all default
+
+
+def test_streaming_layer_follows_last_frame():
+    """Appending frames grows the dims range, and follows the last frame."""
+    viewer = ViewerModel()
+    stream = StreamingArray((8, 8), np.uint8, max_frames=4)
+    layer = viewer.add_image(stream)
+    dims_events = []
+    viewer.dims.events.connect(dims_events.append)
+
+    for i in range(3):
+        stream.append(np.full((8, 8), i + 1))
+    stream.poll()
+    assert viewer.dims.range[0] == (0, 2, 1)
+    assert viewer.dims.current_step[0] == 2
+    assert len(dims_events) == 1
+    np.testing.assert_array_equal(layer._slice.image.raw, 3)
+
+    # the viewer stays on a previous frame
+    viewer.dims.set_current_step(0, 1)
+    stream.append(np.full((8, 8), 4))
+    stream.poll()
+    assert viewer.dims.range[0] == (0, 3, 1)
+    assert viewer.dims.current_step[0] == 1
+    np.testing.assert_array_equal(layer._slice.image.raw, 2)
@@ -418,14 +418,13 @@ class Dims(EventedModel):
     def reset(self):
         """Reset dims values to initial states."""
         # Don't reset axis labels
-        # TODO: could be optimized with self.update, but need to fix
-        #       event firing in EventedModel first
-        self.range = ((0, 2, 1),) * self.ndim
-        self.point = (0,) * self.ndim
-        self.order = tuple(range(self.ndim))
-        self.margin_left = (0,) * self.ndim
-        self.margin_right = (0,) * self.ndim
-        self.rollable = (True,) * self.ndim
+        with self.batched_update():
+            self.range = ((0, 2, 1),) * self.ndim
+            self.point = (0,) * self.ndim
+            self.order = tuple(range(self.ndim))
+            self.margin_left = (0,) * self.ndim
+            self.margin_right = (0,) * self.ndim
+            self.rollable = (True,) * self.ndim
 
     def transpose(self):
         """Transpose displayed dimensions.
@@ -2,7 +2,7 @@
 
 import logging
 from multiprocessing.managers import SharedMemoryManager
-from queue import Empty, Queue
+from queue import Empty, Full, Queue
 from threading import Event
 from typing import ClassVar, NamedTuple
 
@@ -17,6 +17,10 @@ AUTH_KEY = 'napari'
 # port to the client in its NAPARI_MON_CLIENT variable.
 SERVER_PORT = 0
 
+# The number of messages napari queues for each client. Further messages are
+# dropped until the client reads them.
+CLIENT_QUEUE_SIZE = 1000
+
 
 class NapariRemoteAPI(NamedTuple):
     """Napari exposes these shared resources."""
@@ -65,6 +69,10 @@ class MonitorApi:
     client_messages : Queue
         Client puts messages in here for napari to read, such as commands.
 
+    client_queue(client_id) : Queue
+        Napari puts the messages for one client in here, such as the replies
+        to its commands, so that clients don't read each other's messages.
+
     Notes
     -----
     The SharedMemoryManager provides the same proxy objects as SyncManager
@@ -87,6 +95,7 @@ class MonitorApi:
 
     _client_data_dict: ClassVar[dict] = {}
     _client_messages_queue: ClassVar[Queue] = Queue()
+    _client_queues: ClassVar[dict[str, Queue]] = {}
 
     @staticmethod
     def _napari_data() -> Queue:
@@ -108,6 +117,13 @@ class MonitorApi:
     def _client_messages() -> Queue:
         return MonitorApi._client_messages_queue
 
+    @staticmethod
+    def _client_queue(client_id: str) -> Queue:
+        queues = MonitorApi._client_queues
+        if client_id not in queues:
+            queues[client_id] = Queue(maxsize=CLIENT_QUEUE_SIZE)
+        return queues[client_id]
+
     def __init__(self) -> None:
         # RemoteCommands listens to our run_command event. It executes
         # commands from the clients.
@@ -127,6 +143,9 @@ class MonitorApi:
         SharedMemoryManager.register(
             'client_messages', callable=self._client_messages
         )
+        SharedMemoryManager.register(
+            'client_queue', callable=self._client_queue
+        )
 
         # Start our shared memory server.
         self._manager = SharedMemoryManager(
@@ -143,6 +162,8 @@ class MonitorApi:
             self._manager.client_data(),
             self._manager.client_messages(),
         )
+        # The queues of the clients napari sent messages to.
+        self._client_queues: dict[str, Queue] = {}
 
     @property
     def manager(self) -> SharedMemoryManager:
@@ -214,3 +235,35 @@ class MonitorApi:
             Message to send to clients.
         """
         self._remote.napari_messages.put(message)
+
+    def send_client_message(self, client_id: str, message: dict) -> None:
+        """Send a message to one shared memory client.
+
+        Parameters
+        ----------
+        client_id : str
+            The id of the client, which it sends with its commands.
+        message : dict
+            Message to send to the client.
+        """
+        if client_id not in self._client_queues:
+            self._client_queues[client_id] = self._manager.client_queue(
+                client_id
+            )
+        try:
+            self._client_queues[client_id].put_nowait(message)
+        except Full:
+            LOGGER.warning(
+                'Dropped a message to client %s, which does not read them',
+                client_id,
+            )
+
+    def remove_client(self, client_id: str) -> None:
+        """Stop sending messages to a client.
+
+        Parameters
+        ----------
+        client_id : str
+            The id of the client.
+        """
+        self._client_queues.pop(client_id, None)
@@ -144,9 +144,22 @@ class Monitor:
         """The MonitorAPI fires this event for commands from clients."""
         return self._api.events.run_command
 
-    def start(self) -> bool:
+    @property
+    def address(self) -> tuple[str, int] | None:
+        """The (host, port) address clients connect to, if running."""
+        if not self._running:
+            return None
+        return self._api.manager.address
+
+    def start(self, config: dict | None = None) -> bool:
         """Start the monitor service, if it hasn't been started already.
 
+        Parameters
+        ----------
+        config : dict, optional
+            The monitor configuration, in the format of the NAPARI_MON
+            config file. By default, the file NAPARI_MON points to is loaded.
+
         Returns
         -------
         bool
@@ -155,7 +168,8 @@ class Monitor:
         if self._running:
             return True  # It was already started.
 
-        config = _get_monitor_config()
+        if config is None:
+            config = _get_monitor_config()
 
         if config is None:
             return False  # Can't start without config.
@@ -229,5 +243,23 @@ class Monitor:
         if self._running:
             self._api.send_napari_message(message)
 
+    def send_client_message(self, client_id: str, message: dict) -> None:
+        """Send a message to one shared memory client.
+
+        Parameters
+        ----------
+        client_id : str
+            The id of the client.
+        message : dict
+            Post this message to the client.
+        """
+        if self._running:
+            self._api.send_client_message(client_id, message)
+
+    def remove_client(self, client_id: str) -> None:
+        """Stop sending messages to a client, once it disconnected."""
+        if self._running:
+            self._api.remove_client(client_id)
+
 
 monitor = Monitor()
@@ -87,10 +87,15 @@ The client can access data['tiled_image_layer']. Clients should be
 resilient to missing data. Nn case the napari version is different than
 expected, or is just not producing that data for some reason.
 
-Future Work
------------
-We plan to investigate the use of numpy shared memory buffers for bulk
-binary data. Possibly using recarray to organized things.
+Passing Layer Data
+------------------
+`napari.components.experimental.remote.RemoteClient` implements a client,
+which adds layers whose data is in shared memory, without copying it:
+
+    client = RemoteClient.from_env()
+    layer = client.add_image(data)
+    layer.data[0] = 42  # napari maps the same memory
+    layer.refresh()
 """
 
 import copy
@@ -163,13 +168,13 @@ class MonitorService:
         server_port = self._manager.address[1]
         LOGGER.info('Listening on port %s', server_port)
 
-        num_clients = len(self._config['clients'])
+        num_clients = len(self._config.get('clients', []))
         LOGGER.info('Starting %d clients...', num_clients)
 
         env = _create_client_env(server_port)
 
         # Start every client.
-        for args in self._config['clients']:
+        for args in self._config.get('clients', []):
             LOGGER.info('Starting client %s', args)
 
             # Use Popen to run and not wait for the process to finish.
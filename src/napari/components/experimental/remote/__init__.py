@@ -1,3 +1,8 @@
+from napari.components.experimental.remote._client import (
+    RemoteClient,
+    RemoteError,
+    RemoteLayer,
+)
 from napari.components.experimental.remote._manager import RemoteManager
 
-__all__ = ['RemoteManager']
+__all__ = ['RemoteClient', 'RemoteError', 'RemoteLayer', 'RemoteManager']
@@ -0,0 +1,364 @@
+"""RemoteClient class.
+
+A client which controls napari from another process, through the monitor.
+napari must run with the monitor enabled, see the MonitorService, which
+starts the clients listed in its config, or which clients connect to with
+the port napari listens on.
+"""
+
+from __future__ import annotations
+
+import base64
+import contextlib
+import itertools
+import json
+import os
+import time
+import uuid
+from collections import deque
+from multiprocessing.managers import BaseManager
+from queue import Empty
+from typing import TYPE_CHECKING, Any, Self
+
+import numpy as np
+
+from napari.components.experimental.monitor._api import AUTH_KEY
+from napari.utils._shared_memory import attach_shared_array, share_array
+
+if TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory
+
+    import numpy.typing as npt
+
+# The shared resources napari exposes, see NapariRemoteAPI.
+NAPARI_RESOURCES = (
+    'napari_data',
+    'napari_messages',
+    'napari_shutdown',
+    'client_data',
+    'client_messages',
+    'client_queue',
+)
+
+# The default time to wait for napari to run a command, in seconds.
+DEFAULT_TIMEOUT = 30.0
+
+
+class RemoteError(RuntimeError):
+    """A command failed in napari."""
+
+
+class _ClientManager(BaseManager):
+    """Connects to the shared resources of napari."""
+
+
+for _name in NAPARI_RESOURCES:
+    _ClientManager.register(_name)
+
+
+class RemoteLayer:
+    """A layer of napari whose data is in shared memory.
+
+    Parameters
+    ----------
+    client : RemoteClient
+        The client which added the layer.
+    name : str
+        The name of the layer in napari.
+    data : np.ndarray
+        The data of the layer, in shared memory: napari sees changes to it
+        once the layer is refreshed.
+    """
+
+    def __init__(
+        self, client: RemoteClient, name: str, data: np.ndarray
+    ) -> None:
+        self.client = client
+        self.name = name
+        self.data = data
+
+    def refresh(self) -> None:
+        """Refresh the layer in napari, once its data changed."""
+        self.client.refresh(self.name)
+
+    def __repr__(self) -> str:
+        return f'RemoteLayer({self.name!r}, shape={self.data.shape}, dtype={self.data.dtype})'
+
+
+class RemoteClient:
+    """Controls napari from another process.
+
+    Layer data is passed to napari in shared memory, which napari maps
+    without copying it: it stays in the memory of the client, which must
+    call close() once napari doesn't need it anymore. The client can
+    subscribe to events of the viewer, and fetch screenshots.
+
+    napari runs the commands of clients when it polls them, about 60 times
+    per second. Commands which return a result, such as add_image, wait for
+    napari to run them, and raise a TimeoutError if it doesn't.
+
+    Each client has its own queue of messages from napari: the replies to
+    its commands and the events it subscribed to. A client should only be
+    used by one thread at once.
+
+    Parameters
+    ----------
+    port : int
+        The port napari listens on.
+    host : str
+        The host napari runs on, which must share memory with the client.
+
+    Examples
+    --------
+    >>> client = RemoteClient.from_env()  # doctest: +SKIP
+    >>> layer = client.add_image(np.zeros((512, 512)), name='live')  # doctest: +SKIP
+    >>> layer.data[:256] = 1  # doctest: +SKIP
+    >>> layer.refresh()  # doctest: +SKIP
+    >>> client.close()  # doctest: +SKIP
+    """
+
+    def __init__(self, port: int, host: str = '127.0.0.1') -> None:
+        self._manager = _ClientManager(
+            address=(host, port), authkey=str.encode(AUTH_KEY)
+        )
+        self._manager.connect()
+        # The id napari sends the messages for this client with.
+        self.client_id = uuid.uuid4().hex
+        self._napari_data = self._manager.napari_data()  # type: ignore[attr-defined]
+        self._messages = self._manager.client_queue(self.client_id)  # type: ignore[attr-defined]
+        self._client_messages = self._manager.client_messages()  # type: ignore[attr-defined]
+
+        self._request_ids = itertools.count(1)
+        self._replies: dict[int, dict] = {}
+        self._events: deque[dict] = deque()
+        # The shared memory of the layers, which the client owns.
+        self._shared: list[SharedMemory] = []
+
+    @classmethod
+    def from_env(cls) -> RemoteClient:
+        """Connect to the napari which started this client.
+
+        napari gives the clients it starts its port in their
+        NAPARI_MON_CLIENT variable.
+        """
+        env_str = os.getenv('NAPARI_MON_CLIENT')
+        if env_str is None:
+            raise RuntimeError('NAPARI_MON_CLIENT is not set')
+        config = json.loads(base64.b64decode(env_str.encode('ascii')))
+        return cls(int(config['server_port']))
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def send(self, command: str, args: dict | None = None) -> None:
+        """Send a command to napari, without waiting for it to run.
+
+        Parameters
+        ----------
+        command : str
+            The name of the command, see RemoteCommands.
+        args : dict, optional
+            The arguments of the command.
+        """
+        self._client_messages.put(
+            {command: {**(args or {}), 'client_id': self.client_id}}
+        )
+
+    def call(
+        self,
+        command: str,
+        args: dict | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> Any:
+        """Run a command in napari, and return its result.
+
+        Parameters
+        ----------
+        command : str
+            The name of the command, see RemoteCommands.
+        args : dict, optional
+            The arguments of the command.
+        timeout : float
+            The maximum time to wait for the command to run, in seconds.
+
+        Raises
+        ------
+        RemoteError
+            If the command failed.
+        TimeoutError
+            If napari didn't run the command in time.
+        """
+        request_id = next(self._request_ids)
+        self.send(command, {**(args or {}), 'request_id': request_id})
+        deadline = time.monotonic() + timeout
+        while request_id not in self._replies:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f'napari did not run {command!r} within {timeout} s'
+                )
+            self._receive(remaining)
+        reply = self._replies.pop(request_id)
+        if 'error' in reply:
+            raise RemoteError(f'{command!r} failed: {reply["error"]}')
+        return reply['result']
+
+    def add_image(
+        self, data: npt.ArrayLike, timeout: float = DEFAULT_TIMEOUT, **kwargs
+    ) -> RemoteLayer:
+        """Add an image layer, with its data in shared memory.
+
+        Parameters
+        ----------
+        data : array-like
+            The data of the layer, copied once into shared memory.
+        timeout : float
+            The maximum time to wait for napari to add the layer, in seconds.
+        **kwargs
+            The arguments of ``viewer.add_image``, which must be pickleable.
+
+        Returns
+        -------
+        RemoteLayer
+            The layer, whose data is in shared memory.
+        """
+        return self._add_layer('image', data, timeout, kwargs)
+
+    def add_labels(
+        self, data: npt.ArrayLike, timeout: float = DEFAULT_TIMEOUT, **kwargs
+    ) -> RemoteLayer:
+        """Add a labels layer, with its data in shared memory.
+
+        See add_image for the parameters.
+        """
+        return self._add_layer('labels', data, timeout, kwargs)
+
+    def add_points(
+        self, data: npt.ArrayLike, timeout: float = DEFAULT_TIMEOUT, **kwargs
+    ) -> RemoteLayer:
+        """Add a points layer, with its coordinates in shared memory.
+
+        See add_image for the parameters. Points added or removed in napari
+        are not shared anymore.
+        """
+        return self._add_layer('points', data, timeout, kwargs)
+
+    def _add_layer(
+        self,
+        layer_type: str,
+        data: npt.ArrayLike,
+        timeout: float,
+        kwargs: dict,
+    ) -> RemoteLayer:
+        array, shm, info = share_array(data)
+        try:
+            name = self.call(
+                'add_layer',
+                {'layer_type': layer_type, 'data': info, 'kwargs': kwargs},
+                timeout=timeout,
+            )
+        except BaseException:
+            del array
+            shm.close()
+            shm.unlink()
+            raise
+        self._shared.append(shm)
+        return RemoteLayer(self, name, array)
+
+    def refresh(self, name: str) -> None:
+        """Refresh a layer in napari, once its data changed."""
+        self.send('refresh_layer', {'name': name})
+
+    def remove_layer(
+        self, name: str, timeout: float = DEFAULT_TIMEOUT
+    ) -> None:
+        """Remove a layer from napari."""
+        self.call('remove_layer', {'name': name}, timeout=timeout)
+
+    def subscribe(self, *event_types: str) -> None:
+        """Subscribe to events of the viewer, see get_event.
+
+        Parameters
+        ----------
+        *event_types : str
+            The events: 'camera', 'dims' or 'layers'.
+        """
+        self.send('subscribe', {'events': list(event_types)})
+
+    def unsubscribe(self, *event_types: str) -> None:
+        """Unsubscribe from events of the viewer."""
+        self.send('unsubscribe', {'events': list(event_types)})
+
+    def get_event(self, timeout: float | None = None) -> dict | None:
+        """Return the next event of the viewer.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum time to wait for an event, in seconds. By default,
+            wait until there is one.
+
+        Returns
+        -------
+        dict or None
+            The event, as ``{'type': 'dims', 'value': {...}}``, or None if
+            there was none in time.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._events:
+            remaining = (
+                None if deadline is None else deadline - time.monotonic()
+            )
+            if remaining is not None and remaining <= 0:
+                return None
+            self._receive(remaining)
+        return self._events.popleft()
+
+    def layers(self) -> dict[str, dict]:
+        """The layers of the viewer, as of the last time napari polled."""
+        return self._napari_data.get('poll', {}).get('layers', {})
+
+    def screenshot(self, timeout: float = DEFAULT_TIMEOUT) -> np.ndarray:
+        """Return a screenshot of the canvas of the viewer.
+
+        Returns
+        -------
+        np.ndarray
+            The RGBA screenshot, of shape (h, w, 4).
+        """
+        info = self.call('screenshot', timeout=timeout)
+        try:
+            return np.array(attach_shared_array(info))
+        finally:
+            self.send('release', {'name': info['name']})
+
+    def close(self) -> None:
+        """Disconnect, and unlink the shared memory of the layers.
+
+        napari keeps the data of the layers, until they are removed.
+        """
+        # napari may have exited already
+        with contextlib.suppress(OSError, EOFError):
+            self.send('disconnect')
+        while self._shared:
+            shm = self._shared.pop()
+            shm.unlink()
+            # the arrays of the layers may still use the memory, which is
+            # then unmapped once they are garbage collected
+            with contextlib.suppress(BufferError):
+                shm.close()
+
+    def _receive(self, timeout: float | None) -> None:
+        """Receive one message from napari, if one comes in time."""
+        try:
+            message = self._messages.get(timeout=timeout)
+        except Empty:
+            return
+        if 'reply' in message:
+            reply = message['reply']
+            self._replies[reply['request_id']] = reply
+        elif 'event' in message:
+            self._events.append(message['event'])
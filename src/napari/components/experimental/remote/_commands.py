@@ -1,12 +1,31 @@
 """RemoteCommands class."""
 
+from __future__ import annotations
+
 import json
 import logging
+from typing import TYPE_CHECKING, ClassVar
+
+from napari.components.experimental.monitor import monitor
+from napari.utils._shared_memory import attach_shared_array, share_array
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from multiprocessing.shared_memory import SharedMemory
 
-from napari.components.layerlist import LayerList
+    import numpy as np
+
+    from napari.components.experimental.remote._messages import (
+        RemoteMessages,
+    )
+    from napari.components.viewer_model import ViewerModel
+    from napari.utils._shared_memory import SharedArrayInfo
 
 LOGGER = logging.getLogger('napari.monitor')
 
+# The layer types whose data clients can share.
+LAYER_TYPES = ('image', 'labels', 'points')
+
 
 class RemoteCommands:
     """Commands that a remote client can call.
@@ -22,10 +41,25 @@ class RemoteCommands:
     Layer or LayerList. If they did it would create circular dependencies
     because people need to be able to import the monitor from anywhere.
 
+    Clients send their "client_id" in the arguments of every command. If
+    the arguments also include a "request_id", the result of the command is
+    sent back to the client in a reply message:
+
+        {"reply": {"request_id": 3, "result": "my image"}}
+
+    or, if the command failed:
+
+        {"reply": {"request_id": 3, "error": "KeyError: 'my image'"}}
+
     Parameters
     ----------
-    layers : LayerList
-        The viewer's layers, so we can call into them.
+    viewer : ViewerModel
+        The viewer, so we can call into it.
+    messages : RemoteMessages
+        Sends messages to clients, which they subscribe to.
+    screenshot : callable, optional
+        Returns a screenshot of the canvas, as an RGBA array. Without it,
+        the screenshot command fails.
 
     Notes
     -----
@@ -35,8 +69,29 @@ class RemoteCommands:
     commands, command implementations should be spread out all over the system.
     """
 
-    def __init__(self, layers: LayerList) -> None:
-        self.layers = layers
+    # The methods clients can call.
+    COMMANDS: ClassVar[tuple[str, ...]] = (
+        'add_layer',
+        'refresh_layer',
+        'remove_layer',
+        'subscribe',
+        'unsubscribe',
+        'screenshot',
+        'release',
+        'disconnect',
+    )
+
+    def __init__(
+        self,
+        viewer: ViewerModel,
+        messages: RemoteMessages,
+        screenshot: Callable[[], np.ndarray] | None = None,
+    ) -> None:
+        self.viewer = viewer
+        self._messages = messages
+        self._screenshot = screenshot
+        # Shared memory napari created for clients, until they release it.
+        self._shared: dict[str, SharedMemory] = {}
 
     def process_command(self, event) -> None:
         """Process this one command from the remote client.
@@ -47,19 +102,131 @@ class RemoteCommands:
             The remote command.
         """
         command = event.command
-        LOGGER.info('RemoveCommands._process_command: %s', json.dumps(command))
+        LOGGER.info('RemoteCommands._process_command: %s', json.dumps(command))
 
         # Every top-level key in in the command should be a method
-        # in this RemoveCommands class.
+        # in this RemoteCommands class.
         #
         #     { "set_grid": True }
         #
         # Then we would call self.set_grid(True)
         #
         for name, args in command.items():
+            if name not in self.COMMANDS:
+                LOGGER.error('RemoteCommands.%s does not exist.', name)
+                continue
+            request_id, client_id = (
+                (args.get('request_id'), args.get('client_id'))
+                if isinstance(args, dict)
+                else (None, None)
+            )
+            LOGGER.info('Calling RemoteCommands.%s(%s)', name, args)
             try:
-                method = getattr(self, name)
-                LOGGER.info('Calling RemoteCommands.%s(%s)', name, args)
-                method(args)
-            except AttributeError:
-                LOGGER.exception('RemoteCommands.%s does not exist.', name)
+                reply = {'result': getattr(self, name)(args)}
+            except Exception as e:
+                LOGGER.exception('RemoteCommands.%s failed.', name)
+                reply = {'error': f'{type(e).__name__}: {e}'}
+            if request_id is not None and client_id is not None:
+                monitor.send_client_message(
+                    client_id, {'reply': {'request_id': request_id, **reply}}
+                )
+
+    def add_layer(self, args: dict) -> str:
+        """Add a layer whose data is in shared memory.
+
+        The data is not copied: changes the client makes to it are seen by
+        napari once the client calls refresh_layer.
+
+            {
+                "add_layer": {
+                    "layer_type": "image",
+                    "data": {"name": "psm_1234", "shape": [512, 512], ...},
+                    "kwargs": {"name": "my image", "colormap": "magma"},
+                }
+            }
+
+        Returns
+        -------
+        str
+            The name of the new layer.
+        """
+        layer_type = args['layer_type']
+        if layer_type not in LAYER_TYPES:
+            raise ValueError(
+                f'Cannot add a {layer_type!r} layer, the layer types are {LAYER_TYPES}'
+            )
+        data = attach_shared_array(args['data'])
+        add_layer = getattr(self.viewer, f'add_{layer_type}')
+        return add_layer(data, **args.get('kwargs', {})).name
+
+    def refresh_layer(self, args: dict) -> None:
+        """Refresh a layer, once its data changed.
+
+        {"refresh_layer": {"name": "my image"}}
+        """
+        self.viewer.layers[args['name']].refresh()
+
+    def remove_layer(self, args: dict) -> None:
+        """Remove a layer.
+
+        {"remove_layer": {"name": "my image"}}
+        """
+        self.viewer.layers.remove(self.viewer.layers[args['name']])
+
+    def subscribe(self, args: dict) -> None:
+        """Subscribe to events, see RemoteMessages.subscribe.
+
+        {"subscribe": {"events": ["camera", "dims"], "client_id": "5f0c..."}}
+        """
+        self._messages.subscribe(args['client_id'], args['events'])
+
+    def unsubscribe(self, args: dict) -> None:
+        """Unsubscribe from events.
+
+        {"unsubscribe": {"events": ["camera"], "client_id": "5f0c..."}}
+        """
+        self._messages.unsubscribe(args['client_id'], args['events'])
+
+    def screenshot(self, args: dict) -> SharedArrayInfo:
+        """Take a screenshot of the canvas, in shared memory.
+
+        The client must release the shared memory once it copied the
+        screenshot.
+
+            {"screenshot": {"request_id": 4}}
+
+        Returns
+        -------
+        SharedArrayInfo
+            The screenshot, in shared memory.
+        """
+        if self._screenshot is None:
+            raise RuntimeError('This viewer has no canvas to take screenshots')
+        shm, info = share_array(self._screenshot())[1:]
+        self._shared[shm.name] = shm
+        return info
+
+    def release(self, args: dict) -> None:
+        """Release shared memory napari created for a client.
+
+        {"release": {"name": "psm_1234"}}
+        """
+        _release(self._shared.pop(args['name']))
+
+    def disconnect(self, args: dict) -> None:
+        """Stop sending messages to a client, which disconnected.
+
+        {"disconnect": {"client_id": "5f0c..."}}
+        """
+        self._messages.remove_client(args['client_id'])
+        monitor.remove_client(args['client_id'])
+
+    def close(self) -> None:
+        """Release all the shared memory napari created for clients."""
+        while self._shared:
+            _release(self._shared.popitem()[1])
+
+
+def _release(shm: SharedMemory) -> None:
+    shm.close()
+    shm.unlink()
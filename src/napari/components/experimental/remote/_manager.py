@@ -1,11 +1,20 @@
 """RemoteManager class."""
 
+from __future__ import annotations
+
 import logging
+from typing import TYPE_CHECKING
 
 from napari.components.experimental.remote._commands import RemoteCommands
 from napari.components.experimental.remote._messages import RemoteMessages
-from napari.components.layerlist import LayerList
-from napari.utils.events import Event
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import numpy as np
+
+    from napari.components.viewer_model import ViewerModel
+    from napari.utils.events import Event
 
 LOGGER = logging.getLogger('napari.monitor')
 
@@ -23,13 +32,19 @@ class RemoteManager:
 
     Parameters
     ----------
-    layers : LayerList
-        The viewer's layers.
+    viewer : ViewerModel
+        The viewer.
+    screenshot : callable, optional
+        Returns a screenshot of the canvas, as an RGBA array.
     """
 
-    def __init__(self, layers: LayerList) -> None:
-        self._commands = RemoteCommands(layers)
-        self._messages = RemoteMessages(layers)
+    def __init__(
+        self,
+        viewer: ViewerModel,
+        screenshot: Callable[[], np.ndarray] | None = None,
+    ) -> None:
+        self._messages = RemoteMessages(viewer)
+        self._commands = RemoteCommands(viewer, self._messages, screenshot)
 
     def process_command(self, event: Event) -> None:
         """Process this command from a remote client.
@@ -44,3 +59,7 @@ class RemoteManager:
     def on_poll(self, _event: Event) -> None:
         """Send out messages when polled."""
         self._messages.on_poll()
+
+    def close(self) -> None:
+        """Release the shared memory created for clients."""
+        self._commands.close()
@@ -3,29 +3,107 @@
 Sends messages to remote clients.
 """
 
+from __future__ import annotations
+
 import logging
 import time
+from typing import TYPE_CHECKING
 
 from napari.components.experimental.monitor import monitor
-from napari.components.layerlist import LayerList
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from napari.components.viewer_model import ViewerModel
 
 LOGGER = logging.getLogger('napari.monitor')
 
+# The events clients can subscribe to.
+EVENT_TYPES = ('camera', 'dims', 'layers')
+
 
 class RemoteMessages:
     """Sends messages to remote clients.
 
+    Clients subscribe to events of the viewer: its "camera", its "dims",
+    which include the current slice, and its "layers", when layers are
+    added, removed or reordered. When subscribing, and then at most once
+    per frame if it changed, the state of the viewer is sent as an event
+    message:
+
+        {"event": {"type": "dims", "value": {"current_step": [3, 0, 0], ...}}}
+
+    Each client has its own subscriptions, and only receives the events it
+    subscribed to. The layers and the frame time are shared with all
+    clients in the napari data, which is replaced every frame.
+
     Parameters
     ----------
-    layers : LayerList
-        The viewer's layers, so we can call into them.
+    viewer : ViewerModel
+        The viewer, so we can call into it.
     """
 
-    def __init__(self, layers: LayerList) -> None:
-        self.layers = layers
+    def __init__(self, viewer: ViewerModel) -> None:
+        self.viewer = viewer
         self._frame_number = 0
         self._last_time: float | None = None
 
+        # The events each client subscribed to, by client id.
+        self._subscribed: dict[str, set[str]] = {}
+        self._changed: set[str] = set()
+        viewer.scene.camera.events.connect(self._on_camera)
+        viewer.dims.events.connect(self._on_dims)
+        viewer.layers.events.inserted.connect(self._on_layers)
+        viewer.layers.events.removed.connect(self._on_layers)
+        viewer.layers.events.reordered.connect(self._on_layers)
+
+    def subscribe(self, client_id: str, event_types: Iterable[str]) -> None:
+        """Subscribe a client to these events, and send their current state.
+
+        Parameters
+        ----------
+        client_id : str
+            The id of the client.
+        event_types : iterable of str
+            The events, from EVENT_TYPES.
+        """
+        event_types = set(event_types)
+        if unknown := event_types.difference(EVENT_TYPES):
+            raise ValueError(
+                f'Cannot subscribe to {sorted(unknown)}, the events are {EVENT_TYPES}'
+            )
+        # the changes are sent to the other clients, before the current state
+        # is sent to this one
+        self._send_events()
+        self._subscribed.setdefault(client_id, set()).update(event_types)
+        for event_type in sorted(event_types):
+            self._send_event(client_id, event_type, self._state(event_type))
+
+    def unsubscribe(self, client_id: str, event_types: Iterable[str]) -> None:
+        """Unsubscribe a client from these events.
+
+        Parameters
+        ----------
+        client_id : str
+            The id of the client.
+        event_types : iterable of str
+            The events, from EVENT_TYPES.
+        """
+        self._subscribed.get(client_id, set()).difference_update(event_types)
+
+    def remove_client(self, client_id: str) -> None:
+        """Unsubscribe a client which disconnected from all events."""
+        self._subscribed.pop(client_id, None)
+
+    def _on_camera(self, _event=None) -> None:
+        self._changed.add('camera')
+
+    def _on_dims(self, _event=None) -> None:
+        self._changed.add('dims')
+
+    def _on_layers(self, _event=None) -> None:
+        self._changed.add('layers')
+
     def on_poll(self) -> None:
         """Send messages to clients.
 
@@ -38,9 +116,10 @@ class RemoteMessages:
         {
             "poll": {
                 "layers": {
-                    13482484: {
-                        "tile_state": ...
-                        "tile_config": ...
+                    "my image": {
+                        "type": "image",
+                        "ndim": 3,
+                        "visible": True,
                     }
                 }
             }
@@ -48,19 +127,73 @@ class RemoteMessages:
         """
         self._frame_number += 1
 
-        layers: dict[int, dict] = {}
+        layers: dict[str, dict] = {
+            layer.name: {
+                'type': layer._type_string,
+                'ndim': layer.ndim,
+                'visible': layer.visible,
+            }
+            for layer in self.viewer.layers
+        }
 
         monitor.add_data({'poll': {'layers': layers}})
-        self._send_frame_time()
+        self._send_events()
+        self._add_frame_time()
+
+    def _send_events(self) -> None:
+        """Send the subscribed events which changed since last poll."""
+        changed = sorted(self._changed)
+        self._changed.clear()
+        for event_type in changed:
+            clients = [
+                client_id
+                for client_id, subscribed in self._subscribed.items()
+                if event_type in subscribed
+            ]
+            if not clients:
+                continue
+            state = self._state(event_type)
+            for client_id in clients:
+                self._send_event(client_id, event_type, state)
+
+    def _send_event(
+        self, client_id: str, event_type: str, state: dict | list
+    ) -> None:
+        """Send the state for this event type to a client."""
+        monitor.send_client_message(
+            client_id, {'event': {'type': event_type, 'value': state}}
+        )
 
-    def _send_frame_time(self) -> None:
-        """Send the frame time since last poll."""
+    def _state(self, event_type: str) -> dict | list:
+        """The current state for this event type, which can be pickled."""
+        if event_type == 'camera':
+            camera = self.viewer.scene.camera
+            return {
+                'center': [float(x) for x in camera.center],
+                'zoom': float(camera.zoom),
+                'angles': [float(x) for x in camera.angles],
+            }
+        if event_type == 'dims':
+            dims = self.viewer.dims
+            return {
+                'current_step': [int(x) for x in dims.current_step],
+                'point': [float(x) for x in dims.point],
+                'ndisplay': dims.ndisplay,
+                'order': [int(x) for x in dims.order],
+                'axis_labels': list(dims.axis_labels),
+            }
+        return [layer.name for layer in self.viewer.layers]
+
+    def _add_frame_time(self) -> None:
+        """Share the frame time since last poll.
+
+        It is shared in the napari data rather than sent as a message, so
+        that it doesn't pile up in a queue when no client reads it.
+        """
         now = time.time()
         last = self._last_time
         delta = now - last if last is not None else 0
         delta_ms = delta * 1000
 
-        monitor.send_message(
-            {'frame_time': {'time': now, 'delta_ms': delta_ms}}
-        )
+        monitor.add_data({'frame_time': {'time': now, 'delta_ms': delta_ms}})
         self._last_time = now
@@ -4,9 +4,10 @@ import contextlib
 import itertools
 import typing
 import warnings
+import weakref
 from collections.abc import Iterable
-from functools import cached_property
-from typing import TYPE_CHECKING, Literal
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Literal, NamedTuple
 
 import numpy as np
 import pint
@@ -32,6 +33,30 @@ def get_name(layer: Layer) -> str:
     return layer.name
 
 
+class _CachedExtent(NamedTuple):
+    """World extent and step of a layer, converted to the units of a LayerList.
+
+    Attributes
+    ----------
+    version : int
+        The ``_extent_version`` of the layer when the extent was converted.
+    extent : Extent
+        The extent of the layer which was converted.
+    units : tuple of pint.Unit or None
+        The units the extent was converted to, or None if not converted.
+    world : (2, D) array
+        The extent in world coordinates, in ``units``.
+    step : (D,) array
+        The step in world coordinates, in ``units``.
+    """
+
+    version: int
+    extent: Extent
+    units: tuple[pint.Unit, ...] | None
+    world: np.ndarray
+    step: np.ndarray
+
+
 class LayerList(SelectableEventedList[Layer]):
     """List-like layer collection with built-in reordering and callback hooks.
 
@@ -123,6 +148,17 @@ class LayerList(SelectableEventedList[Layer]):
 
     def __init__(self, data=()) -> None:
         self._units = None
+        # Converted extents of layers, which are only converted again when
+        # their extent changed, see _layer_extents.
+        self._cached_extents: weakref.WeakKeyDictionary[
+            Layer, _CachedExtent
+        ] = weakref.WeakKeyDictionary()
+        self._cached_extents_augmented: weakref.WeakKeyDictionary[
+            Layer, _CachedExtent
+        ] = weakref.WeakKeyDictionary()
+        self._cached_units: (
+            tuple[tuple, tuple[pint.Unit, ...] | None] | None
+        ) = None
         super().__init__(
             data=data,
             basetype=Layer,
@@ -316,9 +352,7 @@ class LayerList(SelectableEventedList[Layer]):
         -------
         extent_world : array, shape (2, D)
         """
-        return self._get_extent_world(
-            [layer.extent for layer in self], units=self.units
-        )
+        return self._get_extent_world(list(self), units=self.units)
 
     @cached_property
     def _extent_world_augmented(
@@ -334,9 +368,7 @@ class LayerList(SelectableEventedList[Layer]):
         extent_world : array, shape (2, D)
         """
         return self._get_extent_world(
-            [layer._extent_augmented for layer in self],
-            augmented=True,
-            units=self.units,
+            list(self), augmented=True, units=self.units
         )
 
     def _get_min_and_max(self, mins_list, maxes_list):
@@ -373,7 +405,7 @@ class LayerList(SelectableEventedList[Layer]):
 
     def _get_extent_world(
         self,
-        layer_extent_list,
+        layers: list[Layer],
         augmented: bool = False,
         units: tuple[pint.Unit, ...] | None = None,
     ) -> np.ndarray[tuple[Literal[2], int], np.dtype[np.float32]]:
@@ -386,7 +418,7 @@ class LayerList(SelectableEventedList[Layer]):
         -------
         extent_world : array, shape (2, D)
         """
-        if len(self) == 0:
+        if len(layers) == 0:
             min_v = np.zeros(self.ndim)
             max_v = np.full(self.ndim, 511.0)
             # image-like augmented extent is actually expanded by 0.5
@@ -394,15 +426,10 @@ class LayerList(SelectableEventedList[Layer]):
                 min_v -= 0.5
                 max_v += 0.5
         else:
-            if units is None:
-                extrema = [extent.world for extent in layer_extent_list]
-            else:
-                extrema = [
-                    self._convert_scale_between_units(
-                        extent.world.T, extent.units, units
-                    ).T
-                    for extent in layer_extent_list
-                ]
+            extrema = [
+                cached.world
+                for cached in self._layer_extents(layers, units, augmented)
+            ]
             mins = [e[0] for e in extrema]
             maxs = [e[1] for e in extrema]
             min_v, max_v = self._get_min_and_max(mins, maxs)
@@ -421,7 +448,7 @@ class LayerList(SelectableEventedList[Layer]):
         -------
         step_size : array, shape (D,)
         """
-        return self._get_step_size([layer.extent for layer in self])
+        return self._get_step_size(list(self))
 
     def _step_size_from_scales(self, scales):
         # Reverse order so last axes of scale with different ndim are aligned
@@ -454,32 +481,89 @@ class LayerList(SelectableEventedList[Layer]):
         np.ndarray
             Converted scale.
         """
-        clipped_target_units = to_units[-len(from_units) :]
+        clipped_target_units = tuple(to_units[-len(from_units) :])
+        if tuple(from_units) == clipped_target_units:
+            return np.asarray(scale, dtype=float)
         return np.array(
             [
-                (s * u).to(cu).magnitude
+                s * _unit_factor(u, cu)
                 for s, u, cu in zip(
                     scale, from_units, clipped_target_units, strict=False
                 )
             ]
         )
 
+    def _layer_extents(
+        self,
+        layers: Iterable[Layer],
+        units: tuple[pint.Unit, ...] | None,
+        augmented: bool = False,
+    ) -> list[_CachedExtent]:
+        """World extents and steps of layers, converted to units.
+
+        The converted extent of each layer is cached with the
+        ``_extent_version`` of the layer. The extent of a layer is only
+        converted again if the layer cleared its extent, and it changed.
+
+        Parameters
+        ----------
+        layers : iterable of Layer
+            The layers.
+        units : tuple of pint.Unit, optional
+            The units to convert to. If None, extents are not converted.
+        augmented : bool
+            Whether to use the augmented extents of the layers.
+
+        Returns
+        -------
+        list of _CachedExtent
+            The converted extent of each layer.
+        """
+        cache = (
+            self._cached_extents_augmented
+            if augmented
+            else self._cached_extents
+        )
+        extents = []
+        for layer in layers:
+            cached = cache.get(layer)
+            version = layer._extent_version
+            if cached is None or cached.units != units:
+                cached = None
+            elif cached.version == version:
+                extents.append(cached)
+                continue
+            extent = layer._extent_augmented if augmented else layer.extent
+            if cached is not None and _same_extent(cached.extent, extent):
+                cached = cached._replace(version=version, extent=extent)
+            elif units is None:
+                cached = _CachedExtent(
+                    version, extent, units, extent.world, extent.step
+                )
+            else:
+                cached = _CachedExtent(
+                    version,
+                    extent,
+                    units,
+                    self._convert_scale_between_units(
+                        extent.world.T, extent.units, units
+                    ).T,
+                    self._convert_scale_between_units(
+                        extent.step, extent.units, units
+                    ),
+                )
+            cache[layer] = cached
+            extents.append(cached)
+        return extents
+
     def _get_step_size(
         self,
-        layer_extent_list: list[Extent],
+        layers: list[Layer],
         units: tuple[pint.Unit, ...] | None = None,
     ):
-        if len(layer_extent_list) == 0:
+        if len(layers) == 0:
             return np.ones(self.ndim)
-        if units is None:
-            scales = [extent.step for extent in layer_extent_list]
-        else:
-            scales = [
-                self._convert_scale_between_units(
-                    extent.step, extent.units, units
-                )
-                for extent in layer_extent_list
-            ]
+        scales = [cached.step for cached in self._layer_extents(layers, units)]
         return self._step_size_from_scales(scales)
 
     def get_extent(self, layers: Iterable[Layer]) -> LayerListExtent:
@@ -500,15 +584,26 @@ class LayerList(SelectableEventedList[Layer]):
         extent : LayerListExtent
             extent for selected layers
         """
-        extent_list = [layer.extent for layer in layers]
-        units = self._units or self._get_units(extent_list)
+        layers = list(layers)
+        units = self._units or self._get_units_cached(
+            [layer.extent for layer in layers]
+        )
         return LayerListExtent(
             data=None,
-            world=self._get_extent_world(extent_list, units=units),
-            step=self._get_step_size(extent_list, units=units),
+            world=self._get_extent_world(layers, units=units),
+            step=self._get_step_size(layers, units=units),
             units=units,
         )
 
+    def _get_units_cached(
+        self, layers_extent: list[Extent]
+    ) -> tuple[pint.Unit, ...] | None:
+        """Like `_get_units`, cached while the units of the layers don't change."""
+        key = tuple(extent.units for extent in layers_extent)
+        if self._cached_units is None or self._cached_units[0] != key:
+            self._cached_units = (key, self._get_units(layers_extent))
+        return self._cached_units[1]
+
     @staticmethod
     def _get_units(
         layers_extent: list[Extent],
@@ -779,6 +874,21 @@ class LayerList(SelectableEventedList[Layer]):
             self.events.end_batch()
 
 
+def _same_extent(extent: Extent, other: Extent) -> bool:
+    """Whether two extents of a layer have the same world extent, step and units."""
+    return (
+        extent.units == other.units
+        and np.array_equal(extent.world, other.world, equal_nan=True)
+        and np.array_equal(extent.step, other.step)
+    )
+
+
+@lru_cache
+def _unit_factor(from_unit: pint.Unit, to_unit: pint.Unit) -> float:
+    """The factor to convert values from a unit to another one."""
+    return (1 * from_unit).to(to_unit).magnitude
+
+
 def cmp(u1: pint.Unit, u2: pint.Unit, registry: pint.UnitRegistry) -> bool:
     """
     Compare two units using pint register
@@ -6,11 +6,13 @@ import logging
 import os
 import warnings
 from collections.abc import (
+    Callable,
     Iterator,
     Mapping,
     MutableMapping,
     Sequence,
 )
+from contextlib import AbstractContextManager
 from functools import lru_cache
 from pathlib import Path
 from typing import (
@@ -118,6 +120,11 @@ EXCLUDE_DICT = {
     'mouse_wheel_callbacks',
 }
 EXCLUDE_JSON = EXCLUDE_DICT.union({'layers', 'active_layer'})
+# Dims fields whose changes require the layers to be re-sliced. ndisplay and
+# order are connected separately, as other callbacks depend on their order.
+_DIMS_SLICE_FIELDS = frozenset(
+    {'point', 'current_step', 'margin_left', 'margin_right'}
+)
 Dict = dict  # rename, because ViewerModel has method dict
 
 __all__ = ['ViewerModel', 'valid_add_kwargs']
@@ -130,6 +137,10 @@ def _current_theme() -> str:
     return get_settings().appearance.theme
 
 
+def _never_stale() -> bool:
+    return False
+
+
 def _validate_paths_exist(paths: list[PathLike]) -> None:
     """Raise FileNotFoundError if any local (non-URL) path does not exist."""
     for p in paths:
@@ -208,6 +219,10 @@ class ViewerModel(KeymapProvider, MousemapProviderPydantic, EventedModel):
     _layer_list_scroll_progress: float = 0
     # True if any layer had custom axis labels the last time layers changed
     _layers_had_custom_axis_labels: bool = PrivateAttr(default=False)
+    # dims batches opened by LayerList.batched_update, closed in LIFO order
+    _dims_batches: list[AbstractContextManager[None]] = PrivateAttr(
+        default_factory=list
+    )
 
     def __init__(
         self, title='napari', ndisplay=2, order=(), axis_labels=()
@@ -265,24 +280,26 @@ class ViewerModel(KeymapProvider, MousemapProviderPydantic, EventedModel):
         self.dims.events.ndisplay.connect(self._on_ndisplay_changed)
         self.dims.events.order.connect(self._update_layers)
         self.dims.events.order.connect(self.fit_to_view)
-        self.dims.events.point.connect(self._update_layers)
-        # FIXME: the next line is a temporary workaround. With #5522 and #5751 Dims.point became
-        #        the source of truth, and is now defined in world space. This exposed an existing
-        #        bug where if a field in Dims is modified by the root_validator, events won't
-        #        be fired for it. This won't happen for properties because we have dependency
-        #        checks. To fix this, we need dep checks for fields (psygnal!) and then we
-        #        can remove the following line. Note that because of this we fire double events,
-        #        but this should be ok because we have early returns when slices are unchanged.
-        self.dims.events.current_step.connect(self._update_layers)
+        # Changes to the slice position are handled through the single
+        # compound event of the dims model, so that setting e.g. point and
+        # margins together (or point, which also changes current_step)
+        # results in one slice request.
+        # NOTE: current_step is included because with #5522 and #5751
+        #       Dims.point became the source of truth, and fields modified by
+        #       the model validator do not emit events on their own.
+        self.dims.events.connect(self._on_dims_slice_change)
 
         # Track previous ndisplay for per-mode camera state caching.
         self._previous_ndisplay: int = self.dims.ndisplay
 
-        self.dims.events.margin_left.connect(self._update_layers)
-        self.dims.events.margin_right.connect(self._update_layers)
-        self.cursor.events.position.connect(self.update_status_from_cursor)
+        # the status can't be displayed faster than the canvas redraws
+        self.cursor.events.position.connect(
+            self.update_status_from_cursor, max_rate='frame'
+        )
         self.layers.events.inserted.connect(self._on_add_layer)
         self.layers.events.removed.connect(self._on_remove_layer)
+        self.layers.events.begin_batch.connect(self._on_layers_begin_batch)
+        self.layers.events.end_batch.connect(self._on_layers_end_batch)
         self.layers.events.reordered.connect(self._on_layers_change)
         self.layers.selection.events.active.connect(self._on_active_layer)
         self.layers.events.units.connect(self._on_layers_change)
@@ -473,29 +490,33 @@ class ViewerModel(KeymapProvider, MousemapProviderPydantic, EventedModel):
         # Get the scene parameters
         extent, scene_size, corner = self._get_scene_parameters()
 
-        self.scene.camera.center = self._calculate_view_center(
-            corner, scene_size
-        )
-
         scale_factor = self._get_scale_factor(margin)
 
-        # Set camera zoom based on ndisplay
-        # zoom is defined as the number of canvas pixels per world pixel
-        # The default value used below will zoom such that the whole field
-        # of view will occupy 95% of the canvas on the most filled axis
-        if np.max(scene_size) == 0:
-            # TODO: does this even ever happen?
-            self.scene.camera.zoom = scale_factor * np.min(self.canvas.size)
-
-        elif self.dims.ndisplay == 2:
-            self.scene.camera.zoom = self._get_2d_camera_zoom(
-                scene_size, scale_factor
+        # notify camera listeners once, after both center and zoom are set
+        with self.scene.camera.batched_update():
+            self.scene.camera.center = self._calculate_view_center(
+                corner, scene_size
             )
 
-        elif self.dims.ndisplay == 3:
-            self.scene.camera.zoom = self._get_3d_camera_zoom(
-                extent, scale_factor
-            )
+            # Set camera zoom based on ndisplay
+            # zoom is defined as the number of canvas pixels per world pixel
+            # The default value used below will zoom such that the whole field
+            # of view will occupy 95% of the canvas on the most filled axis
+            if np.max(scene_size) == 0:
+                # TODO: does this even ever happen?
+                self.scene.camera.zoom = scale_factor * np.min(
+                    self.canvas.size
+                )
+
+            elif self.dims.ndisplay == 2:
+                self.scene.camera.zoom = self._get_2d_camera_zoom(
+                    scene_size, scale_factor
+                )
+
+            elif self.dims.ndisplay == 3:
+                self.scene.camera.zoom = self._get_3d_camera_zoom(
+                    extent, scale_factor
+                )
 
         # Emit a reset view event, which is no longer used internally, but
         # which maybe useful for building on napari.
@@ -543,9 +564,10 @@ class ViewerModel(KeymapProvider, MousemapProviderPydantic, EventedModel):
         new_mode = self.dims.ndisplay
         cached = self.scene.camera._pop_cached_state(new_mode)
         if cached is not None:
-            self.scene.camera.center = cached.center
-            self.scene.camera.zoom = cached.zoom
-            self.scene.camera.angles = cached.angles
+            with self.scene.camera.batched_update():
+                self.scene.camera.center = cached.center
+                self.scene.camera.zoom = cached.zoom
+                self.scene.camera.angles = cached.angles
         else:
             # First time in this mode — use fit_to_view defaults
             self.fit_to_view()
@@ -727,6 +749,22 @@ class ViewerModel(KeymapProvider, MousemapProviderPydantic, EventedModel):
             layers=[event.layer], dims=self.dims, force=True
         )
 
+    def _on_dims_slice_change(self, event: Event) -> None:
+        """Update the layers once when the dims slice position changes."""
+        changes = getattr(event, 'changes', None)
+        if changes is None or not _DIMS_SLICE_FIELDS.isdisjoint(changes):
+            self._update_layers()
+
+    def _on_layers_begin_batch(self) -> None:
+        """Defer dims notifications until the layer list batch ends."""
+        self._dims_batches.append(self.dims.batched_update())
+        self._dims_batches[-1].__enter__()
+
+    def _on_layers_end_batch(self) -> None:
+        """Emit the dims changes accumulated during a layer list batch."""
+        if self._dims_batches:
+            self._dims_batches.pop().__exit__(None, None, None)
+
     def _update_layers(self, *, layers=None):
         """Updates the contained layers.
 
@@ -817,6 +855,32 @@ class ViewerModel(KeymapProvider, MousemapProviderPydantic, EventedModel):
                 list(self.cursor.position) + [0] * dim_diff
             )
 
+    def _on_layer_extent_change(self):
+        """Update the dims ranges when the extent of a layer grew.
+
+        Unlike ``_on_layers_change``, the dimensionality, units and axis
+        labels of the layers are unchanged, e.g. when frames are appended to
+        streaming data. Sliders which were at the last step of their axis
+        stay at the last step, to follow the frames as they are appended.
+        """
+        ranges = self.layers._ranges
+        dims = self.dims
+        if len(ranges) != dims.ndim:
+            self._on_layers_change()
+            return
+        if ranges == dims.range:
+            return
+        point = list(dims.point)
+        for axis in dims.not_displayed:
+            old, new = dims.range[axis], ranges[axis]
+            if new.stop > old.stop and dims.current_step[axis] == (
+                dims.nsteps[axis] - 1
+            ):
+                point[axis] = new.stop
+        with dims.batched_update():
+            dims.range = ranges
+            dims.point = tuple(point)
+
     def _update_mouse_pan(self, event):
         """Set the viewer interactive mouse panning"""
         if event.source is self.layers.selection.active:
@@ -841,9 +905,36 @@ class ViewerModel(KeymapProvider, MousemapProviderPydantic, EventedModel):
 
     def _calc_status_from_cursor(
         self,
+        is_stale: Callable[[], bool] | None = None,
     ) -> tuple[str | Dict, str] | None:
+        """Calculate the status and tooltip at the cursor position.
+
+        Values are read from the layers' current slices, so this does not
+        access the (possibly lazy) layer data. It may be called from the
+        status checker thread.
+
+        Parameters
+        ----------
+        is_stale : callable, optional
+            Called before each layer is queried. If it returns True, the
+            cursor has moved since the computation started and the
+            computation is abandoned.
+
+        Returns
+        -------
+        tuple or None
+            The status and the tooltip text, or None if the cursor is not
+            over the canvas or the computation was abandoned.
+        """
         if not self.mouse_over_canvas:
             return None
+        if is_stale is None:
+            is_stale = _never_stale
+        # snapshot the cursor so all layers are queried at the same position
+        # even if the cursor moves while the status is calculated
+        position = self.cursor.position
+        view_direction = self.cursor._view_direction
+        dims_displayed = list(self.dims.displayed)
         coord2val: dict[str, list[str]] = {}
         coord_str = ''
         status_str = ''
@@ -859,9 +950,9 @@ class ViewerModel(KeymapProvider, MousemapProviderPydantic, EventedModel):
             and active._slicing_state._loaded
         ):
             tooltip_text = active._get_tooltip_text(
-                np.asarray(self.cursor.position),
-                view_direction=self.cursor._view_direction,
-                dims_displayed=list(self.dims.displayed),
+                np.asarray(position),
+                view_direction=view_direction,
+                dims_displayed=dims_displayed,
                 world=True,
             )
 
@@ -872,10 +963,12 @@ class ViewerModel(KeymapProvider, MousemapProviderPydantic, EventedModel):
             and active._slicing_state._loaded
             and len(selection) < 2
         ):
+            if is_stale():
+                return None
             status = active.get_status(
-                self.cursor.position,
-                view_direction=self.cursor._view_direction,
-                dims_displayed=list(self.dims.displayed),
+                position,
+                view_direction=view_direction,
+                dims_displayed=dims_displayed,
                 world=True,
             )
             return status, tooltip_text
@@ -890,10 +983,12 @@ class ViewerModel(KeymapProvider, MousemapProviderPydantic, EventedModel):
                 or (layer not in selection and not self.canvas.grid.enabled)
             ):
                 continue
+            if is_stale():
+                return None
             status = layer.get_status(
-                self.cursor.position,
-                view_direction=self.cursor._view_direction,
-                dims_displayed=list(self.dims.displayed),
+                position,
+                view_direction=view_direction,
+                dims_displayed=dims_displayed,
                 world=True,
             )
             separator = '    '
@@ -963,6 +1058,7 @@ class ViewerModel(KeymapProvider, MousemapProviderPydantic, EventedModel):
         layer.events.cursor.connect(self._update_cursor)
         layer.events.cursor_size.connect(self._update_cursor_size)
         layer.events.data.connect(self._on_layers_change)
+        layer.events.extent.connect(self._on_layer_extent_change)
         layer.events.scale.connect(self._on_layers_change)
         layer.events.units.connect(self._on_layers_change)
         layer.events.translate.connect(self._on_layers_change)
@@ -1093,6 +1189,7 @@ class ViewerModel(KeymapProvider, MousemapProviderPydantic, EventedModel):
         rotate=None,
         scale=None,
         shear=None,
+        texture_precision='auto',
         translate=None,
         units=None,
         visible=True,
@@ -1181,14 +1278,15 @@ class ViewerModel(KeymapProvider, MousemapProviderPydantic, EventedModel):
             use automatic selection.
         metadata : dict or list of dict
             Layer metadata.
-        multiscale : bool
+        multiscale : bool or 'auto'
             Whether the data is a multiscale image or not. Multiscale data is
             represented by a list of array-like image data. If not specified by
             the user and if the data is a list of arrays that decrease in shape,
             then it will be taken to be multiscale. The first image in the list
             should be the largest. Please note multiscale rendering is only
             supported in 2D. In 3D, only the lowest resolution scale is
-            displayed.
+            displayed. If 'auto', a pyramid is built for large single-scale
+            images (see `Image`).
         name : str or list of str
             Name of the layer.
         opacity : float or list
@@ -1219,6 +1317,11 @@ class ViewerModel(KeymapProvider, MousemapProviderPydantic, EventedModel):
             Scale factors for the layer.
         shear : 1-D array or list.
             A vector of shear values for an upper triangular n-D shear matrix.
+        texture_precision : str or list of str
+            Precision of the textures that slices are displayed with. Must be
+            one of {'auto', 'uint16', 'uint8'}. With 'uint16' or 'uint8',
+            slices are quantized over the contrast limits range, to textures
+            two or four times smaller than float32 textures.
         translate : tuple of float or list of tuple of float
             Translation values for the layer.
         units : tuple of str or pint.Unit, optional
@@ -1274,6 +1377,7 @@ class ViewerModel(KeymapProvider, MousemapProviderPydantic, EventedModel):
             'experimental_clipping_planes': experimental_clipping_planes,
             'custom_interpolation_kernel_2d': custom_interpolation_kernel_2d,
             'projection_mode': projection_mode,
+            'texture_precision': texture_precision,
             'units': units,
         }
 
@@ -684,6 +684,30 @@ def _disable_notification_dismiss_timer(monkeypatch):
         monkeypatch.setattr(NapariQtNotification, 'slide_in', lambda x: None)
 
 
+@pytest.fixture(autouse=True)
+def _disable_numba_warmup(monkeypatch):
+    """Don't compile numba kernels in the background when viewers start.
+
+    Tests of colormaps reload the module of their numba kernels, which must
+    not happen while they are being compiled.
+    """
+    monkeypatch.setenv('NAPARI_NUMBA_WARMUP', '0')
+
+
+@pytest.fixture(autouse=True)
+def _disable_event_coalescing():
+    """Invoke rate limited event callbacks synchronously.
+
+    Callbacks connected with ``max_rate`` are otherwise delivered later from
+    a Qt timer, which would make assertions right after an event flaky and
+    could fire after the test (and its viewer) was torn down.
+    """
+    from napari.utils.events._coalescing import coalescing_disabled
+
+    with coalescing_disabled():
+        yield
+
+
 @pytest.fixture(autouse=True)
 def _prevent_thread(request, monkeypatch):
     if 'allow_animation_thread' in request.keywords:
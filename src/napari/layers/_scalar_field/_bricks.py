@@ -0,0 +1,257 @@
+"""Brick cache used to read multiscale data for display.
+
+Multiscale data is read in bricks (aligned to the storage chunks of each
+level, e.g. the compressed tiles of a slide scan) that are kept in a
+least-recently-used cache, whose size is bounded across all layers:
+
+* in 2D, the visible region of a level is read, so that panning only reads
+  the bricks that come into view;
+* in 3D, a whole resolution level is displayed at once. When
+  ``experimental.multiscale_volume_streaming`` is enabled, switching between
+  levels, time points or display modes doesn't read the same bricks again.
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from napari.utils.perf import slicing_stats
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterator, Sequence
+
+    from napari.types import ArrayLike
+
+#: Maximum size of the bricks cached by all layers, in bytes.
+BRICK_CACHE_BYTES = 512 * 2**20
+
+#: Maximum number of voxels of the level displayed in 3D when streaming.
+VOLUME_VOXEL_BUDGET = 2**27
+
+# Minimum brick length along the displayed axes. Bricks are made of whole
+# storage chunks of the data, if it has any.
+_MIN_BRICK_LENGTH = 256
+
+# The caches share `BRICK_CACHE_BYTES`: when it is exceeded, the least
+# recently used bricks of all caches are evicted. A single lock guards all
+# the caches, so that one can evict the bricks of another.
+_caches: weakref.WeakSet[_BrickCache] = weakref.WeakSet()
+_lock = threading.Lock()
+# orders the uses of bricks across caches
+_clock = itertools.count()
+
+
+class _BrickCache:
+    """Least-recently-used cache of bricks read from layer data.
+
+    All caches share `BRICK_CACHE_BYTES`: adding a brick evicts the least
+    recently used bricks of any cache. Bricks that are larger than the
+    budget are read but not cached.
+    """
+
+    def __init__(self) -> None:
+        self.nbytes = 0
+        # key -> (data reference, brick, time of last use)
+        self._bricks: OrderedDict[
+            Hashable, tuple[weakref.ref, np.ndarray, int]
+        ] = OrderedDict()
+        with _lock:
+            _caches.add(self)
+
+    def __len__(self) -> int:
+        return len(self._bricks)
+
+    def clear(self) -> None:
+        """Remove all bricks, e.g. because the data was modified."""
+        with _lock:
+            self._bricks.clear()
+            self.nbytes = 0
+
+    def arrays(self) -> list[np.ndarray]:
+        """The cached bricks."""
+        with _lock:
+            return [brick for _, brick, _ in self._bricks.values()]
+
+    def read(
+        self,
+        data: ArrayLike,
+        slices: tuple[slice | int, ...],
+        displayed: Sequence[int],
+    ) -> np.ndarray:
+        """Read ``data[slices]`` brick by brick, through the cache.
+
+        Parameters
+        ----------
+        data : array-like
+            One level of the layer data.
+        slices : tuple of slice or int
+            Index of ``data`` to read. Along the displayed axes, it must be a
+            slice with a step of 1, e.g. ``slice(None)`` in 3D or the
+            visible region of a level in 2D.
+        displayed : sequence of int
+            The displayed axes, which are split in bricks.
+
+        Returns
+        -------
+        np.ndarray
+            The data, as with ``np.asarray(data[slices])``.
+        """
+        if isinstance(data, np.ndarray):
+            # nothing to gain from copying in-memory data
+            return np.asarray(data[slices])
+        try:
+            data_ref = weakref.ref(data)
+        except TypeError:
+            return np.asarray(data[slices])
+        displayed = sorted(displayed)
+        # integer indices drop their axis from the output, and RGB(A) data
+        # has a trailing channel axis that is not sliced
+        out_shape = [
+            len(range(*s.indices(n)))
+            for s, n in zip(slices, data.shape, strict=False)
+            if isinstance(s, slice)
+        ] + list(data.shape[len(slices) :])
+        out = np.empty(out_shape, dtype=data.dtype)
+        out_axes = [
+            sum(isinstance(s, slice) for s in slices[:axis])
+            for axis in displayed
+        ]
+        point = tuple(
+            (s.start, s.stop) if isinstance(s, slice) else s
+            for axis, s in enumerate(slices)
+            if axis not in displayed
+        )
+        window = [
+            slices[axis].indices(data.shape[axis])[:2] for axis in displayed
+        ]
+        shape = [data.shape[axis] for axis in displayed]
+        brick_shape = _brick_shape(data, displayed)
+        bricks = []
+        missing = []
+        for index, brick_slices in _iter_bricks(shape, brick_shape, window):
+            key = (id(data), point, index)
+            brick = self._get(key, data_ref)
+            if brick is None:
+                source = list(slices)
+                for axis, s in zip(displayed, brick_slices, strict=True):
+                    source[axis] = s
+                missing.append((len(bricks), key, data[tuple(source)]))
+            bricks.append((brick_slices, brick))
+        slicing_stats.count('brick_cache_hits', len(bricks) - len(missing))
+        slicing_stats.count('brick_cache_misses', len(missing))
+        read = _materialize([lazy for _, _, lazy in missing])
+        for (i, key, _), brick in zip(missing, read, strict=True):
+            self._put(key, data_ref, brick)
+            slicing_stats.count('bytes_read', brick.nbytes)
+            bricks[i] = (bricks[i][0], brick)
+        for brick_slices, brick in bricks:
+            source = [slice(None)] * brick.ndim
+            target = [slice(None)] * out.ndim
+            for axis, s, (start, stop) in zip(
+                out_axes, brick_slices, window, strict=True
+            ):
+                # the part of the brick in the window
+                low, high = max(s.start, start), min(s.stop, stop)
+                source[axis] = slice(low - s.start, high - s.start)
+                target[axis] = slice(low - start, high - start)
+            out[tuple(target)] = brick[tuple(source)]
+        return out
+
+    def _get(self, key: Hashable, data_ref: weakref.ref) -> np.ndarray | None:
+        with _lock:
+            entry = self._bricks.get(key)
+            # ids of garbage collected arrays can be reused
+            if entry is None or entry[0]() is not data_ref():
+                return None
+            self._bricks[key] = (data_ref, entry[1], next(_clock))
+            self._bricks.move_to_end(key)
+            return entry[1]
+
+    def _put(
+        self, key: Hashable, data_ref: weakref.ref, brick: np.ndarray
+    ) -> None:
+        if brick.nbytes > BRICK_CACHE_BYTES:
+            return
+        with _lock:
+            if (previous := self._bricks.pop(key, None)) is not None:
+                self.nbytes -= previous[1].nbytes
+            self._bricks[key] = (data_ref, brick, next(_clock))
+            self.nbytes += brick.nbytes
+            _evict()
+
+
+def _evict() -> None:
+    """Evict the least recently used bricks until within the budget.
+
+    Must be called with `_lock` held.
+    """
+    caches = list(_caches)
+    nbytes = sum(cache.nbytes for cache in caches)
+    while nbytes > BRICK_CACHE_BYTES:
+        # the oldest brick of each cache is first in its order
+        oldest = min(
+            (cache for cache in caches if cache._bricks),
+            key=lambda cache: next(iter(cache._bricks.values()))[2],
+        )
+        _, (_, evicted, _) = oldest._bricks.popitem(last=False)
+        oldest.nbytes -= evicted.nbytes
+        nbytes -= evicted.nbytes
+
+
+def _brick_shape(data: ArrayLike, displayed: list[int]) -> tuple[int, ...]:
+    """Shape of the bricks along the displayed axes of ``data``."""
+    # dask arrays have `chunksize`, zarr and h5py datasets `chunks`
+    chunks = getattr(data, 'chunksize', None) or getattr(data, 'chunks', None)
+    try:
+        chunk_shape = [max(int(chunks[axis]), 1) for axis in displayed]
+    except (TypeError, IndexError, ValueError):
+        return (_MIN_BRICK_LENGTH,) * len(displayed)
+    return tuple(
+        chunk * -(-_MIN_BRICK_LENGTH // chunk) for chunk in chunk_shape
+    )
+
+
+def _iter_bricks(
+    shape: list[int],
+    brick_shape: tuple[int, ...],
+    window: Sequence[tuple[int, int]] | None = None,
+) -> Iterator[tuple[tuple[int, ...], tuple[slice, ...]]]:
+    """Yield the index and slices of the bricks covering ``shape``.
+
+    If ``window`` is given, as a (start, stop) range along each axis, only
+    the bricks that overlap it are yielded.
+    """
+    if window is None:
+        window = [(0, length) for length in shape]
+    ranges = [
+        range(start // brick * brick, stop, brick)
+        for (start, stop), brick in zip(window, brick_shape, strict=True)
+    ]
+    for starts in itertools.product(*ranges):
+        index = tuple(
+            start // brick
+            for start, brick in zip(starts, brick_shape, strict=True)
+        )
+        slices = tuple(
+            slice(start, min(start + brick, length))
+            for start, brick, length in zip(
+                starts, brick_shape, shape, strict=True
+            )
+        )
+        yield index, slices
+
+
+def _materialize(arrays: list[ArrayLike]) -> list[np.ndarray]:
+    """Read ``arrays``, computing dask arrays together."""
+    if arrays and type(arrays[0]).__module__.startswith('dask.'):
+        import dask
+
+        # a single computation shares the tasks of overlapping chunks
+        return [np.asarray(a) for a in dask.compute(*arrays)]
+    return [np.asarray(a) for a in arrays]
@@ -0,0 +1,215 @@
+"""Block reductions used to fit sliced data in the maximum texture size.
+
+When a slice is larger than the maximum texture size of the graphics card
+along a displayed axis, it is reduced by whole blocks of pixels (instead of
+taking every n-th pixel, which aliases) before it is sent to vispy. Images
+use the block mean, labels the most frequent label of each block.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import weakref
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+
+from napari.utils.perf import slicing_stats
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Sequence
+
+    from napari.types import ArrayLike
+
+BlockReduction = Literal['mean', 'max', 'mode']
+
+
+def texture_downsample_factors(
+    shape: Sequence[int], max_size: int | None
+) -> tuple[int, ...]:
+    """Smallest integer factors that make ``shape`` fit in ``max_size``."""
+    if max_size is None:
+        return (1,) * len(shape)
+    return tuple(max(-(-n // max_size), 1) for n in shape)
+
+
+def block_reduce(
+    data: np.ndarray, factors: Sequence[int], mode: BlockReduction
+) -> np.ndarray:
+    """Reduce blocks of ``data`` of shape ``factors`` to single values.
+
+    The blocks at the end of an axis that isn't a multiple of its factor are
+    smaller. The result has the dtype of ``data``, with the block means of
+    integer data rounded to the nearest integer.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        The data to reduce. It may have more axes than ``factors``, e.g. the
+        channel axis of RGB(A) data, which are not reduced.
+    factors : sequence of int
+        Block length along each of the leading axes of ``data``.
+    mode : {'mean', 'max', 'mode'}
+        The reduction of each block. 'mode' gives the most frequent value of
+        each block, which is suitable for labels.
+
+    Returns
+    -------
+    np.ndarray
+        The reduced data.
+    """
+    factors = tuple(factors) + (1,) * (data.ndim - len(factors))
+    if all(f == 1 for f in factors):
+        return data
+    if mode == 'mode':
+        return _block_mode(data, factors)
+    if mode == 'max':
+        out = data
+        for axis, f in enumerate(factors):
+            if f > 1:
+                starts = np.arange(0, out.shape[axis], f)
+                out = np.maximum.reduceat(out, starts, axis=axis)
+        return out
+    if mode != 'mean':
+        raise ValueError(f'unknown block reduction: {mode}')
+
+    acc_dtype = np.promote_types(data.dtype, np.float32)
+    if acc_dtype.kind != 'f':
+        acc_dtype = np.dtype(np.float64)
+    out = data.astype(acc_dtype, copy=False)
+    for axis, f in enumerate(factors):
+        if f == 1:
+            continue
+        n = out.shape[axis]
+        starts = np.arange(0, n, f)
+        out = np.add.reduceat(out, starts, axis=axis)
+        counts = np.diff(np.append(starts, n)).astype(acc_dtype)
+        out /= counts.reshape((-1,) + (1,) * (out.ndim - axis - 1))
+    if data.dtype.kind in 'biu':
+        np.rint(out, out=out)
+    return out.astype(data.dtype, copy=False)
+
+
+def _block_mode(data: np.ndarray, factors: tuple[int, ...]) -> np.ndarray:
+    """Most frequent value of each block, the lowest one in case of ties."""
+    reduced_shape = [
+        -(-n // f) for n, f in zip(data.shape, factors, strict=True)
+    ]
+    pad = [
+        (0, r * f - n)
+        for r, n, f in zip(reduced_shape, data.shape, factors, strict=True)
+    ]
+    if any(after for _, after in pad):
+        # pad the incomplete blocks by repeating the edge values, so that
+        # all blocks have the same size
+        data = np.pad(data, pad, mode='edge')
+    ndim = data.ndim
+    blocks = (
+        data.reshape(
+            [
+                length
+                for r, f in zip(reduced_shape, factors, strict=True)
+                for length in (r, f)
+            ]
+        )
+        .transpose(list(range(0, 2 * ndim, 2)) + list(range(1, 2 * ndim, 2)))
+        .reshape(reduced_shape + [math.prod(factors)])
+    )
+    if np.may_share_memory(blocks, data):
+        blocks = blocks.copy()
+    blocks.sort(axis=-1)
+    # in sorted blocks, the count of a value up to a position is the distance
+    # to the start of its run, and the first longest run has the lowest value
+    size = blocks.shape[-1]
+    positions = np.arange(size, dtype=np.min_scalar_type(size))
+    run_starts = np.empty(blocks.shape, dtype=positions.dtype)
+    run_starts[..., 0] = 0
+    np.multiply(
+        blocks[..., 1:] != blocks[..., :-1],
+        positions[1:],
+        out=run_starts[..., 1:],
+    )
+    np.maximum.accumulate(run_starts, axis=-1, out=run_starts)
+    np.subtract(positions, run_starts, out=run_starts)
+    best = run_starts.argmax(axis=-1)
+    return np.take_along_axis(blocks, best[..., np.newaxis], axis=-1)[..., 0]
+
+
+class _DownsampledSliceCache:
+    """The last downsampled slice of a layer.
+
+    Downsampled slices are large, so reading and reducing them again when
+    the same slice is requested (e.g. when toggling between 2D and 3D) is
+    slow. A single slice is kept, and it must be cleared with :meth:`clear`
+    when the data is modified in place.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._key: Hashable = None
+        self._data_ref: weakref.ref | None = None
+        self._value: tuple[np.ndarray, tuple[int, ...]] | None = None
+
+    def clear(self) -> None:
+        """Forget the cached slice."""
+        with self._lock:
+            self._key = None
+            self._data_ref = None
+            self._value = None
+
+    def arrays(self) -> list[np.ndarray]:
+        """The cached slice, if any."""
+        with self._lock:
+            return [] if self._value is None else [self._value[0]]
+
+    def get(
+        self, data: ArrayLike, key: Hashable
+    ) -> tuple[np.ndarray, tuple[int, ...]] | None:
+        """The cached slice of ``data`` for ``key``, if any."""
+        with self._lock:
+            if (
+                self._value is None
+                or self._data_ref is None
+                or self._data_ref() is not data
+                or self._key != key
+            ):
+                return None
+            return self._value
+
+    def put(
+        self,
+        data: ArrayLike,
+        key: Hashable,
+        value: tuple[np.ndarray, tuple[int, ...]],
+    ) -> None:
+        """Cache ``value``, the downsampled slice of ``data`` for ``key``."""
+        try:
+            data_ref = weakref.ref(data)
+        except TypeError:
+            return
+        with self._lock:
+            self._key = key
+            self._data_ref = data_ref
+            self._value = value
+
+    def get_or_compute(
+        self,
+        data: ArrayLike,
+        key: Hashable,
+        compute: Callable[[], tuple[np.ndarray, tuple[int, ...]]],
+    ) -> tuple[np.ndarray, tuple[int, ...]]:
+        """The cached slice for ``key``, computing (and caching) it if needed.
+
+        Slices that are not downsampled are not cached, since they are cheap
+        to get again and may be views of the layer data.
+        """
+        value = self.get(data, key)
+        slicing_stats.count(
+            'texture_cache_misses' if value is None else 'texture_cache_hits'
+        )
+        if value is None:
+            value = compute()
+            if any(f > 1 for f in value[1]):
+                self.put(data, key, value)
+        return value
@@ -6,12 +6,16 @@ from typing import TYPE_CHECKING, Any
 import numpy as np
 import numpy.typing as npt
 
+from napari.layers._scalar_field._downsample import (
+    texture_downsample_factors,
+)
 from napari.layers.base._slice import _next_request_id
 from napari.layers.utils._slice_input import _SliceInput, _ThickNDSlice
 from napari.types import ArrayLike
 from napari.utils._dask_utils import DaskIndexer
 from napari.utils._dtype import normalize_dtype
 from napari.utils.misc import reorder_after_dim_reduction
+from napari.utils.perf import slicing_stats
 from napari.utils.transforms import Affine
 
 if TYPE_CHECKING:
@@ -19,28 +23,40 @@ if TYPE_CHECKING:
 
     from numpy.typing import DTypeLike
 
+    from napari.layers._scalar_field._bricks import _BrickCache
+    from napari.layers._scalar_field._downsample import (
+        _DownsampledSliceCache,
+    )
+    from napari.layers._scalar_field._texture import TextureMapping
+    from napari.utils._buffer_pool import BufferPool
+
 
 @dataclass(frozen=True)
 class _ScalarFieldView:
-    """A raw image and a potentially different viewable version of it.
+    """A raw image and the texture-ready version of it sent to vispy.
 
-    This is only needed for labels, and not other image layers, because sliced labels
-    data are passed to vispy as floats in [0, 1] to use continuous colormaps.
-    In that case, a conversion function is defined by `Labels._raw_to_displayed` to
-    handle the desired colormapping behavior.
+    The raw image is the sliced data, which layers keep e.g. to look up the
+    values under the cursor. The view is what is uploaded as a texture: a
+    C-contiguous array with a texture dtype, which is converted while
+    slicing (see `_ScalarFieldSliceRequest._make_view`) or by a layer's
+    converter (see `_ScalarFieldSliceResponse.to_displayed`). So the view may
+    differ from the raw image even for images, e.g.:
 
-    For non-labels image layers the raw and viewable images should be the same instance
-    and no conversion should be necessary.
+    * it may be a buffer taken from the slicing state's buffer pool, which
+      is given back to the pool once the next slice has been drawn;
+    * image slices may be quantized to a normalized integer texture, see
+      `Image.texture_precision`;
+    * 2D RGB slices may be packed to RGBA;
+    * labels are mapped to the texture values of their colormap.
 
-    This is defined for images in general because `Labels` and `_ImageBase` share
-    code through inheritance.
+    The view is the raw image itself only when no conversion is needed.
 
     Attributes
     ----------
     raw : array
         The raw image.
     view : array
-        The viewable image, which should either be the same instance of raw, or a
+        The texture-ready image, either the same instance as raw or a
         converted version of it.
     """
 
@@ -60,6 +76,19 @@ class _ScalarFieldView:
         view = converter(raw)
         return cls(raw=raw, view=view)
 
+    def converted(
+        self, converter: Callable[[np.ndarray], np.ndarray]
+    ) -> _ScalarFieldView:
+        """Makes an image view from the raw image of this one.
+
+        If ``converter`` returns the raw image unchanged, this view is kept,
+        since it may already have been prepared for display when slicing.
+        """
+        view = converter(self.raw)
+        if view is self.raw:
+            return self
+        return _ScalarFieldView(raw=self.raw, view=view)
+
 
 @dataclass(frozen=True)
 class _ScalarFieldSliceResponse:
@@ -79,6 +108,15 @@ class _ScalarFieldSliceResponse:
         Describes the slicing plane or bounding box in the layer's dimensions.
     request_id : int
         The identifier of the request from which this was generated.
+    texture_downsample : tuple of int or None
+        If the sliced image was reduced to fit in the maximum texture size,
+        the reduction factors along the displayed axes (in displayed order).
+    bytes_copied : int
+        The number of bytes copied to convert the sliced image for display.
+        This is 0 if the view of the image is the sliced data itself.
+    texture_mapping : TextureMapping or None
+        If not None, the view of the image is mapped with it, and values
+        displayed with it (e.g. contrast limits) must be mapped with it too.
     """
 
     image: _ScalarFieldView = field(repr=False)
@@ -87,6 +125,9 @@ class _ScalarFieldSliceResponse:
     slice_input: _SliceInput
     request_id: int
     empty: bool = False
+    texture_downsample: tuple[int, ...] | None = None
+    bytes_copied: int = 0
+    texture_mapping: TextureMapping | None = None
 
     @classmethod
     def make_empty(
@@ -157,14 +198,13 @@ class _ScalarFieldSliceResponse:
         _ScalarFieldSliceResponse
             Contains the converted image and thumbnail.
         """
-        image = _ScalarFieldView.from_raw(
-            raw=self.image.raw, converter=converter
-        )
+        if self.texture_mapping is not None:
+            # mapped views are already in the range of their texture
+            return self
+        image = self.image.converted(converter)
         thumbnail = image
         if self.thumbnail is not self.image:
-            thumbnail = _ScalarFieldView.from_raw(
-                raw=self.thumbnail.raw, converter=converter
-            )
+            thumbnail = self.thumbnail.converted(converter)
         return _ScalarFieldSliceResponse(
             image=image,
             thumbnail=thumbnail,
@@ -172,6 +212,8 @@ class _ScalarFieldSliceResponse:
             slice_input=self.slice_input,
             request_id=self.request_id,
             empty=self.empty,
+            texture_downsample=self.texture_downsample,
+            bytes_copied=self.bytes_copied,
         )
 
 
@@ -198,6 +240,19 @@ class _ScalarFieldSliceRequest:
         The dtype of the layer's data.
     data_slice : _ThickNDSlice
         The slicing coordinates and margins in data space.
+    brick_cache : _BrickCache or None
+        If not None, data is read brick by brick through this cache.
+    max_texture_size : int or None
+        If not None, the sliced image is reduced by blocks of pixels to fit
+        in this size along the displayed axes.
+    texture_cache : _DownsampledSliceCache or None
+        Cache of the last reduced slice, which is reused if the same slice
+        is requested again.
+    buffer_pool : BufferPool or None
+        If not None, arrays that the sliced image is converted to for
+        display are taken from this pool.
+    texture_mapping : TextureMapping or None
+        If not None, the sliced image is mapped with it for display.
     others
         See the corresponding attributes in `Layer` and `Image`.
     id : int
@@ -218,6 +273,17 @@ class _ScalarFieldSliceRequest:
     thumbnail_level: int = field(repr=False)
     level_shapes: np.ndarray = field(repr=False)
     downsample_factors: np.ndarray = field(repr=False)
+    brick_cache: _BrickCache | None = field(
+        default=None, repr=False, compare=False
+    )
+    max_texture_size: int | None = field(default=None, repr=False)
+    texture_cache: _DownsampledSliceCache | None = field(
+        default=None, repr=False, compare=False
+    )
+    buffer_pool: BufferPool | None = field(
+        default=None, repr=False, compare=False
+    )
+    texture_mapping: TextureMapping | None = field(default=None, repr=False)
     id: int = field(default_factory=_next_request_id)
 
     def __call__(self) -> _ScalarFieldSliceResponse:
@@ -236,17 +302,21 @@ class _ScalarFieldSliceRequest:
             )
 
     def _call_single_scale(self) -> _ScalarFieldSliceResponse:
-        order = self._get_order()
-        data = self._project_thick_slice(
+        data, factors = self._slice_texture(
             self.data_at_data_level, self.data_slice
         )
-        data = np.transpose(data, order)
-        image = _ScalarFieldView.from_view(data)
+        image, bytes_copied = self._make_view(data)
         # `Layer.multiscale` is mutable so we need to pass back the identity
         # transform to ensure `tile2data` is properly set on the layer.
         ndim = self.slice_input.ndim
+        scale = np.ones(ndim)
+        for d, factor in zip(self.slice_input.displayed, factors, strict=True):
+            scale[d] = factor
         tile_to_data = Affine(
-            name='tile2data', linear_matrix=np.eye(ndim), ndim=ndim
+            name='tile2data',
+            scale=scale,
+            translate=(scale - 1) / 2,
+            ndim=ndim,
         )
         return _ScalarFieldSliceResponse(
             image=image,
@@ -254,6 +324,9 @@ class _ScalarFieldSliceRequest:
             tile_to_data=tile_to_data,
             slice_input=self.slice_input,
             request_id=self.id,
+            texture_downsample=factors if max(factors) > 1 else None,
+            bytes_copied=bytes_copied,
+            texture_mapping=self.texture_mapping,
         )
 
     def _call_multi_scale(self) -> _ScalarFieldSliceResponse:
@@ -275,6 +348,17 @@ class _ScalarFieldSliceRequest:
                 )
             translate = self.corner_pixels[0] * scale
 
+        # only the visible region of the displayed dimensions is read
+        window = tuple(disp_slice) if self.slice_input.ndisplay == 2 else None
+
+        # project the thick slice
+        data_slice = self._thick_slice_at_level(self.data_level)
+        data, factors = self._slice_texture(data, data_slice, window)
+        image, bytes_copied = self._make_view(data)
+        for d, factor in zip(self.slice_input.displayed, factors, strict=True):
+            translate[d] += (factor - 1) / 2 * scale[d]
+            scale[d] *= factor
+
         # This only needs to be a ScaleTranslate but different types
         # of transforms in a chain don't play nicely together right now.
         tile_to_data = Affine(
@@ -283,17 +367,7 @@ class _ScalarFieldSliceRequest:
             translate=translate,
             ndim=self.slice_input.ndim,
         )
-
-        # slice displayed dimensions to get the right tile data
-        data = data[tuple(disp_slice)]
-
-        # project the thick slice
-        data_slice = self._thick_slice_at_level(self.data_level)
-        data = self._project_thick_slice(data, data_slice)
-
         order = self._get_order()
-        data = np.transpose(data, order)
-        image = _ScalarFieldView.from_view(data)
 
         thumbnail_data_slice = self._thick_slice_at_level(self.thumbnail_level)
         thumbnail_data = self._project_thick_slice(
@@ -308,8 +382,78 @@ class _ScalarFieldSliceRequest:
             tile_to_data=tile_to_data,
             slice_input=self.slice_input,
             request_id=self.id,
+            texture_downsample=factors if max(factors) > 1 else None,
+            bytes_copied=bytes_copied,
+            texture_mapping=self.texture_mapping,
         )
 
+    def _slice_texture(
+        self,
+        data: ArrayLike,
+        data_slice: _ThickNDSlice,
+        window: tuple[slice, ...] | None = None,
+    ) -> tuple[np.ndarray, tuple[int, ...]]:
+        """Slice ``data`` for display, reduced to fit in a texture.
+
+        If ``window`` is given, only its slices of the displayed axes are
+        read.
+
+        Returns
+        -------
+        data : np.ndarray
+            The sliced data, with the displayed axes in displayed order.
+        factors : tuple of int
+            The reduction factors along the displayed axes.
+        """
+        ndisplay = self.slice_input.ndisplay
+        # data with fewer dimensions than displayed has fewer displayed axes
+        n_displayed = len(self.slice_input.displayed)
+
+        def compute() -> tuple[np.ndarray, tuple[int, ...]]:
+            sliced = np.transpose(
+                self._project_thick_slice(data, data_slice, window),
+                self._get_order(),
+            )
+            factors = texture_downsample_factors(
+                sliced.shape[:n_displayed], self.max_texture_size
+            )
+            if max(factors) > 1:
+                sliced = self._downsample_texture(sliced, factors)
+            return sliced, factors
+
+        if self.max_texture_size is None or self.texture_cache is None:
+            return compute()
+        key = (
+            data_slice.as_array().tobytes(),
+            self.data_level,
+            self.projection_mode,
+            tuple(self.slice_input.displayed),
+            self.corner_pixels.tobytes() if ndisplay == 2 else None,
+            self.max_texture_size,
+        )
+        return self.texture_cache.get_or_compute(
+            self.data_at_data_level, key, compute
+        )
+
+    def _make_view(self, data: np.ndarray) -> tuple[_ScalarFieldView, int]:
+        """Make the view of a slice, and count the bytes copied to make it.
+
+        By default, the slice is displayed as is. Subclasses may override
+        this to convert it for display while slicing.
+        """
+        return _ScalarFieldView.from_view(data), 0
+
+    @staticmethod
+    def _downsample_texture(
+        data: np.ndarray, factors: tuple[int, ...]
+    ) -> np.ndarray:
+        """Reduce blocks of ``factors`` pixels of a slice to single pixels.
+
+        By default, the first pixel of each block is kept. Subclasses reduce
+        whole blocks instead, to avoid aliasing.
+        """
+        return data[tuple(slice(None, None, f) for f in factors)]
+
     def _thick_slice_at_level(self, level: int) -> _ThickNDSlice:
         """
         Get the data_slice rescaled for a specific level.
@@ -321,30 +465,75 @@ class _ScalarFieldSliceRequest:
         return _ThickNDSlice.from_array(slice_arr)
 
     def _project_thick_slice(
-        self, data: ArrayLike, data_slice: _ThickNDSlice
+        self,
+        data: ArrayLike,
+        data_slice: _ThickNDSlice,
+        window: tuple[slice, ...] | None = None,
     ) -> np.ndarray:
         """
         Slice the given data with the given data slice and project the extra dims.
 
         This is also responsible for materializing the data if it is backed
-        by a lazy store or compute graph (e.g. dask).
+        by a lazy store or compute graph (e.g. dask). If ``window`` is given,
+        only its slices of the displayed dims are read.
         """
 
         if self.projection_mode == 'none':
             # early return with only the dims point being used
             slices = self._point_to_slices(data_slice.point)
-            return np.asarray(data[slices])
+            return self._read(data, self._apply_window(slices, window))
 
         slices = self._data_slice_to_slices(
             data_slice, self.slice_input.displayed
         )
+        slices = self._apply_window(slices, window)
+
+        return self._project_slab(
+            data, slices, axis=tuple(self.slice_input.not_displayed)
+        )
+
+    def _apply_window(
+        self,
+        slices: tuple[slice | int, ...],
+        window: tuple[slice, ...] | None,
+    ) -> tuple[slice | int, ...]:
+        """Replace the slices of the displayed dims by those of ``window``."""
+        if window is None:
+            return slices
+        displayed = self.slice_input.displayed
+        return tuple(
+            window[dim] if dim in displayed else s
+            for dim, s in enumerate(slices)
+        )
 
+    def _project_slab(
+        self,
+        data: ArrayLike,
+        slices: tuple[slice, ...],
+        axis: tuple[int, ...],
+    ) -> np.ndarray:
+        """Materialize ``data[slices]`` and project it along ``axis``.
+
+        Subclasses may override this to avoid materializing the whole slab.
+        """
         return self._project_slice(
-            data=np.asarray(data[slices]),
-            axis=tuple(self.slice_input.not_displayed),
+            data=self._read(data, slices),
+            axis=axis,
             mode=self.projection_mode,
         )
 
+    def _read(
+        self, data: ArrayLike, slices: tuple[slice | int, ...]
+    ) -> np.ndarray:
+        """Materialize ``data[slices]``, through the brick cache if any."""
+        if self.brick_cache is not None:
+            return self.brick_cache.read(
+                data, slices, self.slice_input.displayed
+            )
+        out = np.asarray(data[slices])
+        slicing_stats.count('bytes_read', out.nbytes)
+        return out
+
     @staticmethod
     def _project_slice(
         data: ArrayLike, axis: tuple[int, ...], mode: Any
@@ -0,0 +1,122 @@
+import weakref
+
+import dask.array as da
+import numpy as np
+import pytest
+
+from napari.layers._scalar_field import _bricks
+from napari.layers._scalar_field._bricks import _BrickCache
+
+
+class _CountingArray:
+    """Array-like recording the shape of each read."""
+
+    def __init__(self, data, chunks):
+        self._data = data
+        self.chunks = chunks
+        self.shape = data.shape
+        self.dtype = data.dtype
+        self.ndim = data.ndim
+        self.reads = []
+
+    def __getitem__(self, key):
+        out = self._data[key]
+        self.reads.append(out.shape)
+        return out
+
+
+def test_brick_cache_read():
+    data = np.random.default_rng(0).random((3, 300, 20, 600))
+    counting = _CountingArray(data, chunks=(1, 100, 20, 100))
+    cache = _BrickCache()
+
+    out = cache.read(
+        counting, (1, slice(None), slice(None), slice(None)), [1, 2, 3]
+    )
+    np.testing.assert_array_equal(out, data[1])
+    # bricks are made of whole chunks, of at least 256 along each axis
+    assert counting.reads == [(300, 20, 300), (300, 20, 300)]
+    assert len(cache) == 2
+    assert cache.nbytes == data[1].nbytes
+
+    # cached bricks are not read again
+    counting.reads.clear()
+    out = cache.read(
+        counting, (1, slice(None), slice(None), slice(None)), [1, 2, 3]
+    )
+    np.testing.assert_array_equal(out, data[1])
+    assert counting.reads == []
+
+    # another point reads other bricks
+    out = cache.read(
+        counting, (2, slice(None), slice(None), slice(None)), [1, 2, 3]
+    )
+    np.testing.assert_array_equal(out, data[2])
+    assert len(counting.reads) == 2
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+
+
+@pytest.fixture
+def brick_budget(monkeypatch):
+    """Limit the brick caches to one 300x300 brick of int64."""
+    brick_bytes = 300 * 300 * np.dtype(np.int64).itemsize
+    monkeypatch.setattr(_bricks, 'BRICK_CACHE_BYTES', brick_bytes)
+    # ignore the caches of the layers of other tests
+    monkeypatch.setattr(_bricks, '_caches', weakref.WeakSet())
+    return brick_bytes
+
+
+def test_brick_cache_eviction(brick_budget):
+    data = da.from_array(
+        np.arange(600 * 300, dtype=np.int64).reshape(600, 300), chunks=300
+    )
+    cache = _BrickCache()
+    out = cache.read(data, (slice(None), slice(None)), [0, 1])
+    np.testing.assert_array_equal(out, np.asarray(data))
+    # only the most recently used brick is kept
+    assert len(cache) == 1
+    assert cache.nbytes == brick_budget
+
+
+def test_brick_cache_shared_budget(brick_budget):
+    data = da.from_array(
+        np.arange(600 * 300, dtype=np.int64).reshape(600, 300), chunks=300
+    )
+    first = _BrickCache()
+    second = _BrickCache()
+    first.read(data, (slice(0, 300), slice(None)), [0, 1])
+    assert first.nbytes == brick_budget
+
+    # the bricks of one cache are evicted to make room in another
+    second.read(data, (slice(300, 600), slice(None)), [0, 1])
+    assert len(first) == 0
+    assert first.nbytes == 0
+    assert second.nbytes == brick_budget
+
+
+def test_brick_cache_numpy_passthrough():
+    data = np.zeros((2, 10, 10))
+    cache = _BrickCache()
+    out = cache.read(data, (0, slice(None), slice(None)), [1, 2])
+    np.testing.assert_array_equal(out, data[0])
+    assert len(cache) == 0
+
+
+def test_brick_cache_read_window():
+    data = np.random.default_rng(0).random((600, 900))
+    counting = _CountingArray(data, chunks=(300, 300))
+    cache = _BrickCache()
+
+    out = cache.read(counting, (slice(250, 350), slice(10, 20)), [0, 1])
+    np.testing.assert_array_equal(out, data[250:350, 10:20])
+    # only the bricks overlapping the window are read
+    assert counting.reads == [(300, 300), (300, 300)]
+
+    # panning reads the bricks that come into view
+    counting.reads.clear()
+    out = cache.read(counting, (slice(250, 350), slice(10, 400)), [0, 1])
+    np.testing.assert_array_equal(out, data[250:350, 10:400])
+    assert counting.reads == [(300, 300), (300, 300)]
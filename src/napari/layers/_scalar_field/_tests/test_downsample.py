@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from napari.layers._scalar_field._downsample import (
+    _DownsampledSliceCache,
+    block_reduce,
+    texture_downsample_factors,
+)
+
+
+def test_texture_downsample_factors():
+    assert texture_downsample_factors((100, 2049, 4096), 2048) == (1, 2, 2)
+    assert texture_downsample_factors((100, 5000), None) == (1, 1)
+
+
+@pytest.mark.parametrize('dtype', [np.uint8, np.int32, np.float32])
+def test_block_reduce_mean(dtype):
+    data = np.arange(35).reshape(5, 7).astype(dtype)
+    reduced = block_reduce(data, (2, 3), 'mean')
+    assert reduced.dtype == dtype
+    # blocks at the end of an axis are smaller
+    expected = np.array(
+        [
+            [np.mean(data[i : i + 2, j : j + 3]) for j in range(0, 7, 3)]
+            for i in range(0, 5, 2)
+        ]
+    )
+    if np.issubdtype(dtype, np.integer):
+        expected = np.rint(expected)
+    np.testing.assert_allclose(reduced, expected)
+
+
+def test_block_reduce_max_rgb():
+    data = np.random.default_rng(0).integers(0, 255, (6, 5, 3))
+    reduced = block_reduce(data, (3, 2), 'max')
+    assert reduced.shape == (2, 3, 3)
+    np.testing.assert_array_equal(reduced[1, 2], data[3:, 4:].max((0, 1)))
+
+
+def test_block_reduce_mode():
+    data = np.array(
+        [
+            [1, 1, 2, 2, 7],
+            [1, 3, 4, 5, 7],
+            [6, 6, 0, 0, 0],
+        ]
+    )
+    reduced = block_reduce(data, (2, 2), 'mode')
+    # ties resolve to the lowest label
+    np.testing.assert_array_equal(reduced, [[1, 2, 7], [6, 0, 0]])
+    assert reduced.dtype == data.dtype
+
+
+@pytest.mark.parametrize('factors', [(1, 4), (3, 2), (2, 2, 1)])
+def test_block_reduce_mode_random(factors):
+    data = np.random.default_rng(0).integers(0, 4, (7, 8, 2))
+    original = data.copy()
+    reduced = block_reduce(data, factors, 'mode')
+    # the data is not sorted in place, even when blocks are views of it
+    np.testing.assert_array_equal(data, original)
+    factors = factors + (1,) * (data.ndim - len(factors))
+    for index in np.ndindex(reduced.shape):
+        block = data[
+            tuple(
+                slice(i * f, (i + 1) * f)
+                for i, f in zip(index, factors, strict=True)
+            )
+        ]
+        values, counts = np.unique(block, return_counts=True)
+        assert reduced[index] == values[counts.argmax()]
+
+
+def test_downsampled_slice_cache():
+    data = np.zeros((4, 4))
+    cache = _DownsampledSliceCache()
+    calls = []
+
+    def compute(factors):
+        calls.append(factors)
+        return data[::2, ::2], factors
+
+    cache.get_or_compute(data, 'a', lambda: compute((2, 2)))
+    cache.get_or_compute(data, 'a', lambda: compute((2, 2)))
+    assert calls == [(2, 2)]
+    # slices that are not downsampled are not cached
+    cache.get_or_compute(data, 'b', lambda: compute((1, 1)))
+    cache.get_or_compute(data, 'b', lambda: compute((1, 1)))
+    assert calls == [(2, 2), (1, 1), (1, 1)]
+    cache.get_or_compute(np.zeros((4, 4)), 'a', lambda: compute((2, 2)))
+    assert len(calls) == 4
+    cache.clear()
+    assert cache.get(data, 'a') is None
@@ -0,0 +1,173 @@
+import numpy as np
+import pytest
+
+from napari.components import ViewerModel
+from napari.layers._scalar_field._texture import (
+    TextureMapping,
+    as_texture,
+    texture_dtype,
+)
+from napari.utils._buffer_pool import BufferPool
+from napari.utils.colormaps.colormap_utils import _coerce_contrast_limits
+
+
+@pytest.mark.parametrize(
+    ('dtype', 'expected'),
+    [
+        (np.uint8, np.uint8),
+        (np.int8, np.float32),
+        (np.uint16, np.uint16),
+        (np.uint32, np.float32),
+        (np.float64, np.float32),
+        (bool, np.uint8),
+        (np.complex64, None),
+    ],
+)
+def test_texture_dtype(dtype, expected):
+    assert texture_dtype(dtype) == (
+        None if expected is None else np.dtype(expected)
+    )
+
+
+def test_as_texture_zero_copy():
+    data = np.zeros((4, 5), dtype=np.float32)
+    converted, nbytes = as_texture(data)
+    assert converted is data
+    assert nbytes == 0
+
+
+def test_as_texture_single_copy():
+    data = np.arange(20, dtype=np.float64).reshape(4, 5).T
+    pool = BufferPool()
+    converted, nbytes = as_texture(data, pool)
+    assert converted.dtype == np.float32
+    assert converted.flags.c_contiguous
+    assert nbytes == converted.nbytes
+    np.testing.assert_array_equal(converted, data)
+
+
+def test_as_texture_packs_rgb():
+    data = np.random.default_rng(0).integers(0, 256, (8, 9, 3), dtype=np.uint8)
+    # a transposed view, as sliced from the layer data
+    converted, nbytes = as_texture(data.transpose(1, 0, 2), rgb=True)
+    assert converted.shape == (9, 8, 4)
+    assert converted.dtype == np.uint8
+    assert nbytes == converted.nbytes
+    np.testing.assert_array_equal(converted[..., :3], data.transpose(1, 0, 2))
+    np.testing.assert_array_equal(converted[..., 3], 255)
+
+    # RGBA data is uploaded as is
+    rgba = np.zeros((8, 9, 4), dtype=np.uint8)
+    assert as_texture(rgba, rgb=True) == (rgba, 0)
+
+
+def test_image_slices_reuse_texture_buffers():
+    viewer = ViewerModel()
+    data = np.random.default_rng(0).random((5, 30, 40))
+    layer = viewer.add_image(data)
+    # only the view for display is converted, the raw slice keeps its dtype
+    assert layer._slice.image.raw.dtype == np.float64
+    assert layer._data_view.dtype == np.float32
+    assert layer._slice.bytes_copied == 30 * 40 * 4
+    views = set()
+    for i in range(5):
+        viewer.dims.set_point(0, i)
+        np.testing.assert_array_equal(
+            layer._data_view, data[i].astype(np.float32)
+        )
+        views.add(id(layer._data_view))
+        # the canvas is drawn with the new slice
+        layer._update_draw(1, np.array([[0, 0], [30, 40]]), (30, 40))
+    # the buffer of the previous slice is reused once it's no longer drawn
+    assert len(views) == 2
+
+
+def test_image_slices_keep_undrawn_texture_buffers():
+    viewer = ViewerModel()
+    layer = viewer.add_image(np.random.default_rng(0).random((5, 30, 40)))
+    views = [layer._data_view]
+    for i in range(1, 5):
+        viewer.dims.set_point(0, i)
+        views.append(layer._data_view)
+    # without drawing, the canvas may still display the replaced slices
+    assert len({id(view) for view in views}) == 5
+
+
+def test_image_slice_without_copy():
+    viewer = ViewerModel()
+    layer = viewer.add_image(np.zeros((5, 30, 40), dtype=np.uint8))
+    assert layer._slice.bytes_copied == 0
+    assert np.shares_memory(layer._data_view, layer.data)
+
+
+@pytest.mark.parametrize('dtype', [np.uint8, np.uint16])
+def test_texture_mapping(dtype):
+    quantization = TextureMapping.from_range(dtype, (-1, 3))
+    maxval = np.iinfo(dtype).max
+    data = np.array([[-2, -1, 1], [3, 4, np.nan]])
+    quantized, nbytes = quantization.apply(data, BufferPool())
+    assert quantized.dtype == dtype
+    assert nbytes == quantized.nbytes
+    # values out of the range are clipped, NaNs are 0
+    np.testing.assert_array_equal(
+        quantized, [[0, 0, round(maxval / 2)], [maxval, maxval, 0]]
+    )
+    np.testing.assert_allclose(
+        quantization.to_texture([-1, 1]), [0, maxval / 2]
+    )
+
+
+def test_image_texture_precision():
+    viewer = ViewerModel()
+    data = np.linspace(0, 100, 30 * 40).reshape(30, 40)
+    layer = viewer.add_image(data, texture_precision='uint8')
+    assert layer._data_view.dtype == np.uint8
+    assert layer._slice.bytes_copied == 30 * 40
+    quantization = layer._slice.texture_mapping
+    np.testing.assert_array_equal(
+        layer._data_view, np.rint(quantization.to_texture(data))
+    )
+    # values are still read from the raw slice
+    assert layer.get_value((29, 39)) == 100
+
+    # changing the contrast limits doesn't slice again...
+    layer.contrast_limits = (10, 50)
+    assert layer._slice.texture_mapping is quantization
+    # ...unlike changing their range
+    layer.contrast_limits_range = (0, 200)
+    assert layer._slice.texture_mapping == TextureMapping.from_range(
+        np.uint8, (0, 200)
+    )
+    assert layer._data_view.max() == 128
+
+    layer.texture_precision = 'auto'
+    assert layer._slice.texture_mapping is None
+    assert layer._data_view.dtype == np.float32
+
+
+def test_texture_mapping_from_coercion():
+    data = np.array([1e39, 2e39, 3e39])
+    coerced = _coerce_contrast_limits((1e39, 3e39))
+    mapping = TextureMapping.from_coercion(coerced)
+    mapped, _ = mapping.apply(data)
+    assert mapped.dtype == np.float32
+    atol = 1e-6 * np.abs(coerced.contrast_limits).max()
+    np.testing.assert_allclose(mapped, coerced.coerce_data(data), atol=atol)
+    np.testing.assert_allclose(
+        mapping.to_texture((1e39, 3e39)), coerced.contrast_limits, atol=atol
+    )
+
+
+@pytest.mark.parametrize('scale', [1, 1e39])
+def test_image_contrast_limits_change_without_slicing(scale):
+    viewer = ViewerModel()
+    data = np.linspace(0, 100, 30 * 40).reshape(30, 40) * scale
+    layer = viewer.add_image(data)
+    response = layer._slice
+    assert (response.texture_mapping is None) == (scale == 1)
+    for low, high in [(10, 90), (20, 30), (0, 100)]:
+        layer.contrast_limits = (low * scale, high * scale)
+        assert layer._slice is response
+    # the mapping of the slice depends on the range of contrast limits
+    layer.contrast_limits_range = (0, 1000 * scale)
+    assert (layer._slice is response) == (scale == 1)
@@ -0,0 +1,202 @@
+"""Conversion of sliced data to arrays that can be uploaded as textures.
+
+Textures only support a few dtypes, and are uploaded from C-contiguous
+memory, so sliced data that is neither is converted once, in the slicing
+worker, instead of being copied again (possibly several times) when it is
+sent to vispy.
+
+2D RGB uint8 slices are packed to RGBA, whose rows of 4-byte pixels are
+uploaded without the unaligned transfers that 3-byte pixels need.
+
+Images can also be quantized to normalized integer textures, which are half
+or a quarter of the size of float32 textures, see `TextureMapping`.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+from napari.utils._buffer_pool import take_array
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, DTypeLike
+
+    from napari.utils._buffer_pool import BufferPool
+    from napari.utils.colormaps.colormap_utils import CoercedContrastLimits
+
+#: The dtypes of the data that can be uploaded to textures without
+#: conversion.
+TEXTURE_DTYPES = (
+    np.dtype(np.uint8),
+    np.dtype(np.uint16),
+    np.dtype(np.float32),
+)
+
+_TEXTURE_DTYPE_BY_KIND = {
+    'i': np.dtype(np.float32),
+    'f': np.dtype(np.float32),
+    'u': np.dtype(np.uint16),
+    'b': np.dtype(np.uint8),
+}
+
+
+def texture_dtype(dtype: DTypeLike) -> np.dtype | None:
+    """The dtype that data of ``dtype`` is converted to for textures.
+
+    Returns None if there is no such dtype, e.g. for complex data.
+    """
+    dtype = np.dtype(dtype)
+    if dtype in TEXTURE_DTYPES:
+        return dtype
+    converted = _TEXTURE_DTYPE_BY_KIND.get(dtype.kind)
+    if converted == np.uint16 and dtype.itemsize > 2:
+        return np.dtype(np.float32)
+    return converted
+
+
+def as_texture(
+    data: np.ndarray, pool: BufferPool | None = None, rgb: bool = False
+) -> tuple[np.ndarray, int]:
+    """Convert ``data`` to a C-contiguous array with a texture dtype.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        Sliced data, e.g. a transposed view of the layer data.
+    pool : BufferPool, optional
+        If given, the converted array is taken from this pool.
+    rgb : bool
+        Whether the last axis of ``data`` holds colour channels. 2D uint8
+        RGB data is then packed to RGBA, with opaque alpha.
+
+    Returns
+    -------
+    data : np.ndarray
+        ``data`` itself if it can be uploaded as is, otherwise a converted
+        copy of it.
+    nbytes : int
+        The number of bytes copied, which is 0 if ``data`` is not copied.
+    """
+    if (
+        rgb
+        and data.ndim == 3
+        and data.shape[-1] == 3
+        and data.dtype == np.uint8
+    ):
+        return _pack_rgba(data, pool)
+    dtype = texture_dtype(data.dtype)
+    if dtype is None or (dtype == data.dtype and data.flags.c_contiguous):
+        return data, 0
+    out = take_array(pool, data.shape, dtype)
+    # a single pass makes the data contiguous and converts its dtype. Values
+    # out of the float32 range are rescaled with a `TextureMapping` instead
+    with np.errstate(over='ignore'):
+        np.copyto(out, data, casting='unsafe')
+    return out, out.nbytes
+
+
+def _pack_rgba(
+    data: np.ndarray, pool: BufferPool | None = None
+) -> tuple[np.ndarray, int]:
+    """Copy uint8 RGB ``data`` to an opaque RGBA array."""
+    n_pixels = math.prod(data.shape[:-1])
+    # copying bytes to every 4th byte is slow, so the RGB values are made
+    # contiguous (with a trailing byte) and read as unaligned 4-byte words
+    # whose last byte is replaced by the alpha value
+    packed = take_array(pool, (3 * n_pixels + 1,), np.uint8)
+    np.copyto(packed[:-1].reshape(data.shape), data)
+    words = np.ndarray((n_pixels,), dtype='<u4', buffer=packed, strides=(3,))
+    out = take_array(pool, data.shape[:-1] + (4,), np.uint8)
+    np.bitwise_or(
+        words, np.uint32(0xFF000000), out=out.reshape(-1).view('<u4')
+    )
+    if pool is not None:
+        pool.release(packed)
+    return out, out.nbytes
+
+
+class TextureMapping(NamedTuple):
+    """Linear mapping of data values to the values stored in a texture.
+
+    A data value ``v`` is stored as ``(v - offset) * scale``. In integer
+    textures, it is rounded and clipped to the range of ``dtype``. Values
+    displayed with such a texture, e.g. contrast limits, are mapped with
+    :meth:`to_texture`.
+    """
+
+    dtype: np.dtype
+    offset: float
+    scale: float
+
+    @classmethod
+    def from_range(
+        cls, dtype: DTypeLike, value_range: tuple[float, float]
+    ) -> TextureMapping:
+        """The quantization of ``value_range`` to all the values of ``dtype``."""
+        dtype = np.dtype(dtype)
+        low, high = (float(v) for v in value_range)
+        scale = np.iinfo(dtype).max / (high - low) if high > low else 1.0
+        return cls(dtype, low, scale)
+
+    @classmethod
+    def from_coercion(cls, coerced: CoercedContrastLimits) -> TextureMapping:
+        """The rescaling of values to float32 textures given by ``coerced``."""
+        scale = float(coerced.scale)
+        return cls(np.dtype(np.float32), -float(coerced.offset) / scale, scale)
+
+    def to_texture(self, values: ArrayLike) -> np.ndarray:
+        """Map data values to texture values, without rounding or clipping."""
+        values = np.asarray(values, dtype=np.float64)
+        if self.scale <= 1:
+            return values * self.scale - self.offset * self.scale
+        return (values - self.offset) * self.scale
+
+    def apply(
+        self, data: np.ndarray, pool: BufferPool | None = None
+    ) -> tuple[np.ndarray, int]:
+        """Map ``data`` to a C-contiguous array of ``dtype``.
+
+        Parameters
+        ----------
+        data : np.ndarray
+            Sliced data, of any real dtype.
+        pool : BufferPool, optional
+            If given, the mapped array, and the float32 array that integer
+            textures are computed in, are taken from this pool.
+
+        Returns
+        -------
+        data : np.ndarray
+            The mapped copy of ``data``.
+        nbytes : int
+            The number of bytes of the mapped copy.
+        """
+        if self.dtype.kind == 'f':
+            out = take_array(pool, data.shape, self.dtype)
+            # operations are done with the precision of ``data`` before the
+            # result is cast: large values are scaled down before they are
+            # shifted, narrow ranges of values are shifted before they are
+            # scaled up (see `CoercedContrastLimits.coerce_data`)
+            with np.errstate(over='ignore'):
+                if self.scale <= 1:
+                    np.multiply(data, self.scale, out=out, casting='unsafe')
+                    out -= self.offset * self.scale
+                else:
+                    np.subtract(data, self.offset, out=out, casting='unsafe')
+                    out *= self.scale
+            return out, out.nbytes
+        out = take_array(pool, data.shape, self.dtype)
+        values = take_array(pool, data.shape, np.float32)
+        with np.errstate(over='ignore', invalid='ignore'):
+            np.subtract(data, self.offset, out=values, casting='unsafe')
+            values *= self.scale
+            np.clip(values, 0, np.iinfo(self.dtype).max, out=values)
+            np.rint(values, out=values)
+            # NaNs are stored as 0
+            np.copyto(out, np.nan_to_num(values, copy=False), casting='unsafe')
+        if pool is not None:
+            pool.release(values)
+        return out, out.nbytes
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import types
 from abc import ABC, abstractmethod
-from contextlib import nullcontext
+from contextlib import contextmanager, nullcontext
 from functools import lru_cache
 from typing import TYPE_CHECKING, cast
 
@@ -11,6 +11,11 @@ from numpy import typing as npt
 
 from napari.layers._data_protocols import LayerDataProtocol
 from napari.layers._multiscale_data import MultiScaleData
+from napari.layers._scalar_field._bricks import (
+    VOLUME_VOXEL_BUDGET,
+    _BrickCache,
+)
+from napari.layers._scalar_field._downsample import _DownsampledSliceCache
 from napari.layers._scalar_field._slice import (
     _ScalarFieldSliceRequest,
     _ScalarFieldSliceResponse,
@@ -22,6 +27,7 @@ from napari.layers.image._image_mouse_bindings import (
     set_plane_position as plane_double_click_callback,
 )
 from napari.layers.image._image_utils import guess_multiscale
+from napari.layers.utils._memory import MemoryReport
 from napari.layers.utils._slice_input import (
     _SliceInput,
     _ThickNDSlice,
@@ -31,19 +37,23 @@ from napari.layers.utils.layer_utils import (
     expand_corners_to_chunk_boundaries,
 )
 from napari.layers.utils.plane import SlicingPlane
+from napari.settings import get_settings
 from napari.types import LayerDataType
 from napari.utils._dask_utils import DaskIndexer
 from napari.utils._dtype import normalize_dtype
+from napari.utils._shared_memory import SharedMemoryArray
+from napari.utils._streaming import StreamingArray
 from napari.utils._xarray_utils import _get_xr_metadata
 from napari.utils.events import Event
 from napari.utils.events.event import WarningEmitter
 from napari.utils.events.event_utils import connect_no_arg
 from napari.utils.geometry import clamp_point_to_bounding_box
 from napari.utils.naming import magic_name
+from napari.utils.perf import add_counter_event, slicing_stats
 from napari.utils.transforms import Affine
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
+    from collections.abc import Callable, Generator, Sequence
 
     from napari.components import Dims
 
@@ -245,6 +255,7 @@ class ScalarFieldBase(Layer, ABC):
 
         # Determine if data is a multiscale
         self._data_raw = data
+        self._watch_data_changes(None, data)
         if multiscale is None:
             multiscale, data = guess_multiscale(data)
         elif multiscale and not isinstance(data, MultiScaleData):
@@ -321,6 +332,16 @@ class ScalarFieldBase(Layer, ABC):
         # automatically selecting one based on the viewport / 3D mode.
         self._locked_data_level: int | None = None
 
+        # Maximum texture sizes for 2D and 3D rendering, which are set by
+        # the canvas displaying the layer. Larger slices are reduced by
+        # blocks of pixels when slicing.
+        self._max_texture_sizes: tuple[int | None, int | None] = (None, None)
+
+        # True while the layer is refreshed for a new data level or visible
+        # region of unchanged data, or for the first time, which keeps the
+        # slicing caches.
+        self._keep_caches = False
+
         # Set data
         self._data = data
         if isinstance(data, MultiScaleData):
@@ -349,8 +370,10 @@ class ScalarFieldBase(Layer, ABC):
         self.custom_interpolation_kernel_2d = custom_interpolation_kernel_2d
 
     def _post_init(self):
-        # Trigger generation of view slice and thumbnail
-        self.refresh()
+        # Trigger generation of view slice and thumbnail. Nothing was read
+        # from the data yet, so there are no caches to clear.
+        with self._keeping_caches():
+            self.refresh()
 
     def _slice_dtype(self):
         """Return the dtype of the slice view.
@@ -387,6 +410,7 @@ class ScalarFieldBase(Layer, ABC):
 
     @data.setter
     def data(self, data: LayerDataProtocol | MultiScaleData) -> None:
+        self._watch_data_changes(self._data_raw, data)
         self._data_raw = data
         # note, we don't support changing from/to multiscale after construction
         self._data = MultiScaleData(data) if self.multiscale else data  # type: ignore[arg-type]
@@ -396,6 +420,63 @@ class ScalarFieldBase(Layer, ABC):
         self.events.data(value=self.data)
         self._reset_editable()
 
+    def _watch_data_changes(self, old_data, new_data) -> None:
+        """Display the changes other processes make to shared memory data."""
+        if isinstance(old_data, SharedMemoryArray):
+            old_data.events.changed.disconnect(self._on_data_changed)
+        if isinstance(new_data, SharedMemoryArray):
+            new_data.events.changed.connect(self._on_data_changed)
+        if isinstance(old_data, StreamingArray):
+            old_data.events.appended.disconnect(self._on_data_appended)
+        if isinstance(new_data, StreamingArray):
+            new_data.events.appended.connect(self._on_data_appended)
+
+    def _on_data_changed(self, event: Event) -> None:
+        """Display the regions of the data which another process changed.
+
+        Parameters
+        ----------
+        event : Event
+            The ``changed`` event of a SharedMemoryArray, whose ``regions``
+            changed.
+        """
+        self.refresh(extent=False, highlight=False)
+
+    def _on_data_appended(self, event: Event) -> None:
+        """Display the frames appended to streaming data.
+
+        Unlike replacing the data, the data range and the dimensionality are
+        unchanged: only the extent grows, which the viewer handles by
+        updating its dims ranges. The slice is refreshed only if an appended
+        frame is in view, and the viewer didn't slice the layer again
+        already, e.g. to follow the last frame.
+
+        Parameters
+        ----------
+        event : Event
+            The ``appended`` event of a StreamingArray, whose frames from
+            ``start`` to ``stop`` were appended.
+        """
+        slice_input = self._slice_input
+        self._clear_extent()
+        self.events.extent()
+        if self._slice_input is not slice_input:
+            return
+        if self._frames_in_view(event.start, event.stop):
+            self.refresh(extent=False, highlight=False)
+
+    def _frames_in_view(self, start: int, stop: int) -> bool:
+        """Whether the current slice shows frames start to stop of axis 0."""
+        if 0 in self._slice_input.displayed:
+            return True
+        data_slice = self._data_slice
+        point = data_slice.point[0]
+        if self.projection_mode == 'none':
+            return bool(start <= np.round(point) < stop)
+        low = np.round(point - data_slice.margin_left[0])
+        high = np.round(point + data_slice.margin_right[0])
+        return bool(low < stop and high >= start)
+
     def _get_ndim(self) -> int:
         """Determine number of dimensions of the layer."""
         return len(self.level_shapes[0])
@@ -489,6 +570,93 @@ class ScalarFieldBase(Layer, ABC):
         else:
             self._data_level = 0
 
+    def _volume_data_level(self, displayed_axes: Sequence[int]) -> int:
+        """Level of a multiscale layer to display in 3D.
+
+        This is the coarsest level, unless multiscale volume streaming is
+        enabled. Then it is the coarsest level whose voxels are not larger
+        than a canvas pixel at the current zoom, if it has at most
+        ``VOLUME_VOXEL_BUDGET`` voxels, or else the finest level that does.
+        """
+        coarsest = len(self.level_shapes) - 1
+        if not get_settings().experimental.multiscale_volume_streaming:
+            return coarsest
+        displayed_axes = list(displayed_axes)
+        n_voxels = np.prod(
+            self.level_shapes[:, displayed_axes].astype(float), axis=1
+        )
+        voxel_size = np.max(
+            self.downsample_factors[:, displayed_axes]
+            * np.abs(self.scale[displayed_axes]),
+            axis=1,
+        )
+        fits = np.flatnonzero(n_voxels <= VOLUME_VOXEL_BUDGET)
+        if fits.size == 0:
+            return coarsest
+        detailed = fits[voxel_size[fits] <= self.scale_factor]
+        return int(detailed.max() if detailed.size else fits.min())
+
+    def refresh(
+        self,
+        event: Event | None = None,
+        *,
+        thumbnail: bool = True,
+        data_displayed: bool = True,
+        highlight: bool = True,
+        extent: bool = True,
+        force: bool = False,
+    ) -> None:
+        if data_displayed and not self._keep_caches:
+            # the data may have been modified in place, unless only e.g. its
+            # transforms changed
+            self._slicing_state._clear_caches(data_changed=extent)
+        super().refresh(
+            event,
+            thumbnail=thumbnail,
+            data_displayed=data_displayed,
+            highlight=highlight,
+            extent=extent,
+            force=force,
+        )
+
+    def _set_max_texture_sizes(
+        self, max_size_2d: int | None, max_size_3d: int | None
+    ) -> None:
+        """Set the maximum texture sizes of the canvas displaying the layer.
+
+        The layer is sliced again if the current slice doesn't fit.
+        """
+        if self._max_texture_sizes == (max_size_2d, max_size_3d):
+            return
+        self._max_texture_sizes = (max_size_2d, max_size_3d)
+        ndisplay = self._slice_input.ndisplay
+        max_size = self._slicing_state._max_texture_size(ndisplay)
+        if (
+            max_size is not None
+            and self.loaded
+            and not self._slice.empty
+            and max(self._slice.image.raw.shape[:ndisplay]) > max_size
+        ):
+            self.refresh(thumbnail=False, extent=False, highlight=False)
+
+    def _refresh_view(self) -> None:
+        """Refresh the layer for a new data level or visible region.
+
+        The data is unchanged, so the slicing caches (e.g. the bricks read
+        while panning) are kept.
+        """
+        with self._keeping_caches():
+            self.refresh(extent=False, thumbnail=False)
+
+    @contextmanager
+    def _keeping_caches(self) -> Generator[None, None, None]:
+        """Keep the slicing caches while the layer is refreshed."""
+        self._keep_caches = True
+        try:
+            yield
+        finally:
+            self._keep_caches = False
+
     def _update_level_and_corners(
         self, data_bbox_int, shape_threshold, displayed_axes
     ):
@@ -517,7 +685,7 @@ class ScalarFieldBase(Layer, ABC):
             )
             self.corner_pixels = corners
             if old_level != locked:
-                self.refresh(extent=False, thumbnail=False)
+                self._refresh_view()
         elif self._slice_input.ndisplay == 2:
             level, scaled_corners = compute_multiscale_level_and_corners(
                 data_bbox_int,
@@ -550,10 +718,10 @@ class ScalarFieldBase(Layer, ABC):
             ):
                 self._data_level = level
                 self.corner_pixels = corners
-                self.refresh(extent=False, thumbnail=False)
+                self._refresh_view()
         else:
-            # 3D: use the coarsest level, full extent
-            new_level = len(self.level_shapes) - 1
+            # 3D: full extent of a single level
+            new_level = self._volume_data_level(displayed_axes)
             level_changed = self._data_level != new_level
             self._data_level = new_level
             corners = np.zeros((2, self.ndim), dtype=int)
@@ -562,7 +730,7 @@ class ScalarFieldBase(Layer, ABC):
             )
             self.corner_pixels = corners
             if level_changed:
-                self.refresh(extent=False, thumbnail=False)
+                self._refresh_view()
 
     def _reset_thumbnail_level_data(self) -> None:
         """Set ``_thumbnail_level`` and ``_level_materializer`` for the current data.
@@ -700,9 +868,9 @@ class ScalarFieldBase(Layer, ABC):
         value : tuple
             Value of the data.
         """
-        if self.multiscale:
-            # for multiscale data map the coordinate from the data back to
-            # the tile
+        if self.multiscale or self._slice.texture_downsample is not None:
+            # for multiscale or reduced data map the coordinate from the data
+            # back to the tile
             coord = self._transforms['tile2data'].inverse(position)
         else:
             coord = position
@@ -883,6 +1051,48 @@ class ScalarFieldSlicingState(_LayerSlicingState):
             rgb=len(self.layer.data.shape) != self.ndim,
             dtype=self.layer._slice_dtype(),
         )
+        self._brick_cache = _BrickCache()
+        self._texture_cache = _DownsampledSliceCache()
+        # the view of the last replaced slice, until the canvas is drawn
+        self._replaced_view: np.ndarray | None = None
+
+    def _clear_caches(self, data_changed: bool = True) -> None:
+        """Forget data read by previous slices.
+
+        Parameters
+        ----------
+        data_changed : bool
+            Whether the data itself may have changed, rather than e.g. how it
+            is displayed.
+        """
+        self._brick_cache.clear()
+        self._texture_cache.clear()
+
+    def _release_drawn_buffers(self) -> None:
+        if self._replaced_view is not None:
+            self._buffer_pool.release(self._replaced_view)
+            self._replaced_view = None
+
+    def _add_memory(self, report: MemoryReport) -> None:
+        image, thumbnail = self._slice.image, self._slice.thumbnail
+        report.add(
+            'view', image.raw, image.view, thumbnail.raw, thumbnail.view
+        )
+        report.add(
+            'caches', self._brick_cache.arrays(), self._texture_cache.arrays()
+        )
+
+    def _max_texture_size(self, ndisplay: int) -> int | None:
+        """Maximum size of the displayed axes of slices, if limited."""
+        if ndisplay == 3:
+            return self.layer._max_texture_sizes[1]
+        # large 2D images are displayed in tiles, and 2D multiscale slices
+        # are tiles already
+        return None
+
+    def _raw_to_displayed(self, raw: np.ndarray) -> np.ndarray:
+        """Convert a raw slice for display, see `Layer._raw_to_displayed`."""
+        return self.layer._raw_to_displayed(raw)
 
     def _set_view_slice(self):
         if (
@@ -891,7 +1101,7 @@ class ScalarFieldSlicingState(_LayerSlicingState):
             and self.layer._locked_data_level is None
         ):
             displayed = list(self._slice_input.displayed)
-            level = len(self.layer.level_shapes) - 1
+            level = self.layer._volume_data_level(displayed)
             shape = np.take(
                 np.asarray(self.layer.level_shapes[level]), displayed
             )
@@ -960,7 +1170,9 @@ class ScalarFieldSlicingState(_LayerSlicingState):
             if locked is not None:
                 data_level = locked
             elif slice_input.ndisplay == 3:
-                data_level = len(data) - 1  # type: ignore[arg-type]
+                data_level = self.layer._volume_data_level(
+                    slice_input.displayed
+                )
             else:
                 data_level = self.layer.data_level
         else:
@@ -1002,6 +1214,16 @@ class ScalarFieldSlicingState(_LayerSlicingState):
             thumbnail_level=thumbnail_level,
             level_shapes=self.layer.level_shapes,
             downsample_factors=self.layer.downsample_factors,
+            brick_cache=self._brick_cache
+            if self.layer.multiscale
+            and (
+                slice_input.ndisplay == 2
+                or get_settings().experimental.multiscale_volume_streaming
+            )
+            else None,
+            max_texture_size=self._max_texture_size(slice_input.ndisplay),
+            texture_cache=self._texture_cache,
+            buffer_pool=self._buffer_pool,
         )
 
     def _update_slice_response(
@@ -1010,7 +1232,7 @@ class ScalarFieldSlicingState(_LayerSlicingState):
         """Update the slice output state currently on the layer. Currently used
         for both sync and async slicing.
         """
-        response = response.to_displayed(self.layer._raw_to_displayed)
+        response = response.to_displayed(self._raw_to_displayed)
         # We call to_displayed here to ensure that if the contrast limits
         # are outside the range of supported by vispy, then data view is
         # rescaled to fit within the range.
@@ -1019,4 +1241,13 @@ class ScalarFieldSlicingState(_LayerSlicingState):
         self.layer._transforms[0] = response.tile_to_data
         #
         self.transforms = response.tile_to_data
-        self._slice = response
+        previous, self._slice = self._slice, response
+        if previous.image.view is not response.image.view:
+            # the canvas may display the view of the replaced slice until it
+            # is drawn again. Older replaced views are left to the garbage
+            # collector, since the canvas may not have been drawn at all.
+            self._replaced_view = previous.image.view
+        add_counter_event('slice_bytes_copied', image=response.bytes_copied)
+        slicing_stats.count(
+            'bytes_copied', response.bytes_copied, layer=self.layer
+        )
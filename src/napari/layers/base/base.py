@@ -28,6 +28,7 @@ from napari.layers.base._base_mouse_bindings import (
     highlight_box_handles,
     transform_with_box,
 )
+from napari.layers.utils._memory import MemoryReport
 from napari.layers.utils._slice_input import (
     _SliceInput,
     _ThickNDSlice,
@@ -46,6 +47,7 @@ from napari.layers.utils.layer_utils import (
 from napari.layers.utils.plane import ClippingPlane, ClippingPlaneList
 from napari.settings import get_settings
 from napari.types import LayerDataType
+from napari.utils._buffer_pool import BufferPool
 from napari.utils._dask_utils import configure_dask
 from napari.utils._magicgui import (
     add_layer_to_viewer,
@@ -62,6 +64,7 @@ from napari.utils.migrations import _DeprecatingDict
 from napari.utils.misc import StringEnum
 from napari.utils.mouse_bindings import MousemapProvider
 from napari.utils.naming import magic_name
+from napari.utils.perf import slicing_stats
 from napari.utils.status_messages import (
     generate_layer_status_strings,
 )
@@ -134,9 +137,14 @@ class _LayerSlicingState(ABC):
         self._loaded: bool = True
         self._last_slice_id: int = -1
         self._units: tuple[pint.Unit, ...] | None = None
+        # replaced by the pool of the viewer's layer slicer, if any
+        self._buffer_pool = BufferPool()
 
     def set_view_slice(self) -> None:
-        with self.dask_optimized_slicing():
+        with (
+            slicing_stats.slicing(self.layer),
+            self.dask_optimized_slicing(),
+        ):
             self._set_view_slice()
 
     def _slice_indices(
@@ -293,6 +301,27 @@ class _LayerSlicingState(ABC):
     def _set_view_slice(self):
         raise NotImplementedError
 
+    def _release_drawn_buffers(self) -> None:  # noqa: B027
+        """Release the buffers of the slices the canvas no longer displays.
+
+        Called once the canvas was drawn with the current slice. By default,
+        slices don't keep buffers of the buffer pool.
+        """
+
+    def _add_memory(self, report: MemoryReport) -> None:
+        """Add the memory held by the current slice to ``report``.
+
+        By default, the arrays of the attributes named ``_view_*``.
+        """
+        report.add(
+            'view',
+            *(
+                value
+                for name, value in vars(self).items()
+                if name.startswith('_view_')
+            ),
+        )
+
     @property
     def loaded(self) -> bool:
         """True if this layer is fully loaded in memory, False otherwise.
@@ -575,6 +604,9 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
         self._blending = Blending(blending)
         self._visible = visible
         self._visible_mode: str | None = None
+        # incremented whenever the extent is cleared, so that caches of the
+        # extent, e.g. in LayerList, only check it again once it may differ
+        self._extent_version = 0
         self._freeze = False
         self._status = 'Ready'
         self._help = ''
@@ -1246,6 +1278,7 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
 
     def _clear_extent(self) -> None:
         """Clear extent cache and emit extent event."""
+        self._extent_version += 1
         if 'extent' in self.__dict__:
             del self.extent
         if '_extent_augmented' in self.__dict__:
@@ -1297,6 +1330,37 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
     def _get_state(self) -> dict[str, Any]:
         raise NotImplementedError
 
+    def _memory_report(self) -> dict[str, int]:
+        """Bytes held in memory by the layer, by category.
+
+        The categories include ``'data'``, ``'view'`` (the current slice),
+        ``'thumbnail'``, ``'features'`` and ``'caches'``, and others
+        depending on the layer type, e.g. ``'mesh'`` or ``'undo'``. Only
+        the buffers of numpy arrays and pandas objects are counted, each
+        once, see :class:`napari.layers.utils._memory.MemoryReport`.
+
+        Returns
+        -------
+        dict of str to int
+            The bytes of each category.
+        """
+        report = MemoryReport()
+        self._add_memory(report)
+        return report.nbytes
+
+    def _add_memory(self, report: MemoryReport) -> None:
+        """Add the memory held by the layer to ``report``.
+
+        Layers override this to add their own categories, after calling
+        the base implementation.
+        """
+        report.add('data', self.data)
+        self._slicing_state._add_memory(report)
+        report.add('thumbnail', self._thumbnail)
+        report.add('features', getattr(self, 'features', None))
+        # reported even if the layer has no caches
+        report.add('caches')
+
     @property
     def _type_string(self) -> str:
         return self.__class__.__name__.lower()
@@ -2153,6 +2217,8 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
         shape_threshold : tuple
             Requested shape of field of view in data coordinates.
         """
+        # the canvas was drawn, so it no longer displays replaced slices
+        self._slicing_state._release_drawn_buffers()
         self.scale_factor = scale_factor
 
         displayed_axes = self._slice_input.displayed
@@ -145,3 +145,19 @@ class ImageProjectionMode(StringEnum):
     MEAN = auto()
     MAX = auto()
     MIN = auto()
+
+
+class ImageTexturePrecision(StringEnum):
+    """TexturePrecision: Precision of the textures of image slices.
+
+    * AUTO: slices are displayed with the closest dtype that textures
+      support, e.g. float32 for float64 data.
+    * UINT16: slices are quantized to 65536 levels over the contrast limits
+      range.
+    * UINT8: slices are quantized to 256 levels over the contrast limits
+      range.
+    """
+
+    AUTO = auto()
+    UINT16 = auto()
+    UINT8 = auto()
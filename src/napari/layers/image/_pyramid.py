@@ -0,0 +1,628 @@
+"""Pyramids built automatically for ``Image(..., multiscale='auto')``.
+
+Each level of an automatic pyramid halves the last two (spatial) axes of the
+previous one, with the mean of blocks of 2x2 pixels. The levels are computed
+one plane (an index of the other axes) at a time, in bands of rows so that
+large planes are never read at once:
+
+* planes that are read by slicing are computed on demand;
+* all the other planes are computed by background threads.
+
+Once all levels are computed, they are saved in the user cache directory,
+under a key identifying the data, so that the pyramid of the same data is
+memory-mapped instead of being computed again. The key is computed by a
+background thread, as it may read all the data, and the least recently used
+pyramids are removed once the cache is larger than ``_CACHE_BYTES``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import json
+import logging
+import math
+import os
+import shutil
+import threading
+import time
+import uuid
+import weakref
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from napari.layers._multiscale_data import MultiScaleData
+from napari.layers._scalar_field._downsample import block_reduce
+from napari.utils._platformdirs import user_cache_dir
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from numpy.typing import DTypeLike
+
+    from napari.layers._data_protocols import LayerDataProtocol
+
+_logger = logging.getLogger(__name__)
+
+#: Largest size of the spatial axes of data kept single scale, and of the
+#: coarsest level of automatic pyramids.
+AUTO_MULTISCALE_SIZE = 2048
+
+# Bands of rows are read in blocks of at most this size.
+_BAND_BYTES = 64 * 2**20
+
+# Number of threads computing each pyramid in the background.
+_N_WORKERS = min(4, os.cpu_count() or 1)
+
+# Bump when the way levels are computed changes, to invalidate cached
+# pyramids.
+_PYRAMID_VERSION = 1
+
+# Largest total size of the cached pyramids.
+_CACHE_BYTES = 8 * 2**30
+
+# Age after which the temporary directories of pyramids which were never
+# completed, e.g. because napari exited, are removed.
+_STALE_SECONDS = 24 * 3600
+
+
+def pyramid_cache_dir() -> Path:
+    """Directory where automatic pyramids are cached."""
+    return Path(user_cache_dir()) / 'pyramids'
+
+
+def auto_multiscale(
+    data: LayerDataProtocol, ndim: int
+) -> LayerDataProtocol | MultiScaleData:
+    """Wrap ``data`` in an automatic pyramid, if it is large.
+
+    Parameters
+    ----------
+    data : array-like
+        Single-scale image data.
+    ndim : int
+        Number of dimensions of the layer, which is one less than
+        ``data.ndim`` for RGB(A) data.
+
+    Returns
+    -------
+    array-like or MultiScaleData
+        ``data`` itself if its spatial axes are at most
+        ``AUTO_MULTISCALE_SIZE`` long, otherwise a pyramid with ``data`` as
+        its first level.
+    """
+    shapes = _level_shapes(tuple(data.shape), ndim)
+    if len(shapes) == 1:
+        return data
+    builder = _PyramidBuilder(data, shapes, ndim)
+    return MultiScaleData(
+        [data]
+        + [_PyramidLevel(builder, level) for level in range(1, len(shapes))]
+    )
+
+
+def refresh_auto_multiscale(data: Any) -> None:
+    """Compute the automatic pyramid of ``data`` again, if the data changed.
+
+    Called when the data may have been modified in place.
+
+    Parameters
+    ----------
+    data : array-like or MultiScaleData
+        The data of an image layer.
+    """
+    if not isinstance(data, MultiScaleData):
+        return
+    for level in data:
+        if isinstance(level, _PyramidLevel):
+            level._builder.revalidate()
+            return
+
+
+def _level_shapes(shape: tuple[int, ...], ndim: int) -> list[tuple[int, ...]]:
+    """Shapes of the levels of the automatic pyramid of ``shape``."""
+    shapes = [shape]
+    while max(shapes[-1][ndim - 2 : ndim]) > AUTO_MULTISCALE_SIZE:
+        previous = shapes[-1]
+        shapes.append(
+            previous[: ndim - 2]
+            + tuple(-(-n // 2) for n in previous[ndim - 2 : ndim])
+            + previous[ndim:]
+        )
+    return shapes
+
+
+def _data_token(data: Any) -> Callable[[], str | None] | None:
+    """A function returning a string identifying the content of ``data``.
+
+    NumPy arrays are identified by a hash of their content, dask arrays by
+    their name (which is derived from their content or source) and zarr
+    arrays in local directories by the sizes and modification times of
+    their files. Other arrays have no token, and their pyramids are not
+    cached on disk.
+
+    Returns
+    -------
+    callable or None
+        None if ``data`` can't be identified. Otherwise a function returning
+        the token, or None, which may read all the data.
+    """
+    if isinstance(data, np.ndarray):
+        return partial(_numpy_token, data)
+    module = type(data).__module__
+    if module.startswith('dask.') and isinstance(
+        getattr(data, 'name', None), str
+    ):
+        return partial(str, f'dask-{data.name}')
+    if module.startswith('zarr.') and hasattr(data, 'store'):
+        # the local directory of zarr v3 and v2 stores
+        root = getattr(data.store, 'root', None) or getattr(
+            data.store, 'path', None
+        )
+        if isinstance(root, str | os.PathLike):
+            return partial(_zarr_token, Path(root) / getattr(data, 'path', ''))
+    return None
+
+
+def _numpy_token(data: np.ndarray) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for index in np.ndindex(data.shape[:1]):
+        digest.update(np.ascontiguousarray(data[index]).data)
+    return f'numpy-{digest.hexdigest()}'
+
+
+def _zarr_token(path: Path) -> str | None:
+    """Identify a zarr array by the metadata and chunk files in ``path``."""
+    if not path.is_dir():
+        return None
+    digest = hashlib.blake2b(digest_size=16)
+    for dirpath, dirnames, filenames in os.walk(path):
+        dirnames.sort()
+        for name in sorted(filenames):
+            file = Path(dirpath, name)
+            stat = file.stat()
+            digest.update(
+                f'{file.relative_to(path)}:{stat.st_size}:{stat.st_mtime_ns}'.encode()
+            )
+    return f'zarr-{path.resolve()}-{digest.hexdigest()}'
+
+
+def _evict_cache(keep: str) -> None:
+    """Remove the least recently used pyramids beyond ``_CACHE_BYTES``.
+
+    Parameters
+    ----------
+    keep : str
+        The key of a pyramid which is never removed.
+    """
+    cache_dir = pyramid_cache_dir()
+    pyramids = []
+    now = time.time()
+    for path in cache_dir.iterdir():
+        try:
+            mtime = path.stat().st_mtime
+            size = sum(file.stat().st_size for file in path.iterdir())
+        except OSError:
+            continue
+        if '.' in path.name:
+            # the temporary directory of a pyramid being computed
+            if now - mtime > _STALE_SECONDS:
+                shutil.rmtree(path, ignore_errors=True)
+            continue
+        pyramids.append((mtime, size, path))
+    total = sum(size for _, size, _ in pyramids)
+    for _, size, path in sorted(pyramids):
+        if total <= _CACHE_BYTES:
+            break
+        if path.name != keep:
+            # pyramids memory-mapped by layers stay readable once removed,
+            # except on Windows where they can't be removed
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+
+class _PyramidBuilder:
+    """Computes and stores the levels of an automatic pyramid.
+
+    Parameters
+    ----------
+    data : array-like
+        The first level of the pyramid.
+    shapes : list of tuple of int
+        The shapes of all the levels, including the first one.
+    ndim : int
+        Number of dimensions of the layer. The spatial axes are
+        ``ndim - 2`` and ``ndim - 1``.
+
+    Notes
+    -----
+    Levels are first computed in a temporary directory, while a background
+    thread identifies the data. If a pyramid of the data is cached, the
+    levels are replaced with the cached ones, otherwise the levels are moved
+    to the cache once complete. When the data may have been modified in
+    place, `revalidate` identifies it again, and the same builder computes
+    the levels again only if it changed.
+    """
+
+    def __init__(
+        self,
+        data: LayerDataProtocol,
+        shapes: list[tuple[int, ...]],
+        ndim: int,
+    ) -> None:
+        self.data = data
+        self.dtype = np.dtype(data.dtype)
+        self.shapes = shapes
+        self.n_lead = ndim - 2
+        lead_shape = shapes[0][: self.n_lead]
+        n_planes = math.prod(lead_shape)
+        self._plane_ids = np.arange(n_planes).reshape(lead_shape)
+        n_levels = len(shapes) - 1
+        self._done = np.zeros((n_levels, n_planes), dtype=bool)
+        self._locks = [
+            [threading.Lock() for _ in range(n_planes)]
+            for _ in range(n_levels)
+        ]
+        self._lock = threading.Lock()
+        self._remaining = n_levels * n_planes
+        self._tmp_dir: Path | None = None
+        self._remove_tmp_dir: weakref.finalize | None = None
+        self._cache_key: str | None = None
+        self._cancelled = False
+        self._identified = threading.Event()
+        # cleared while the data is identified again, see revalidate
+        self._valid = threading.Event()
+        self._valid.set()
+        # incremented when the levels are computed again
+        self._generation = 0
+
+        self._token = _data_token(data)
+        self.levels = self._create_levels(cacheable=self._token is not None)
+
+        self._queue = self._new_queue()
+        # all the threads started, and those computing planes
+        self._workers: list[threading.Thread] = []
+        self._computing: list[threading.Thread] = []
+        if self._token is None:
+            self._identified.set()
+        else:
+            self._start(self._identify, self._token)
+        self._start_workers()
+
+    @property
+    def started(self) -> bool:
+        """True if levels were computed, or found in the cache."""
+        return self._identified.is_set() or bool(self._done.any())
+
+    @property
+    def complete(self) -> bool:
+        """True if all the levels are computed."""
+        return self._remaining <= 0
+
+    def cancel(self) -> None:
+        """Stop computing the levels, e.g. once the data changed."""
+        self._cancelled = True
+        self._discard_tmp_dir()
+
+    def revalidate(self) -> None:
+        """Compute the levels again if the data changed since they were.
+
+        The data is identified again by a background thread, and planes are
+        only read once it is done: the levels are kept if the data is
+        unchanged. Data which can't be identified is assumed to have
+        changed.
+        """
+        if not self.started or self._cancelled:
+            # nothing was computed from the data yet
+            return
+        if self._token is None:
+            with self._lock:
+                self._reset(None, None)
+            self._start_workers()
+            return
+        self._valid.clear()
+        self._start(self._reidentify, self._token)
+
+    def _reidentify(self, token: Callable[[], str | None]) -> None:
+        """Compute the levels again if the key of the data changed."""
+        try:
+            self._identified.wait()
+            key = self._cache_key_from(token())
+            if key is not None and key == self._cache_key:
+                return
+            cached = None if key is None else self._open_cache(key)
+            with self._lock:
+                self._reset(key, cached)
+        except Exception:
+            _logger.warning('Could not identify the data', exc_info=True)
+        finally:
+            self._valid.set()
+        if self.complete:
+            self._save()
+        else:
+            self._start_workers()
+
+    def _reset(self, key: str | None, cached: list[np.ndarray] | None) -> None:
+        """Forget the computed planes, using ``cached`` levels if any.
+
+        Must be called with the lock held.
+        """
+        self._generation += 1
+        self._discard_tmp_dir(locked=True)
+        self._cache_key = key
+        self._queue = self._new_queue()
+        if cached is not None:
+            self.levels = cached
+            self._done[:] = True
+            self._remaining = 0
+            return
+        self.levels = self._create_levels(cacheable=self._token is not None)
+        self._done[:] = False
+        self._remaining = self._done.size
+
+    def _new_queue(self) -> Iterator[tuple[int, int]]:
+        return itertools.product(
+            range(1, len(self.shapes)), range(self._done.shape[1])
+        )
+
+    def _start(self, target: Callable, *args: Any) -> threading.Thread:
+        thread = threading.Thread(
+            target=target, args=args, name='napari-pyramid', daemon=True
+        )
+        self._workers = [t for t in self._workers if t.is_alive()]
+        self._workers.append(thread)
+        thread.start()
+        return thread
+
+    def _start_workers(self) -> None:
+        """Start threads computing planes, up to ``_N_WORKERS`` of them."""
+        with self._lock:
+            self._computing = [t for t in self._computing if t.is_alive()]
+            for _ in range(_N_WORKERS - len(self._computing)):
+                self._computing.append(self._start(self._work))
+
+    def _identify(self, token: Callable[[], str | None]) -> None:
+        """Use the cached pyramid of the data, if there is one."""
+        try:
+            key = self._cache_key_from(token())
+            cached = None if key is None else self._open_cache(key)
+            with self._lock:
+                self._cache_key = key
+                if cached is not None and not self._cancelled:
+                    # planes being computed are not stored
+                    self._generation += 1
+                    self.levels = cached
+                    self._done[:] = True
+                    self._remaining = 0
+            if cached is not None:
+                self._discard_tmp_dir()
+        except Exception:
+            _logger.warning('Could not identify the data', exc_info=True)
+        finally:
+            self._identified.set()
+        if self.complete:
+            self._save()
+
+    def _cache_key_from(self, token: str | None) -> str | None:
+        if token is None:
+            return None
+        key = json.dumps(
+            [_PYRAMID_VERSION, token, self.shapes, self.dtype.str]
+        ).encode()
+        return hashlib.blake2b(key, digest_size=16).hexdigest()
+
+    def _open_cache(self, key: str) -> list[np.ndarray] | None:
+        """Memory-map the levels of a cached pyramid, if there is one."""
+        path = pyramid_cache_dir() / key
+        try:
+            levels = [
+                np.load(path / f'level{level}.npy', mmap_mode='r')
+                for level in range(1, len(self.shapes))
+            ]
+            # the modification time of pyramids is their last use
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        if [level.shape for level in levels] != [
+            tuple(shape) for shape in self.shapes[1:]
+        ] or any(level.dtype != self.dtype for level in levels):
+            return None
+        return levels
+
+    def _create_levels(self, cacheable: bool) -> list[np.ndarray]:
+        """Allocate the levels, in a temporary cache directory if possible."""
+        if cacheable:
+            tmp_dir = pyramid_cache_dir() / f'tmp.{uuid.uuid4().hex}'
+            try:
+                tmp_dir.mkdir(parents=True)
+                levels = [
+                    np.lib.format.open_memmap(
+                        tmp_dir / f'level{level}.npy',
+                        mode='w+',
+                        dtype=self.dtype,
+                        shape=self.shapes[level],
+                    )
+                    for level in range(1, len(self.shapes))
+                ]
+            except OSError:
+                _logger.warning(
+                    'Could not cache the pyramid in %s', tmp_dir, exc_info=True
+                )
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+            else:
+                self._tmp_dir = tmp_dir
+                # removed unless the levels are moved to the cache
+                self._remove_tmp_dir = weakref.finalize(
+                    self, shutil.rmtree, tmp_dir, True
+                )
+                return levels
+        return [np.empty(shape, dtype=self.dtype) for shape in self.shapes[1:]]
+
+    def ensure(self, level: int, key: Any) -> None:
+        """Compute the planes of ``level`` that ``key`` indexes."""
+        key = key if isinstance(key, tuple) else (key,)
+        if any(k is Ellipsis for k in key):
+            i = next(i for i, k in enumerate(key) if k is Ellipsis)
+            n_expanded = len(self.shapes[0]) - len(key) + 1
+            key = key[:i] + (slice(None),) * n_expanded + key[i + 1 :]
+        lead_key = key[: self.n_lead]
+        # the levels are only read once the data is identified again
+        self._valid.wait()
+        for plane in np.unique(self._plane_ids[lead_key]):
+            self._ensure_plane(level, int(plane))
+
+    def _ensure_plane(self, level: int, plane: int) -> None:
+        if self._done[level - 1, plane]:
+            return
+        with self._locks[level - 1][plane]:
+            if level > 1:
+                self._ensure_plane(level - 1, plane)
+            with self._lock:
+                if self._done[level - 1, plane]:
+                    return
+                # the levels are replaced if the pyramid is found in the
+                # cache, or computed again once the data changed
+                levels, generation = self.levels, self._generation
+            self._compute_plane(levels, level, plane)
+            with self._lock:
+                if generation != self._generation:
+                    return
+                self._done[level - 1, plane] = True
+                self._remaining -= 1
+                complete = self._remaining == 0
+        if complete:
+            self._save()
+
+    def _compute_plane(
+        self, levels: list[np.ndarray], level: int, plane: int
+    ) -> None:
+        """Compute a plane of ``level`` from the previous level."""
+        source = self.data if level == 1 else levels[level - 2]
+        dest = levels[level - 1]
+        lead = tuple(
+            int(i) for i in np.unravel_index(plane, self._plane_ids.shape)
+        )
+        n_rows = source.shape[self.n_lead]
+        row_bytes = (
+            math.prod(source.shape[self.n_lead + 1 :]) * self.dtype.itemsize
+        )
+        band = max(_BAND_BYTES // max(row_bytes, 1) // 2 * 2, 2)
+        for start in range(0, n_rows, band):
+            block = np.asarray(source[lead + (slice(start, start + band),)])
+            reduced = block_reduce(block, (2, 2), 'mean')
+            dest[lead + (slice(start // 2, start // 2 + len(reduced)),)] = (
+                reduced
+            )
+
+    def _work(self) -> None:
+        """Compute planes in the background until all levels are done."""
+        # don't compute levels which may be found in the cache
+        self._identified.wait()
+        while not self._cancelled:
+            with self._lock:
+                item = next(self._queue, None)
+            if item is None:
+                return
+            try:
+                self._ensure_plane(*item)
+            except Exception:
+                # the plane is computed again (raising) when it's read
+                _logger.warning(
+                    'Could not compute pyramid level %s',
+                    item[0],
+                    exc_info=True,
+                )
+                return
+
+    def _save(self) -> None:
+        """Move the levels of a complete pyramid to the cache directory."""
+        with self._lock:
+            tmp_dir, key = self._tmp_dir, self._cache_key
+            if (
+                tmp_dir is None
+                or key is None
+                or self._cancelled
+                or not self._identified.is_set()
+            ):
+                return
+            self._tmp_dir = None
+        for level in self.levels:
+            level.flush()
+        path = pyramid_cache_dir() / key
+        try:
+            # the levels stay memory-mapped from the moved files
+            tmp_dir.replace(path)
+            os.utime(path)
+        except OSError:
+            # e.g. another process cached the same pyramid first
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        else:
+            self._remove_tmp_dir.detach()
+            _evict_cache(keep=key)
+
+    def _discard_tmp_dir(self, locked: bool = False) -> None:
+        """Remove the temporary directory of the levels, if any.
+
+        Parameters
+        ----------
+        locked : bool
+            Whether the caller holds the lock.
+        """
+        if locked:
+            self._tmp_dir = None
+        else:
+            with self._lock:
+                self._tmp_dir = None
+        if self._remove_tmp_dir is not None:
+            self._remove_tmp_dir()
+
+
+class _PyramidLevel:
+    """A level of an automatic pyramid, whose planes are computed on access.
+
+    Parameters
+    ----------
+    builder : _PyramidBuilder
+        The builder of the pyramid.
+    level : int
+        The index of the level in the pyramid, starting at 1.
+    """
+
+    def __init__(self, builder: _PyramidBuilder, level: int) -> None:
+        self._builder = builder
+        self._level = level
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._builder.dtype
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self._builder.shapes[self._level]
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        return math.prod(self.shape)
+
+    def __getitem__(self, key: Any) -> np.ndarray:
+        self._builder.ensure(self._level, key)
+        return self._builder.levels[self._level - 1][key]
+
+    def __array__(
+        self, dtype: DTypeLike = None, copy: bool | None = None
+    ) -> np.ndarray:
+        return np.asarray(self[...], dtype=dtype)
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for i in range(self.shape[0]):
+            yield self[i]
+
+    def __len__(self) -> int:
+        return self.shape[0]
@@ -1,17 +1,47 @@
+import itertools
+import math
+from dataclasses import dataclass, field
+from functools import partial
 from typing import TYPE_CHECKING
 
 import numpy as np
 import numpy.typing as npt
 
-from napari.layers._scalar_field._slice import _ScalarFieldSliceRequest
+from napari.layers._scalar_field._downsample import block_reduce
+from napari.layers._scalar_field._slice import (
+    _ScalarFieldSliceRequest,
+    _ScalarFieldView,
+)
+from napari.layers._scalar_field._texture import as_texture
 from napari.layers.image._image_constants import ImageProjectionMode
 from napari.types import ArrayLike
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
 
+    from napari.layers.image._sliding_projection import _SlidingProjection
 
+# Thick slabs larger than this are projected block by block along one of the
+# projected axes instead of being read into memory at once.
+_PROJECTION_BLOCK_BYTES = 64 * 2**20
+
+
+@dataclass(frozen=True)
 class _ImageSliceRequest(_ScalarFieldSliceRequest):
+    """A callable that stores all the input data needed to slice an image.
+
+    Attributes
+    ----------
+    projection_window : _SlidingProjection or None
+        State of the layer's last thick-slice projection. It is updated in
+        place, so that moving the slice point only reads the planes that
+        enter or leave the thick slice.
+    """
+
+    projection_window: '_SlidingProjection | None' = field(
+        default=None, repr=False, compare=False
+    )
+
     @staticmethod
     def _project_slice(
         data: ArrayLike, axis: tuple[int, ...], mode: ImageProjectionMode
@@ -37,3 +67,151 @@ class _ImageSliceRequest(_ScalarFieldSliceRequest):
         else:
             raise NotImplementedError(f'unimplemented projection: {mode}')
         return func(data, tuple(axis))
+
+    def _make_view(self, data: np.ndarray) -> tuple[_ScalarFieldView, int]:
+        """Convert the slice to a contiguous array with a texture dtype.
+
+        The slice is mapped with ``texture_mapping`` instead, if it is set.
+        """
+        if self.texture_mapping is not None:
+            view, bytes_copied = self.texture_mapping.apply(
+                data, self.buffer_pool
+            )
+        else:
+            view, bytes_copied = as_texture(
+                data,
+                self.buffer_pool,
+                rgb=self.rgb and self.slice_input.ndisplay == 2,
+            )
+        return _ScalarFieldView(raw=data, view=view), bytes_copied
+
+    @staticmethod
+    def _downsample_texture(
+        data: np.ndarray, factors: tuple[int, ...]
+    ) -> np.ndarray:
+        """Average blocks of ``factors`` pixels, to avoid aliasing."""
+        return block_reduce(data, factors, 'mean')
+
+    def _project_slab(
+        self,
+        data: ArrayLike,
+        slices: tuple[slice, ...],
+        axis: tuple[int, ...],
+    ) -> np.ndarray:
+        """Project ``data[slices]`` along ``axis``, streaming large slabs.
+
+        If the previous projection overlaps this one, it is updated with
+        ``projection_window``. Otherwise, slabs larger than
+        ``_PROJECTION_BLOCK_BYTES`` are read in blocks along the longest
+        projected axis (aligned to the chunks of the data, if any), and each
+        plane of a block is reduced into a running accumulator. Peak memory
+        is then one block plus the accumulator, instead of the whole slab.
+        """
+        # RGB(A) data has a trailing channel axis that is not sliced
+        shape = tuple(
+            len(range(*s.indices(n)))
+            for s, n in zip(slices, data.shape, strict=False)
+        ) + tuple(data.shape[len(slices) :])
+        dtype = np.dtype(data.dtype)
+        nbytes = math.prod(shape) * dtype.itemsize
+        if (
+            all(shape[a] == 1 for a in axis)
+            or self.projection_mode == ImageProjectionMode.NONE
+        ):
+            return super()._project_slab(data, slices, axis)
+
+        mode = self.projection_mode
+        if self.projection_window is not None and not self.multiscale:
+            projected = self.projection_window.project(
+                data, slices, axis, mode
+            )
+            if projected is not None:
+                return projected
+        if nbytes <= _PROJECTION_BLOCK_BYTES:
+            return super()._project_slab(data, slices, axis)
+
+        reduce, combine, acc_dtype = _accumulator(mode, dtype)
+        stream_axis = max(axis, key=lambda a: shape[a])
+        # the other projected axes, once stream_axis is removed
+        plane_axes = tuple(
+            a - (a > stream_axis) for a in axis if a != stream_axis
+        )
+        acc = None
+        for block in _iter_blocks(data, slices, stream_axis, nbytes):
+            for plane in np.moveaxis(block, stream_axis, 0):
+                if plane_axes:
+                    plane = reduce(plane, plane_axes)
+                if acc is None:
+                    acc = np.array(plane, dtype=acc_dtype)
+                else:
+                    combine(acc, plane, out=acc)
+
+        return _finalize(acc, mode, math.prod(shape[a] for a in axis), dtype)
+
+
+def _accumulator(
+    mode: ImageProjectionMode, dtype: np.dtype
+) -> tuple['Callable', 'Callable', np.dtype]:
+    """Reduction, combination and accumulator dtype of a projection mode.
+
+    Projecting a slab plane by plane with these gives the same dtype as
+    `_ImageSliceRequest._project_slice` (see `_finalize`).
+    """
+    if mode == ImageProjectionMode.MAX:
+        return np.max, np.maximum, dtype
+    if mode == ImageProjectionMode.MIN:
+        return np.min, np.minimum, dtype
+    if mode == ImageProjectionMode.SUM:
+        acc_dtype = np.sum(np.zeros(1, dtype=dtype)).dtype
+    elif mode == ImageProjectionMode.MEAN:
+        # np.mean accumulates integers in float64 and float16 in float32
+        if dtype.kind == 'f':
+            acc_dtype = np.promote_types(dtype, np.float32)
+        else:
+            acc_dtype = np.dtype(np.float64)
+    else:
+        raise NotImplementedError(f'unimplemented projection: {mode}')
+    return partial(np.sum, dtype=acc_dtype), np.add, acc_dtype
+
+
+def _finalize(
+    acc: np.ndarray, mode: ImageProjectionMode, count: int, dtype: np.dtype
+) -> np.ndarray:
+    """Turn an accumulator of ``count`` planes into the projection."""
+    if mode == ImageProjectionMode.MEAN:
+        acc /= count
+        return acc.astype(np.mean(np.zeros(1, dtype=dtype)).dtype, copy=False)
+    return acc
+
+
+def _iter_blocks(
+    data: ArrayLike,
+    slices: tuple[slice, ...],
+    axis: int,
+    nbytes: int,
+) -> 'Iterator[np.ndarray]':
+    """Read ``data[slices]`` in blocks of planes along ``axis``.
+
+    Blocks hold at most ``_PROJECTION_BLOCK_BYTES`` (but at least one chunk
+    of the data along ``axis``) and start at chunk boundaries, so that each
+    chunk is only read once.
+    """
+    start, stop, _ = slices[axis].indices(data.shape[axis])
+    plane_bytes = nbytes // (stop - start)
+    chunk = _chunk_length(data, axis)
+    step = max(_PROJECTION_BLOCK_BYTES // plane_bytes // chunk, 1) * chunk
+    bounds = [start, *range((start // step + 1) * step, stop, step), stop]
+    block_slices = list(slices)
+    for low, high in itertools.pairwise(bounds):
+        block_slices[axis] = slice(low, high)
+        yield np.asarray(data[tuple(block_slices)])
+
+
+def _chunk_length(data: ArrayLike, axis: int) -> int:
+    """Length of the storage chunks of ``data`` along ``axis``, if chunked."""
+    # dask arrays have `chunksize`, zarr and h5py datasets `chunks`
+    chunks = getattr(data, 'chunksize', None) or getattr(data, 'chunks', None)
+    try:
+        return max(int(chunks[axis]), 1)
+    except (TypeError, IndexError, ValueError):
+        return 1
@@ -0,0 +1,354 @@
+"""Incremental update of thick-slice projections when the slice moves.
+
+When the slice point of a thick slice moves by a few planes, most of the
+planes in the new thick slice were already part of the previous one. The
+:class:`_SlidingProjection` of an image layer keeps the state of its last
+projection so that only the planes entering or leaving the thick slice are
+read:
+
+* SUM and MEAN keep the running sum of the thick slice, which is updated by
+  subtracting the leaving planes and adding the entering ones.
+* MAX and MIN keep the planes of the thick slice in a deque made of two
+  stacks of running maxima (or minima), so that planes can be added or
+  removed at both ends in amortized constant time.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from napari.layers.image._image_constants import ImageProjectionMode
+from napari.layers.image._slice import (
+    _PROJECTION_BLOCK_BYTES,
+    _accumulator,
+    _finalize,
+    _iter_blocks,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from napari.types import ArrayLike
+
+# MAX and MIN keep two planes per plane of the thick slice, SUM and MEAN a
+# single plane. The states of the projections of all the layers share this
+# budget: thick slices whose state doesn't fit in what the other layers left
+# are projected without keeping any state.
+_WINDOW_CACHE_BYTES = 4 * _PROJECTION_BLOCK_BYTES
+
+# the bytes kept by the state of each projection, until it is cleared or
+# garbage collected
+_kept_bytes: weakref.WeakKeyDictionary[_SlidingProjection, int] = (
+    weakref.WeakKeyDictionary()
+)
+_kept_bytes_lock = threading.Lock()
+
+
+def _reserve(projection: _SlidingProjection, nbytes: int) -> bool:
+    """Reserve ``nbytes`` of the budget for the state of ``projection``.
+
+    The reservation replaces the previous one of ``projection``. Returns
+    False, and releases the previous reservation, if the other projections
+    keep too much for ``nbytes`` to fit in the budget.
+    """
+    with _kept_bytes_lock:
+        others = sum(
+            kept
+            for other, kept in _kept_bytes.items()
+            if other is not projection
+        )
+        if others + nbytes > _WINDOW_CACHE_BYTES:
+            _kept_bytes.pop(projection, None)
+            return False
+        _kept_bytes[projection] = nbytes
+        return True
+
+
+def _release(projection: _SlidingProjection) -> None:
+    """Release the budget reserved for the state of ``projection``."""
+    with _kept_bytes_lock:
+        _kept_bytes.pop(projection, None)
+
+
+class _SlidingProjection:
+    """State of the last thick-slice projection of an image layer.
+
+    The state is only reused if the new thick slice differs from the
+    previous one along a single axis, for the same data, dtype and mode.
+    It must be cleared with :meth:`clear` when the data is modified in place.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._key: tuple | None = None
+        self._data_ref: weakref.ref | None = None
+        self._low = 0
+        self._high = 0
+        self._sum: np.ndarray | None = None
+        self._updates = 0
+        self._deque: _AggregateDeque | None = None
+
+    def clear(self) -> None:
+        """Forget the previous projection."""
+        with self._lock:
+            self._reset()
+
+    def _reset(self) -> None:
+        _release(self)
+        self._key = None
+        self._data_ref = None
+        self._sum = None
+        self._deque = None
+
+    def project(
+        self,
+        data: ArrayLike,
+        slices: tuple[slice, ...],
+        axis: tuple[int, ...],
+        mode: ImageProjectionMode,
+    ) -> np.ndarray | None:
+        """Project ``data[slices]`` along ``axis``, reusing the last state.
+
+        Returns None if the projection can't be computed incrementally, in
+        which case the state is cleared.
+        """
+        with self._lock:
+            try:
+                return self._project(data, slices, axis, mode)
+            except BaseException:
+                self._reset()
+                raise
+
+    def _project(
+        self,
+        data: ArrayLike,
+        slices: tuple[slice, ...],
+        axis: tuple[int, ...],
+        mode: ImageProjectionMode,
+    ) -> np.ndarray | None:
+        extents = {a: slices[a].indices(data.shape[a])[:2] for a in axis}
+        thick = [a for a in axis if extents[a][1] - extents[a][0] > 1]
+        if len(thick) != 1:
+            self._reset()
+            return None
+        (window_axis,) = thick
+        low, high = extents[window_axis]
+        dtype = np.dtype(data.dtype)
+        plane_shape = tuple(
+            len(range(*s.indices(n)))
+            for d, (s, n) in enumerate(zip(slices, data.shape, strict=False))
+            if d not in axis
+        ) + tuple(data.shape[len(slices) :])
+        plane_bytes = math.prod(plane_shape) * dtype.itemsize
+        _, combine, acc_dtype = _accumulator(mode, dtype)
+        keep_planes = mode in (
+            ImageProjectionMode.MAX,
+            ImageProjectionMode.MIN,
+        )
+        if keep_planes:
+            state_bytes = 2 * (high - low) * plane_bytes
+        else:
+            state_bytes = math.prod(plane_shape) * acc_dtype.itemsize
+        if not _reserve(self, state_bytes):
+            self._reset()
+            return None
+
+        key = (
+            mode,
+            dtype,
+            data.shape,
+            window_axis,
+            tuple(
+                (s.start, s.stop, s.step)
+                for d, s in enumerate(slices)
+                if d != window_axis
+            ),
+        )
+        data_ref = self._data_ref() if self._data_ref is not None else None
+        reuse = (
+            key == self._key
+            and data_ref is data
+            and low < self._high
+            and high > self._low
+            and abs(low - self._low) + abs(high - self._high) < high - low
+        )
+        # position of the window axis once the other projected axes (of
+        # size 1) are dropped
+        plane_axis = window_axis - sum(a < window_axis for a in axis)
+
+        def read(start: int, stop: int) -> Iterable[np.ndarray]:
+            """Read the planes in [start, stop) along the window axis."""
+            if start >= stop:
+                return
+            window_slices = list(slices)
+            window_slices[window_axis] = slice(start, stop)
+            nbytes = (stop - start) * plane_bytes
+            for block in _iter_blocks(
+                data, tuple(window_slices), window_axis, nbytes
+            ):
+                # drop the projected axes of size 1 with the window axis
+                index = tuple(
+                    0 if d in axis and d != window_axis else slice(None)
+                    for d in range(block.ndim)
+                )
+                yield from np.moveaxis(block[index], plane_axis, 0)
+
+        if not reuse:
+            try:
+                self._data_ref = weakref.ref(data)
+            except TypeError:
+                # can't tell if the data is replaced by another object
+                self._reset()
+                return None
+            self._key = key
+            self._sum = None
+            self._deque = None
+            self._updates = 0
+
+        if keep_planes:
+            self._update_deque(read, combine, low, high, reuse)
+            assert self._deque is not None
+            projected = self._deque.aggregate()
+        else:
+            self._update_sum(read, acc_dtype, dtype, low, high, reuse)
+            assert self._sum is not None
+            projected = _finalize(self._sum.copy(), mode, high - low, dtype)
+        self._low, self._high = low, high
+        return projected
+
+    def _update_sum(
+        self,
+        read: Callable[[int, int], Iterable[np.ndarray]],
+        acc_dtype: np.dtype,
+        dtype: np.dtype,
+        low: int,
+        high: int,
+        reuse: bool,
+    ) -> None:
+        # sums of integers are exact, even in a float64 accumulator (MEAN)
+        inexact = dtype.kind in 'fc'
+        if reuse and inexact:
+            # subtracting planes accumulates rounding errors and can't undo
+            # nans and infs, so the sum is recomputed from time to time
+            self._updates += abs(low - self._low) + abs(high - self._high)
+            reuse = self._updates < high - low
+        if not reuse:
+            self._sum = None
+            self._updates = 0
+            for plane in read(low, high):
+                if self._sum is None:
+                    self._sum = np.array(plane, dtype=acc_dtype)
+                else:
+                    np.add(self._sum, plane, out=self._sum)
+            return
+
+        def add(start: int, stop: int, sign: int) -> bool:
+            for plane in read(start, stop):
+                if sign > 0:
+                    np.add(self._sum, plane, out=self._sum)
+                elif inexact and not np.isfinite(plane).all():
+                    return False
+                else:
+                    np.subtract(self._sum, plane, out=self._sum)
+            return True
+
+        removed = add(self._low, min(low, self._high), -1) and add(
+            max(high, self._low), self._high, -1
+        )
+        if not removed:
+            self._update_sum(read, acc_dtype, dtype, low, high, False)
+            return
+        add(low, min(self._low, high), 1)
+        add(max(self._high, low), high, 1)
+
+    def _update_deque(
+        self,
+        read: Callable[[int, int], Iterable[np.ndarray]],
+        combine: Callable,
+        low: int,
+        high: int,
+        reuse: bool,
+    ) -> None:
+        if not reuse or self._deque is None:
+            self._deque = _AggregateDeque(combine)
+            for plane in read(low, high):
+                self._deque.push_high(plane)
+            return
+        deque = self._deque
+        for _ in range(self._low, min(low, self._high)):
+            deque.pop_low()
+        for _ in range(max(high, self._low), self._high):
+            deque.pop_high()
+        for plane in reversed(list(read(low, min(self._low, high)))):
+            deque.push_low(plane)
+        for plane in read(max(self._high, low), high):
+            deque.push_high(plane)
+
+
+class _AggregateDeque:
+    """A deque of planes that keeps the aggregate of all its planes.
+
+    The planes are kept in two stacks: ``_low`` holds the lower planes, with
+    the lowest on top, and ``_high`` the higher planes, with the highest on
+    top. Each entry also holds the aggregate of its plane with all the planes
+    below it in its stack, so the aggregate of the deque combines the tops
+    of both stacks. When a stack is empty, the other one is split in two.
+
+    Parameters
+    ----------
+    combine : callable
+        Associative and commutative binary ufunc, such as ``np.maximum``.
+    """
+
+    def __init__(self, combine: Callable) -> None:
+        self._combine = combine
+        self._low: list[tuple[np.ndarray, np.ndarray]] = []
+        self._high: list[tuple[np.ndarray, np.ndarray]] = []
+
+    def __len__(self) -> int:
+        return len(self._low) + len(self._high)
+
+    def aggregate(self) -> np.ndarray:
+        """Aggregate of all planes, as a new array."""
+        if self._low and self._high:
+            return self._combine(self._low[-1][1], self._high[-1][1])
+        stack = self._low or self._high
+        return stack[-1][1].copy()
+
+    def push_low(self, plane: np.ndarray) -> None:
+        self._push(self._low, plane)
+
+    def push_high(self, plane: np.ndarray) -> None:
+        self._push(self._high, plane)
+
+    def pop_low(self) -> None:
+        if not self._low:
+            self._rebalance(n_low=(len(self) + 1) // 2)
+        self._low.pop()
+
+    def pop_high(self) -> None:
+        if not self._high:
+            self._rebalance(n_low=len(self) // 2)
+        self._high.pop()
+
+    def _push(
+        self, stack: list[tuple[np.ndarray, np.ndarray]], plane: Any
+    ) -> None:
+        aggregate = self._combine(stack[-1][1], plane) if stack else plane
+        stack.append((plane, aggregate))
+
+    def _rebalance(self, n_low: int) -> None:
+        """Split the planes between both stacks, ``n_low`` in the lower."""
+        planes = [plane for plane, _ in reversed(self._low)]
+        planes.extend(plane for plane, _ in self._high)
+        self._low.clear()
+        self._high.clear()
+        for plane in reversed(planes[:n_low]):
+            self.push_low(plane)
+        for plane in planes[n_low:]:
+            self.push_high(plane)
@@ -1,3 +1,5 @@
+import weakref
+
 import dask.array as da
 import numpy as np
 import numpy.testing as npt
@@ -10,6 +12,8 @@ from napari.layers import Image
 from napari.layers.image._image_constants import ImageRendering
 from napari.layers.utils.plane import ClippingPlaneList, SlicingPlane
 from napari.utils import Colormap
+from napari.utils._shared_memory import SharedMemoryArray
+from napari.utils._streaming import StreamingArray
 from napari.utils._test_utils import (
     validate_all_params_in_docstring,
     validate_kwargs_sorted,
@@ -960,6 +964,133 @@ def test_thick_slice():
     )
 
 
+@pytest.mark.parametrize('mode', ['sum', 'mean', 'max', 'min'])
+@pytest.mark.parametrize('dtype', [np.uint8, np.int16, np.float32])
+def test_thick_slice_streamed(monkeypatch, mode, dtype):
+    """Projections of large slabs are streamed with the same results."""
+    from napari.layers.image import _slice
+
+    rng = np.random.default_rng(0)
+    data = rng.integers(0, 100, size=(3, 20, 6, 7)).astype(dtype)
+    chunked = da.from_array(data, chunks=(1, 4, 6, 7))
+    # each slab is read in blocks of (at least) one chunk along axis 1
+    monkeypatch.setattr(_slice, '_PROJECTION_BLOCK_BYTES', 1)
+    read_shapes = []
+    blocks = _slice._iter_blocks
+
+    def _iter_blocks(*args):
+        for block in blocks(*args):
+            read_shapes.append(block.shape)
+            yield block
+
+    monkeypatch.setattr(_slice, '_iter_blocks', _iter_blocks)
+
+    layer = Image(chunked, projection_mode=mode)
+    layer._slice_dims(
+        Dims(
+            ndim=4,
+            range=((0, 2, 1), (0, 19, 1), (0, 5, 1), (0, 6, 1)),
+            point=(1, 9, 0, 0),
+            margin_left=(1, 6, 0, 0),
+            margin_right=(0, 8, 0, 0),
+        )
+    )
+    expected = getattr(np, mode)(data[0:2, 3:18], axis=(0, 1))
+    assert layer._slice.image.raw.dtype == expected.dtype
+    npt.assert_allclose(layer._slice.image.raw, expected, rtol=1e-6)
+    assert read_shapes == [
+        (2, 1, 6, 7),
+        (2, 4, 6, 7),
+        (2, 4, 6, 7),
+        (2, 4, 6, 7),
+        (2, 2, 6, 7),
+    ]
+
+
+@pytest.mark.parametrize('mode', ['sum', 'mean', 'max', 'min'])
+def test_thick_slice_sliding(monkeypatch, mode):
+    """Moving a thick slice only reads the planes entering it."""
+    from napari.layers.image import _sliding_projection
+
+    rng = np.random.default_rng(0)
+    data = rng.integers(0, 100, size=(2, 30, 6, 7)).astype(np.uint16)
+    n_read = []
+    blocks = _sliding_projection._iter_blocks
+
+    def _iter_blocks(data, slices, axis, nbytes):
+        for block in blocks(data, slices, axis, nbytes):
+            n_read.append(block.shape[axis])
+            yield block
+
+    monkeypatch.setattr(_sliding_projection, '_iter_blocks', _iter_blocks)
+
+    layer = Image(data, projection_mode=mode)
+    # planes read when keeping the max/min, and the sum (that also reads the
+    # planes leaving the thick slice to subtract them)
+    for point, n_max, n_sum in [
+        (10, 9, 9),
+        (11, 1, 2),
+        (12, 1, 2),
+        (10, 2, 4),
+        (9, 1, 2),
+        (25, 9, 9),
+        (27, 0, 2),
+    ]:
+        n_read.clear()
+        layer._slice_dims(
+            Dims(
+                ndim=4,
+                range=((0, 1, 1), (0, 29, 1), (0, 5, 1), (0, 6, 1)),
+                point=(1, point, 0, 0),
+                margin_left=(0, 4, 0, 0),
+                margin_right=(0, 4, 0, 0),
+            )
+        )
+        expected = getattr(np, mode)(
+            data[1, max(point - 4, 0) : point + 5], axis=0
+        )
+        np.testing.assert_array_equal(layer._slice.image.raw, expected)
+        assert layer._slice.image.raw.dtype == expected.dtype
+        assert sum(n_read) == (n_sum if mode in ('sum', 'mean') else n_max)
+
+    # in-place modifications are picked up on refresh
+    data[1] = 0
+    layer.refresh()
+    np.testing.assert_array_equal(layer._slice.image.raw, 0)
+
+
+def test_thick_slice_sliding_shares_budget(monkeypatch):
+    """The projection states of all the layers share a memory budget."""
+    from napari.layers.image import _sliding_projection
+
+    data = np.zeros((30, 6, 7), dtype=np.uint8)
+    # the states of MAX projections of 9 planes, 2 planes per plane
+    monkeypatch.setattr(
+        _sliding_projection, '_WINDOW_CACHE_BYTES', 2 * 9 * 6 * 7 + 1
+    )
+    # ignore the states kept by the layers of other tests
+    monkeypatch.setattr(
+        _sliding_projection, '_kept_bytes', weakref.WeakKeyDictionary()
+    )
+    dims = Dims(
+        ndim=3,
+        point=(10, 0, 0),
+        margin_left=(4, 0, 0),
+        margin_right=(4, 0, 0),
+    )
+    first = Image(data, projection_mode='max')
+    second = Image(data, projection_mode='max')
+    first._slice_dims(dims)
+    second._slice_dims(dims)
+    assert first._slicing_state._projection_window._key is not None
+    assert second._slicing_state._projection_window._key is None
+
+    # the budget is available again once the first state is cleared
+    first.projection_mode = 'none'
+    second.refresh()
+    assert second._slicing_state._projection_window._key is not None
+
+
 def test_thick_slice_maintains_contrast_limits():
     data = np.ones((5, 5, 5)) * np.arange(5).reshape(-1, 1, 1)
     layer = Image(data.astype(np.uint8))
@@ -981,7 +1112,10 @@ def test_thick_slice_maintains_contrast_limits():
 def test_adjust_contrast_out_of_range():
     arr = np.linspace(1, 9, 5 * 5, dtype=np.float64).reshape((5, 5))
     img_lay = Image(arr)
-    npt.assert_array_equal(img_lay._slice.image.view, img_lay._slice.image.raw)
+    # the view is only converted to a texture dtype
+    npt.assert_array_equal(
+        img_lay._slice.image.view, img_lay._slice.image.raw.astype(np.float32)
+    )
     img_lay.contrast_limits = (0, float(np.finfo(np.float32).max) * 2)
     assert not np.array_equal(
         img_lay._slice.image.view, img_lay._slice.image.raw
@@ -992,7 +1126,10 @@ def test_adjust_contrast_limits_range_set_data():
     arr = np.linspace(1, 9, 5 * 5, dtype=np.float64).reshape((5, 5))
     img_lay = Image(arr)
     img_lay.auto_contrast = True
-    npt.assert_array_equal(img_lay._slice.image.view, img_lay._slice.image.raw)
+    # the view is only converted to a texture dtype
+    npt.assert_array_equal(
+        img_lay._slice.image.view, img_lay._slice.image.raw.astype(np.float32)
+    )
     img_lay.data = arr * 1e39
     assert not np.array_equal(
         img_lay._slice.image.view, img_lay._slice.image.raw
@@ -1076,3 +1213,93 @@ def test_contrast_outside_range():
 def test_docstring():
     validate_all_params_in_docstring(Image)
     validate_kwargs_sorted(Image)
+
+
+def test_3d_slice_reduced_to_texture_size():
+    """Slices larger than the maximum texture size are block averaged."""
+    data = np.random.default_rng(0).random((4, 40, 30)).astype(np.float32)
+    layer = Image(data)
+    layer._set_max_texture_sizes(None, 16)
+    layer._slice_dims(Dims(ndim=3, ndisplay=3))
+
+    raw = layer._slice.image.raw
+    assert raw.shape == (4, 14, 15)
+    npt.assert_allclose(raw[1, 2, 3], data[1, 6:9, 6:8].mean(), rtol=1e-6)
+    assert layer._slice.texture_downsample == (1, 3, 2)
+    tile2data = layer._transforms['tile2data']
+    npt.assert_array_equal(tile2data.scale, [1, 3, 2])
+    npt.assert_array_equal(tile2data.translate, [0, 1, 0.5])
+
+    # the reduced slice is kept when coming back to it
+    cached = layer._slice.image.raw
+    layer._slice_dims(Dims(ndim=3, ndisplay=2))
+    assert layer._slice.texture_downsample is None
+    layer._slice_dims(Dims(ndim=3, ndisplay=3))
+    assert layer._slice.image.raw is cached
+    layer.refresh()
+    assert layer._slice.image.raw is not cached
+
+
+def test_shared_memory_data_refresh():
+    """Changes made in shared memory by a producer refresh the layer."""
+    shared = SharedMemoryArray.create((10, 12), np.float32)
+    try:
+        layer = Image(shared, contrast_limits=(0, 1))
+        layer.refresh()
+        set_data = []
+        layer.events.set_data.connect(set_data.append)
+
+        producer = SharedMemoryArray.attach(shared.info)
+        producer[2:4] = 1
+        shared.poll()
+        assert len(set_data) == 1
+        npt.assert_array_equal(layer._slice.image.raw[2:4], 1)
+
+        # replaced data is not watched anymore
+        layer.data = np.zeros((10, 12), dtype=np.float32)
+        set_data.clear()
+        producer[5] = 1
+        shared.poll()
+        assert not set_data
+    finally:
+        shared.unlink()
+
+
+def test_streaming_data_append():
+    """Appended frames grow the extent, and only refresh the layer in view."""
+    stream = StreamingArray((10, 12), np.float32, max_frames=2)
+    layer = Image(stream, contrast_limits=(0, 1))
+    layer._slice_dims(Dims(ndim=3, ndisplay=2))
+    set_data = []
+    extent = []
+    layer.events.set_data.connect(set_data.append)
+    layer.events.extent.connect(extent.append)
+
+    # the first frame is in view
+    stream.append(np.ones((10, 12)))
+    stream.poll()
+    assert len(extent) == 1
+    assert len(set_data) == 1
+    npt.assert_array_equal(layer._slice.image.raw, 1)
+
+    stream.append(np.ones((10, 12)))
+    stream.poll()
+    assert len(extent) == 2
+    assert len(set_data) == 1
+    npt.assert_array_equal(layer.extent.data[1], [1, 9, 11])
+    assert layer.contrast_limits == [0, 1]
+
+    # a thick slice shows the appended frame
+    layer.projection_mode = 'mean'
+    layer._slice_dims(Dims(ndim=3, ndisplay=2, margin_right=(2, 0, 0)))
+    set_data.clear()
+    stream.append(np.ones((10, 12)))
+    stream.poll()
+    assert len(set_data) == 1
+
+    # replaced data is not watched anymore
+    layer.data = np.zeros((3, 10, 12), dtype=np.float32)
+    extent.clear()
+    stream.append(np.ones((10, 12)))
+    stream.poll()
+    assert not extent
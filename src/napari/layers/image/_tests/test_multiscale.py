@@ -6,6 +6,7 @@ import zarr
 from skimage.transform import pyramid_gaussian
 
 from napari._tests.utils import check_layer_world_data_extent
+from napari.components.dims import Dims
 from napari.layers import Image
 from napari.utils import Colormap
 
@@ -575,3 +576,233 @@ def test_update_draw_expands_tensorstore_multiscale_fov():
 
     assert layer.data_level == 0
     np.testing.assert_equal(layer.corner_pixels, [[0, 0], [7, 9]])
+
+
+def test_3D_multiscale_level_streaming(monkeypatch):
+    """Test the 3D level selection when streaming multiscale volumes."""
+    from napari.layers._scalar_field import scalar_field
+    from napari.settings import get_settings
+
+    shapes = [(64, 64, 64), (32, 32, 32), (16, 16, 16)]
+    data = [da.zeros(s, chunks=8) for s in shapes]
+    layer = Image(data, multiscale=True)
+    displayed = [0, 1, 2]
+    # without streaming, 3D always uses the coarsest level
+    assert layer._volume_data_level(displayed) == 2
+
+    get_settings().experimental.multiscale_volume_streaming = True
+    # the coarsest level whose voxels are no larger than a canvas pixel
+    layer.scale_factor = 1
+    assert layer._volume_data_level(displayed) == 0
+    layer.scale_factor = 2.5
+    assert layer._volume_data_level(displayed) == 1
+    layer.scale_factor = 10
+    assert layer._volume_data_level(displayed) == 2
+    # within the voxel budget
+    monkeypatch.setattr(scalar_field, 'VOLUME_VOXEL_BUDGET', 32**3)
+    layer.scale_factor = 1
+    assert layer._volume_data_level(displayed) == 1
+
+    layer._slice_dims(Dims(ndim=3, ndisplay=3))
+    assert layer.data_level == 1
+    np.testing.assert_array_equal(layer._slice.image.raw.shape, shapes[1])
+    # the level is read in bricks that are kept for later slices
+    assert len(layer._slicing_state._brick_cache) > 0
+    layer._slicing_state._clear_caches()
+    assert len(layer._slicing_state._brick_cache) == 0
+    # 2D slices read the visible region through the brick cache
+    layer._slice_dims(Dims(ndim=3, ndisplay=2))
+    assert len(layer._slicing_state._brick_cache) > 0
+
+
+def test_rgb_multiscale_pan():
+    """Test that panning a multiscale RGB image reads new bricks only."""
+    base = np.random.default_rng(0).integers(
+        0, 256, (1024, 1024, 3), dtype=np.uint8
+    )
+    data = [
+        da.from_array(base, chunks=(256, 256, 3)),
+        da.from_array(base[::2, ::2], chunks=(256, 256, 3)),
+    ]
+    layer = Image(data, rgb=True, multiscale=True)
+    cache = layer._slicing_state._brick_cache
+
+    def pan(offset):
+        layer._update_draw(
+            scale_factor=1,
+            corner_pixels_displayed=np.array(
+                [[offset, offset], [offset + 300, offset + 300]]
+            ),
+            shape_threshold=(300, 300),
+        )
+
+    pan(0)
+    assert layer.data_level == 0
+    np.testing.assert_equal(layer.corner_pixels, [[0, 0], [511, 511]])
+    np.testing.assert_array_equal(layer._slice.image.raw, base[:512, :512])
+    # uint8 RGB is packed to opaque RGBA textures
+    view = layer._data_view
+    assert view.shape == (512, 512, 4)
+    np.testing.assert_array_equal(view[..., :3], base[:512, :512])
+    np.testing.assert_array_equal(view[..., 3], 255)
+    # no contrast limits are computed for uint8 data
+    assert layer.contrast_limits == [0, 255]
+
+    # panning keeps the bricks read before, and the level isn't changed
+    n_bricks = len(cache)
+    pan(400)
+    np.testing.assert_equal(layer.corner_pixels, [[256, 256], [767, 767]])
+    np.testing.assert_array_equal(
+        layer._slice.image.raw, base[256:768, 256:768]
+    )
+    assert len(cache) > n_bricks
+    n_bricks = len(cache)
+    pan(0)
+    assert len(cache) == n_bricks
+
+    # modifying the data clears the cache
+    layer.refresh()
+    assert len(cache) < n_bricks
+
+
+@pytest.fixture
+def small_auto_pyramids(monkeypatch, tmp_path):
+    """Build automatic pyramids for small images, cached in tmp_path."""
+    from napari.layers.image import _pyramid
+
+    monkeypatch.setattr(_pyramid, 'AUTO_MULTISCALE_SIZE', 16)
+    monkeypatch.setattr(_pyramid, 'pyramid_cache_dir', lambda: tmp_path)
+    return tmp_path
+
+
+def _wait_complete(layer):
+    builder = layer.data[1]._builder
+    # workers may start more workers, e.g. once the data is identified again
+    while workers := [w for w in builder._workers if w.is_alive()]:
+        for worker in workers:
+            worker.join(timeout=10)
+    assert builder.complete
+    return builder
+
+
+def test_auto_multiscale(small_auto_pyramids):
+    """Test the pyramid built for large single-scale images."""
+    data = np.random.default_rng(0).random((3, 64, 40), dtype=np.float32)
+    layer = Image(data, multiscale='auto')
+    assert layer.multiscale
+    assert layer.data[0] is data
+    assert layer.level_shapes.tolist() == [
+        [3, 64, 40],
+        [3, 32, 20],
+        [3, 16, 10],
+    ]
+    # levels are computed when they are read
+    np.testing.assert_allclose(
+        layer.data[1][2], data[2].reshape(32, 2, 20, 2).mean((1, 3)), rtol=1e-6
+    )
+    np.testing.assert_allclose(
+        layer.data[2][0, -1], data[0, 60:64].reshape(4, 10, 4).mean((0, 2))
+    )
+
+    builder = _wait_complete(layer)
+    # complete pyramids are moved to the cache directory
+    assert [p.name for p in small_auto_pyramids.iterdir()] == [
+        builder._cache_key
+    ]
+    cached = Image(data.copy(), multiscale='auto')
+    assert _wait_complete(cached)._cache_key == builder._cache_key
+    np.testing.assert_array_equal(cached.data[2][...], layer.data[2][...])
+    assert isinstance(cached.data[2][...], np.memmap)
+
+
+def test_auto_multiscale_refresh(small_auto_pyramids):
+    """Test the pyramid is computed again once the data changed in place."""
+    data = np.zeros((64, 40), dtype=np.float32)
+    layer = Image(data, multiscale='auto')
+    builder = _wait_complete(layer)
+    assert not layer.data[2][...].any()
+
+    # changing e.g. transforms doesn't change the data
+    layer.scale = (2, 2)
+    assert layer.data[1]._builder is builder
+
+    # refreshing unchanged data keeps the computed levels
+    key = builder._cache_key
+    layer.refresh()
+    assert _wait_complete(layer)._cache_key == key
+    assert builder._generation == 0
+
+    data[:4, :4] = 1
+    layer.refresh()
+    assert layer.data[1]._builder is builder
+    assert layer.data[2][0, 0] == 1
+    assert _wait_complete(layer)._cache_key != key
+    assert builder._generation == 1
+
+
+def test_auto_multiscale_single_builder(small_auto_pyramids, monkeypatch):
+    """Test adding and refreshing a layer builds its pyramid once."""
+    from napari.components import ViewerModel
+    from napari.layers.image import _pyramid
+
+    builders = []
+    init = _pyramid._PyramidBuilder.__init__
+
+    def _init(self, *args, **kwargs):
+        builders.append(self)
+        init(self, *args, **kwargs)
+
+    monkeypatch.setattr(_pyramid._PyramidBuilder, '__init__', _init)
+    data = np.random.default_rng(0).random((3, 64, 40), dtype=np.float32)
+    layer = ViewerModel().add_image(data, multiscale='auto')
+    layer.refresh()
+    layer.refresh()
+    builder = _wait_complete(layer)
+    assert builders == [builder]
+    assert builder._generation == 0
+
+
+def test_auto_multiscale_zarr_rewritten(small_auto_pyramids, tmp_path):
+    """Test pyramids of zarr arrays are not reused once rewritten."""
+    zarr = pytest.importorskip('zarr')
+    path = tmp_path / 'data.zarr'
+    data = zarr.open(
+        str(path), mode='w', shape=(64, 40), chunks=(16, 16), dtype='f4'
+    )
+    data[:] = 1
+    key = _wait_complete(Image(data, multiscale='auto'))._cache_key
+    assert key is not None
+    same = zarr.open(str(path), mode='r')
+    assert _wait_complete(Image(same, multiscale='auto'))._cache_key == key
+
+    data[:16, :16] = 2
+    layer = Image(zarr.open(str(path), mode='r'), multiscale='auto')
+    assert _wait_complete(layer)._cache_key != key
+    assert layer.data[2][0, 0] == 2
+
+
+def test_auto_multiscale_cache_evicted(small_auto_pyramids, monkeypatch):
+    """Test the least recently used pyramids are removed from the cache."""
+    from napari.layers.image import _pyramid
+
+    # the levels of one pyramid of 64x40 float32 pixels
+    monkeypatch.setattr(_pyramid, '_CACHE_BYTES', 4000)
+    keys = [
+        _wait_complete(
+            Image(np.full((64, 40), i, dtype=np.float32), multiscale='auto')
+        )._cache_key
+        for i in range(3)
+    ]
+    assert [p.name for p in small_auto_pyramids.iterdir()] == [keys[-1]]
+
+
+def test_auto_multiscale_small_and_rgb(small_auto_pyramids):
+    """Small images stay single scale, RGB channels are not downsampled."""
+    assert not Image(np.zeros((8, 16, 16)), multiscale='auto').multiscale
+
+    data = np.zeros((40, 32, 3), dtype=np.uint8)
+    layer = Image(data, multiscale='auto')
+    assert layer.rgb
+    assert layer.level_shapes.tolist() == [[40, 32], [20, 16], [10, 8]]
+    assert layer.data[1][...].shape == (20, 16, 3)
+    _wait_complete(layer)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import typing
 import warnings
+from dataclasses import replace
 from typing import Any, Literal, cast
 
 import numpy as np
@@ -11,6 +12,7 @@ import numpy as np
 from napari.layers._data_protocols import LayerDataProtocol
 from napari.layers._multiscale_data import MultiScaleData
 from napari.layers._scalar_field._slice import _ScalarFieldSliceResponse
+from napari.layers._scalar_field._texture import TextureMapping
 from napari.layers._scalar_field.scalar_field import (
     ScalarFieldBase,
     ScalarFieldSlicingState,
@@ -18,17 +20,25 @@ from napari.layers._scalar_field.scalar_field import (
 from napari.layers.image._image_constants import (
     ImageProjectionMode,
     ImageRendering,
+    ImageTexturePrecision,
     Interpolation,
     InterpolationStr,
 )
 from napari.layers.image._image_utils import guess_rgb
+from napari.layers.image._pyramid import (
+    auto_multiscale,
+    refresh_auto_multiscale,
+)
 from napari.layers.image._slice import _ImageSliceRequest
+from napari.layers.image._sliding_projection import _SlidingProjection
 from napari.layers.intensity_mixin import IntensityVisualizationMixin
-from napari.layers.utils.layer_utils import calc_data_range
+from napari.layers.utils.layer_utils import calc_data_range, zoom_nearest
 from napari.types import LayerDataType
 from napari.utils._dtype import get_dtype_limits, normalize_dtype
 from napari.utils.colormaps import ensure_colormap
 from napari.utils.colormaps.colormap_utils import _coerce_contrast_limits
+from napari.utils.events import Event
+from napari.utils.naming import magic_name
 
 if typing.TYPE_CHECKING:
     from collections.abc import Sequence
@@ -37,7 +47,9 @@ if typing.TYPE_CHECKING:
     import pint
 
     from napari.components.histogram import HistogramModel
+    from napari.layers.utils._slice_input import _SliceInput, _ThickNDSlice
     from napari.types import ArrayLike
+    from napari.utils._dask_utils import DaskIndexer
     from napari.utils.transforms import Affine
 
 __all__ = ('Image',)
@@ -121,7 +133,7 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
         use automatic selection.
     metadata : dict
         Layer metadata.
-    multiscale : bool
+    multiscale : bool or 'auto'
         Whether the data is a multiscale image or not. Multiscale data is
         represented by a list of array-like image data. If not specified by
         the user and if the data is a list of arrays that decrease in shape,
@@ -130,7 +142,10 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
         automatically based on the viewport. In 3D, the lowest resolution
         scale is displayed by default. The resolution level can be locked
         via ``locked_data_level`` or the resolution control in the layer
-        controls UI.
+        controls UI. If 'auto', a pyramid is built for single-scale data
+        whose last two (spatial) axes are larger than 2048 pixels. Its
+        levels are computed as they are displayed and in background threads,
+        and cached on disk so that opening the same data again is fast.
     name : str
         Name of the layer.
     opacity : float
@@ -161,6 +176,13 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
     shear : 1-D array or n-D array
         Either a vector of upper triangular values, or an nD shear matrix with
         ones along the main diagonal.
+    texture_precision : str
+        Precision of the textures that slices are displayed with. Must be
+        one of {'auto', 'uint16', 'uint8'}. With 'auto', slices are
+        displayed with the closest dtype that textures support, e.g.
+        float32 for float64 data. With 'uint16' or 'uint8', slices are
+        quantized over the contrast limits range, to textures two or four
+        times smaller than float32 textures.
     translate : tuple of float
         Translation values for the layer.
     units : tuple of str or pint.Unit, optional
@@ -243,6 +265,8 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
     projection_mode : str
         How data outside the viewed dimensions, but inside the thick Dims slice will
         be projected onto the viewed dimensions. Must fit to ImageProjectionMode
+    texture_precision : str
+        Precision of the textures that slices are displayed with.
     experimental_clipping_planes : ClippingPlaneList
         Clipping planes defined in data coordinates, used to clip the volume.
     custom_interpolation_kernel_2d : np.ndarray
@@ -280,7 +304,7 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
         iso_threshold: float | None = None,
         locked_data_level: int | None = None,
         metadata: dict | None = None,
-        multiscale: bool | None = None,
+        multiscale: bool | Literal['auto'] | None = None,
         name: str | None = None,
         opacity: float = 1.0,
         plane: dict | None = None,
@@ -290,6 +314,7 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
         rotate: float | Sequence[float] | npt.NDArray | None = None,
         scale: Sequence[float] | None = None,
         shear: Sequence[float] | npt.NDArray | None = None,
+        texture_precision: str = 'auto',
         translate: Sequence[float] | None = None,
         units: Sequence[str | pint.Unit] | None = None,
         visible: bool = True,
@@ -303,7 +328,15 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
         if rgb is None:
             rgb = guess_rgb(data_shape)
 
+        if multiscale == 'auto':
+            if name is None:
+                name = magic_name(data)
+            ndim = len(data_shape) - 1 if rgb else len(data_shape)
+            data = auto_multiscale(data, ndim)
+            multiscale = isinstance(data, MultiScaleData)
+
         self.rgb = rgb
+        self._texture_precision = ImageTexturePrecision.AUTO
         super().__init__(
             data,
             affine=affine,
@@ -329,6 +362,8 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
             visible=visible,
         )
 
+        self.events.add(texture_precision=Event)
+
         self.rgb = rgb
         self._colormap = ensure_colormap(colormap)
         self._gamma = gamma
@@ -363,6 +398,7 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
 
         if locked_data_level is not None:
             self.locked_data_level = locked_data_level
+        self.texture_precision = texture_precision
 
     @property
     def rendering(self) -> str:
@@ -426,6 +462,7 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
                 'iso_threshold': self.iso_threshold,
                 'attenuation': self.attenuation,
                 'gamma': self.gamma,
+                'texture_precision': self.texture_precision,
                 'data': self.data,
                 'custom_interpolation_kernel_2d': self.custom_interpolation_kernel_2d,
             }
@@ -443,6 +480,81 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
         self._update_thumbnail()
         self.events.attenuation()
 
+    @property
+    def texture_precision(self) -> str:
+        """Precision of the textures that slices are displayed with.
+
+        * ``auto``: slices are displayed with the closest dtype that
+          textures support, e.g. float32 for float64 or int32 data.
+        * ``uint16``: slices are quantized to 65536 levels over the contrast
+          limits range, half the size of float32 textures.
+        * ``uint8``: slices are quantized to 256 levels over the contrast
+          limits range, a quarter of the size of float32 textures.
+
+        Quantized slices are sliced again when the contrast limits range
+        changes, but not when the contrast limits change within it.
+        """
+        return str(self._texture_precision)
+
+    @texture_precision.setter
+    def texture_precision(self, value: str) -> None:
+        precision = ImageTexturePrecision(value)
+        if precision == self._texture_precision:
+            return
+        self._texture_precision = precision
+        self.events.texture_precision()
+        self.refresh(highlight=False, extent=False)
+
+    def _texture_mapping(self) -> TextureMapping | None:
+        """The mapping of slices to textures, if they aren't displayed as is.
+
+        Slices are quantized for ``texture_precision``, or rescaled to the
+        range and precision of float32 textures if the contrast limits range
+        exceeds them. Both mappings only depend on the contrast limits
+        range, so that changing the contrast limits within it only updates
+        the shader, unless the contrast limits are too close to each other
+        to be displayed with the mapping of the range.
+        """
+        if None in self._contrast_limits_range:
+            return None
+        if self._texture_precision != ImageTexturePrecision.AUTO:
+            return TextureMapping.from_range(
+                str(self._texture_precision), self.contrast_limits_range
+            )
+        coerced = _coerce_contrast_limits(self.contrast_limits_range)
+        if None not in self._contrast_limits:
+            limits = coerced.coerce_data(
+                np.asarray(self.contrast_limits, dtype=np.float64)
+            )
+            if not np.allclose(
+                _coerce_contrast_limits(limits).contrast_limits, limits
+            ):
+                coerced = _coerce_contrast_limits(self.contrast_limits)
+        if coerced.offset == 0 and coerced.scale == 1:
+            return None
+        return TextureMapping.from_coercion(coerced)
+
+    def _update_texture_mapping(self) -> None:
+        """Slice again if the displayed slice was mapped differently."""
+        if (
+            None in self._contrast_limits
+            or self._slice.empty
+            or self._slice.texture_mapping == self._texture_mapping()
+        ):
+            return
+        # we use the private attribute here to avoid triggering the setter again
+        prev = self._auto_contrast
+        self._auto_contrast = False
+        try:
+            self.refresh(highlight=False, extent=False)
+        finally:
+            self._auto_contrast = prev
+
+    @IntensityVisualizationMixin.contrast_limits_range.setter  # type: ignore [attr-defined]
+    def contrast_limits_range(self, value: tuple[float, float]) -> None:
+        IntensityVisualizationMixin.contrast_limits_range.fset(self, value)  # type: ignore [attr-defined]
+        self._update_texture_mapping()
+
     @property
     def histogram(self) -> HistogramModel:
         """Histogram model for this layer, created lazily on first access.
@@ -530,8 +642,6 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
 
     def _update_thumbnail(self) -> None:
         """Update thumbnail with current image data and colormap."""
-        from scipy import ndimage as ndi
-
         # black thumbnail if there is no data in the slice
         if self._slice.empty:
             self.thumbnail = np.zeros(self._thumbnail_shape, self.dtype)
@@ -542,11 +652,6 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
         if self._slice_input.ndisplay == 3 and self.ndim > 2:
             image = np.max(image, axis=0)
 
-        # float16 not supported by ndi.zoom
-        dtype = np.dtype(image.dtype)
-        if dtype in [np.dtype(np.float16)]:
-            image = image.astype(np.float32)
-
         raw_zoom_factor = np.divide(
             self._thumbnail_shape[:2], image.shape[:2]
         ).min()
@@ -557,9 +662,7 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
         )
         zoom_factor = tuple(new_shape / image.shape[:2])
         if self.rgb:
-            downsampled = ndi.zoom(
-                image, zoom_factor + (1,), prefilter=False, order=0
-            )
+            downsampled = zoom_nearest(image, zoom_factor)
             if image.shape[2] == 4:  # image is RGBA
                 colormapped = np.copy(downsampled)
                 colormapped[..., 3] = downsampled[..., 3] * self.opacity
@@ -577,9 +680,7 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
                     alpha = np.full(downsampled.shape[:2] + (1,), self.opacity)
                 colormapped = np.concatenate([downsampled, alpha], axis=2)
         else:
-            downsampled = ndi.zoom(
-                image, zoom_factor, prefilter=False, order=0
-            )
+            downsampled = zoom_nearest(image, zoom_factor)
             low, high = self.contrast_limits
             if np.issubdtype(downsampled.dtype, np.integer):
                 low = max(low, np.iinfo(downsampled.dtype).min)
@@ -617,11 +718,9 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
     def _raw_to_displayed(self, raw: np.ndarray) -> np.ndarray:
         """Determine displayed image from raw image.
 
-        This function checks if current contrast_limits are within the range
-        supported by vispy.
-        If yes, it returns the raw image.
-        If not, it rescales the raw image to fit within
-        the range supported by vispy.
+        Images are displayed as is: slices whose values are out of the
+        range or precision supported by vispy are rescaled while slicing,
+        see `_texture_mapping`.
 
         Parameters
         ----------
@@ -633,28 +732,12 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
         image : array
             Displayed array.
         """
-        fixed_contrast_info = _coerce_contrast_limits(self.contrast_limits)
-        if np.allclose(
-            fixed_contrast_info.contrast_limits, self.contrast_limits
-        ):
-            return raw
-
-        return fixed_contrast_info.coerce_data(raw)
+        return raw
 
     @IntensityVisualizationMixin.contrast_limits.setter  # type: ignore [attr-defined]
     def contrast_limits(self, contrast_limits: tuple[float, float]) -> None:
         IntensityVisualizationMixin.contrast_limits.fset(self, contrast_limits)  # type: ignore [attr-defined]
-        if not np.allclose(
-            _coerce_contrast_limits(self.contrast_limits).contrast_limits,
-            self.contrast_limits,
-        ):
-            # we use the private attribute here to avoid triggering the setter again
-            prev = self._auto_contrast
-            self._auto_contrast = False
-            try:
-                self.refresh(highlight=False, extent=False)
-            finally:
-                self._auto_contrast = prev
+        self._update_texture_mapping()
 
     def _calculate_value_from_ray(self, values: npt.NDArray) -> float | None:
         # translucent is special: just return the first value, no matter what
@@ -715,6 +798,35 @@ class _ImageSlicingState(ScalarFieldSlicingState):
     layer: Image
     _slice_request_class = _ImageSliceRequest
 
+    def __init__(self, layer: Image, data: LayerDataType, cache: bool):
+        super().__init__(layer, data, cache)
+        self._projection_window = _SlidingProjection()
+
+    def _clear_caches(self, data_changed: bool = True) -> None:
+        super()._clear_caches(data_changed)
+        self._projection_window.clear()
+        if data_changed:
+            refresh_auto_multiscale(self.layer.data)
+
+    def _make_slice_request_internal(
+        self,
+        *,
+        slice_input: _SliceInput,
+        data_slice: _ThickNDSlice,
+        dask_indexer: DaskIndexer,
+    ) -> _ImageSliceRequest:
+        request = super()._make_slice_request_internal(
+            slice_input=slice_input,
+            data_slice=data_slice,
+            dask_indexer=dask_indexer,
+        )
+        # update the previous projection when the slice point moves
+        return replace(
+            request,
+            projection_window=self._projection_window,
+            texture_mapping=self.layer._texture_mapping(),
+        )
+
     def _update_slice_response(
         self, response: _ScalarFieldSliceResponse
     ) -> None:
@@ -1,5 +1,7 @@
+import numpy as np
 import numpy.typing as npt
 
+from napari.layers._scalar_field._downsample import block_reduce
 from napari.layers._scalar_field._slice import _ScalarFieldSliceRequest
 from napari.layers.base._base_constants import BaseProjectionMode
 from napari.types import ArrayLike
@@ -12,3 +14,10 @@ class _LabelsSliceRequest(_ScalarFieldSliceRequest):
     ) -> npt.NDArray:
         """Project a thick slice along axis based on mode."""
         raise NotImplementedError
+
+    @staticmethod
+    def _downsample_texture(
+        data: np.ndarray, factors: tuple[int, ...]
+    ) -> np.ndarray:
+        """Keep the most frequent label of blocks of ``factors`` pixels."""
+        return block_reduce(data, factors, 'mode')
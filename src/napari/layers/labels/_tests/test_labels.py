@@ -23,6 +23,7 @@ from napari.layers.labels._labels_constants import LabelsRendering
 from napari.layers.labels._labels_utils import get_contours
 from napari.layers.labels.labels import WrongSelectedLabelError
 from napari.utils import Colormap
+from napari.utils._shared_memory import SharedMemoryArray
 from napari.utils._test_utils import (
     validate_all_params_in_docstring,
     validate_kwargs_sorted,
@@ -2830,3 +2831,70 @@ def test_negative_coord_meaning_follows_axis_role_via_n_edit_dims():
     brush.paint(coord, 1)
     assert np.any(brush.data[0])  # -1 clipped to the near edge
     assert not np.any(brush.data[-1])
+
+
+def test_2d_slice_reduced_to_texture_size():
+    """Labels larger than the maximum texture size keep their main label."""
+    data = np.zeros((50, 40), dtype=np.int32)
+    data[:, 20:] = 2
+    layer = Labels(data)
+    layer._set_max_texture_sizes(16, None)
+
+    raw = layer._slice.image.raw
+    assert raw.shape == (13, 14)
+    assert layer._slice.texture_downsample == (4, 3)
+    npt.assert_array_equal(np.unique(raw[:, :7]), [0])
+    npt.assert_array_equal(np.unique(raw[:, 7:]), [2])
+    assert layer.get_value((30, 35)) == 2
+
+    # painting slices the layer again instead of patching the reduced slice
+    layer.paint_polygon([[0, 0], [0, 7], [7, 7], [7, 0]], 3)
+    npt.assert_array_equal(layer._slice.image.raw[:2, :2], 3)
+
+
+@pytest.mark.parametrize('contour', [0, 1])
+def test_shared_memory_data_partial_refresh(contour):
+    """Changes made in shared memory by a producer only refresh their region."""
+    shared = SharedMemoryArray.create((3, 20, 20), np.int32)
+    try:
+        layer = Labels(shared)
+        layer.contour = contour
+        layer._slice_dims(Dims(ndim=3, ndisplay=2, point=(1, 0, 0)))
+        updates = []
+        layer.events.labels_update.connect(updates.append)
+        set_data = []
+        layer.events.set_data.connect(set_data.append)
+
+        # the producer attaches the data, e.g. in another process
+        producer = SharedMemoryArray.attach(shared.info)
+        producer[1, 5:8, 6:10] = 4
+        producer[2, 0:3, 0:3] = 5  # not in the displayed slice
+        shared.poll()
+
+        assert not set_data
+        assert len(updates) == 1
+        assert list(updates[0].offset) == ([4, 5] if contour else [5, 6])
+        npt.assert_array_equal(
+            layer._slice.image.view,
+            layer._raw_to_displayed(layer._slice.image.raw),
+        )
+        assert layer._slice.image.raw[6, 7] == 4
+    finally:
+        shared.unlink()
+
+
+def test_shared_memory_data_painting_is_not_logged():
+    """Painting shared memory data doesn't log changes for the producer."""
+    shared = SharedMemoryArray.create((20, 20), np.int32)
+    try:
+        layer = Labels(shared)
+        layer.paint((5, 5), 3)
+        layer.undo()
+        layer.redo()
+
+        assert shared[5, 5] == 3
+        assert layer._slice.image.raw[5, 5] == 3
+        assert shared._count == 0
+        assert shared.poll() == []
+    finally:
+        shared.unlink()
@@ -46,7 +46,8 @@ from napari.layers.labels._labels_utils import (
     interpolate_coordinates,
 )
 from napari.layers.labels._slice import _LabelsSliceRequest
-from napari.layers.utils.layer_utils import _FeatureTable
+from napari.layers.utils._memory import MemoryReport
+from napari.layers.utils.layer_utils import _FeatureTable, zoom_nearest
 from napari.types import LayerDataType
 from napari.utils._dtype import (
     get_dtype_limits,
@@ -54,6 +55,7 @@ from napari.utils._dtype import (
     vispy_texture_dtype,
 )
 from napari.utils._indexing import elements_in_slice, index_in_slice
+from napari.utils._shared_memory import SharedMemoryArray
 from napari.utils.colormaps import (
     direct_colormap,
     label_colormap,
@@ -73,6 +75,8 @@ from napari.utils.status_messages import format_feature_value
 if TYPE_CHECKING:
     import pandas as pd
 
+    from napari.utils._buffer_pool import BufferPool
+
 __all__ = ('Labels',)
 
 
@@ -494,7 +498,8 @@ class Labels(ScalarFieldBase):
     def _post_init(self):
         self._reset_history()
         # Trigger generation of view slice and thumbnail
-        self.refresh()
+        with self._keeping_caches():
+            self.refresh()
         self._reset_editable()
 
     @property
@@ -655,6 +660,19 @@ class Labels(ScalarFieldBase):
         ScalarFieldBase.data.fset(self, data)  # type: ignore[attr-defined]
         self.events.features()
 
+    @property
+    def _painted_data(self) -> LayerDataProtocol | MultiScaleData:
+        """The data which painting writes into.
+
+        Painting writes into the array of shared memory data directly, and
+        refreshes the layer itself, so that it doesn't log the regions it
+        changed: only the process producing the data may log changes.
+        """
+        data = self.data
+        if isinstance(data, SharedMemoryArray):
+            return data.array
+        return data
+
     @property
     def features(self):
         """Dataframe-like features table.
@@ -747,6 +765,15 @@ class Labels(ScalarFieldBase):
             data = data[0]
         return data
 
+    def _add_memory(self, report: MemoryReport) -> None:
+        super()._add_memory(report)
+        report.add(
+            'undo',
+            self._undo_history,
+            self._redo_history,
+            self._staged_history,
+        )
+
     def _get_state(self) -> dict[str, Any]:
         """Get dictionary of layer state.
 
@@ -932,6 +959,13 @@ class Labels(ScalarFieldBase):
         if self._updated_slice is None or not self._slicing_state.loaded:
             return
 
+        if self._slice.texture_downsample is not None:
+            # the slice was reduced to fit in a texture, so it can't be
+            # updated in place at the painted data coordinates
+            self._updated_slice = None
+            self.refresh(thumbnail=False, extent=False, highlight=False)
+            return
+
         dims_displayed = self._slice_input.displayed
         raw_displayed = self._slice.image.raw
 
@@ -1000,7 +1034,10 @@ class Labels(ScalarFieldBase):
         return sliced_labels[delta_slice]
 
     def _raw_to_displayed(
-        self, raw, data_slice: tuple[slice, ...] | None = None
+        self,
+        raw,
+        data_slice: tuple[slice, ...] | None = None,
+        buffer_pool: BufferPool | None = None,
     ) -> np.ndarray:
         """Determine displayed image from a saved raw image and a saved seed.
 
@@ -1017,6 +1054,9 @@ class Labels(ScalarFieldBase):
             should be computed and displayed.
             If None, the whole input image will be processed.
 
+        buffer_pool : BufferPool, optional
+            If given, the displayed array is taken from this pool.
+
         Returns
         -------
         mapped_labels : array
@@ -1035,7 +1075,7 @@ class Labels(ScalarFieldBase):
         if sliced_labels is None:
             sliced_labels = labels[data_slice]
 
-        return self.colormap._data_to_texture(sliced_labels)
+        return self.colormap._data_to_texture(sliced_labels, buffer_pool)
 
     def _update_thumbnail(self):
         """Update the thumbnail with current data and colormap.
@@ -1044,8 +1084,6 @@ class Labels(ScalarFieldBase):
         like adjusting gamma or changing the data based on the contrast
         limits.
         """
-        from scipy import ndimage as ndi
-
         if not self._slicing_state.loaded or self._slice.empty:
             # ASYNC_TODO: Do not compute the thumbnail until we are loaded.
             # Is there a nicer way to prevent this from getting called?
@@ -1067,7 +1105,7 @@ class Labels(ScalarFieldBase):
         )
         zoom_factor = tuple(new_shape / imshape)
 
-        downsampled = ndi.zoom(image, zoom_factor, prefilter=False, order=0)
+        downsampled = zoom_nearest(image, zoom_factor)
         color_array = self.colormap.map(downsampled)
         color_array[..., 3] *= self.opacity
 
@@ -1134,7 +1172,7 @@ class Labels(ScalarFieldBase):
                 self._replay_masked_atom(atom, undoing=True)
                 continue
             indices, prev_values, _ = atom
-            self.data[indices] = prev_values
+            self._painted_data[indices] = prev_values
         self._staged_history = []
         self._block_history = False
         self.refresh()
@@ -1208,7 +1246,9 @@ class Labels(ScalarFieldBase):
                 self._replay_masked_atom(atom, undoing)
                 continue
             prev_indices, prev_values, next_values = atom
-            self.data[prev_indices] = prev_values if undoing else next_values
+            self._painted_data[prev_indices] = (
+                prev_values if undoing else next_values
+            )
 
         self.refresh()
 
@@ -1224,11 +1264,11 @@ class Labels(ScalarFieldBase):
         values = atom.old_values if undoing else atom.new_value
         if atom.mask is None:
             # The whole bounding box changed: assign directly.
-            self.data[atom.slice_key] = values
+            self._painted_data[atom.slice_key] = values
             return
         region = np.asarray(self.data[atom.slice_key])
         region[atom.mask] = values
-        self.data[atom.slice_key] = region
+        self._painted_data[atom.slice_key] = region
 
     def undo(self) -> None:
         self._load_history(
@@ -1867,7 +1907,7 @@ class Labels(ScalarFieldBase):
         # _apply_mask_to_data already wrote through and this assignment is a
         # no-op; for copy-returning backends (zarr, tensorstore, dask, ...)
         # this is the actual write-back.
-        self.data[slice_key] = region_data
+        self._painted_data[slice_key] = region_data
 
         # Update caches (raw and view) for non-shared memory backends
         # This handles mapping the N-D painted region to the currently displayed slice
@@ -1992,8 +2032,13 @@ class Labels(ScalarFieldBase):
         """
         # If the slice has not loaded yet (e.g. async slicing), the caches
         # are placeholders; the pending slice load will pick up the painted
-        # data directly, so there is nothing to patch here.
-        if not self._slicing_state.loaded or self._slice.empty:
+        # data directly, so there is nothing to patch here. Reduced slices
+        # are sliced again by _partial_labels_refresh instead.
+        if (
+            not self._slicing_state.loaded
+            or self._slice.empty
+            or self._slice.texture_downsample is not None
+        ):
             return
 
         # Invariant: for numpy-backed data, both raw and view caches are
@@ -2044,6 +2089,54 @@ class Labels(ScalarFieldBase):
                 new_color
             )
 
+    def _on_data_changed(self, event: Event) -> None:
+        """Display the regions of the data which another process changed.
+
+        Only the changed regions of the displayed slice are updated, as when
+        painting.
+        """
+        self._slicing_state._clear_caches()
+        for region in event.regions:
+            if self._refresh_caches_from_data(region):
+                self._accumulate_updated_slice(region)
+        self._partial_labels_refresh()
+
+    def _refresh_caches_from_data(self, slice_key: tuple[slice, ...]) -> bool:
+        """Update raw and view caches with a region of the data.
+
+        Parameters
+        ----------
+        slice_key : tuple of slice
+            The region of the data which changed, e.g. in another process.
+
+        Returns
+        -------
+        bool
+            Whether the region is displayed, and must be refreshed.
+        """
+        if not self._slicing_state.loaded or self._slice.empty:
+            # the pending slice load will read the changed data
+            return False
+        if self._slice.texture_downsample is not None:
+            # _partial_labels_refresh slices reduced slices again
+            return True
+
+        update_slices = self._get_update_slices(slice_key)
+        if update_slices is None:
+            return False
+
+        region_slices, view_slices = update_slices
+        (visible_data,) = self._align_data_to_view(
+            np.asarray(self.data[slice_key])[tuple(region_slices)]
+        )
+        # a no-op when the raw cache is a view of the data
+        self._slice.image.raw[tuple(view_slices)] = visible_data
+        if self.contour == 0:
+            self._slice.image.view[tuple(view_slices)] = (
+                self.colormap._data_to_texture(visible_data)
+            )
+        return True
+
     def _get_update_slices(
         self, slice_key: tuple[slice, ...]
     ) -> tuple[list[slice | int], list[slice]] | None:
@@ -2082,11 +2175,9 @@ class Labels(ScalarFieldBase):
         return region_slices, view_slices
 
     def _align_data_to_view(
-        self,
-        visible_data: np.ndarray,
-        visible_mask: np.ndarray,
-    ) -> tuple[np.ndarray, np.ndarray]:
-        """Transpose data from ascending dimension order to the displayed order.
+        self, *arrays: np.ndarray
+    ) -> tuple[np.ndarray, ...]:
+        """Transpose arrays from ascending dimension order to the displayed order.
 
         ``displayed`` may not be sorted (e.g. a transposed view), so the
         extracted region (whose axes are in ascending dimension order) is
@@ -2094,11 +2185,10 @@ class Labels(ScalarFieldBase):
         """
         displayed_dims = self._slice_input.displayed
         sorted_dims = sorted(displayed_dims)
-        if list(displayed_dims) != sorted_dims:
-            perm = [sorted_dims.index(d) for d in displayed_dims]
-            visible_data = np.transpose(visible_data, perm)
-            visible_mask = np.transpose(visible_mask, perm)
-        return visible_data, visible_mask
+        if list(displayed_dims) == sorted_dims:
+            return arrays
+        perm = [sorted_dims.index(d) for d in displayed_dims]
+        return tuple(np.transpose(array, perm) for array in arrays)
 
     def _get_shape_and_dims_to_paint(self) -> tuple[list, list]:
         dims_to_paint = sorted(self._get_dims_to_paint())
@@ -2164,7 +2254,7 @@ class Labels(ScalarFieldBase):
         )
 
         # update the labels image
-        self.data[indices] = value
+        self._painted_data[indices] = value
 
         pt_not_disp = self._get_pt_not_disp()
         displayed_indices = index_in_slice(
@@ -2361,6 +2451,15 @@ class _LabelsSlicingState(ScalarFieldSlicingState):
     layer: Labels
     _slice_request_class = _LabelsSliceRequest
 
+    def _raw_to_displayed(self, raw: np.ndarray) -> np.ndarray:
+        return self.layer._raw_to_displayed(raw, buffer_pool=self._buffer_pool)
+
+    def _max_texture_size(self, ndisplay: int) -> int | None:
+        # unlike images, large 2D labels are not displayed in tiles
+        if ndisplay == 2 and not self.layer.multiscale:
+            return self.layer._max_texture_sizes[0]
+        return super()._max_texture_size(ndisplay)
+
 
 class WrongSelectedLabelError(ValueError):
     """Raised when a label value is out of range for the layer's data dtype.
@@ -7,6 +7,7 @@ import numpy.typing as npt
 from napari.layers.base._slice import _next_request_id
 from napari.layers.points._points_constants import PointsProjectionMode
 from napari.layers.utils._slice_input import _SliceInput, _ThickNDSlice
+from napari.utils._buffer_pool import BufferPool, take_array
 
 
 @dataclass(frozen=True)
@@ -54,6 +55,9 @@ class _PointSliceRequest:
         Size of each point. This is used in calculating visibility.
     shown : array like
         Boolean array indicating if each point should be shown.
+    buffer_pool : BufferPool or None
+        If not None, the temporary arrays used to find the points in the
+        slice are taken from this pool.
     others
         See the corresponding attributes in `Layer` and `Points`.
     """
@@ -64,6 +68,9 @@ class _PointSliceRequest:
     projection_mode: PointsProjectionMode
     size: npt.NDArray = field(repr=False)
     shown: npt.NDArray = field(repr=False)
+    buffer_pool: BufferPool | None = field(
+        default=None, repr=False, compare=False
+    )
     id: int = field(default_factory=_next_request_id)
 
     def __call__(self) -> _PointSliceResponse:
@@ -115,13 +122,35 @@ class _PointSliceRequest:
         low[too_thin_slice] -= 0.5
         high[too_thin_slice] += 0.5
 
-        data_not_disp = self.data[:, not_disp]
-        inside_slice = np.all(
-            (data_not_disp >= low) & (data_not_disp <= high), axis=1
+        # the masks have the size of the data, and are reused for the next
+        # slices through the buffer pool
+        n_points = len(self.data)
+        data_not_disp = np.take(
+            self.data,
+            not_disp,
+            axis=1,
+            out=take_array(
+                self.buffer_pool,
+                (n_points, len(not_disp)),
+                self.data.dtype,
+            ),
         )
-        visible = np.where(inside_slice & self.shown)[0].astype(int)
+        above = take_array(self.buffer_pool, data_not_disp.shape, bool)
+        below = take_array(self.buffer_pool, data_not_disp.shape, bool)
+        inside_slice = take_array(self.buffer_pool, (n_points,), bool)
+        np.greater_equal(data_not_disp, low, out=above)
+        np.less_equal(data_not_disp, high, out=below)
+        np.logical_and(above, below, out=above)
+        np.all(above, axis=1, out=inside_slice)
+        np.logical_and(inside_slice, self.shown, out=inside_slice)
+        visible = np.flatnonzero(inside_slice).astype(int, copy=False)
+        if self.buffer_pool is not None:
+            self.buffer_pool.release(above, below, inside_slice)
+        del above, below, inside_slice
 
         if not visible.size:
+            if self.buffer_pool is not None:
+                self.buffer_pool.release(data_not_disp)
             return (
                 np.empty(0, dtype=int),
                 np.empty(0, dtype=float),
@@ -177,4 +206,6 @@ class _PointSliceRequest:
 
                 visible = visible[valid]
 
+        if self.buffer_pool is not None:
+            self.buffer_pool.release(data_not_disp)
         return visible, size
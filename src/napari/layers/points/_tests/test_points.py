@@ -300,6 +300,36 @@ def test_single_point_extent():
     assert np.array_equal(layer.extent.step, np.ones(3))
 
 
+def test_extent_updated_incrementally():
+    """Test the extent as points are added, removed and moved."""
+    layer = Points([[0, 0], [5, 5], [2, 3]])
+    np.testing.assert_array_equal(layer._extent_data, [[0, 0], [5, 5]])
+
+    layer.add([[10, -1]])
+    np.testing.assert_array_equal(layer._extent_data, [[0, -1], [10, 5]])
+    # points inside the extent don't need all the points to update it
+    layer.selected_data = {2}
+    layer.remove_selected()
+    assert layer._data_bounds._bounds is not None
+    np.testing.assert_array_equal(layer._extent_data, [[0, -1], [10, 5]])
+
+    layer._move([1], [5, 5])
+    layer._move([1], [6, 7])
+    np.testing.assert_array_equal(layer._extent_data, [[0, -1], [10, 7]])
+    layer.selected_data = {2}
+    layer.remove_selected()
+    np.testing.assert_array_equal(layer._extent_data, [[0, 0], [6, 7]])
+
+    # slicing doesn't change the extent, but refreshing may
+    layer._slice_dims(Dims(ndim=2, point=(1, 1)))
+    assert layer._data_bounds._bounds is not None
+    layer.data[0] = [-4, 20]
+    layer.refresh()
+    np.testing.assert_array_equal(layer._extent_data, [[-4, 7], [6, 20]])
+    layer.data = np.empty((0, 2))
+    assert np.isnan(layer._extent_data).all()
+
+
 def test_4D_points():
     """Test instantiating Points layer with random 4D data."""
     shape = (10, 4)
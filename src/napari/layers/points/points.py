@@ -38,6 +38,8 @@ from napari.layers.points._points_utils import (
 )
 from napari.layers.points._slice import _PointSliceRequest, _PointSliceResponse
 from napari.layers.utils._color_manager_constants import ColorMode
+from napari.layers.utils._data_bounds import DataBounds
+from napari.layers.utils._memory import MemoryReport
 from napari.layers.utils._slice_input import (
     _SliceInput,
     _ThickNDSlice,
@@ -446,6 +448,8 @@ class Points(Layer):
         self._drag_box_stored: Optional[np.ndarray] = None
         self._is_selecting = False
         self._clipboard = {}
+        # the extent of the points, updated as points are added and moved
+        self._data_bounds = DataBounds(self._compute_extent_data)
 
         super().__init__(
             data,
@@ -629,6 +633,7 @@ class Points(Layer):
         data, _ = fix_data_points(data, self.ndim)
         cur_npoints = len(self._data)
         self._data = data
+        self._data_bounds.clear_unless_updating()
 
         # Add/remove property and style values based on the number of new points.
         with (
@@ -844,6 +849,10 @@ class Points(Layer):
         -------
         extent_data : array, shape (2, D)
         """
+        return self._data_bounds.bounds
+
+    def _compute_extent_data(self) -> np.ndarray:
+        """Extent of all the points in data coordinates, see `DataBounds`."""
         if len(self.data) == 0:
             extrema = np.full((2, self.ndim), np.nan)
         else:
@@ -852,6 +861,29 @@ class Points(Layer):
             extrema = np.vstack([mins, maxs])
         return extrema.astype(float)
 
+    def refresh(
+        self,
+        event: Event | None = None,
+        *,
+        thumbnail: bool = True,
+        data_displayed: bool = True,
+        highlight: bool = True,
+        extent: bool = True,
+        force: bool = False,
+    ) -> None:
+        if extent:
+            # unless the layer is updating the bounds of the points it
+            # changes, the points may have been modified in place
+            self._data_bounds.clear_unless_updating()
+        super().refresh(
+            event,
+            thumbnail=thumbnail,
+            data_displayed=data_displayed,
+            highlight=highlight,
+            extent=extent,
+            force=force,
+        )
+
     @property
     def _extent_data_augmented(self) -> npt.NDArray:
         # _extent_data is a property that returns a new/copied array, which
@@ -1350,6 +1382,19 @@ class Points(Layer):
         self._border._refresh_colors(self.properties, update_color_mapping)
         self._face._refresh_colors(self.properties, update_color_mapping)
 
+    def _add_memory(self, report: MemoryReport) -> None:
+        super()._add_memory(report)
+        report.add(
+            'attributes',
+            self._size,
+            self._border_width,
+            self._symbol,
+            self._shown,
+            self._border.colors,
+            self._face.colors,
+        )
+        report.add('text', self._text.string._values)
+
     def _get_state(self) -> dict[str, Any]:
         """Get dictionary of layer state.
 
@@ -1975,7 +2020,9 @@ class Points(Layer):
             data_indices=(-1,),
             vertex_indices=((),),
         )
-        self._set_data(np.append(self.data, np.atleast_2d(coords), axis=0))
+        with self._data_bounds.updating():
+            self._data_bounds.add(coords)
+            self._set_data(np.append(self.data, np.atleast_2d(coords), axis=0))
         self.events.data(
             value=self.data,
             action=ActionType.ADDED,
@@ -2024,7 +2071,9 @@ class Points(Layer):
                     self._value -= offset
                     self._value_stored -= offset
 
-            self._set_data(np.delete(self.data, indices, axis=0))
+            with self._data_bounds.updating():
+                self._data_bounds.remove(self.data[indices])
+                self._set_data(np.delete(self.data, indices, axis=0))
 
             if len(self.data) == 0 and self.selected_data:
                 self.selected_data.clear()
@@ -2133,10 +2182,13 @@ class Points(Layer):
             self._set_drag_start(selection_indices, position)
             center = self.data[np.ix_(selection_indices, disp)].mean(axis=0)
             shift = np.array(position)[disp] - center - self._drag_start
+            old = self.data[selection_indices]
             self.data[np.ix_(selection_indices, disp)] = (
                 self.data[np.ix_(selection_indices, disp)] + shift
             )
-            self.refresh()
+            with self._data_bounds.updating():
+                self._data_bounds.move(old, self.data[selection_indices])
+                self.refresh()
             self.events.data(
                 value=self.data,
                 action=ActionType.CHANGED,
@@ -2222,7 +2274,9 @@ class Points(Layer):
             self._selected_data.update(
                 set(range(totpoints, totpoints + len(self._clipboard['data'])))
             )
-            self.refresh()
+            with self._data_bounds.updating():
+                self._data_bounds.add(data)
+                self.refresh()
 
     def _copy_data(self) -> None:
         """Copy selected points to clipboard."""
@@ -2497,6 +2551,7 @@ class _PointsSlicingState(_LayerSlicingState):
             projection_mode=self.layer.projection_mode,
             size=self.layer.size,
             shown=self.layer.shown,
+            buffer_pool=self._buffer_pool,
         )
 
     def _update_slice_response(self, response: _PointSliceResponse) -> None:
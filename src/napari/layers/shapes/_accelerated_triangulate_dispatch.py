@@ -143,19 +143,36 @@ def warmup_numba_cache() -> None:
     CACHE_WARMUP = True
     warmup_universal_numba()
 
+    if not USE_NUMBA_FOR_EDGE_TRIANGULATION:
+        _warmup_swappable_numba()
+
+
+def warmup_all_numba() -> None:
+    """Compile all the numba triangulation functions.
+
+    Unlike `warmup_numba_cache`, this does not depend on the triangulation
+    backend, so that switching backend never compiles. It is run in the
+    background when a viewer starts, see `napari.utils._numba_warmup`.
+    """
+    if _accelerated_triangulate_numba is None:
+        # no numba, nothing to warm up
+        return
+    warmup_universal_numba()
+    _warmup_swappable_numba()
+
+
+def _warmup_swappable_numba() -> None:
+    """Warm up the numba functions that can be swapped for other backends."""
+    assert _accelerated_triangulate_numba is not None
     for order in ('C', 'F'):
         data = np.array(
             [[0, 0], [1, 1], [0, 1], [1, 0]], dtype=np.float32, order=order
         )
-
-        if not USE_NUMBA_FOR_EDGE_TRIANGULATION:
-            _accelerated_triangulate_numba.generate_2D_edge_meshes(data, True)
-            _accelerated_triangulate_numba.generate_2D_edge_meshes(data, False)
-            _accelerated_triangulate_numba.remove_path_duplicates(data, False)
-            _accelerated_triangulate_numba.is_convex(data)
-            v, e = _accelerated_triangulate_numba.normalize_vertices_and_edges(
-                data
-            )
-            _accelerated_triangulate_numba.reconstruct_polygons_from_edges(
-                v, e
-            )
+        _accelerated_triangulate_numba.generate_2D_edge_meshes(data, True)
+        _accelerated_triangulate_numba.generate_2D_edge_meshes(data, False)
+        _accelerated_triangulate_numba.remove_path_duplicates(data, False)
+        _accelerated_triangulate_numba.is_convex(data)
+        v, e = _accelerated_triangulate_numba.normalize_vertices_and_edges(
+            data
+        )
+        _accelerated_triangulate_numba.reconstruct_polygons_from_edges(v, e)
@@ -25,6 +25,7 @@ from napari.layers.shapes.shape_types import (
     ZOrderArray,
     ZOrderDtype,
 )
+from napari.layers.utils._data_bounds import DataBounds
 from napari.utils.geometry import (
     inside_triangles,
     intersect_line_with_triangles,
@@ -443,6 +444,9 @@ class ShapeList:
         self._edge_color: ShapeColorArray = np.empty((0, 4))  # type: ignore[assignment]
         self._face_color: ShapeColorArray = np.empty((0, 4))  # type: ignore[assignment]
 
+        # the bounds of all the shapes, updated as shapes are added and moved
+        self._data_bounds = DataBounds(self._compute_bounds)
+
         # counter for the depth of re entrance of the context manager.
         self.__batched_level = 0
         self.__batch_force_call = False
@@ -595,6 +599,30 @@ class ShapeList:
 
         assert self.__batched_level >= 0
 
+    @contextmanager
+    def _moving(self, index: int) -> Generator[None, None, None]:
+        """Update the bounds of the shapes for a shape changed in the context."""
+        old = self.shapes[index]._bounding_box.copy()
+        yield
+        self._data_bounds.move(old, self.shapes[index]._bounding_box)
+
+    def _compute_bounds(self) -> np.ndarray:
+        """Bounds of all the shapes, see `DataBounds`."""
+        if not self.shapes:
+            return np.empty((2, 0))
+        bounding_boxes = np.array([s._bounding_box for s in self.shapes])
+        return np.array(
+            [
+                np.min(bounding_boxes[:, 0], axis=0),
+                np.max(bounding_boxes[:, 1], axis=0),
+            ]
+        )
+
+    @property
+    def bounds(self) -> np.ndarray:
+        """(2, D) array: minimum and maximum of the vertices of all shapes."""
+        return self._data_bounds.bounds
+
     @property
     def data(self) -> list[npt.NDArray]:
         """list of (M, D) array: data arrays for each shape."""
@@ -884,6 +912,7 @@ class ShapeList:
             raise TypeError('shape must be subclass of Shape')
 
         if shape_index is None:
+            self._data_bounds.add(shape._bounding_box)
             self.shapes.append(shape)
             self._z_index = np.append(self._z_index, shape.z_index)
 
@@ -895,6 +924,9 @@ class ShapeList:
             self._edge_color = np.vstack([self._edge_color, edge_color])
         else:
             z_refresh = False
+            self._data_bounds.move(
+                self.shapes[shape_index]._bounding_box, shape._bounding_box
+            )
             self.shapes[shape_index] = shape
             self._z_index[shape_index] = shape.z_index
 
@@ -1091,6 +1123,9 @@ class ShapeList:
         self._extend_meshes(face_colors, edge_colors, arrays)
 
         # Update list of shapes
+        self._data_bounds.add(
+            np.concatenate([shape._bounding_box for shape in shapes])
+        )
         self.shapes.extend(shapes)
 
         if z_refresh:
@@ -1102,6 +1137,7 @@ class ShapeList:
     def remove_all(self):
         """Removes all shapes"""
         self.shapes = []
+        self._data_bounds.clear()
         self._vertices = np.empty((0, self.ndisplay))  # type: ignore[assignment]
         self._vertices_index = np.zeros(1, dtype=IndexDtype)
         self._z_index = np.empty(0, dtype=IndexDtype)
@@ -1323,6 +1359,9 @@ class ShapeList:
         ).astype(IndexDtype)
 
         if renumber:
+            self._data_bounds.remove(
+                np.concatenate([self.shapes[i]._bounding_box for i in indices])
+            )
             for i in indices:
                 del self.shapes[i]
             self._z_index = np.delete(self._z_index, indices)
@@ -1464,10 +1503,12 @@ class ShapeList:
                 z_index=cur_shape.z_index,
                 dims_order=cur_shape.dims_order,
             )
-            self.shapes[index] = shape
+            with self._moving(index):
+                self.shapes[index] = shape
         else:
             shape = self.shapes[index]
-            shape.data = data
+            with self._moving(index):
+                shape.data = data
 
         if face_color is not None:
             self._face_color[index] = face_color
@@ -1615,7 +1656,8 @@ class ShapeList:
         shift : np.ndarray
             length 2 array specifying shift of shapes.
         """
-        self.shapes[index].shift(shift)
+        with self._moving(index):
+            self.shapes[index].shift(shift)
         self._update_mesh_vertices(index, edge=True, face=True)
 
     def scale(self, index, scale, center=None):
@@ -1630,7 +1672,8 @@ class ShapeList:
         center : list
             length 2 list specifying coordinate of center of scaling.
         """
-        self.shapes[index].scale(scale, center=center)
+        with self._moving(index):
+            self.shapes[index].scale(scale, center=center)
         self.update(index)
         self._update_z_order()
 
@@ -1646,7 +1689,8 @@ class ShapeList:
         center : list
             length 2 list specifying coordinate of center of rotation.
         """
-        self.shapes[index].rotate(angle, center=center)
+        with self._moving(index):
+            self.shapes[index].rotate(angle, center=center)
         self._update_mesh_vertices(index, edge=True, face=True)
 
     def flip(self, index, axis, center=None):
@@ -1662,7 +1706,8 @@ class ShapeList:
         center : list
             length 2 list specifying coordinate of center of flip axes.
         """
-        self.shapes[index].flip(axis, center=center)
+        with self._moving(index):
+            self.shapes[index].flip(axis, center=center)
         self._update_mesh_vertices(index, edge=True, face=True)
 
     def transform(self, index, transform):
@@ -1675,7 +1720,8 @@ class ShapeList:
         transform : np.ndarray
             2x2 array specifying linear transform.
         """
-        self.shapes[index].transform(transform)
+        with self._moving(index):
+            self.shapes[index].transform(transform)
         self.update(index)
         self._update_z_order()
         self._clear_cache()
@@ -6,10 +6,6 @@ import typing
 from typing import TYPE_CHECKING, overload
 
 import numpy as np
-from skimage import measure
-from skimage.draw import line, polygon2mask
-from vispy.geometry import Triangulation
-from vispy.visuals.tube import _frenet_frames
 
 from napari.layers.shapes import (
     _accelerated_triangulate_dispatch as _triangulate_dispatch,
@@ -659,8 +655,10 @@ def _cull_triangles_not_in_poly(vertices, triangles, poly):
     culled_triangles: np.ndarray[np.intp], shape (P, 3), P ≤ M
         A subset of the input triangles.
     """
+    from skimage.measure import points_in_poly
+
     centers = np.mean(vertices[triangles], axis=1)
-    in_poly = measure.points_in_poly(centers, poly)
+    in_poly = points_in_poly(centers, poly)
     return triangles[in_poly]
 
 
@@ -856,6 +854,8 @@ def triangulate_face_vispy(
     edges: EdgeArray,
     polygon_vertices: CoordinateArray,
 ) -> tuple[CoordinateArray, TriangleArray]:
+    from vispy.geometry import Triangulation
+
     try:
         tri = Triangulation(raw_vertices, edges)
         tri.triangulate()
@@ -1005,6 +1005,9 @@ def generate_tube_meshes(path, closed=False, tube_points=10):
     triangles : (P, 3) array
         Vertex indices that form the mesh triangles
     """
+    # importing vispy.visuals is slow, and only needed for 3D paths
+    from vispy.visuals.tube import _frenet_frames
+
     points = np.array(path).astype(float)
 
     if closed and not np.array_equal(points[0], points[-1]):
@@ -1070,6 +1073,8 @@ def path_to_mask(
         Boolean array with `True` for points along the path
 
     """
+    from skimage.draw import line
+
     mask_shape = np.asarray(mask_shape, dtype=int)
     mask = np.zeros(mask_shape, dtype=bool)
 
@@ -1110,6 +1115,8 @@ def poly_to_mask(
     mask : np.ndarray
         Boolean array with `True` for points inside the polygon
     """
+    from skimage.draw import polygon2mask
+
     return polygon2mask(mask_shape, vertices)
 
 
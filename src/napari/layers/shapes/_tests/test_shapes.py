@@ -2588,6 +2588,28 @@ def test_world_data_extent():
     check_layer_world_data_extent(layer, extent, (3, 1, 1), (10, 20, 5))
 
 
+def test_extent_updated_incrementally():
+    """Test the extent as shapes are added, removed and moved."""
+    layer = Shapes(
+        [[[0, 0], [4, 4]], [[1, 1], [2, 3]]], shape_type='rectangle'
+    )
+    np.testing.assert_array_equal(layer._extent_data, [[0, 0], [4, 4]])
+
+    layer.add([[-2, 3], [1, 8]], shape_type='line')
+    np.testing.assert_array_equal(layer._extent_data, [[-2, 0], [4, 8]])
+    layer._data_view.shift(1, [10, 0])
+    np.testing.assert_array_equal(layer._extent_data, [[-2, 0], [12, 8]])
+    layer._data_view.edit(2, [[0, 3], [1, 3]])
+    np.testing.assert_array_equal(layer._extent_data, [[0, 0], [12, 4]])
+
+    layer.selected_data = {1}
+    layer.remove_selected()
+    np.testing.assert_array_equal(layer._extent_data, [[0, 0], [4, 4]])
+    layer.selected_data = {0, 1}
+    layer.remove_selected()
+    assert np.isnan(layer._extent_data).all()
+
+
 def test_set_data_3d():
     """Test to reproduce https://github.com/napari/napari/issues/4527"""
     lines = [
@@ -51,6 +51,7 @@ from napari.layers.shapes._shapes_utils import (
     validate_num_vertices,
 )
 from napari.layers.shapes.shape_types import BoxArray
+from napari.layers.utils._memory import MemoryReport
 from napari.layers.utils.color_manager import DEFAULT_COLOR_CYCLE
 from napari.layers.utils.color_manager_utils import (
     guess_continuous,
@@ -862,15 +863,9 @@ class Shapes(Layer):
         -------
         extent_data : array, shape (2, D)
         """
-        if len(self.data) == 0:
+        if self.nshapes == 0:
             return np.full((2, self.ndim), np.nan)
-
-        bounding_boxes = np.array(
-            [d._bounding_box for d in self._data_view.shapes]
-        )
-        mins = np.min(bounding_boxes[:, 0, :], axis=0)
-        maxs = np.max(bounding_boxes[:, 1, :], axis=0)
-        return np.vstack([mins, maxs])
+        return self._data_view.bounds
 
     @property
     def nshapes(self):
@@ -1589,6 +1584,23 @@ class Shapes(Layer):
             'Should be the name of a color, an array of colors, or the name of a property'
         )
 
+    def _add_memory(self, report: MemoryReport) -> None:
+        super()._add_memory(report)
+        data_view = self._data_view
+        report.add(
+            'mesh',
+            vars(data_view._mesh),
+            [vars(shape) for shape in data_view.shapes],
+        )
+        report.add(
+            'view',
+            data_view.displayed_vertices,
+            data_view.displayed_vertices_to_shape_num,
+            data_view.displayed_indices,
+        )
+        report.add('attributes', vars(data_view))
+        report.add('text', self._text.string._values)
+
     def _get_state(self) -> dict[str, Any]:
         """Get dictionary of layer state.
 
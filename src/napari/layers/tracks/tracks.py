@@ -9,6 +9,7 @@ import numpy as np
 
 from napari.layers.base import Layer, _LayerSlicingState
 from napari.layers.tracks._track_utils import TrackManager
+from napari.layers.utils._data_bounds import DataBounds
 from napari.types import LayerDataType
 from napari.utils.colormaps import AVAILABLE_COLORMAPS, Colormap
 from napari.utils.events import Event
@@ -149,6 +150,9 @@ class Tracks(Layer):
         # set the track data dimensions (remove ID from data)
         ndim = data.shape[1] - 1
 
+        # the extent of the tracks, computed once for each data
+        self._data_bounds = DataBounds(self._compute_extent_data)
+
         super().__init__(
             data,
             ndim,
@@ -235,6 +239,10 @@ class Tracks(Layer):
         -------
         extent_data : array, shape (2, D)
         """
+        return self._data_bounds.bounds
+
+    def _compute_extent_data(self) -> np.ndarray:
+        """Extent of all the tracks in data coordinates, see `DataBounds`."""
         if len(self.data) == 0:
             extrema = np.full((2, self.ndim), np.nan)
         else:
@@ -383,6 +391,7 @@ class Tracks(Layer):
         # set the data and build the tracks
         self._manager.data = data
         self._manager.build_tracks()
+        self._data_bounds.clear()
 
         # reset the properties and recolor the tracks
         self.features = {}
@@ -0,0 +1,113 @@
+"""Bounds of the coordinates of a layer, maintained as they change."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+import numpy as np
+import numpy.typing as npt
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+
+class DataBounds:
+    """Minimum and maximum of coordinates, updated as coordinates change.
+
+    Layers whose data are coordinates, e.g. points or the vertices of shapes,
+    use it for their extent. Adding coordinates only extends the bounds, and
+    removing or moving coordinates only recomputes them if the removed
+    coordinates were on the bounds. Otherwise, the bounds are recomputed
+    from all the data once they are needed again.
+
+    Layers update the bounds within `updating`, while they change their
+    data, and clear them with `clear_unless_updating` when they are
+    refreshed: then the data may have been modified in place. The bounds are
+    kept when the layer is only sliced again.
+
+    Parameters
+    ----------
+    compute : callable
+        Returns the (2, D) bounds of all the coordinates, which are all NaN
+        if there are none.
+    """
+
+    def __init__(self, compute: Callable[[], npt.ArrayLike]) -> None:
+        self._compute = compute
+        self._bounds: np.ndarray | None = None
+        self._updating = 0
+
+    @property
+    def bounds(self) -> np.ndarray:
+        """(2, D) array: the minimum and maximum of the coordinates."""
+        if self._bounds is None:
+            self._bounds = np.array(self._compute(), dtype=float)
+        return self._bounds.copy()
+
+    @contextmanager
+    def updating(self) -> Iterator[None]:
+        """Keep the bounds while a layer changes its data and updates them."""
+        self._updating += 1
+        try:
+            yield
+        finally:
+            self._updating -= 1
+
+    def clear(self) -> None:
+        """Recompute the bounds from all the data once they are needed."""
+        self._bounds = None
+
+    def clear_unless_updating(self) -> None:
+        """Clear the bounds, unless they are being updated."""
+        if not self._updating:
+            self.clear()
+
+    def add(self, coords: npt.ArrayLike) -> None:
+        """Extend the bounds with coordinates which were added.
+
+        Parameters
+        ----------
+        coords : (N, D) array
+            The added coordinates.
+        """
+        coords = np.atleast_2d(np.asarray(coords, dtype=float))
+        if self._bounds is None or len(coords) == 0:
+            return
+        if coords.shape[1] != self._bounds.shape[1]:
+            self.clear()
+            return
+        # fmin and fmax ignore the NaN bounds of empty data
+        self._bounds[0] = np.fmin(self._bounds[0], coords.min(axis=0))
+        self._bounds[1] = np.fmax(self._bounds[1], coords.max(axis=0))
+
+    def remove(self, coords: npt.ArrayLike) -> None:
+        """Update the bounds for coordinates which were removed.
+
+        Parameters
+        ----------
+        coords : (N, D) array
+            The removed coordinates.
+        """
+        coords = np.atleast_2d(np.asarray(coords, dtype=float))
+        if self._bounds is None or len(coords) == 0:
+            return
+        if coords.shape[1] != self._bounds.shape[1] or (
+            np.any(coords.min(axis=0) <= self._bounds[0])
+            or np.any(coords.max(axis=0) >= self._bounds[1])
+        ):
+            # the bounds may shrink
+            self.clear()
+
+    def move(self, old: npt.ArrayLike, new: npt.ArrayLike) -> None:
+        """Update the bounds for coordinates which moved.
+
+        Parameters
+        ----------
+        old : (N, D) array
+            The coordinates before they moved.
+        new : (N, D) array
+            The coordinates after they moved.
+        """
+        self.remove(old)
+        self.add(new)
@@ -0,0 +1,81 @@
+"""Attribution of the memory held by layers, see ``Layer._memory_report``."""
+
+from __future__ import annotations
+
+import mmap
+import sys
+from collections.abc import Sequence, Set as AbstractSet
+from typing import Any
+
+import numpy as np
+
+from napari.utils._streaming import StreamingArray
+
+
+class MemoryReport:
+    """Bytes held in memory by a layer, by category.
+
+    Only the buffers of numpy arrays and pandas objects are counted: lazy
+    arrays, such as dask or zarr arrays, don't hold their data in memory,
+    memory-mapped arrays, such as arrays in shared memory, are not owned by
+    the layer, and the overhead of python objects is ignored. Streaming arrays
+    count the frames they keep in memory. Each buffer is counted
+    once, in the first category it is added to, so views of the data of a
+    layer (e.g. slices) don't count twice.
+
+    Attributes
+    ----------
+    nbytes : dict of str to int
+        The bytes of each category, in the order categories were added.
+    """
+
+    def __init__(self) -> None:
+        self.nbytes: dict[str, int] = {}
+        self._seen: set[int] = set()
+
+    def add(self, category: str, *objects: Any) -> None:
+        """Add the bytes held by ``objects`` to ``category``.
+
+        Parameters
+        ----------
+        category : str
+            The category, e.g. 'data' or 'view'.
+        *objects : Any
+            Arrays, data frames, or sequences, sets and dicts of them, which
+            may be nested, e.g. multiscale data.
+        """
+        nbytes = sum(self._nbytes(obj) for obj in objects)
+        self.nbytes[category] = self.nbytes.get(category, 0) + nbytes
+
+    def _nbytes(self, obj: Any) -> int:
+        if isinstance(obj, np.ndarray):
+            # a view keeps the array it views alive
+            while isinstance(obj.base, np.ndarray):
+                obj = obj.base
+            if (
+                isinstance(obj, np.memmap)
+                or isinstance(obj.base, mmap.mmap)
+                or id(obj) in self._seen
+            ):
+                return 0
+            self._seen.add(id(obj))
+            return obj.nbytes
+        if isinstance(obj, StreamingArray):
+            return self._nbytes(obj._frames)
+        # there can't be pandas objects unless pandas was imported
+        pd = sys.modules.get('pandas')
+        if pd is not None and isinstance(
+            obj, pd.DataFrame | pd.Series | pd.Index
+        ):
+            if id(obj) in self._seen:
+                return 0
+            self._seen.add(id(obj))
+            usage = obj.memory_usage(deep=True)
+            return int(usage.sum() if isinstance(obj, pd.DataFrame) else usage)
+        if isinstance(obj, dict):
+            return sum(self._nbytes(value) for value in obj.values())
+        if isinstance(obj, Sequence | AbstractSet) and not isinstance(
+            obj, str | bytes
+        ):
+            return sum(self._nbytes(item) for item in obj)
+        return 0
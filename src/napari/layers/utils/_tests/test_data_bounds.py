@@ -0,0 +1,67 @@
+import numpy as np
+import numpy.testing as npt
+
+from napari.layers.utils._data_bounds import DataBounds
+
+
+def _bounds(coords):
+    calls = []
+
+    def compute():
+        calls.append(1)
+        if len(coords) == 0:
+            return np.full((2, 2), np.nan)
+        return np.array([np.min(coords, axis=0), np.max(coords, axis=0)])
+
+    return DataBounds(compute), calls
+
+
+def test_bounds_computed_once():
+    bounds, calls = _bounds(np.array([[0, 1], [4, -2]]))
+    npt.assert_array_equal(bounds.bounds, [[0, -2], [4, 1]])
+    bounds.bounds[0] = 10
+    npt.assert_array_equal(bounds.bounds, [[0, -2], [4, 1]])
+    assert len(calls) == 1
+
+    bounds.clear()
+    npt.assert_array_equal(bounds.bounds, [[0, -2], [4, 1]])
+    assert len(calls) == 2
+
+
+def test_add_extends_bounds():
+    bounds, calls = _bounds(np.empty((0, 2)))
+    assert np.isnan(bounds.bounds).all()
+    bounds.add([1, 2])
+    npt.assert_array_equal(bounds.bounds, [[1, 2], [1, 2]])
+    bounds.add([[0, 5], [-1, 3]])
+    npt.assert_array_equal(bounds.bounds, [[-1, 2], [1, 5]])
+    assert len(calls) == 1
+
+    # coordinates with another number of dimensions clear the bounds
+    bounds.add([[0, 0, 0]])
+    assert bounds._bounds is None
+
+
+def test_remove_and_move():
+    bounds, calls = _bounds(np.array([[0, 0], [5, 5]]))
+    bounds.bounds
+    # removing or moving coordinates inside the bounds keeps them
+    bounds.remove([[2, 3]])
+    bounds.move([[2, 3]], [[4, 4]])
+    npt.assert_array_equal(bounds.bounds, [[0, 0], [5, 5]])
+    assert len(calls) == 1
+
+    # coordinates on the bounds may shrink them
+    bounds.move([[5, 5]], [[3, 6]])
+    assert bounds._bounds is None
+
+
+def test_clear_unless_updating():
+    bounds, _calls = _bounds(np.array([[0, 0], [5, 5]]))
+    bounds.bounds
+    with bounds.updating():
+        bounds.add([[6, 6]])
+        bounds.clear_unless_updating()
+    npt.assert_array_equal(bounds.bounds, [[0, 0], [6, 6]])
+    bounds.clear_unless_updating()
+    assert bounds._bounds is None
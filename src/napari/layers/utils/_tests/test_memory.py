@@ -0,0 +1,78 @@
+import dask.array as da
+import numpy as np
+import pandas as pd
+
+from napari.layers import Image, Labels, Points, Shapes
+from napari.layers.utils._memory import MemoryReport
+from napari.utils._shared_memory import SharedMemoryArray
+
+
+def test_memory_report_counts_buffers_once():
+    data = np.zeros((100, 100))
+    report = MemoryReport()
+    report.add('data', data)
+    report.add('view', data[10:20], [data.T, (data[0],)])
+    report.add('features', pd.DataFrame({'a': np.arange(10)}))
+    report.add('lazy', da.zeros((100, 100)), 'not an array', None)
+    assert report.nbytes['data'] == data.nbytes
+    assert report.nbytes['view'] == 0
+    assert report.nbytes['features'] >= 10 * 8
+    assert report.nbytes['lazy'] == 0
+
+
+def test_memory_report_ignores_shared_memory():
+    shared = SharedMemoryArray.create((100, 100), np.float64)
+    try:
+        report = MemoryReport()
+        report.add('shared', shared.array, shared[10:20])
+        assert report.nbytes['shared'] == 0
+    finally:
+        shared.unlink()
+
+
+def test_points_memory_report():
+    n = 1000
+    layer = Points(
+        np.random.default_rng(0).random((n, 3)),
+        features={'a': np.arange(n)},
+        text='{a}',
+    )
+    report = layer._memory_report()
+    assert report['data'] == n * 3 * 8
+    assert report['features'] >= n * 8
+    assert report['thumbnail'] == layer.thumbnail.nbytes
+    # sizes, border widths and face and border colors at least
+    assert report['attributes'] >= n * (8 + 8 + 2 * 4 * 4)
+    assert report['text'] > 0
+
+
+def test_labels_memory_report_undo():
+    layer = Labels(np.zeros((4, 64, 64), dtype=np.uint8))
+    assert layer._memory_report()['undo'] == 0
+    layer.brush_size = 10
+    layer.paint((1, 32, 32), 2)
+    report = layer._memory_report()
+    assert report['undo'] > 0
+    assert report['data'] == layer.data.nbytes
+
+
+def test_shapes_memory_report_mesh():
+    data = [
+        np.array([[0, 0], [10, 0], [10, 10], [0, 10]]) + i for i in range(10)
+    ]
+    layer = Shapes(data, shape_type='polygon')
+    report = layer._memory_report()
+    assert report['data'] == sum(shape.nbytes for shape in layer.data)
+    assert report['mesh'] > 0
+
+
+def test_image_memory_report():
+    layer = Image(np.zeros((8, 32, 32), dtype=np.uint16))
+    report = layer._memory_report()
+    assert report['data'] == layer.data.nbytes
+    # the slice is a view of the data, and is not counted twice
+    assert report['view'] < 32 * 32 * 4
+    assert set(report) >= {'thumbnail', 'features', 'caches'}
+
+    dask_layer = Image(da.zeros((8, 32, 32), chunks=(1, 32, 32)))
+    assert dask_layer._memory_report()['data'] == 0
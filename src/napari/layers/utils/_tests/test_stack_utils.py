@@ -461,3 +461,14 @@ def test_slice_from_axis_different_array_types(
     )
     expected = data[:, element, :]
     np.testing.assert_array_equal(result_computed, expected)
+
+
+def test_split_channels_auto_multiscale():
+    """'auto' is passed on to the channels of single-scale data."""
+    data = np.zeros((2, 8, 8))
+    layers = split_channels(data, 0, multiscale='auto')
+    assert [meta['multiscale'] for _, meta, _ in layers] == ['auto'] * 2
+
+    pyramid = [np.zeros((2, 8, 8)), np.zeros((2, 4, 4))]
+    layers = split_channels(pyramid, 0, multiscale='auto')
+    assert [meta['multiscale'] for _, meta, _ in layers] == [True] * 2
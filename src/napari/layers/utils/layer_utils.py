@@ -3,6 +3,7 @@ from __future__ import annotations
 import functools
 import inspect
 import operator
+import sys
 import warnings
 from collections.abc import Callable, Sequence
 from importlib import import_module
@@ -13,7 +14,6 @@ from typing import (
     TypeVar,
 )
 
-import dask
 import numpy as np
 
 from napari.utils.action_manager import action_manager
@@ -314,8 +314,10 @@ def calc_data_range(
                 [_nanmax(data[idx]) for idx in idxs],
                 [_nanmin(data[idx]) for idx in idxs],
             ]
-        # compute everything in one go
-        reduced_data = dask.compute(*reduced_data)
+        # compute everything in one go. dask arrays can't exist before dask
+        # is imported, so dask isn't imported otherwise
+        if (dask := sys.modules.get('dask')) is not None:
+            reduced_data = dask.compute(*reduced_data)
     else:
         reduced_data = data
 
@@ -417,6 +419,41 @@ def convert_to_uint8(data: np.ndarray) -> np.ndarray:
     raise NotImplementedError
 
 
+def zoom_nearest(image: np.ndarray, zoom: Sequence[float]) -> np.ndarray:
+    """Resize an image by nearest-neighbor interpolation.
+
+    Equivalent to ``scipy.ndimage.zoom(image, zoom, order=0,
+    prefilter=False)``, except at the last row and column, which are always
+    taken from the image, without importing scipy.ndimage, which is slow
+    to import. Used to downsample thumbnails.
+
+    Parameters
+    ----------
+    image : np.ndarray
+        The image.
+    zoom : sequence of float
+        The zoom factor of the first axes of the image. The remaining axes,
+        e.g. RGB channels, are not resized.
+
+    Returns
+    -------
+    np.ndarray
+        The resized image, whose size along each resized axis is the
+        rounded product of its size and zoom factor.
+    """
+    out = image
+    for axis, (size, factor) in enumerate(
+        zip(image.shape, zoom, strict=False)
+    ):
+        new_size = max(round(size * factor), 1)
+        if new_size == size:
+            continue
+        step = (size - 1) / (new_size - 1) if new_size > 1 else 0
+        indices = np.floor(np.arange(new_size) * step + 0.5).astype(np.intp)
+        out = np.take(out, np.minimum(indices, size - 1), axis=axis)
+    return out
+
+
 def get_current_properties(
     properties: dict[str, np.ndarray],
     choices: dict[str, np.ndarray],
@@ -88,9 +88,14 @@ def split_channels(
 
     # Determine if data is a multiscale
     multiscale = kwargs.get('multiscale')
-    if not multiscale:
+    if not multiscale or multiscale == 'auto':
+        # with 'auto', pyramids are built for each channel of single-scale
+        # data by the Image layers
+        auto = multiscale == 'auto'
         multiscale, data = guess_multiscale(data)
-        kwargs['multiscale'] = multiscale
+        kwargs['multiscale'] = (
+            'auto' if auto and not multiscale else multiscale
+        )
 
     n_channels = (data[0] if multiscale else data).shape[channel_axis]
     # Use original blending mode or for multichannel use translucent for first channel then additive
@@ -6,6 +6,7 @@ import numpy as np
 
 from napari.layers.base import Layer, _LayerSlicingState
 from napari.layers.utils._color_manager_constants import ColorMode
+from napari.layers.utils._memory import MemoryReport
 from napari.layers.utils._slice_input import (
     _SliceInput,
     _ThickNDSlice,
@@ -436,6 +437,10 @@ class Vectors(Layer):
     def property_choices(self) -> dict[str, np.ndarray]:
         return self._feature_table.choices()
 
+    def _add_memory(self, report: MemoryReport) -> None:
+        super()._add_memory(report)
+        report.add('attributes', self._edge.colors)
+
     def _get_state(self) -> dict[str, Any]:
         """Get dictionary of layer state.
 
@@ -5,6 +5,7 @@ from npe2 import (
 )
 
 from napari.plugins import _npe2
+from napari.plugins._manifest_cache import discover_plugins
 from napari.settings import _clear_plugin_settings_cache, get_settings
 
 __all__ = ('menu_item_template', 'plugin_manager')
@@ -36,7 +37,7 @@ def _initialize_plugins() -> None:
     _npe2pm.events.enablement_changed.connect(_clear_plugin_settings_cache)
     _npe2pm.events.plugins_registered.connect(_npe2.on_plugins_registered)
     _npe2pm.events.plugins_registered.connect(_clear_plugin_settings_cache)
-    _npe2pm.discover(include_npe1=True)
+    discover_plugins(_npe2pm)
 
     # Disable plugins listed as disabled in settings, or detected in npe2
     _from_npe2 = {m.name for m in _npe2pm.iter_manifests()}
@@ -0,0 +1,176 @@
+"""On-disk cache of the manifests of installed plugins.
+
+Discovering plugins parses the YAML manifest of every installed plugin,
+which takes most of the time to register plugins at startup (the pure python
+YAML parser takes tens of milliseconds per manifest), whereas building their
+actions, menus and reader tables from the parsed manifests is fast. Parsed
+manifests are therefore saved as JSON in the user cache directory, under a
+key derived from the metadata of the distribution of each plugin, and loaded
+instead of being parsed again on the next launch.
+
+Only plugins installed from a wheel are cached: their RECORD metadata lists
+the hash of every installed file, so that any change to the plugin, such as
+an update of its manifest, changes the key. Editable installs have no RECORD
+and are always parsed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from napari.utils._platformdirs import user_cache_dir
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from importlib.metadata import Distribution
+
+    from npe2 import PluginManager
+    from npe2.manifest import PluginManifest
+
+_logger = logging.getLogger(__name__)
+
+# Bump when the way manifests are cached changes, to invalidate them.
+_MANIFEST_CACHE_VERSION = 1
+
+# The entry point group of npe2 manifests.
+_MANIFEST_ENTRY_POINT = 'napari.manifest'
+
+
+def manifest_cache_dir() -> Path:
+    """Directory where the manifests of installed plugins are cached."""
+    return Path(user_cache_dir()) / 'plugin_manifests'
+
+
+def _distribution_key(dist: Distribution) -> str | None:
+    """A key identifying an installed distribution, if it can be cached.
+
+    The key changes with the version of npe2 and of this cache, and with the
+    version and installed files of the distribution.
+    """
+    from npe2 import __version__ as npe2_version
+
+    record = dist.read_text('RECORD')
+    if record is None:
+        return None
+    name = dist.metadata['Name']
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (
+        str(_MANIFEST_CACHE_VERSION),
+        npe2_version,
+        name,
+        dist.version,
+        record,
+    ):
+        digest.update(part.encode())
+        digest.update(b'\0')
+    return f'{name}-{digest.hexdigest()}'
+
+
+def _load_manifest(path: Path) -> PluginManifest | None:
+    """Load a cached manifest, if there is a valid one at ``path``."""
+    from npe2 import PluginManifest
+
+    try:
+        with path.open() as f:
+            cached = json.load(f)
+        mf = PluginManifest.model_validate(cached['manifest'])
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError):
+        # pydantic's ValidationError is a ValueError
+        _logger.warning('Ignoring invalid plugin manifest cache %s', path)
+        return None
+    if cached.get('source_file') is not None:
+        mf._source_file = Path(cached['source_file'])
+    return mf
+
+
+def _save_manifest(path: Path, mf: PluginManifest) -> None:
+    """Cache a manifest at ``path``."""
+    source_file = getattr(mf, '_source_file', None)
+    cached = {
+        'source_file': None if source_file is None else str(source_file),
+        'manifest': json.loads(mf.model_dump_json(exclude_unset=True)),
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # written to a unique file first, so that another napari process
+        # never reads a partially written cache
+        tmp_path = path.with_suffix(f'.{uuid.uuid4().hex}.tmp')
+        tmp_path.write_text(json.dumps(cached))
+        tmp_path.replace(path)
+    except OSError:
+        _logger.warning('Could not cache the manifest of %s', mf.name)
+
+
+def _cached_from_dist(from_dist):
+    """Wrap npe2's ``_from_dist`` to cache the manifests it parses."""
+
+    def _from_dist(dist: Distribution) -> PluginManifest | None:
+        if not any(
+            ep.group == _MANIFEST_ENTRY_POINT for ep in dist.entry_points
+        ):
+            # not a npe2 plugin, e.g. a npe1 plugin, or not a plugin
+            return from_dist(dist)
+        key = _distribution_key(dist)
+        if key is None:
+            return from_dist(dist)
+        path = manifest_cache_dir() / f'{key}.json'
+        mf = _load_manifest(path)
+        if mf is None:
+            mf = from_dist(dist)
+            if mf is not None:
+                _save_manifest(path, mf)
+        return mf
+
+    return _from_dist
+
+
+@contextmanager
+def cached_manifests() -> Generator[None, None, None]:
+    """Use cached manifests while discovering plugins in this context.
+
+    npe2 has no hook to load manifests, so the function it uses to parse the
+    manifest of each distribution is replaced within the context.
+    """
+    from npe2.manifest import schema
+
+    from_dist = getattr(schema, '_from_dist', None)
+    if from_dist is None:  # pragma: no cover
+        # npe2 changed, discover plugins without the cache
+        yield
+        return
+    schema._from_dist = _cached_from_dist(from_dist)
+    try:
+        yield
+    finally:
+        schema._from_dist = from_dist
+
+
+def discover_plugins(pm: PluginManager) -> int:
+    """Discover plugins, including npe1 plugins, with cached manifests.
+
+    Parameters
+    ----------
+    pm : PluginManager
+        The plugin manager registering the discovered plugins.
+
+    Returns
+    -------
+    int
+        The number of discovered plugins.
+    """
+    with cached_manifests():
+        return pm.discover(include_npe1=True)
+
+
+def clear_manifest_cache() -> None:
+    """Remove all the cached manifests of installed plugins."""
+    for path in manifest_cache_dir().glob('*.json'):
+        path.unlink(missing_ok=True)
@@ -0,0 +1,80 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from npe2 import PluginManifest
+from npe2.manifest import schema
+
+from napari.plugins import _manifest_cache
+
+MANIFEST_PATH = Path(__file__).parent / '_sample_manifest.yaml'
+
+
+def _dist(record='my_plugin/napari.yaml,sha256=abc,100'):
+    """A fake installed distribution of the sample plugin."""
+    return SimpleNamespace(
+        entry_points=[
+            SimpleNamespace(group='napari.manifest', value='my_plugin:x')
+        ],
+        metadata={'Name': 'my-plugin'},
+        version='0.1.0',
+        read_text=lambda name: record if name == 'RECORD' else None,
+    )
+
+
+@pytest.fixture
+def from_dist(monkeypatch, tmp_path):
+    """Cached npe2 `_from_dist`, and the distributions it parsed."""
+    monkeypatch.setattr(
+        _manifest_cache, 'manifest_cache_dir', lambda: tmp_path
+    )
+    parsed = []
+
+    def _from_dist(dist):
+        parsed.append(dist)
+        return PluginManifest.from_file(MANIFEST_PATH)
+
+    return _manifest_cache._cached_from_dist(_from_dist), parsed
+
+
+def test_manifest_cached(from_dist, tmp_path):
+    cached_from_dist, parsed = from_dist
+    dist = _dist()
+    mf = cached_from_dist(dist)
+    assert len(parsed) == 1
+    assert len(list(tmp_path.glob('my-plugin-*.json'))) == 1
+
+    cached_mf = cached_from_dist(dist)
+    assert len(parsed) == 1
+    assert cached_mf.model_dump() == mf.model_dump()
+    assert cached_mf._source_file == MANIFEST_PATH
+
+    # a change to the installed files changes the key
+    cached_from_dist(_dist(record='my_plugin/napari.yaml,sha256=def,100'))
+    assert len(parsed) == 2
+
+
+def test_manifest_not_cached_without_record(from_dist, tmp_path):
+    cached_from_dist, parsed = from_dist
+    dist = _dist(record=None)
+    cached_from_dist(dist)
+    cached_from_dist(dist)
+    assert len(parsed) == 2
+    assert not list(tmp_path.iterdir())
+
+
+def test_invalid_manifest_cache_parsed(from_dist, tmp_path):
+    cached_from_dist, parsed = from_dist
+    dist = _dist()
+    path = tmp_path / f'{_manifest_cache._distribution_key(dist)}.json'
+    path.write_text('{not json')
+    mf = cached_from_dist(dist)
+    assert len(parsed) == 1
+    assert _manifest_cache._load_manifest(path).model_dump() == mf.model_dump()
+
+
+def test_cached_manifests_context():
+    from_dist = schema._from_dist
+    with _manifest_cache.cached_manifests():
+        assert schema._from_dist is not from_dist
+    assert schema._from_dist is from_dist
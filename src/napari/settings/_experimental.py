@@ -130,6 +130,16 @@ class ExperimentalSettings(EventedSettings):
         le=100,
     )
 
+    multiscale_volume_streaming: bool = Field(
+        default=False,
+        title='Stream multiscale volumes in 3D',
+        description=(
+            'In 3D, display the multiscale level matching the zoom (within a\n'
+            'fixed voxel budget) instead of the coarsest one, and read it\n'
+            'in bricks that are cached for reuse.'
+        ),
+    )
+
     dynamic_layer_controls: bool = Field(
         default=False,
         title='Generate GUI layer controls dynamically instead of using premade panels.',
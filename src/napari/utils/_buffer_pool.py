@@ -0,0 +1,130 @@
+"""Pool of arrays reused for the output of successive slices.
+
+Slicing allocates a new output array for each slice, even though successive
+slices of a layer usually have the same shape and dtype. Instead, arrays
+taken from a :class:`BufferPool` belong to the caller until it releases
+them, once nothing else (e.g. the canvas) uses them, and are then reused for
+the next slices.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from collections import deque
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import DTypeLike
+
+
+#: Default maximum total size of the arrays kept for reuse, in bytes.
+BUFFER_POOL_BYTES = 256 * 2**20
+
+
+class BufferPool:
+    """Arrays released by previous slices, keyed by shape and dtype.
+
+    An array taken from the pool is owned by the caller, and may be reused
+    by any later `take` as soon as it is released: the caller must only
+    release arrays that nothing reads or writes anymore.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Maximum total size of the released arrays kept for reuse. The
+        oldest released arrays are dropped first.
+
+    Attributes
+    ----------
+    nbytes : int
+        Total size of the released arrays.
+    reused : int
+        Number of arrays taken from the released arrays.
+    allocated : int
+        Number of arrays taken that had to be allocated.
+    """
+
+    def __init__(self, max_bytes: int = BUFFER_POOL_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.reused = 0
+        self.allocated = 0
+        self._released: deque[np.ndarray] = deque()
+        # arrays taken from the pool and not released yet, so that other
+        # arrays (e.g. views of layer data) are never released to it and
+        # written to. Arrays the caller drops without releasing them are
+        # simply freed.
+        self._taken: weakref.WeakValueDictionary[int, np.ndarray] = (
+            weakref.WeakValueDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._released)
+
+    def stats(self) -> dict[str, int]:
+        """Counts of the arrays taken, and size of the released arrays."""
+        return {
+            'reused': self.reused,
+            'allocated': self.allocated,
+            'released': len(self._released),
+            'released_bytes': self.nbytes,
+        }
+
+    def take(self, shape: Sequence[int], dtype: DTypeLike) -> np.ndarray:
+        """An uninitialized array, reusing a released one if possible.
+
+        The array belongs to the caller until it is given back with
+        `release`.
+        """
+        shape = tuple(shape)
+        dtype = np.dtype(dtype)
+        with self._lock:
+            for index, array in enumerate(self._released):
+                if array.shape == shape and array.dtype == dtype:
+                    del self._released[index]
+                    self.nbytes -= array.nbytes
+                    self.reused += 1
+                    self._taken[id(array)] = array
+                    return array
+            self.allocated += 1
+        array = np.empty(shape, dtype=dtype)
+        with self._lock:
+            self._taken[id(array)] = array
+        return array
+
+    def release(self, *arrays: np.ndarray) -> None:
+        """Give back ``arrays``, to be reused by the next calls to `take`.
+
+        Arrays which were not taken from this pool, or were released
+        already, are ignored.
+        """
+        with self._lock:
+            for array in arrays:
+                if self._taken.get(id(array)) is not array:
+                    continue
+                del self._taken[id(array)]
+                self._released.append(array)
+                self.nbytes += array.nbytes
+            while self.nbytes > self.max_bytes:
+                self.nbytes -= self._released.popleft().nbytes
+
+    def clear(self) -> None:
+        """Drop all released arrays."""
+        with self._lock:
+            self._released.clear()
+            self.nbytes = 0
+
+
+def take_array(
+    pool: BufferPool | None, shape: Sequence[int], dtype: DTypeLike
+) -> np.ndarray:
+    """An uninitialized array from ``pool``, or a new one without a pool."""
+    if pool is None:
+        return np.empty(shape, dtype=dtype)
+    return pool.take(shape, dtype)
@@ -1,25 +1,45 @@
 """Dask cache utilities."""
 
+from __future__ import annotations
+
 import collections.abc
 import contextlib
+import sys
 from collections.abc import Callable, Iterator
-from typing import Any
+from functools import cache
+from typing import TYPE_CHECKING, Any
 
-import dask
-from dask.cache import Cache
+if TYPE_CHECKING:
+    from dask.cache import Cache
 
-#: dask.cache.Cache, optional : A dask cache for opportunistic caching
-#: use :func:`~.resize_dask_cache` to actually register and resize.
-#: this is a global cache (all layers will use it), but individual layers
-#: can opt out using Layer(..., cache=False)
-_DASK_CACHE = Cache(1)
 _DEFAULT_MEM_FRACTION = 0.25
 
 DaskIndexer = Callable[
-    [], contextlib.AbstractContextManager[tuple[dict, Cache] | None]
+    [], contextlib.AbstractContextManager[tuple[dict, 'Cache'] | None]
 ]
 
 
+@cache
+def _dask_cache() -> Cache:
+    """The dask cache for opportunistic caching, created on first use.
+
+    Use :func:`~.resize_dask_cache` to actually register and resize it.
+    This is a global cache (all layers will use it), but individual layers
+    can opt out using Layer(..., cache=False). dask is slow to import, so it
+    is only imported once needed.
+    """
+    from dask.cache import Cache
+
+    return Cache(1)
+
+
+def __getattr__(name: str) -> Any:
+    # the cache was a module attribute before it was created lazily
+    if name == '_DASK_CACHE':
+        return _dask_cache()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
 def resize_dask_cache(
     nbytes: int | None = None, mem_fraction: float | None = None
 ) -> Cache:
@@ -63,19 +83,20 @@ def resize_dask_cache(
     if nbytes is None and mem_fraction is not None:
         nbytes = int(virtual_memory().total * mem_fraction)
 
-    avail = _DASK_CACHE.cache.available_bytes
+    dask_cache = _dask_cache()
+    avail = dask_cache.cache.available_bytes
     # if we don't have a cache already, create one.
     if avail == 1:
         # If neither nbytes nor mem_fraction was provided, use default
         if nbytes is None:
             nbytes = int(virtual_memory().total * _DEFAULT_MEM_FRACTION)
-        _DASK_CACHE.cache.resize(nbytes)
-    elif nbytes is not None and nbytes != _DASK_CACHE.cache.available_bytes:
+        dask_cache.cache.resize(nbytes)
+    elif nbytes is not None and nbytes != dask_cache.cache.available_bytes:
         # if the cache has already been registered, then calling
         # resize_dask_cache() without supplying either mem_fraction or nbytes
         # is a no-op:
-        _DASK_CACHE.cache.resize(nbytes)
-    return _DASK_CACHE
+        dask_cache.cache.resize(nbytes)
+    return dask_cache
 
 
 def _is_dask_data(data: Any) -> bool:
@@ -88,6 +109,10 @@ def _is_dask_data(data: Any) -> bool:
     - `xarray.DataArray` backed by a dask array (but *not* numpy-backed)
     - Any other dask-collection type
     """
+    dask = sys.modules.get('dask')
+    if dask is None:
+        # dask collections can't exist before dask is imported
+        return False
     if dask.is_dask_collection(data):
         return True
     return isinstance(data, collections.abc.Sequence) and any(
@@ -155,6 +180,8 @@ def configure_dask(data: Any, cache: bool = True) -> DaskIndexer:
     ) -> Iterator[tuple[Any, Any]]:
         # For debug from where the delayed slicer is called
         # add "scheduler": "synchronous" to opts
+        import dask
+
         opts = {'optimization.fuse.active': False}
         with dask.config.set(opts) as cfg, _cache as c:
             yield cfg, c
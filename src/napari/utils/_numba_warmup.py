@@ -0,0 +1,181 @@
+"""Background compilation of the numba kernels of napari.
+
+numba compiles functions the first time they are called with each signature,
+which takes seconds, e.g. the first time shapes are drawn or labels are
+displayed. When a viewer starts, the kernels are therefore compiled in a
+background thread, before they are needed, by calling the warm-up functions
+registered here. The kernels are compiled with ``cache=True``, so that they
+are only compiled once per installation, and later loaded from numba's
+on-disk cache, which is still faster done in the background.
+
+The warm-up can be disabled with the env var ``NAPARI_NUMBA_WARMUP=0``. Its
+progress is given by ``numba_warmup.status()``, and ``numba_warmup.wait()``
+waits for it to finish::
+
+    from napari.utils._numba_warmup import numba_warmup
+
+    numba_warmup.wait(timeout=30)
+    numba_warmup.status()  # {'triangulation': 'ready', 'colormap': 'ready'}
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import os
+import threading
+from importlib.util import find_spec
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_logger = logging.getLogger(__name__)
+
+#: The states of each warm-up, in order.
+WARMUP_STATES = ('pending', 'running', 'ready', 'failed')
+
+
+class NumbaWarmup:
+    """Warm-up functions compiling numba kernels, run in a background thread.
+
+    Warm-up functions are registered by name, either as callables or as
+    ``'module:function'`` strings, which are only imported when the warm-up
+    runs.
+
+    Attributes
+    ----------
+    seconds : dict of str to float
+        The duration of each finished warm-up.
+    """
+
+    def __init__(self) -> None:
+        self._warmups: dict[str, Callable[[], None] | str] = {}
+        self._states: dict[str, str] = {}
+        self.seconds: dict[str, float] = {}
+        self._lock = threading.Lock()
+        # whether warming up was started, and whether the thread runs
+        self._started = False
+        self._running = False
+        self._done = threading.Event()
+
+    def register(self, name: str, warmup: Callable[[], None] | str) -> None:
+        """Register a warm-up function.
+
+        Warm-ups registered while warming up run after the others.
+
+        Parameters
+        ----------
+        name : str
+            The name of the warm-up, e.g. the kernels it compiles.
+        warmup : callable or str
+            The function compiling the kernels, or its ``'module:function'``
+            import path. It must do nothing if numba is not installed.
+        """
+        with self._lock:
+            self._warmups[name] = warmup
+            self._states[name] = 'pending'
+            self._done.clear()
+            if self._started and not self._running:
+                # the thread finished before this warm-up was registered
+                self._start()
+
+    def status(self) -> dict[str, str]:
+        """The state of each warm-up, one of `WARMUP_STATES`."""
+        with self._lock:
+            return dict(self._states)
+
+    @property
+    def ready(self) -> bool:
+        """Whether all the warm-ups are finished."""
+        return all(
+            state in ('ready', 'failed') for state in self.status().values()
+        )
+
+    def start(self) -> bool:
+        """Start warming up in a background thread, unless it was started.
+
+        Returns
+        -------
+        bool
+            Whether the warm-ups run, which requires numba, and the env var
+            ``NAPARI_NUMBA_WARMUP`` not to be ``0``.
+        """
+        if os.getenv('NAPARI_NUMBA_WARMUP', '1') == '0':
+            return False
+        if find_spec('numba') is None:
+            return False
+        with self._lock:
+            if not self._started:
+                self._started = True
+                self._start()
+        return True
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait for the started warm-ups to finish.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum time to wait, in seconds. By default, no limit.
+
+        Returns
+        -------
+        bool
+            Whether all the warm-ups are finished.
+        """
+        with self._lock:
+            if not self._started:
+                return False
+        return self._done.wait(timeout)
+
+    def _start(self) -> None:
+        self._running = True
+        threading.Thread(
+            target=self._run, name='napari-numba-warmup', daemon=True
+        ).start()
+
+    def _next(self) -> tuple[str, Callable[[], None] | str] | None:
+        """Mark the next pending warm-up running, and return it."""
+        with self._lock:
+            for name, state in self._states.items():
+                if state == 'pending':
+                    self._states[name] = 'running'
+                    return name, self._warmups[name]
+            self._running = False
+            self._done.set()
+            return None
+
+    def _run(self) -> None:
+        while (item := self._next()) is not None:
+            name, warmup = item
+            start = perf_counter()
+            try:
+                if isinstance(warmup, str):
+                    module, _, function = warmup.partition(':')
+                    warmup = getattr(importlib.import_module(module), function)
+                warmup()
+            except Exception:
+                # the kernels are compiled on first use instead
+                _logger.warning(
+                    'Failed to warm up numba %s kernels', name, exc_info=True
+                )
+                state = 'failed'
+            else:
+                state = 'ready'
+            seconds = perf_counter() - start
+            with self._lock:
+                self._states[name] = state
+                self.seconds[name] = seconds
+            _logger.info('Numba %s warm-up %s in %.2f s', name, state, seconds)
+
+
+numba_warmup = NumbaWarmup()
+numba_warmup.register(
+    'triangulation',
+    'napari.layers.shapes._accelerated_triangulate_dispatch:warmup_all_numba',
+)
+numba_warmup.register(
+    'colormap', 'napari.utils.colormaps._accelerated_cmap:warmup_numba'
+)
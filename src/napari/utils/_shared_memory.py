@@ -0,0 +1,487 @@
+"""NumPy arrays in shared memory, to pass data between processes.
+
+A process creates an array in shared memory with `create_shared_array`, and
+describes it to other processes with its `SharedArrayInfo`, a small
+picklable dict. Other processes map the same memory with
+`attach_shared_array`, without copying the data.
+
+The process which created the shared memory owns it: it must unlink it, with
+``SharedMemory.unlink()``, once no other process needs to attach it. Arrays
+which are attached keep mapping the memory until they are garbage collected,
+even once it was unlinked.
+
+`SharedMemoryArray` wraps an array in shared memory with a log of the regions
+a producer process changed, so that layers displaying it only refresh those.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Any, TypedDict
+
+import numpy as np
+import numpy.typing as npt
+
+if TYPE_CHECKING:
+    import mmap
+
+# Names of the shared memory blocks created by this process.
+_CREATED: set[str] = set()
+
+
+class SharedArrayInfo(TypedDict):
+    """Description of an array in shared memory.
+
+    Attributes
+    ----------
+    name : str
+        The name of the shared memory block.
+    shape : list of int
+        The shape of the array.
+    dtype : str
+        The dtype of the array, as a numpy dtype string, e.g. '<u2'.
+    """
+
+    name: str
+    shape: list[int]
+    dtype: str
+
+
+def create_shared_array(
+    shape: tuple[int, ...], dtype: npt.DTypeLike
+) -> tuple[np.ndarray, SharedMemory, SharedArrayInfo]:
+    """Create an array in a new block of shared memory.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        The shape of the array.
+    dtype : dtype-like
+        The dtype of the array.
+
+    Returns
+    -------
+    array : np.ndarray
+        The array, filled with zeros, which must not be used once ``shm``
+        is closed.
+    shm : SharedMemory
+        The shared memory block, owned by this process.
+    info : SharedArrayInfo
+        The description of the array, to attach it in other processes.
+    """
+    dtype = np.dtype(dtype)
+    nbytes = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+    # shared memory blocks can't be empty
+    shm = SharedMemory(create=True, size=max(nbytes, 1))
+    _CREATED.add(shm.name)
+    array: np.ndarray = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    array.fill(0)
+    info = SharedArrayInfo(name=shm.name, shape=list(shape), dtype=dtype.str)
+    return array, shm, info
+
+
+def share_array(
+    data: npt.ArrayLike,
+) -> tuple[np.ndarray, SharedMemory, SharedArrayInfo]:
+    """Copy ``data`` into a new block of shared memory.
+
+    See `create_shared_array` for the returned values.
+    """
+    data = np.asarray(data)
+    array, shm, info = create_shared_array(data.shape, data.dtype)
+    array[...] = data
+    return array, shm, info
+
+
+def attach_shared_array(info: SharedArrayInfo) -> np.ndarray:
+    """Map an array in shared memory created by another process.
+
+    The memory is not copied, so changes made by any process are seen by
+    all of them. This process does not own the memory: it is not unlinked
+    when this process exits.
+
+    Parameters
+    ----------
+    info : SharedArrayInfo
+        The description of the array.
+
+    Returns
+    -------
+    np.ndarray
+        The array, which maps the memory as long as it, or any view of it,
+        exists.
+
+    Raises
+    ------
+    FileNotFoundError
+        If there is no shared memory block with this name.
+    ValueError
+        If the block is smaller than the array.
+    """
+    shm = _open_untracked(info['name'])
+    try:
+        # the array keeps the memory map alive, the SharedMemory object
+        # only needs to close its file descriptor
+        array = np.ndarray(
+            tuple(info['shape']),
+            dtype=np.dtype(info['dtype']),
+            buffer=shm._mmap,
+        )
+    except TypeError as e:
+        shm.close()
+        raise ValueError(
+            f'Shared memory {info["name"]!r} is too small for {info}'
+        ) from e
+    shm._buf.release()
+    shm._buf = None
+    shm._mmap = None
+    shm.close()
+    return array
+
+
+# The header of the shared memory of a SharedMemoryArray: a magic number,
+# the number of dimensions of the array, the number of regions its log
+# holds, and the number of regions logged so far.
+_MAGIC = 0x6E61706172690001
+_HEADER = ('magic', 'ndim', 'capacity', 'count')
+# The data of a SharedMemoryArray starts at a multiple of this offset.
+_ALIGNMENT = 64
+
+
+class SharedMemoryArray:
+    """An array in shared memory, with a log of the regions which changed.
+
+    A producer process writes into the array, and logs the regions it
+    changed: assigning with ``shared[key] = value`` logs ``key``, and
+    `mark_changed` logs a region written with `array` directly. Other
+    processes, such as napari, attach the array without copying it, and
+    `poll` the log, which emits a ``changed`` event with the regions that
+    changed since their last poll. Layers whose data is a SharedMemoryArray
+    only refresh the regions which changed, and napari polls their data
+    every frame.
+
+    Only one process may log changes: other processes, e.g. napari when
+    painting labels, write with `array` directly and refresh their own
+    display. If more regions changed since the last poll than the log holds,
+    the whole array is reported as changed.
+
+    SharedMemoryArrays are pickled as their `info`, so that passing one to
+    another process, e.g. with multiprocessing, attaches it.
+
+    Create or attach SharedMemoryArrays with `create` and `attach`, rather
+    than with the constructor.
+
+    Parameters
+    ----------
+    name : str
+        The name of the shared memory block.
+    buffer : mmap.mmap
+        The memory map of the shared memory block.
+    shape : tuple of int
+        The shape of the array.
+    dtype : dtype-like
+        The dtype of the array.
+    shm : SharedMemory, optional
+        The closed shared memory block, if this process created it.
+
+    Attributes
+    ----------
+    array : np.ndarray
+        The array, which maps the shared memory.
+    events : EmitterGroup
+        Event emitters of the array, with a ``changed`` event, whose
+        ``regions`` are tuples of slices.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        buffer: mmap.mmap,
+        shape: tuple[int, ...],
+        dtype: npt.DTypeLike,
+        shm: SharedMemory | None = None,
+    ) -> None:
+        from napari.utils.events import EmitterGroup
+
+        self._name = name
+        self._shm = shm
+        self._header = np.ndarray(
+            (len(_HEADER),), dtype=np.int64, buffer=buffer
+        )
+        capacity = int(self._header[_HEADER.index('capacity')])
+        self._log = np.ndarray(
+            (capacity, 2, len(shape)),
+            dtype=np.int64,
+            buffer=buffer,
+            offset=self._header.nbytes,
+        )
+        self.array: np.ndarray = np.ndarray(
+            shape,
+            dtype=dtype,
+            buffer=buffer,
+            offset=_data_offset(len(shape), capacity),
+        )
+        # the number of logged regions this process has seen
+        self._polled = self._count
+        self.events = EmitterGroup(source=self, changed=None)
+
+    @classmethod
+    def create(
+        cls,
+        shape: tuple[int, ...],
+        dtype: npt.DTypeLike,
+        max_regions: int = 256,
+    ) -> SharedMemoryArray:
+        """Create an array, filled with zeros, in a new block of shared memory.
+
+        The process which creates the array owns the shared memory, see
+        `unlink`.
+
+        Parameters
+        ----------
+        shape : tuple of int
+            The shape of the array.
+        dtype : dtype-like
+            The dtype of the array.
+        max_regions : int
+            The number of changed regions the log holds between two polls.
+        """
+        if max_regions < 1:
+            raise ValueError('max_regions must be at least 1')
+        shape = tuple(int(n) for n in shape)
+        dtype = np.dtype(dtype)
+        offset = _data_offset(len(shape), max_regions)
+        nbytes = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+        # new shared memory is filled with zeros
+        shm = SharedMemory(create=True, size=offset + nbytes)
+        _CREATED.add(shm.name)
+        name = shm.name
+        buffer = _detach_mmap(shm)
+        header = np.ndarray((len(_HEADER),), dtype=np.int64, buffer=buffer)
+        header[:] = (_MAGIC, len(shape), max_regions, 0)
+        return cls(name, buffer, shape, dtype, shm=shm)
+
+    @classmethod
+    def attach(cls, info: SharedArrayInfo) -> SharedMemoryArray:
+        """Map an array created by another process, without copying it.
+
+        Parameters
+        ----------
+        info : SharedArrayInfo
+            The description of the array, its `info`.
+
+        Raises
+        ------
+        FileNotFoundError
+            If there is no shared memory block with this name.
+        ValueError
+            If the block is not a SharedMemoryArray with this shape.
+        """
+        shape = tuple(info['shape'])
+        buffer = _detach_mmap(_open_untracked(info['name']))
+        message = f'Shared memory {info["name"]!r} is not a SharedMemoryArray of shape {shape}'
+        if len(buffer) < _data_offset(len(shape), 0):
+            raise ValueError(message)
+        header = np.ndarray((len(_HEADER),), dtype=np.int64, buffer=buffer)
+        if tuple(header[:2]) != (_MAGIC, len(shape)):
+            raise ValueError(message)
+        try:
+            return cls(info['name'], buffer, shape, info['dtype'])
+        except TypeError as e:
+            raise ValueError(message) from e
+
+    @property
+    def info(self) -> SharedArrayInfo:
+        """The description of the array, to attach it in other processes."""
+        return SharedArrayInfo(
+            name=self._name, shape=list(self.shape), dtype=self.dtype.str
+        )
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.array.dtype
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.array.shape
+
+    @property
+    def ndim(self) -> int:
+        return self.array.ndim
+
+    @property
+    def size(self) -> int:
+        return self.array.size
+
+    @property
+    def nbytes(self) -> int:
+        return self.array.nbytes
+
+    def __len__(self) -> int:
+        return len(self.array)
+
+    def __getitem__(self, key: Any) -> np.ndarray:
+        return self.array[key]
+
+    def __setitem__(self, key: Any, value: npt.ArrayLike) -> None:
+        self.array[key] = value
+        self.mark_changed(key)
+
+    def __array__(
+        self, dtype: npt.DTypeLike = None, copy: bool | None = None
+    ) -> np.ndarray:
+        if copy:
+            return np.array(self.array, dtype=dtype)
+        return np.asarray(self.array, dtype=dtype)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return SharedMemoryArray.attach, (self.info,)
+
+    def __repr__(self) -> str:
+        return f'SharedMemoryArray({self._name!r}, shape={self.shape}, dtype={self.dtype})'
+
+    @property
+    def _count(self) -> int:
+        """The number of regions logged so far."""
+        return int(self._header[_HEADER.index('count')])
+
+    def mark_changed(self, key: Any = ...) -> None:
+        """Log that a region of the array changed.
+
+        Parameters
+        ----------
+        key : Any
+            The index of the region, as in ``array[key]``. Regions of
+            advanced indices are logged as the whole array. By default, the
+            whole array changed.
+        """
+        region = _index_region(key, self.shape)
+        if region is None:
+            return  # nothing changed
+        count = self._count
+        entry = self._log[count % len(self._log)]
+        entry[0] = [axis.start for axis in region]
+        entry[1] = [axis.stop for axis in region]
+        # the region is logged before it is counted, for polling processes
+        self._header[_HEADER.index('count')] = count + 1
+
+    def poll(self) -> list[tuple[slice, ...]]:
+        """Emit a ``changed`` event, if regions changed since the last poll.
+
+        Returns
+        -------
+        list of tuple of slice
+            The regions which changed since the last poll.
+        """
+        count = self._count
+        if count == self._polled:
+            return []
+        capacity = len(self._log)
+        entries = self._log[np.arange(self._polled, count) % capacity].copy()
+        if self._count - self._polled > capacity:
+            # regions were logged over before they were read
+            regions = [tuple(slice(0, n) for n in self.shape)]
+        else:
+            regions = [
+                tuple(
+                    slice(int(start), int(stop))
+                    for start, stop in zip(*entry, strict=True)
+                )
+                for entry in entries
+            ]
+        self._polled = count
+        self.events.changed(regions=regions)
+        return regions
+
+    def unlink(self) -> None:
+        """Remove the shared memory, once no other process needs to attach it.
+
+        Only the process which created the array can remove it. The memory
+        is freed once no array maps it.
+        """
+        if self._shm is None:
+            raise RuntimeError(
+                f'{self!r} was attached, only the process which created it can unlink it'
+            )
+        self._shm.unlink()
+
+
+def _data_offset(ndim: int, capacity: int) -> int:
+    """The offset of the data of a SharedMemoryArray, after its header and log."""
+    offset = (len(_HEADER) + capacity * 2 * ndim) * np.dtype(np.int64).itemsize
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _index_region(
+    key: Any, shape: tuple[int, ...]
+) -> tuple[slice, ...] | None:
+    """The bounding box of ``array[key]``, or None if it is empty.
+
+    The region of a key with advanced indices, or which numpy would reject,
+    is the whole array.
+    """
+    whole = tuple(slice(0, n) for n in shape)
+    if not isinstance(key, tuple):
+        key = (key,)
+    ellipses = [i for i, k in enumerate(key) if k is Ellipsis]
+    if len(ellipses) > 1:
+        return whole
+    if ellipses:
+        i = ellipses[0]
+        key = (
+            key[:i]
+            + (slice(None),) * (len(shape) - len(key) + 1)
+            + key[i + 1 :]
+        )
+    key = key + (slice(None),) * (len(shape) - len(key))
+    if len(key) != len(shape):
+        return whole
+    region = []
+    for k, n in zip(key, shape, strict=True):
+        if isinstance(k, slice):
+            indices = range(*k.indices(n))
+            if not indices:
+                return None
+            start, stop = sorted((indices[0], indices[-1]))
+            region.append(slice(start, stop + 1))
+        elif isinstance(k, int | np.integer) and not isinstance(k, bool):
+            k = int(k) + n if k < 0 else int(k)
+            region.append(slice(k, k + 1))
+        else:
+            return whole
+    return tuple(region)
+
+
+def _detach_mmap(shm: SharedMemory) -> mmap.mmap:
+    """Return the memory map of ``shm``, and close ``shm``.
+
+    Arrays on the memory map keep it alive, so that the memory stays mapped
+    as long as they exist, whereas ``shm`` can't be closed while arrays use
+    its buffer.
+    """
+    buffer = shm._mmap  # type: ignore[attr-defined]
+    shm._buf.release()  # type: ignore[attr-defined]
+    shm._buf = None  # type: ignore[attr-defined]
+    shm._mmap = None  # type: ignore[attr-defined]
+    shm.close()
+    return buffer
+
+
+def _open_untracked(name: str) -> SharedMemory:
+    """Open an existing shared memory block, which this process doesn't own.
+
+    Until Python 3.13, the resource tracker of a process unlinks all the
+    shared memory blocks it opened when it exits, even those created by
+    other processes, unless they are unregistered. Blocks created by this
+    process stay registered, to be unlinked if their owner doesn't.
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    shm = SharedMemory(name=name)
+    if os.name == 'posix' and name not in _CREATED:
+        from multiprocessing import resource_tracker
+
+        resource_tracker.unregister(shm._name, 'shared_memory')  # type: ignore[attr-defined]
+    return shm
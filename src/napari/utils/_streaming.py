@@ -0,0 +1,195 @@
+"""An append-only image stack, to display acquisitions as they stream in.
+
+`StreamingArray` holds frames appended along its first axis, e.g. time, in
+a ring buffer: its first axis keeps growing, but only its last frames are
+kept in memory. Image layers displaying a StreamingArray update their extent
+and the dims ranges of the viewer as frames are appended, and only slice
+again when an appended frame is in view, rather than recomputing everything
+as when their data is replaced.
+"""
+
+from __future__ import annotations
+
+import operator
+import threading
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+
+class StreamingArray:
+    """An array which grows along its first axis as frames are appended.
+
+    A producer, e.g. a camera acquisition thread, appends frames with
+    `append`. The first axis of the array counts all the frames appended so
+    far, but only the last ``max_frames`` frames are kept, in a buffer
+    allocated once: older frames, and the first frame until one is
+    appended, read as ``fill_value``. Frames are returned as views of the
+    buffer, which are overwritten once ``max_frames`` newer frames are
+    appended.
+
+    Appending a frame doesn't emit events, so that frames can be appended
+    from another thread, and faster than they are displayed. `poll` emits an
+    ``appended`` event with the frames appended since the last poll, which
+    layers handle by updating their extent, and by refreshing their slice if
+    the new frames are in view. napari polls the data of layers every frame.
+
+    Parameters
+    ----------
+    frame_shape : tuple of int
+        The shape of each frame.
+    dtype : dtype-like
+        The dtype of the frames.
+    max_frames : int
+        The number of frames kept in memory.
+    fill_value : scalar
+        The value of the frames which are not in memory.
+
+    Attributes
+    ----------
+    events : EmitterGroup
+        Event emitters of the array, with an ``appended`` event, whose
+        ``start`` and ``stop`` are the indices of the first frame appended
+        since the last poll, and of the frame after the last one.
+
+    Examples
+    --------
+    >>> stream = StreamingArray((512, 512), np.uint16, max_frames=10)
+    >>> layer = viewer.add_image(stream, contrast_limits=(0, 4095))  # doctest: +SKIP
+    >>> stream.append(camera.snap())  # doctest: +SKIP
+    """
+
+    def __init__(
+        self,
+        frame_shape: tuple[int, ...],
+        dtype: npt.DTypeLike,
+        max_frames: int = 100,
+        fill_value: Any = 0,
+    ) -> None:
+        from napari.utils.events import EmitterGroup
+
+        if max_frames < 1:
+            raise ValueError('max_frames must be at least 1')
+        frame_shape = tuple(int(n) for n in frame_shape)
+        # frames are only read once written, so the buffer isn't filled
+        self._frames = np.empty((max_frames, *frame_shape), dtype=dtype)
+        self._fill = np.full(frame_shape, fill_value, dtype=dtype)
+        self._fill.flags.writeable = False
+        self._count = 0
+        self._polled = 0
+        self._lock = threading.Lock()
+        self.events = EmitterGroup(source=self, appended=None)
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._frames.dtype
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return (max(self._count, 1), *self.frame_shape)
+
+    @property
+    def ndim(self) -> int:
+        return self._frames.ndim
+
+    @property
+    def size(self) -> int:
+        return int(np.prod(self.shape, dtype=np.int64))
+
+    @property
+    def frame_shape(self) -> tuple[int, ...]:
+        """The shape of each frame."""
+        return self._frames.shape[1:]
+
+    @property
+    def max_frames(self) -> int:
+        """The number of frames kept in memory."""
+        return len(self._frames)
+
+    @property
+    def n_frames(self) -> int:
+        """The number of frames appended so far."""
+        return self._count
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def append(self, frame: npt.ArrayLike) -> int:
+        """Append a frame, replacing the oldest one in memory.
+
+        Parameters
+        ----------
+        frame : array-like
+            The frame, of shape ``frame_shape``.
+
+        Returns
+        -------
+        int
+            The index of the frame along the first axis.
+        """
+        frame = np.asarray(frame)
+        if frame.shape != self.frame_shape:
+            raise ValueError(
+                f'Frames must have shape {self.frame_shape}, not {frame.shape}'
+            )
+        with self._lock:
+            index = self._count
+            self._frames[index % self.max_frames] = frame
+            # the frame is written before it is counted, for readers
+            self._count = index + 1
+        return index
+
+    def poll(self) -> range:
+        """Emit an ``appended`` event, if frames were appended since the last poll.
+
+        Returns
+        -------
+        range
+            The indices of the frames appended since the last poll.
+        """
+        start, stop = self._polled, self._count
+        if start == stop:
+            return range(start, stop)
+        self._polled = stop
+        self.events.appended(start=start, stop=stop)
+        return range(start, stop)
+
+    def __getitem__(self, key: Any) -> np.ndarray:
+        count = self._count
+        oldest = count - self.max_frames
+        first, *rest = _expand_key(key, self.ndim)
+        if isinstance(first, int | np.integer):
+            index = operator.index(first)
+            if index < 0:
+                index += max(count, 1)
+            if not 0 <= index < max(count, 1):
+                raise IndexError(
+                    f'index {first} is out of bounds for axis 0 with size {max(count, 1)}'
+                )
+            if oldest <= index < count:
+                return self._frames[index % self.max_frames][tuple(rest)]
+            return self._fill[tuple(rest)]
+        indices = np.arange(max(count, 1))[first]
+        frames = np.take(self._frames, indices % self.max_frames, axis=0)
+        frames[(indices < oldest) | (indices >= count)] = self._fill
+        return frames[(slice(None), *rest)]
+
+    def __array__(
+        self, dtype: npt.DTypeLike = None, copy: bool | None = None
+    ) -> np.ndarray:
+        return np.asarray(self[:], dtype=dtype)
+
+    def __repr__(self) -> str:
+        return f'StreamingArray(shape={self.shape}, dtype={self.dtype}, max_frames={self.max_frames})'
+
+
+def _expand_key(key: Any, ndim: int) -> tuple[Any, ...]:
+    """Expand an index to one index per axis."""
+    if not isinstance(key, tuple):
+        key = (key,)
+    ellipses = [i for i, k in enumerate(key) if k is Ellipsis]
+    if ellipses:
+        i = ellipses[0]
+        key = key[:i] + (slice(None),) * (ndim - len(key) + 1) + key[i + 1 :]
+    return key + (slice(None),) * (ndim - len(key))
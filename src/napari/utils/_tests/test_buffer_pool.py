@@ -0,0 +1,48 @@
+import numpy as np
+
+from napari.utils._buffer_pool import BufferPool
+
+
+def test_buffer_pool_reuses_released_arrays():
+    pool = BufferPool()
+    array = pool.take((3, 4), np.float32)
+    pool.release(array)
+    assert len(pool) == 1
+    assert pool.nbytes == array.nbytes
+    # another shape or dtype needs a new array
+    assert pool.take((3, 4), np.uint8) is not array
+    assert pool.take((4, 3), np.float32) is not array
+    assert pool.take((3, 4), np.float32) is array
+    assert len(pool) == 0
+
+
+def test_buffer_pool_keeps_taken_arrays():
+    pool = BufferPool()
+    array = pool.take((3, 4), np.float32)
+    # taken arrays belong to the caller until they are released, whatever
+    # refers to them
+    assert pool.take((3, 4), np.float32) is not array
+    pool.release(array)
+    pool.release(array)
+    assert len(pool) == 1
+    assert pool.take((3, 4), np.float32) is array
+    assert pool.take((3, 4), np.float32) is not array
+
+
+def test_buffer_pool_ignores_other_arrays():
+    pool = BufferPool(max_bytes=4)
+    pool.release(np.empty((3, 4)))
+    assert len(pool) == 0
+    arrays = [pool.take((i + 1,), np.uint8) for i in range(3)]
+    pool.release(*arrays)
+    pool.release(arrays[2])
+    # the oldest arrays are dropped to fit in max_bytes
+    assert len(pool) == 1
+    assert pool.stats() == {
+        'reused': 0,
+        'allocated': 3,
+        'released': 1,
+        'released_bytes': 3,
+    }
+    pool.clear()
+    assert len(pool) == 0
@@ -0,0 +1,83 @@
+import importlib.util
+import os
+import subprocess
+import sys
+
+import pytest
+
+from napari.utils.perf._import_time import import_time, parse_import_time
+
+# Budgets of the wall time to run each statement in a new interpreter, in
+# seconds. They are generous, to catch regressions such as a heavy module
+# imported eagerly, and scaled by NAPARI_IMPORT_TIME_BUDGET_SCALE on slow
+# machines.
+IMPORT_TIME_BUDGETS = {
+    'import napari': 3,
+    'import napari; napari.Viewer(show=False).close()': 20,
+}
+
+# Optional dependencies only imported once they are used, e.g. pandas is
+# imported by layers with features, such as points.
+LAZY_MODULES = ('pandas', 'xarray', 'skimage', 'scipy.ndimage')
+
+
+def _budget(statement):
+    scale = float(os.getenv('NAPARI_IMPORT_TIME_BUDGET_SCALE', '1'))
+    return IMPORT_TIME_BUDGETS[statement] * scale
+
+
+def test_parse_import_time():
+    output = '\n'.join(
+        [
+            'import time: self [us] | cumulative | imported package',
+            'import time:        10 |         10 |     numpy.core',
+            'import time:        20 |         30 |   numpy',
+            'import time:         5 |          5 | json',
+            'some other output',
+        ]
+    )
+    report = parse_import_time(output)
+    assert report.self_us == {'numpy.core': 10, 'numpy': 20, 'json': 5}
+    assert report.cumulative_ms('numpy') == 0.03
+    assert report.cumulative_ms('dask') == 0
+    assert report.top_level == ['json']
+    assert report.total_us == 35
+
+
+@pytest.mark.slow
+def test_import_napari_budget():
+    statement = 'import napari'
+    report = import_time(statement)
+    assert report.wall_s < _budget(statement), sorted(
+        report.cumulative_us.items(), key=lambda item: -item[1]
+    )[:20]
+
+
+@pytest.mark.slow
+def test_viewer_model_defers_optional_imports():
+    statement = (
+        'import sys; import numpy as np; '
+        'from napari.components import ViewerModel; '
+        'ViewerModel().add_image(np.zeros((8, 64, 64))); '
+        f'print(*(m for m in {LAZY_MODULES!r} if m in sys.modules))'
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.split() == []
+
+
+@pytest.mark.slow
+def test_viewer_budget():
+    if not any(
+        importlib.util.find_spec(binding)
+        for binding in ('PyQt5', 'PyQt6', 'PySide2', 'PySide6')
+    ):
+        pytest.skip('Viewer needs a Qt binding')
+    statement = 'import napari; napari.Viewer(show=False).close()'
+    env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+    report = import_time(statement, env=env)
+    assert report.wall_s < _budget(statement)
@@ -0,0 +1,94 @@
+import threading
+
+import pytest
+
+from napari.layers.shapes._accelerated_triangulate_dispatch import (
+    warmup_all_numba,
+)
+from napari.utils import _numba_warmup
+from napari.utils._numba_warmup import NumbaWarmup
+from napari.utils.colormaps import _accelerated_cmap
+from napari.utils.colormaps._accelerated_cmap import warmup_numba
+
+
+@pytest.fixture
+def warmup(monkeypatch):
+    """A warm-up which runs, whether numba is installed or not."""
+    monkeypatch.delenv('NAPARI_NUMBA_WARMUP')
+    monkeypatch.setattr(_numba_warmup, 'find_spec', lambda name: object())
+    return NumbaWarmup()
+
+
+def test_warmup_runs_in_background(warmup):
+    threads = []
+    warmup.register('a', lambda: threads.append(threading.current_thread()))
+    warmup.register(
+        'b', 'napari.utils.colormaps._accelerated_cmap:warmup_numba'
+    )
+    assert warmup.status() == {'a': 'pending', 'b': 'pending'}
+    assert not warmup.ready
+    assert not warmup.wait(0)
+
+    assert warmup.start()
+    assert warmup.wait(60)
+    assert warmup.ready
+    assert warmup.status() == {'a': 'ready', 'b': 'ready'}
+    assert set(warmup.seconds) == {'a', 'b'}
+    assert threads[0] is not threading.main_thread()
+
+
+def test_warmup_failure(warmup):
+    def _fail():
+        raise RuntimeError('compilation failed')
+
+    warmup.register('fail', _fail)
+    warmup.register('ok', lambda: None)
+    warmup.start()
+    assert warmup.wait(60)
+    assert warmup.status() == {'fail': 'failed', 'ok': 'ready'}
+
+
+def test_warmup_registered_after_start(warmup):
+    warmup.start()
+    assert warmup.wait(60)
+    warmup.register('late', lambda: None)
+    assert warmup.wait(60)
+    assert warmup.status() == {'late': 'ready'}
+
+
+def test_warmup_disabled(warmup, monkeypatch):
+    monkeypatch.setenv('NAPARI_NUMBA_WARMUP', '0')
+    warmup.register('a', lambda: None)
+    assert not warmup.start()
+    assert warmup.status() == {'a': 'pending'}
+
+    monkeypatch.delenv('NAPARI_NUMBA_WARMUP')
+    monkeypatch.setattr(_numba_warmup, 'find_spec', lambda name: None)
+    assert not warmup.start()
+
+
+def test_numba_warmup_functions():
+    """The registered warm-ups run, with or without numba."""
+    warmup_all_numba()
+    warmup_numba()
+    assert set(_numba_warmup.numba_warmup.status()) == {
+        'triangulation',
+        'colormap',
+    }
+
+
+def test_numba_warmup_colormap_signatures():
+    """The colormap kernels are compiled for 2D and 3D slices."""
+    pytest.importorskip('numba')
+    warmup_numba()
+    for kernel in (
+        _accelerated_cmap._zero_preserving_modulo_inner_loop,
+        _accelerated_cmap._labels_raw_to_texture_direct_inner_loop,
+    ):
+        compiled = {
+            (signature[0].dtype.name, signature[0].ndim, signature[0].layout)
+            for signature in kernel.signatures
+        }
+        for dtype in ('int32', 'uint32', 'int64', 'uint64'):
+            assert (dtype, 2, 'C') in compiled
+            assert (dtype, 3, 'C') in compiled
@@ -0,0 +1,107 @@
+import json
+import weakref
+
+import numpy as np
+import pytest
+
+from napari.components import ViewerModel
+from napari.utils.perf import LatencyHistogram, SlicingStats, slicing_stats
+
+
+@pytest.fixture
+def stats():
+    slicing_stats.clear()
+    slicing_stats.enable()
+    yield slicing_stats
+    slicing_stats.disable()
+    slicing_stats.clear()
+
+
+def test_latency_histogram_percentiles():
+    values = np.random.default_rng(0).exponential(1e6, 10_000).astype(int)
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.add(value)
+    assert histogram.count == len(values)
+    assert histogram.min == values.min()
+    assert histogram.max == values.max()
+    assert histogram.mean == pytest.approx(values.mean())
+    for percent in (50, 95, 99):
+        assert histogram.percentile(percent) == pytest.approx(
+            np.percentile(values, percent), rel=0.02
+        )
+    assert histogram.percentile(100) == values.max()
+
+    histogram.clear()
+    assert histogram.count == 0
+    assert histogram.percentile(50) == 0
+
+
+def test_slicing_stats_disabled():
+    stats = SlicingStats()
+    stats.request('layer')
+    stats.count('bytes_read', 10, layer='layer')
+    with stats.slicing('layer'):
+        pass
+    assert stats.summary() == {}
+
+
+def test_slicing_stats_layers(stats):
+    viewer = ViewerModel()
+    data = np.random.default_rng(0).random((10, 20, 30))
+    viewer.add_image(data, name='image')
+    for i in range(10):
+        viewer.dims.set_point(0, i)
+
+    summary = stats.summary()['image']
+    latency = summary['latency_ms']['slice']
+    assert latency['count'] >= 10
+    assert 0 < latency['p50'] <= latency['p95'] <= latency['p99']
+    assert latency['p99'] <= latency['max']
+    # float64 slices are converted to float32 textures
+    assert summary['counters']['bytes_copied'] >= 10 * 20 * 30 * 4
+    assert summary['counters']['bytes_read'] >= 10 * 20 * 30 * 8
+
+    # the canvas records the upload and draw of the slices
+    with stats.timing('image', 'upload'):
+        pass
+    stats.drawn()
+    latencies = stats.summary()['image']['latency_ms']
+    assert latencies['draw']['count'] == 1
+    assert latencies['total']['count'] == 1
+    assert latencies['total']['max'] >= latencies['draw']['max']
+
+
+def test_slicing_stats_queue(stats):
+    viewer = ViewerModel()
+    layer = viewer.add_image(np.zeros((4, 5, 6)), name='image')
+    slicer = viewer._layer_slicer
+    request = layer._slicing_state._make_slice_request(viewer.dims)
+    slicer._slice_layers({weakref.ref(layer): request}, submitted_ns=0)
+    latencies = stats.summary()['image']['latency_ms']
+    assert latencies['queue']['count'] == 1
+    assert latencies['slice']['count'] >= 1
+
+
+def test_slicing_stats_export(stats, tmp_path):
+    viewer = ViewerModel()
+    viewer.add_image(np.zeros((4, 5, 6)), name='image')
+    viewer.dims.set_point(0, 2)
+
+    summary_path = tmp_path / 'summary.json'
+    stats.write_summary(str(summary_path))
+    summary = json.loads(summary_path.read_text())
+    assert set(summary['image']['latency_ms']['slice']) == {
+        'count',
+        'mean',
+        'max',
+        'p50',
+        'p95',
+        'p99',
+    }
+
+    trace_path = tmp_path / 'trace.json'
+    stats.write_trace(str(trace_path))
+    events = json.loads(trace_path.read_text())
+    assert {event['name'] for event in events} == {'slice:image'}
+    assert all(event['ph'] == 'X' for event in events)
@@ -0,0 +1,126 @@
+import multiprocessing
+import pickle
+
+import numpy as np
+import pytest
+
+from napari.layers._data_protocols import LayerDataProtocol
+from napari.utils._shared_memory import (
+    SharedMemoryArray,
+    _index_region,
+    attach_shared_array,
+    share_array,
+)
+
+
+@pytest.fixture
+def shared():
+    array = SharedMemoryArray.create((4, 6, 8), np.uint16, max_regions=4)
+    yield array
+    array.unlink()
+
+
+def _produce(shared):
+    """Write into a shared array in another process."""
+    shared[1, 2:4, 3:6] = 7
+    shared.array[3] = 2
+    shared.mark_changed(3)
+
+
+def test_share_array():
+    data = np.arange(12, dtype=np.int32).reshape(3, 4)
+    array, shm, info = share_array(data)
+    try:
+        attached = attach_shared_array(info)
+        np.testing.assert_array_equal(attached, data)
+        attached[0, 0] = 42
+        assert array[0, 0] == 42
+        with pytest.raises(ValueError, match='too small'):
+            attach_shared_array({**info, 'shape': [30, 40]})
+    finally:
+        del array
+        shm.close()
+        shm.unlink()
+
+
+def test_shared_memory_array(shared):
+    assert isinstance(shared, LayerDataProtocol)
+    assert shared.shape == (4, 6, 8)
+    assert shared.ndim == 3
+    assert shared.size == 4 * 6 * 8
+    assert shared.dtype == np.uint16
+    assert not np.asarray(shared).any()
+    assert shared.array.ctypes.data % 64 == 0
+
+    attached = SharedMemoryArray.attach(shared.info)
+    shared[0, 1] = 5
+    assert attached[0, 1, 0] == 5
+    with pytest.raises(RuntimeError, match='attached'):
+        attached.unlink()
+    with pytest.raises(ValueError, match='not a SharedMemoryArray'):
+        SharedMemoryArray.attach({**shared.info, 'shape': [4, 6]})
+
+
+def test_poll_changed_regions(shared):
+    attached = SharedMemoryArray.attach(shared.info)
+    events = []
+    attached.events.changed.connect(events.append)
+    assert attached.poll() == []
+    assert not events
+
+    shared[1, 2:4, ::2] = 3
+    shared.array[2] = 1
+    shared.mark_changed((2, Ellipsis))
+    regions = attached.poll()
+    assert regions == [
+        (slice(1, 2), slice(2, 4), slice(0, 7)),
+        (slice(2, 3), slice(0, 6), slice(0, 8)),
+    ]
+    assert events[0].regions == regions
+    assert attached.poll() == []
+
+    # more regions than the log holds
+    for i in range(5):
+        shared[0, i] = 1
+    assert attached.poll() == [(slice(0, 4), slice(0, 6), slice(0, 8))]
+
+
+def test_changes_from_another_process(shared):
+    process = multiprocessing.get_context('spawn').Process(
+        target=_produce, args=(shared,)
+    )
+    process.start()
+    process.join(60)
+    assert process.exitcode == 0
+    assert shared[1, 2, 3] == 7
+    assert (shared[3] == 2).all()
+    assert shared.poll() == [
+        (slice(1, 2), slice(2, 4), slice(3, 6)),
+        (slice(3, 4), slice(0, 6), slice(0, 8)),
+    ]
+
+
+def test_pickle_attaches(shared):
+    attached = pickle.loads(pickle.dumps(shared))
+    assert attached.info == shared.info
+    shared[0, 0, 0] = 9
+    assert attached[0, 0, 0] == 9
+
+
+@pytest.mark.parametrize(
+    ('key', 'region'),
+    [
+        (1, ((1, 2), (0, 6))),
+        (-1, ((3, 4), (0, 6))),
+        ((slice(None), 2), ((0, 4), (2, 3))),
+        ((Ellipsis, slice(1, 3)), ((0, 4), (1, 3))),
+        (slice(3, 0, -1), ((1, 4), (0, 6))),
+        (np.array([0, 2]), ((0, 4), (0, 6))),
+        ((None, 1), ((0, 4), (0, 6))),
+        (slice(2, 2), None),
+    ],
+)
+def test_index_region(key, region):
+    if region is not None:
+        region = tuple(slice(*axis) for axis in region)
+    assert _index_region(key, (4, 6)) == region
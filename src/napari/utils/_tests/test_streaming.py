@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from napari.layers._data_protocols import LayerDataProtocol
+from napari.utils._streaming import StreamingArray
+
+
+@pytest.fixture
+def stream():
+    stream = StreamingArray((2, 3), np.int16, max_frames=3, fill_value=-1)
+    for i in range(5):
+        stream.append(np.full((2, 3), i))
+    return stream
+
+
+def test_empty_stream():
+    stream = StreamingArray((2, 3), np.uint8, max_frames=2)
+    assert isinstance(stream, LayerDataProtocol)
+    assert stream.shape == (1, 2, 3)
+    assert stream.n_frames == 0
+    assert not np.asarray(stream).any()
+    assert stream.poll() == range(0)
+    with pytest.raises(ValueError, match='at least 1'):
+        StreamingArray((2, 3), np.uint8, max_frames=0)
+
+
+def test_append(stream):
+    assert stream.shape == (5, 2, 3)
+    assert stream.ndim == 3
+    assert stream.size == 30
+    assert len(stream) == 5
+    assert stream.n_frames == 5
+    assert stream.dtype == np.int16
+    assert stream.append(np.full((2, 3), 5)) == 5
+    with pytest.raises(ValueError, match='shape'):
+        stream.append(np.zeros((3, 2)))
+
+
+def test_getitem(stream):
+    # only the last 3 frames are kept
+    np.testing.assert_array_equal(stream[:, 0, 0], [-1, -1, 2, 3, 4])
+    np.testing.assert_array_equal(stream[4], np.full((2, 3), 4))
+    assert stream[-2, 1, 2] == 3
+    assert stream[1, 1, 2] == -1
+    np.testing.assert_array_equal(stream[::-2, ..., 1][:, 0], [4, 2, -1])
+    np.testing.assert_array_equal(stream[[0, 3]][:, 0, 0], [-1, 3])
+    assert stream[1:4, 1].shape == (3, 3)
+    with pytest.raises(IndexError, match='out of bounds'):
+        stream[5]
+
+
+def test_poll(stream):
+    events = []
+    stream.events.appended.connect(events.append)
+    assert stream.poll() == range(5)
+    assert stream.poll() == range(5, 5)
+    stream.append(np.zeros((2, 3)))
+    assert stream.poll() == range(5, 6)
+    assert [(e.start, e.stop) for e in events] == [(0, 5), (5, 6)]
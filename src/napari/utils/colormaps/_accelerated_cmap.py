@@ -71,7 +71,11 @@ def minimum_dtype_for_labels(num_colors: int) -> np.dtype:
 
 
 def zero_preserving_modulo_numpy(
-    values: np.ndarray, n: int, dtype: np.dtype, to_zero: int = 0
+    values: np.ndarray,
+    n: int,
+    dtype: np.dtype,
+    to_zero: int = 0,
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
     """``(values - 1) % n + 1``, but with one specific value mapped to 0.
 
@@ -89,6 +93,8 @@ def zero_preserving_modulo_numpy(
         The desired dtype for the output array.
     to_zero : int, optional
         A specific value to map to 0. (By default, 0 itself.)
+    out : np.ndarray, optional
+        Preallocated output array, of ``dtype``.
 
     Returns
     -------
@@ -96,18 +102,23 @@ def zero_preserving_modulo_numpy(
         The result: 0 for the ``to_zero`` value, ``values % n + 1``
         everywhere else.
     """
+    if out is None:
+        out = np.empty_like(values, dtype=dtype)
     if n > np.iinfo(dtype).max:
         # n is to big, modulo will be pointless
-        res = values.astype(dtype)
-        res[values == to_zero] = 0
-        return res
-    res = ((values - 1) % n + 1).astype(dtype)
-    res[values == to_zero] = 0
-    return res
+        np.copyto(out, values, casting='unsafe')
+    else:
+        np.copyto(out, (values - 1) % n + 1, casting='unsafe')
+    out[values == to_zero] = 0
+    return out
 
 
 def _zero_preserving_modulo_loop(
-    values: np.ndarray, n: int, dtype: np.dtype, to_zero: int = 0
+    values: np.ndarray,
+    n: int,
+    dtype: np.dtype,
+    to_zero: int = 0,
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
     """``(values - 1) % n + 1``, but with one specific value mapped to 0.
 
@@ -125,6 +136,8 @@ def _zero_preserving_modulo_loop(
         The desired dtype for the output array.
     to_zero : int, optional
         A specific value to map to 0. (By default, 0 itself.)
+    out : np.ndarray, optional
+        Preallocated output array, of ``dtype``.
 
     Returns
     -------
@@ -132,9 +145,10 @@ def _zero_preserving_modulo_loop(
         The result: 0 for the ``to_zero`` value, ``values % n + 1``
         everywhere else.
     """
-    result = np.empty_like(values, dtype=dtype)
-    # need to preallocate numpy array for asv memory benchmarks
-    return _zero_preserving_modulo_inner_loop(values, n, to_zero, out=result)
+    if out is None:
+        # need to preallocate numpy array for asv memory benchmarks
+        out = np.empty_like(values, dtype=dtype)
+    return _zero_preserving_modulo_inner_loop(values, n, to_zero, out=out)
 
 
 def _zero_preserving_modulo_inner_loop(
@@ -189,7 +203,9 @@ else:
 
 
 def _labels_raw_to_texture_direct_numpy(
-    data: np.ndarray, direct_colormap: 'DirectLabelColormap'
+    data: np.ndarray,
+    direct_colormap: 'DirectLabelColormap',
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
     """Convert labels data to the data type used in the texture.
 
@@ -206,11 +222,13 @@ def _labels_raw_to_texture_direct_numpy(
     else:
         data = clip(data, 0, mapper.shape[0] - 1)
 
-    return mapper[data]
+    return np.take(mapper, data, out=out, mode='wrap')
 
 
 def _labels_raw_to_texture_direct_loop(
-    data: np.ndarray, direct_colormap: 'DirectLabelColormap'
+    data: np.ndarray,
+    direct_colormap: 'DirectLabelColormap',
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
     """
     Cast direct labels to the minimum type.
@@ -221,6 +239,8 @@ def _labels_raw_to_texture_direct_loop(
         The input data array.
     direct_colormap : DirectLabelColormap
         The direct colormap.
+    out : np.ndarray, optional
+        Preallocated output array, of the texture dtype.
 
     Returns
     -------
@@ -234,10 +254,10 @@ def _labels_raw_to_texture_direct_loop(
     target_dtype = minimum_dtype_for_labels(
         direct_colormap._num_unique_colors + 2
     )
-    result_array = np.full_like(
-        data, MAPPING_OF_UNKNOWN_VALUE, dtype=target_dtype
-    )
-    return _labels_raw_to_texture_direct_inner_loop(data, dkt, result_array)
+    if out is None:
+        out = np.empty_like(data, dtype=target_dtype)
+    out.fill(MAPPING_OF_UNKNOWN_VALUE)
+    return _labels_raw_to_texture_direct_inner_loop(data, dkt, out)
 
 
 def _labels_raw_to_texture_direct_inner_loop(
@@ -257,17 +277,24 @@ def _labels_raw_to_texture_direct_inner_loop(
 
 
 def zero_preserving_modulo_partsegcore(
-    values: np.ndarray, n: int, dtype: np.dtype, to_zero: int = 0
+    values: np.ndarray,
+    n: int,
+    dtype: np.dtype,
+    to_zero: int = 0,
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
-    out = np.empty(values.size, dtype=dtype)
+    if out is None:
+        out = np.empty(values.shape, dtype=dtype)
     partsegcore_mapping.zero_preserving_modulo_parallel(
-        values.reshape(-1), n, to_zero, out
+        values.reshape(-1), n, to_zero, out.reshape(-1)
     )
-    return out.reshape(values.shape)
+    return out
 
 
 def labels_raw_to_texture_direct_partsegcore(
-    data: np.ndarray, direct_colormap: 'DirectLabelColormap'
+    data: np.ndarray,
+    direct_colormap: 'DirectLabelColormap',
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
     if direct_colormap.use_selection:
         dkt = {None: 0, direct_colormap.selection: 1}
@@ -283,11 +310,12 @@ def labels_raw_to_texture_direct_partsegcore(
     target_dtype = minimum_dtype_for_labels(
         direct_colormap._num_unique_colors + 2
     )
-    out = np.empty(data.size, dtype=target_dtype)
+    if out is None:
+        out = np.empty(data.shape, dtype=target_dtype)
     partsegcore_mapping.map_array_parallel(
-        data.reshape(-1), dkt, MAPPING_OF_UNKNOWN_VALUE, out
+        data.reshape(-1), dkt, MAPPING_OF_UNKNOWN_VALUE, out.reshape(-1)
     )
-    return out.reshape(data.shape)
+    return out
 
 
 zero_preserving_modulo = zero_preserving_modulo_numpy
@@ -302,6 +330,42 @@ if numba is not None:
     )(_labels_raw_to_texture_direct_inner_loop)
 
 
+def warmup_numba() -> None:
+    """Compile the numba colormap functions for common labels data.
+
+    The functions are compiled for each dtype and number of dimensions of
+    the arrays they are given, so they are warmed up for what they are
+    given when mapping labels slices: C-contiguous 2D and 3D arrays of the
+    dtypes larger than 16 bits (smaller ones are cast to unsigned
+    integers), mapped to the texture dtype of colormaps of fewer than 254
+    colors. It is run in the background when a viewer starts, see
+    `napari.utils._numba_warmup`.
+    """
+    if numba is None:
+        # no numba, nothing to warm up
+        return
+    from napari.utils.colormaps.colormap import DirectLabelColormap
+
+    colormap = DirectLabelColormap(
+        color_dict={1: 'red', 2: 'blue', None: 'transparent'}
+    )
+    num_colors = 3
+    # the texture dtypes of `_cast_labels_data_to_texture_dtype_auto` and
+    # `_labels_raw_to_texture_direct_loop`
+    auto_dtype = minimum_dtype_for_labels(num_colors + 1)
+    direct_dtype = minimum_dtype_for_labels(colormap._num_unique_colors + 2)
+    for dtype in (np.int32, np.uint32, np.int64, np.uint64):
+        dkt = colormap._get_typed_dict_mapping(np.dtype(dtype))
+        for shape in ((2, 2), (2, 2, 2)):
+            data = np.zeros(shape, dtype=dtype)
+            _zero_preserving_modulo_inner_loop(
+                data, num_colors, 0, np.empty(shape, dtype=auto_dtype)
+            )
+            _labels_raw_to_texture_direct_inner_loop(
+                data, dkt, np.empty(shape, dtype=direct_dtype)
+            )
+
+
 def set_colormap_backend(backend: ColormapBackend) -> None:
     """Set the colormap backend to use.
 
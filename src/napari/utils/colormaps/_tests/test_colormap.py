@@ -9,6 +9,7 @@ import numpy.testing as npt
 import pytest
 from pydantic import ValidationError
 
+from napari.utils._buffer_pool import BufferPool
 from napari.utils.color import ColorArray
 from napari.utils.colormap_backend import ColormapBackend, set_backend
 from napari.utils.colormaps import (
@@ -195,6 +196,28 @@ def test_cast_labels_to_minimum_type_auto(num: int, dtype, monkeypatch):
     assert cast_arr[2] == 10**6 % num + 5
 
 
+@pytest.mark.parametrize('direct', [False, True])
+def test_cast_labels_to_texture_dtype_with_buffer_pool(direct):
+    data = np.arange(12, dtype=np.int32).reshape(3, 4)
+    if direct:
+        cmap = DirectLabelColormap(
+            color_dict={1: 'red', 5: 'blue', None: 'black'}
+        )
+        cast = colormap._cast_labels_data_to_texture_dtype_direct
+    else:
+        cmap = label_colormap(40)
+        cast = colormap._cast_labels_data_to_texture_dtype_auto
+    pool = BufferPool()
+    expected = cast(data, cmap)
+    converted = cast(data, cmap, pool)
+    npt.assert_array_equal(converted, expected)
+    pool.release(converted)
+    del converted
+    # the array of the previous conversion is reused
+    npt.assert_array_equal(cast(data, cmap, pool), expected)
+    assert pool.stats()['reused'] == 1
+
+
 @pytest.fixture
 def direct_label_colormap():
     return DirectLabelColormap(
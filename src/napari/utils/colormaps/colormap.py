@@ -22,6 +22,7 @@ from pydantic import (
     field_validator,
 )
 
+from napari.utils._buffer_pool import BufferPool
 from napari.utils.color import ColorArray, ColorValue
 from napari.utils.colormaps import _accelerated_cmap as _accel_cmap
 from napari.utils.colormaps.colorbars import make_colorbar
@@ -228,15 +229,24 @@ class LabelColormapBase(Colormap):
     )
 
     @overload
-    def _data_to_texture(self, values: np.ndarray) -> np.ndarray: ...
+    def _data_to_texture(
+        self, values: np.ndarray, buffer_pool: BufferPool | None = None
+    ) -> np.ndarray: ...
 
     @overload
-    def _data_to_texture(self, values: np.integer) -> np.integer: ...
+    def _data_to_texture(
+        self, values: np.integer, buffer_pool: BufferPool | None = None
+    ) -> np.integer: ...
 
     def _data_to_texture(
-        self, values: np.ndarray | np.integer
+        self,
+        values: np.ndarray | np.integer,
+        buffer_pool: BufferPool | None = None,
     ) -> np.ndarray | np.integer:
-        """Map input values to values for send to GPU."""
+        """Map input values to values for send to GPU.
+
+        If ``buffer_pool`` is given, converted arrays are taken from it.
+        """
         raise NotImplementedError
 
     def _cmap_without_selection(self) -> Self:
@@ -343,16 +353,27 @@ class CyclicLabelColormap(LabelColormapBase):
         return int(self._data_to_texture(dtype.type(self.background_value)))
 
     @overload
-    def _data_to_texture(self, values: np.ndarray) -> np.ndarray: ...
+    def _data_to_texture(
+        self, values: np.ndarray, buffer_pool: BufferPool | None = None
+    ) -> np.ndarray: ...
 
     @overload
-    def _data_to_texture(self, values: np.integer) -> np.integer: ...
+    def _data_to_texture(
+        self, values: np.integer, buffer_pool: BufferPool | None = None
+    ) -> np.integer: ...
 
     def _data_to_texture(
-        self, values: np.ndarray | np.integer
+        self,
+        values: np.ndarray | np.integer,
+        buffer_pool: BufferPool | None = None,
     ) -> np.ndarray | np.integer:
-        """Map input values to values for send to GPU."""
-        return _cast_labels_data_to_texture_dtype_auto(values, self)
+        """Map input values to values for send to GPU.
+
+        If ``buffer_pool`` is given, converted arrays are taken from it.
+        """
+        return _cast_labels_data_to_texture_dtype_auto(
+            values, self, buffer_pool
+        )
 
     def _map_without_cache(self, values) -> np.ndarray:
         texture_dtype_values = _accel_cmap.zero_preserving_modulo_numpy(
@@ -502,16 +523,27 @@ class DirectLabelColormap(LabelColormapBase):
         )
 
     @overload
-    def _data_to_texture(self, values: np.ndarray) -> np.ndarray: ...
+    def _data_to_texture(
+        self, values: np.ndarray, buffer_pool: BufferPool | None = None
+    ) -> np.ndarray: ...
 
     @overload
-    def _data_to_texture(self, values: np.integer) -> np.integer: ...
+    def _data_to_texture(
+        self, values: np.integer, buffer_pool: BufferPool | None = None
+    ) -> np.integer: ...
 
     def _data_to_texture(
-        self, values: np.ndarray | np.integer
+        self,
+        values: np.ndarray | np.integer,
+        buffer_pool: BufferPool | None = None,
     ) -> np.ndarray | np.integer:
-        """Map input values to values for send to GPU."""
-        return _cast_labels_data_to_texture_dtype_direct(values, self)
+        """Map input values to values for send to GPU.
+
+        If ``buffer_pool`` is given, converted arrays are taken from it.
+        """
+        return _cast_labels_data_to_texture_dtype_direct(
+            values, self, buffer_pool
+        )
 
     def map(self, values: np.ndarray | np.integer | int) -> np.ndarray:
         """Map values to colors.
@@ -780,6 +812,7 @@ def _convert_small_ints_to_unsigned(
 def _cast_labels_data_to_texture_dtype_auto(
     data: np.ndarray,
     colormap: CyclicLabelColormap,
+    buffer_pool: BufferPool | None = None,
 ) -> np.ndarray: ...
 
 
@@ -787,12 +820,14 @@ def _cast_labels_data_to_texture_dtype_auto(
 def _cast_labels_data_to_texture_dtype_auto(
     data: np.integer,
     colormap: CyclicLabelColormap,
+    buffer_pool: BufferPool | None = None,
 ) -> np.integer: ...
 
 
 def _cast_labels_data_to_texture_dtype_auto(
     data: np.ndarray | np.integer,
     colormap: CyclicLabelColormap,
+    buffer_pool: BufferPool | None = None,
 ) -> np.ndarray | np.integer:
     """Convert labels data to the data type used in the texture.
 
@@ -815,6 +850,8 @@ def _cast_labels_data_to_texture_dtype_auto(
         Labels data to be converted.
     colormap : CyclicLabelColormap
         Colormap used to display the labels data.
+    buffer_pool : BufferPool, optional
+        If given, the converted array is taken from this pool.
 
     Returns
     -------
@@ -841,30 +878,42 @@ def _cast_labels_data_to_texture_dtype_auto(
             data_arr == colormap.selection, selection_in_texture, dtype.type(0)
         )
     else:
+        out = None
+        if buffer_pool is not None and not isinstance(data, np.integer):
+            out = buffer_pool.take(data_arr.shape, dtype)
         converted = zero_preserving_modulo_func(
-            data_arr, num_colors, dtype, colormap.background_value
+            data_arr, num_colors, dtype, colormap.background_value, out=out
         )
 
     if isinstance(data, np.integer):
         return dtype.type(converted[0])
 
+    if converted.shape == original_shape:
+        # the array itself, so that it can be given back to a buffer pool
+        return converted
     return np.reshape(converted, original_shape)
 
 
 @overload
 def _cast_labels_data_to_texture_dtype_direct(
-    data: np.ndarray, direct_colormap: DirectLabelColormap
+    data: np.ndarray,
+    direct_colormap: DirectLabelColormap,
+    buffer_pool: BufferPool | None = None,
 ) -> np.ndarray: ...
 
 
 @overload
 def _cast_labels_data_to_texture_dtype_direct(
-    data: np.integer, direct_colormap: DirectLabelColormap
+    data: np.integer,
+    direct_colormap: DirectLabelColormap,
+    buffer_pool: BufferPool | None = None,
 ) -> np.integer: ...
 
 
 def _cast_labels_data_to_texture_dtype_direct(
-    data: np.ndarray | np.integer, direct_colormap: DirectLabelColormap
+    data: np.ndarray | np.integer,
+    direct_colormap: DirectLabelColormap,
+    buffer_pool: BufferPool | None = None,
 ) -> np.ndarray | np.integer:
     """Convert labels data to the data type used in the texture.
 
@@ -891,6 +940,8 @@ def _cast_labels_data_to_texture_dtype_direct(
         Labels data to be converted.
     direct_colormap : CyclicLabelColormap
         Colormap used to display the labels data.
+    buffer_pool : BufferPool, optional
+        If given, the converted array is taken from this pool.
 
     Returns
     -------
@@ -913,10 +964,21 @@ def _cast_labels_data_to_texture_dtype_direct(
 
     original_shape = np.shape(data)
     array_data = np.atleast_1d(data)
-    return np.reshape(
-        _accel_cmap.labels_raw_to_texture_direct(array_data, direct_colormap),
-        original_shape,
+    out = None
+    if buffer_pool is not None and not direct_colormap.use_selection:
+        out = buffer_pool.take(
+            array_data.shape,
+            _accel_cmap.minimum_dtype_for_labels(
+                direct_colormap._num_unique_colors + 2
+            ),
+        )
+    converted = _accel_cmap.labels_raw_to_texture_direct(
+        array_data, direct_colormap, out=out
     )
+    if converted.shape == original_shape:
+        # the array itself, so that it can be given back to a buffer pool
+        return converted
+    return np.reshape(converted, original_shape)
 
 
 def _texture_dtype(num_colors: int, dtype: np.dtype) -> np.dtype:
@@ -0,0 +1,152 @@
+"""Rate limiting of event callbacks that only care about the latest event.
+
+Some callbacks are connected to events that fire much more often than the
+result can be displayed (e.g. mouse moves updating the status bar, or the
+dims slider following ``Dims.current_step`` during playback). Connecting
+them with ``emitter.connect(callback, max_rate=...)`` routes their events
+through a :class:`_Coalescer`: the callback runs immediately if it has not
+run for a full interval, otherwise the event is stored and only the latest
+stored event is delivered once the interval has elapsed.
+
+Deferred delivery needs an event loop, so it is provided by a *scheduler*
+installed by the GUI backend with :func:`set_coalescing_scheduler`. Without
+a scheduler (e.g. a headless ``ViewerModel``), or outside the main thread,
+callbacks are invoked synchronously for every event.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from time import perf_counter
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from napari.utils.events.event import Event, EventEmitter
+
+#: Rate used by ``max_rate='frame'``, in calls per second.
+FRAME_RATE = 60.0
+
+MaxRate = float | Literal['frame']
+Scheduler = Callable[[float, Callable[[], None]], None]
+
+_scheduler: Scheduler | None = None
+_disabled = 0
+
+
+def set_coalescing_scheduler(scheduler: Scheduler | None) -> Scheduler | None:
+    """Set the function used to deliver deferred events.
+
+    Parameters
+    ----------
+    scheduler : callable or None
+        Called as ``scheduler(delay, callback)`` from the main thread; it
+        must call ``callback()`` on the main thread after ``delay`` seconds.
+        If None, rate limited callbacks are invoked for every event.
+
+    Returns
+    -------
+    callable or None
+        The previously installed scheduler.
+    """
+    global _scheduler
+    previous, _scheduler = _scheduler, scheduler
+    return previous
+
+
+@contextmanager
+def coalescing_disabled() -> Iterator[None]:
+    """Invoke rate limited callbacks synchronously within this context."""
+    global _disabled
+    _disabled += 1
+    try:
+        yield
+    finally:
+        _disabled -= 1
+
+
+def _rate_to_interval(max_rate: MaxRate) -> float:
+    rate = FRAME_RATE if max_rate == 'frame' else float(max_rate)
+    if rate <= 0:
+        raise ValueError(f'max_rate must be positive, got {max_rate!r}')
+    return 1.0 / rate
+
+
+class _Coalescer:
+    """Deliver at most one event per interval to a single callback.
+
+    Parameters
+    ----------
+    emitter : EventEmitter
+        The emitter the callback is connected to. Used to invoke the
+        callback with the emitter error handling and source.
+    max_rate : float or 'frame'
+        Maximum number of calls per second, or ``'frame'`` for
+        ``FRAME_RATE``.
+    """
+
+    __slots__ = (
+        '_emitter_ref',
+        '_interval',
+        '_last_call',
+        '_pending',
+        '_scheduled',
+    )
+
+    def __init__(self, emitter: EventEmitter, max_rate: MaxRate) -> None:
+        self._emitter_ref = weakref.ref(emitter)
+        self._interval = _rate_to_interval(max_rate)
+        self._last_call = float('-inf')
+        self._pending: tuple[Callable, Event | None] | None = None
+        self._scheduled = False
+
+    def submit(self, callback: Callable, event: Event | None) -> None:
+        """Invoke ``callback`` now, or defer it and drop older events."""
+        scheduler = _scheduler
+        if (
+            scheduler is None
+            or _disabled
+            or threading.current_thread() is not threading.main_thread()
+        ):
+            self._invoke(callback, event, deferred=False)
+            return
+        self._pending = (callback, event)
+        if self._scheduled:
+            return
+        wait = self._last_call + self._interval - perf_counter()
+        if wait <= 0:
+            self._pending = None
+            self._invoke(callback, event, deferred=False)
+        else:
+            self._scheduled = True
+            scheduler(wait, self.flush)
+
+    def cancel(self) -> None:
+        """Drop the pending event, e.g. once the callback is disconnected."""
+        self._pending = None
+
+    def flush(self) -> None:
+        """Deliver the latest pending event, if any."""
+        self._scheduled = False
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            self._invoke(*pending, deferred=True)
+
+    def _invoke(
+        self, callback: Callable, event: Event | None, deferred: bool
+    ) -> None:
+        emitter = self._emitter_ref()
+        if emitter is None:
+            return
+        self._last_call = perf_counter()
+        if not deferred or event is None:
+            emitter._invoke_callback(callback, event)
+            return
+        # the emitter popped its source once the emission returned
+        event._push_source(emitter.source)
+        try:
+            emitter._invoke_callback(callback, event)
+        finally:
+            event._pop_source()
@@ -1,3 +1,4 @@
+import gc
 import weakref
 from functools import partial
 
@@ -351,3 +352,204 @@ def test_none_disconnect():
     e.connect(fun2)
     e()
     assert count_list == [1, 2]
+
+
+def test_dispatch_invalidated_on_connect_and_disconnect():
+    """Test that the compiled dispatch follows connections."""
+    count_list = []
+
+    def fun1():
+        count_list.append(1)
+
+    def fun2():
+        count_list.append(2)
+
+    e = EventEmitter(type_name='test')
+    e()
+    assert e._dispatch == ()
+    e.connect(fun1)
+    e()
+    assert count_list == [1]
+    e.connect(fun2)
+    e()
+    assert count_list == [1, 1, 2]
+    e.disconnect(fun1)
+    e()
+    assert count_list == [1, 1, 2, 2]
+
+
+def test_dispatch_drops_dead_weakrefs():
+    """Test that collected objects are removed from the dispatch."""
+
+    class TestOb:
+        def fun(self):
+            pass
+
+    e = EventEmitter(type_name='test')
+    t = TestOb()
+    e.connect(t.fun)
+    e()
+    assert len(e._dispatch) == 1
+    del t
+    e()
+    assert e.callbacks == ()
+    e()
+    assert e._dispatch == ()
+
+
+def test_dispatch_honors_replaced_method():
+    """Test that methods are resolved on the instance at emission time."""
+    count_list = []
+
+    class TestOb:
+        def fun(self):
+            count_list.append(1)
+
+    t = TestOb()
+    e = EventEmitter(type_name='test')
+    e.connect(t.fun)
+    e()
+    t.fun = lambda: count_list.append(2)
+    e()
+    assert count_list == [1, 2]
+
+
+def test_emit_without_callbacks_returns_event():
+    """Test the fast path when nothing is connected."""
+    e = EventEmitter(source=None, type_name='test')
+    event = e(value=1)
+    assert event.type == 'test'
+    assert event.value == 1
+    assert event.sources == []
+
+
+def test_blocked_callback_with_other_callbacks():
+    """Test that per-callback blocks still apply on the dispatch path."""
+    count_list = []
+
+    def fun1():
+        count_list.append(1)
+
+    def fun2():
+        count_list.append(2)
+
+    e = EventEmitter(type_name='test')
+    e.connect(fun1)
+    e.connect(fun2)
+    with e.blocker(fun1) as block:
+        e()
+    assert count_list == [2]
+    assert block.count == 1
+
+
+@pytest.fixture
+def fake_scheduler(monkeypatch):
+    """Enable coalescing and collect the deferred deliveries."""
+    from napari.utils.events import _coalescing
+
+    scheduled = []
+    monkeypatch.setattr(_coalescing, '_disabled', 0)
+    monkeypatch.setattr(
+        _coalescing,
+        '_scheduler',
+        lambda delay, callback: scheduled.append((delay, callback)),
+    )
+    return scheduled
+
+
+def test_max_rate_delivers_latest_event(fake_scheduler):
+    """Test that events faster than max_rate are coalesced."""
+    values = []
+    sources = []
+
+    def fun(event):
+        values.append(event.value)
+        sources.append(event.source)
+
+    source = EventEmitter(type_name='source')  # any weakref-able object
+    e = EventEmitter(source=source, type_name='test')
+    e.connect(fun, max_rate=10)
+
+    # leading edge is delivered immediately
+    e(value=1)
+    assert values == [1]
+    assert not fake_scheduler
+
+    # the following events are coalesced until the interval elapsed
+    e(value=2)
+    e(value=3)
+    assert values == [1]
+    assert len(fake_scheduler) == 1
+    delay, flush = fake_scheduler[0]
+    assert 0 < delay <= 0.1
+
+    flush()
+    assert values == [1, 3]
+    assert sources == [source, source]
+
+
+def test_max_rate_without_scheduler_is_synchronous(monkeypatch):
+    """Test that coalescing needs a scheduler to defer events."""
+    from napari.utils.events import _coalescing
+
+    monkeypatch.setattr(_coalescing, '_disabled', 0)
+    monkeypatch.setattr(_coalescing, '_scheduler', None)
+    count_list = []
+    e = EventEmitter(type_name='test')
+    e.connect(lambda: count_list.append(1), max_rate='frame')
+    for _ in range(3):
+        e()
+    assert count_list == [1, 1, 1]
+
+
+def test_max_rate_disconnect(fake_scheduler):
+    """Test that disconnecting keeps callbacks and rate limiters aligned."""
+    count_list = []
+
+    def fun1():
+        count_list.append(1)
+
+    def fun2():
+        count_list.append(2)
+
+    e = EventEmitter(type_name='test')
+    e.connect(fun1, max_rate='frame')
+    e.connect(fun2)
+    e.disconnect(fun1)
+    e()
+    e()
+    assert count_list == [2, 2]
+    assert e._callback_coalescers == [None]
+
+
+def test_max_rate_disconnect_drops_pending_event(fake_scheduler):
+    """Test that a deferred event isn't delivered once disconnected."""
+    count_list = []
+
+    class Receiver:
+        def fun(self):
+            count_list.append(1)
+
+    receiver = Receiver()
+    e = EventEmitter(type_name='test')
+    e.connect(receiver.fun, max_rate='frame')
+    e()
+    e()
+    assert count_list == [1]
+    assert len(fake_scheduler) == 1
+
+    e.disconnect(receiver.fun)
+    receiver_ref = weakref.ref(receiver)
+    del receiver
+    gc.collect()
+    # the pending event doesn't keep the receiver alive
+    assert receiver_ref() is None
+    _delay, flush = fake_scheduler[0]
+    flush()
+    assert count_list == [1]
+
+
+def test_max_rate_invalid():
+    e = EventEmitter(type_name='test')
+    with pytest.raises(ValueError, match='max_rate must be positive'):
+        e.connect(lambda: None, max_rate=0)
@@ -244,6 +244,54 @@ def test_values_updated():
     assert user1_events.call_count == 0
 
 
+def test_batched_update_coalesces_events():
+    """Test that a batch emits one event per field and one compound event."""
+
+    class Model(EventedModel):
+        a: int = 0
+        b: int = 0
+        c: int = 0
+
+    model = Model()
+    a_events = []
+    model.events.a.connect(lambda e: a_events.append(e.value))
+    compound = []
+    model.events.connect(compound.append)
+
+    with model.batched_update():
+        model.a = 1
+        model.a = 2
+        model.b = 3
+        model.c = 5
+        model.c = 0
+        # values are set immediately, only notifications are deferred
+        assert model.a == 2
+        assert not a_events
+        assert not compound
+
+    assert a_events == [2]
+    assert len(compound) == 1
+    assert compound[0].changes == {'a': (0, 2), 'b': (0, 3)}
+
+
+def test_batched_update_nested():
+    """Test that only the outermost batch emits."""
+
+    class Model(EventedModel):
+        a: int = 0
+
+    model = Model()
+    values = []
+    model.events.a.connect(lambda e: values.append(e.value))
+
+    with model.batched_update():
+        with model.batched_update():
+            model.a = 1
+        assert not values
+        model.a = 2
+    assert values == [2]
+
+
 def test_update_with_inner_model_union():
     class Inner(EventedModel):
         w: str
@@ -67,6 +67,8 @@ from typing import (
 
 from vispy.util.logs import _handle_exception
 
+from napari.utils.events._coalescing import MaxRate, _Coalescer
+
 
 class Event:
     """Class describing events that occur and can be reacted to with callbacks.
@@ -284,6 +286,14 @@ class EventEmitter:
         # used when connecting new callbacks at specific positions
         self._callback_refs: list[str | None] = []
         self._callback_pass_event: list[bool] = []
+        # rate limiters for callbacks connected with ``max_rate``
+        self._callback_coalescers: list[_Coalescer | None] = []
+        # immutable snapshot of (callback, pass_event, coalescer) used by
+        # __call__, rebuilt lazily after any connect or disconnect
+        self._dispatch: (
+            tuple[tuple[Callback | CallbackRef, bool, _Coalescer | None], ...]
+            | None
+        ) = None
 
         # count number of times this emitter is blocked for each callback.
         self._blocked: dict[Callback | None, int] = {None: 0}
@@ -397,6 +407,7 @@ class EventEmitter:
         before: str | Callback | list[str | Callback] | None = None,
         after: str | Callback | list[str | Callback] | None = None,
         until: Optional['EventEmitter'] = None,
+        max_rate: MaxRate | None = None,
     ):
         """Connect this emitter to a new callback.
 
@@ -426,6 +437,13 @@ class EventEmitter:
         until : optional eventEmitter
             if provided, when the event `until` is emitted, `callback`
             will be disconnected from this emitter.
+        max_rate : float or 'frame', optional
+            Maximum number of times per second the callback is invoked, or
+            ``'frame'`` for once per displayed frame. Events arriving faster
+            are coalesced and only the latest one is delivered, once the
+            interval has elapsed. Only has an effect when a GUI event loop
+            provides deferred delivery (see
+            ``napari.utils.events._coalescing``).
 
         Notes
         -----
@@ -534,6 +552,10 @@ class EventEmitter:
         self._callbacks.insert(idx, callback)
         self._callback_refs.insert(idx, _ref)
         self._callback_pass_event.insert(idx, pass_event)
+        self._callback_coalescers.insert(
+            idx, None if max_rate is None else _Coalescer(self, max_rate)
+        )
+        self._dispatch = None
 
         if until is not None:
             until.connect(partial(self.disconnect, callback))
@@ -548,10 +570,14 @@ class EventEmitter:
         If no callback is specified, then *all* callbacks are removed.
         If the callback was not already connected, then the call does nothing.
         """
+        self._dispatch = None
         if callback is None:
             self._callbacks = []
             self._callback_refs = []
             self._callback_pass_event = []
+            for coalescer in self._callback_coalescers:
+                _cancel(coalescer)
+            self._callback_coalescers = []
         elif isinstance(callback, Callable | tuple):
             callback, _pass_event = self._normalize_cb(callback)
             if callback in self._callbacks:
@@ -559,6 +585,7 @@ class EventEmitter:
                 self._callbacks.pop(idx)
                 self._callback_refs.pop(idx)
                 self._callback_pass_event.pop(idx)
+                _cancel(self._callback_coalescers.pop(idx))
         else:
             index_list = []
             for idx, local_callback in enumerate(self._callbacks):
@@ -576,6 +603,7 @@ class EventEmitter:
                 self._callbacks.pop(idx)
                 self._callback_refs.pop(idx)
                 self._callback_pass_event.pop(idx)
+                _cancel(self._callback_coalescers.pop(idx))
 
     @staticmethod
     def _get_proper_name(callback):
@@ -671,21 +699,30 @@ class EventEmitter:
         # create / massage event as needed
         event = self._prepare_event(*args, **kwargs)
 
+        if blocked.get(None, 0) > 0:  # this is the same as self.blocked()
+            self._block_counter.update([None])
+            return event
+
+        dispatch = self._dispatch
+        if dispatch is None:
+            dispatch = self._compile_dispatch()
+        if not dispatch and _log_event_stack is _noop:
+            # nothing listens, so there is no need to touch the event
+            return event
+
+        # only look up per-callback blocks if any callback is blocked
+        # (the ``None`` key for the whole emitter is always present)
+        check_blocked = len(blocked) > 1
+
         # Add our source to the event; remove it after all callbacks have been
         # invoked.
         event._push_source(self.source)
         self._emitting = True
         try:
-            if blocked.get(None, 0) > 0:  # this is the same as self.blocked()
-                self._block_counter.update([None])
-                return event
-
             _log_event_stack(event)
 
             rem: list[CallbackRef] = []
-            for cb, pass_event in zip(
-                self._callbacks[:], self._callback_pass_event[:], strict=False
-            ):
+            for cb, pass_event, coalescer in dispatch:
                 if isinstance(cb, tuple):
                     obj = cb[0]()
                     if obj is None:
@@ -702,11 +739,14 @@ class EventEmitter:
                         continue
                     cb = cast(Callback, cb)
 
-                if blocked.get(cb, 0) > 0:
+                if check_blocked and blocked.get(cb, 0) > 0:
                     self._block_counter.update([cb])
                     continue
 
-                self._invoke_callback(cb, event if pass_event else None)
+                if coalescer is not None:
+                    coalescer.submit(cb, event if pass_event else None)
+                else:
+                    self._invoke_callback(cb, event if pass_event else None)
                 if event.blocked:
                     break
 
@@ -721,6 +761,25 @@ class EventEmitter:
 
         return event
 
+    def _compile_dispatch(
+        self,
+    ) -> tuple[tuple[Callback | CallbackRef, bool, _Coalescer | None], ...]:
+        """Build the snapshot of callbacks iterated over by ``__call__``.
+
+        Weak method references are resolved with ``getattr`` at emission
+        time rather than cached, so that callbacks never keep their objects
+        alive and attributes replaced on the instance are still honored.
+        """
+        self._dispatch = tuple(
+            zip(
+                self._callbacks,
+                self._callback_pass_event,
+                self._callback_coalescers,
+                strict=True,
+            )
+        )
+        return self._dispatch
+
     def _invoke_callback(
         self, cb: Callback | Callable[[], None], event: Event | None
     ):
@@ -1190,3 +1249,9 @@ def set_event_tracing_enabled(enabled=True, cfg=None):
 
 if os.getenv('NAPARI_DEBUG_EVENTS', '').lower() in ('1', 'true'):
     set_event_tracing_enabled(True)
+
+
+def _cancel(coalescer: _Coalescer | None) -> None:
+    """Drop the event a disconnected callback may still have pending."""
+    if coalescer is not None:
+        coalescer.cancel()
@@ -1,5 +1,5 @@
 import warnings
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from contextlib import contextmanager
 from typing import Any, ClassVar, Union
 
@@ -13,7 +13,7 @@ from pydantic import (
 from pydantic._internal._model_construction import ModelMetaclass
 
 from napari._pydantic_util import get_inner_type, get_outer_type
-from napari.utils.events.event import EmitterGroup, Event
+from napari.utils.events.event import EmitterGroup
 from napari.utils.misc import pick_equality_operator
 
 # encoders for non-napari specific field types.  To declare a custom encoder
@@ -285,7 +285,7 @@ class EventedModel(BaseModel, metaclass=EventedMetaclass):
                 continue
             old_value = self._changes_queue[name]
             if (res := self._check_if_differ(name, old_value))[0]:
-                to_emit.append((name, res[1]))
+                to_emit.append((name, old_value, res[1]))
             self._changes_queue.pop(name)
         if not to_emit:
             # If no direct changes were made then we can skip the whole machinery
@@ -295,21 +295,29 @@ class EventedModel(BaseModel, metaclass=EventedMetaclass):
         for name, old_value in self._changes_queue.items():
             # check if any of the dependent properties changed
             if (res := self._check_if_differ(name, old_value))[0]:
-                to_emit.append((name, res[1]))
+                to_emit.append((name, old_value, res[1]))
         self._changes_queue.clear()
         self._primary_changes.clear()
 
         with ComparisonDelayer(self):
             # Again delay comparison to avoid having events caused by callback functions
-            for name, new_value in to_emit:
+            for name, _, new_value in to_emit:
                 getattr(self.events, name)(value=new_value)
 
             if len(self.events.callbacks):
                 # If there are callbacks connected to the obj.events itself,
-                # To mimic previous behavior for an object without
-                # dependent properties, we set type to the first changed field
-                # and value to the new value of that field.
-                self.events(type_name=to_emit[0][0], value=to_emit[0][1])
+                # they receive a single event for all the changes. To mimic
+                # previous behavior for an object without dependent
+                # properties, we set type to the first changed field and
+                # value to the new value of that field.
+                self.events(
+                    type_name=to_emit[0][0],
+                    value=to_emit[0][2],
+                    changes={
+                        name: (old_value, new_value)
+                        for name, old_value, new_value in to_emit
+                    },
+                )
 
     def _setattr_impl(self, name: str, value: Any) -> None:
         if name not in getattr(self, 'events', {}):
@@ -405,7 +413,7 @@ class EventedModel(BaseModel, metaclass=EventedMetaclass):
         if not isinstance(values, dict):
             raise TypeError(f'Unsupported update from {type(values)}')
 
-        with self.events.blocker() as block:
+        with self.batched_update():
             for key, value in values.items():
                 field = getattr(self, key)
                 if isinstance(field, EventedModel) and recurse:
@@ -413,8 +421,25 @@ class EventedModel(BaseModel, metaclass=EventedMetaclass):
                 else:
                     setattr(self, key, value)
 
-        if block.count:
-            self.events(Event(self))
+    @contextmanager
+    def batched_update(self) -> Iterator[None]:
+        """Coalesce all changes made within the context into one notification.
+
+        Field events are deferred until the outermost batch exits. Then each
+        changed field (and dependent property) emits its event once, with
+        its final value, and callbacks connected to ``model.events`` itself
+        receive a single event whose ``changes`` attribute maps each changed
+        name to its ``(old_value, new_value)``. Fields that end up with their
+        original value emit nothing.
+
+        Examples
+        --------
+        >>> with dims.batched_update():  # doctest: +SKIP
+        ...     dims.point = (1, 0, 0)
+        ...     dims.margin_left = (1, 0, 0)
+        """
+        with ComparisonDelayer(self):
+            yield
 
     def __eq__(self, other) -> bool:
         """Check equality with another object.
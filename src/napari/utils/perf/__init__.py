@@ -47,12 +47,25 @@ You can also manually add "perf_timer" context objects and
 three of these should be removed before merging the PR into main. While
 they have almost zero overhead when perfmon is disabled, it's still better
 not to leave them in the code. Think of them as similar to debug prints.
+
+Slicing Statistics
+------------------
+
+The slicing pipeline is always instrumented, independently of perfmon. Turn
+on ``slicing_stats`` with ``slicing_stats.enable()`` or the env var
+NAPARI_SLICING_STATS=1 to record, per layer, histograms of the latency of
+each stage (from the slice request to the draw of the canvas) and counters
+such as bytes read and cache hits. ``slicing_stats.summary()`` gives their
+percentiles, which ``slicing_stats.write_summary()`` writes as JSON, and
+``slicing_stats.write_trace()`` writes the stages as a Chrome trace file.
 """
 
 import os
 
 from napari.utils.perf._config import perf_config
 from napari.utils.perf._event import PerfEvent
+from napari.utils.perf._histogram import LatencyHistogram
+from napari.utils.perf._slicing import SlicingStats, slicing_stats
 from napari.utils.perf._timers import (
     add_counter_event,
     add_instant_event,
@@ -66,11 +79,14 @@ USE_PERFMON = os.getenv('NAPARI_PERFMON', '0') != '0'
 
 __all__ = [
     'USE_PERFMON',
+    'LatencyHistogram',
     'PerfEvent',
+    'SlicingStats',
     'add_counter_event',
     'add_instant_event',
     'block_timer',
     'perf_config',
     'perf_timer',
+    'slicing_stats',
     'timers',
 ]
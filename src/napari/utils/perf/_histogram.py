@@ -0,0 +1,139 @@
+"""LatencyHistogram class."""
+
+from __future__ import annotations
+
+# Number of buckets per power of two. Values are recorded with a relative
+# error of at most 1 / _SUB_BUCKETS (about 1.6%).
+_SUB_BITS = 6
+_SUB_BUCKETS = 1 << _SUB_BITS
+
+#: The percentiles reported in summaries.
+SUMMARY_PERCENTILES = (50, 95, 99)
+
+
+def _bucket_index(value: int) -> int:
+    """Index of the bucket of a non-negative integer value."""
+    if value < 2 * _SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - _SUB_BITS - 1
+    return shift * _SUB_BUCKETS + (value >> shift)
+
+
+def _bucket_value(index: int) -> int:
+    """Middle value of the bucket at ``index``."""
+    if index < 2 * _SUB_BUCKETS:
+        return index
+    shift = index // _SUB_BUCKETS - 1
+    low = (index - shift * _SUB_BUCKETS) << shift
+    return low + (1 << shift) // 2
+
+
+class LatencyHistogram:
+    """Histogram of integer values with logarithmic buckets.
+
+    As in HDR histograms, each power of two is split in the same number of
+    linear buckets, so that percentiles are estimated with a bounded
+    relative error while the memory used only grows with the logarithm of
+    the largest value.
+
+    Attributes
+    ----------
+    count : int
+        How many values were added.
+    sum : int
+        Sum of all the values added.
+    min : int
+        Minimum value, or 0 if no values were added.
+    max : int
+        Maximum value, or 0 if no values were added.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.sum = 0
+        self.min = 0
+        self.max = 0
+        self._counts: list[int] = []
+
+    def add(self, value: int) -> None:
+        """Add a value, e.g. a duration in nanoseconds.
+
+        Parameters
+        ----------
+        value : int
+            The value. Negative values are recorded as 0.
+        """
+        value = max(int(value), 0)
+        index = _bucket_index(value)
+        if index >= len(self._counts):
+            self._counts.extend([0] * (index + 1 - len(self._counts)))
+        self._counts[index] += 1
+        if self.count == 0:
+            self.min = self.max = value
+        else:
+            self.min = min(self.min, value)
+            self.max = max(self.max, value)
+        self.count += 1
+        self.sum += value
+
+    @property
+    def mean(self) -> float:
+        """Average value, or 0 if no values were added."""
+        return self.sum / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> int:
+        """Estimate of the value below which ``percent`` % of values fall.
+
+        Parameters
+        ----------
+        percent : float
+            The percentile, between 0 and 100.
+
+        Returns
+        -------
+        int
+            The estimated value, or 0 if no values were added.
+        """
+        if self.count == 0:
+            return 0
+        rank = max(percent / 100 * self.count, 1)
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen == self.count:
+                # the last bucket holds the exact maximum
+                return self.max
+            if seen >= rank:
+                return max(_bucket_value(index), self.min)
+        return self.max
+
+    def summary(self, scale: float = 1e-6) -> dict[str, float]:
+        """Count, mean, max and percentiles (``p50``, ``p95``, ``p99``).
+
+        Parameters
+        ----------
+        scale : float
+            Factor applied to the values, by default from nanoseconds to
+            milliseconds.
+
+        Returns
+        -------
+        dict
+            The statistics, keyed by name.
+        """
+        summary = {
+            'count': self.count,
+            'mean': self.mean * scale,
+            'max': self.max * scale,
+        }
+        for percent in SUMMARY_PERCENTILES:
+            summary[f'p{percent}'] = self.percentile(percent) * scale
+        return summary
+
+    def clear(self) -> None:
+        """Remove all values."""
+        self.count = 0
+        self.sum = 0
+        self.min = 0
+        self.max = 0
+        self._counts.clear()
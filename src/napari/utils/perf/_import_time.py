@@ -0,0 +1,119 @@
+"""Per-module import times, measured with ``python -X importtime``.
+
+Imports are measured in a new interpreter, as modules imported before, e.g.
+by the test runner, would be free to import again. For example, to list the
+slowest imports of napari::
+
+    report = import_time('import napari')
+    sorted(report.cumulative_us.items(), key=lambda x: -x[1])[:10]
+"""
+
+from __future__ import annotations
+
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from time import perf_counter
+
+# e.g. "import time:       523 |       5645 |     scipy"
+_IMPORT_TIME_LINE = re.compile(
+    r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s+)(\S+)\s*$'
+)
+
+
+@dataclass
+class ImportTimeReport:
+    """Import times of the modules imported by a statement.
+
+    Attributes
+    ----------
+    self_us : dict of str to int
+        The time to import each module itself, in microseconds.
+    cumulative_us : dict of str to int
+        The time to import each module with the modules it imported first,
+        in microseconds.
+    top_level : list of str
+        The modules imported directly by the statement, in import order.
+    wall_s : float
+        The wall time to run the interpreter, including its startup, in
+        seconds.
+    """
+
+    self_us: dict[str, int] = field(default_factory=dict)
+    cumulative_us: dict[str, int] = field(default_factory=dict)
+    top_level: list[str] = field(default_factory=list)
+    wall_s: float = 0.0
+
+    @property
+    def total_us(self) -> int:
+        """The time of all imports, in microseconds."""
+        return sum(self.self_us.values())
+
+    def cumulative_ms(self, module: str) -> float:
+        """The cumulative import time of ``module``, in milliseconds.
+
+        Modules that were not imported took 0 ms.
+        """
+        return self.cumulative_us.get(module, 0) / 1000
+
+
+def parse_import_time(output: str) -> ImportTimeReport:
+    """Parse the ``-X importtime`` output of an interpreter.
+
+    Parameters
+    ----------
+    output : str
+        The stderr of the interpreter. Lines which are not import times
+        are ignored.
+
+    Returns
+    -------
+    ImportTimeReport
+        The import time of each module.
+    """
+    report = ImportTimeReport()
+    for line in output.splitlines():
+        match = _IMPORT_TIME_LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        report.self_us[module] = int(self_us)
+        report.cumulative_us[module] = int(cumulative_us)
+        # modules are indented by two spaces per level of nesting
+        if len(indent) == 1:
+            report.top_level.append(module)
+    return report
+
+
+def import_time(
+    statement: str, env: dict[str, str] | None = None
+) -> ImportTimeReport:
+    """Measure the import times of running ``statement`` in a new interpreter.
+
+    Parameters
+    ----------
+    statement : str
+        The python code to run, e.g. ``'import napari'``.
+    env : dict of str to str, optional
+        The environment variables of the interpreter. By default, those of
+        this process.
+
+    Returns
+    -------
+    ImportTimeReport
+        The import time of each module.
+
+    Raises
+    ------
+    subprocess.CalledProcessError
+        If the statement fails.
+    """
+    cmd = [sys.executable, '-X', 'importtime', '-c', statement]
+    start = perf_counter()
+    result = subprocess.run(
+        cmd, capture_output=True, text=True, env=env, check=True
+    )
+    report = parse_import_time(result.stderr)
+    report.wall_s = perf_counter() - start
+    return report
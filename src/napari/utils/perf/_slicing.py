@@ -0,0 +1,277 @@
+"""SlicingStats class and global instance.
+
+Unlike perf timers, which are only active when perfmon is enabled, slicing
+statistics can be turned on at any time, e.g. from the console or a
+benchmark, with ``slicing_stats.enable()``, or on startup with the env var
+``NAPARI_SLICING_STATS=1``. When disabled, each instrumented step of the
+slicing pipeline costs a single attribute check.
+
+The latencies of each layer are recorded for these stages, in order:
+
+queue
+    From the submission of an asynchronous slice request to the start of
+    its slicing in the slicing thread.
+slice
+    Slicing itself, from the slice request to the slice response.
+response
+    From the end of asynchronous slicing to the slice response being set
+    on the layer, in the main thread.
+upload
+    Sending the new slice to vispy, e.g. uploading textures.
+draw
+    From the upload to the end of the next draw of the canvas.
+total
+    From the slice request to the end of the draw.
+
+Counters are also kept per layer, e.g. bytes read, bytes copied, cache hits
+and misses, and queued and cancelled requests.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any
+
+from napari.utils.perf._event import PerfEvent
+from napari.utils.perf._histogram import LatencyHistogram
+from napari.utils.perf._timers import timers
+from napari.utils.perf._trace_file import PerfTraceFile
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+#: The latency stages recorded for each layer, in pipeline order.
+SLICING_STAGES = ('queue', 'slice', 'response', 'upload', 'draw', 'total')
+
+# Maximum number of events kept for trace files.
+_MAX_TRACE_EVENTS = 100_000
+
+
+class _LayerStats:
+    """Latency histograms and counters of one layer."""
+
+    def __init__(self) -> None:
+        self.latencies: dict[str, LatencyHistogram] = defaultdict(
+            LatencyHistogram
+        )
+        self.counters: dict[str, int] = defaultdict(int)
+        # perf_counter_ns() of the pending slice request, of the end of its
+        # slicing and of the upload of its slice, until the canvas is drawn
+        self.requested_ns: int | None = None
+        self.sliced_ns: int | None = None
+        self.uploaded_ns: int | None = None
+
+
+class SlicingStats:
+    """Latencies and counters of the slicing pipeline, per layer.
+
+    Layers are identified by name: methods accept either a layer or its
+    name, which is only looked up while the statistics are enabled. All
+    methods are thread-safe, and do nothing while the statistics are
+    disabled.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether statistics are recorded.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self._layers: dict[str, _LayerStats] = defaultdict(_LayerStats)
+        self._events: deque[PerfEvent] = deque(maxlen=_MAX_TRACE_EVENTS)
+        self._lock = threading.RLock()
+        # the layer being sliced by each thread, see `slicing`
+        self._local = threading.local()
+
+    def enable(self) -> None:
+        """Start recording statistics."""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording statistics, keeping those recorded so far."""
+        self.enabled = False
+
+    def clear(self) -> None:
+        """Remove all the recorded statistics and trace events."""
+        with self._lock:
+            self._layers.clear()
+            self._events.clear()
+
+    def request(self, layer: Any) -> None:
+        """Record that a slice of ``layer`` was requested now."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._layers[_layer_name(layer)].requested_ns = perf_counter_ns()
+
+    def count(self, name: str, value: int = 1, layer: Any = None) -> None:
+        """Add ``value`` to the counter ``name`` of ``layer``.
+
+        Parameters
+        ----------
+        name : str
+            The name of the counter, e.g. 'bytes_read'.
+        value : int
+            The value to add to the counter.
+        layer : Layer or str, optional
+            The layer. By default, the layer being sliced by the current
+            thread, if any.
+        """
+        if not self.enabled:
+            return
+        if layer is None:
+            layer = getattr(self._local, 'layer', None)
+            if layer is None:
+                return
+        with self._lock:
+            self._layers[_layer_name(layer)].counters[name] += value
+
+    def add_latency(
+        self, layer: Any, stage: str, start_ns: int, end_ns: int
+    ) -> None:
+        """Record the latency of a stage of slicing ``layer``.
+
+        Parameters
+        ----------
+        layer : Layer or str
+            The layer.
+        stage : str
+            One of ``SLICING_STAGES``.
+        start_ns, end_ns : int
+            The perf_counter_ns() at the start and end of the stage.
+        """
+        if not self.enabled:
+            return
+        layer = _layer_name(layer)
+        event = PerfEvent(
+            f'{stage}:{layer}', start_ns, end_ns, category='slicing'
+        )
+        with self._lock:
+            stats = self._layers[layer]
+            stats.latencies[stage].add(end_ns - start_ns)
+            if stage == 'slice':
+                stats.sliced_ns = end_ns
+                if stats.requested_ns is None:
+                    # e.g. a refresh, slicing without a request
+                    stats.requested_ns = start_ns
+            elif stage == 'upload':
+                stats.uploaded_ns = end_ns
+            self._events.append(event)
+        # the stages also appear in perfmon traces
+        timers.add_event(event)
+
+    def responded(self, layer: Any) -> None:
+        """Record that the slice response of ``layer`` was set now.
+
+        This is only needed for asynchronous slicing, whose responses are
+        set later, in the main thread.
+        """
+        if not self.enabled:
+            return
+        layer = _layer_name(layer)
+        with self._lock:
+            sliced_ns = self._layers[layer].sliced_ns
+            if sliced_ns is not None:
+                self.add_latency(
+                    layer, 'response', sliced_ns, perf_counter_ns()
+                )
+
+    @contextmanager
+    def slicing(self, layer: Any) -> Generator[None, None, None]:
+        """Time the slicing of ``layer`` in the current thread.
+
+        Counters recorded while slicing, without a layer, are added to
+        ``layer``.
+        """
+        if not self.enabled:
+            yield
+            return
+        layer = _layer_name(layer)
+        self._local.layer = layer
+        start_ns = perf_counter_ns()
+        try:
+            yield
+        finally:
+            self._local.layer = None
+            self.add_latency(layer, 'slice', start_ns, perf_counter_ns())
+
+    @contextmanager
+    def timing(self, layer: Any, stage: str) -> Generator[None, None, None]:
+        """Time a stage of the pipeline of ``layer``, e.g. 'upload'."""
+        if not self.enabled:
+            yield
+            return
+        start_ns = perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.add_latency(layer, stage, start_ns, perf_counter_ns())
+
+    def drawn(self) -> None:
+        """Record that the canvas was drawn, with all uploaded slices."""
+        if not self.enabled:
+            return
+        now = perf_counter_ns()
+        with self._lock:
+            for name, stats in list(self._layers.items()):
+                if stats.uploaded_ns is None:
+                    continue
+                self.add_latency(name, 'draw', stats.uploaded_ns, now)
+                if stats.requested_ns is not None:
+                    self.add_latency(name, 'total', stats.requested_ns, now)
+                stats.requested_ns = None
+                stats.sliced_ns = None
+                stats.uploaded_ns = None
+
+    def summary(self) -> dict[str, Any]:
+        """Summary of the statistics of each layer.
+
+        Returns
+        -------
+        dict
+            Maps each layer name to a dict with ``'latency_ms'``, the count,
+            mean, max and percentiles (``p50``, ``p95``, ``p99``) of each
+            recorded stage in milliseconds, and ``'counters'``.
+        """
+        with self._lock:
+            return {
+                name: {
+                    'latency_ms': {
+                        stage: stats.latencies[stage].summary()
+                        for stage in SLICING_STAGES
+                        if stage in stats.latencies
+                    },
+                    'counters': dict(stats.counters),
+                }
+                for name, stats in self._layers.items()
+            }
+
+    def write_summary(self, path: str) -> None:
+        """Write the summary of the statistics to a JSON file."""
+        with open(path, 'w') as outf:
+            json.dump(self.summary(), outf, indent=2)
+
+    def write_trace(self, path: str) -> None:
+        """Write the recorded stages to a chrome://tracing file."""
+        trace_file = PerfTraceFile(path)
+        with self._lock:
+            trace_file.events = list(self._events)
+        trace_file.close()
+
+
+def _layer_name(layer: Any) -> str:
+    """The name of ``layer``, which may already be a name."""
+    if isinstance(layer, str):
+        return layer
+    return str(getattr(layer, 'name', type(layer).__name__))
+
+
+slicing_stats = SlicingStats(
+    enabled=os.getenv('NAPARI_SLICING_STATS', '0') != '0'
+)
@@ -59,12 +59,16 @@ class Viewer(ViewerModel):
         # we delay initialization of plugin system to the first instantiation
         # of a viewer... rather than just on import of plugins module
         from napari.plugins import _initialize_plugins
+        from napari.utils._numba_warmup import numba_warmup
 
         # having this import here makes all of Qt imported lazily, upon
         # instantiating the first Viewer.
         from napari.window import Window
 
         _initialize_plugins()
+        # compile numba kernels while the window is created, rather than on
+        # the first drawing of shapes or labels
+        numba_warmup.start()
 
         self._window = Window(
             self, show=show, show_welcome_screen=show_welcome_screen
@@ -70,3 +70,133 @@ def test_get_writer_succeeds(
     assert set(written) == expected
     for expect in expected:
         assert Path(expect).is_file()
+
+
+@pytest.mark.parametrize('n_workers', [1, 3])
+def test_write_zarr_streams_dask_data(tmp_path: Path, n_workers: int):
+    """Test that lazy data is written to zarr block by block."""
+    pytest.importorskip('zarr')
+    import dask.array as da
+
+    from napari_builtins.io import write_zarr
+
+    data = da.random.randint(0, 1000, (3, 70, 90), chunks=(1, 32, 32))
+    path = str(tmp_path / 'image.zarr')
+    assert write_zarr(path, data, n_workers=n_workers) == path
+
+    reader = napari_get_reader(path)
+    assert callable(reader)
+    [(read_data, *_)] = reader(path)
+    np.testing.assert_array_equal(read_data, data)
+    assert read_data.chunksize == (1, 32, 32)
+
+
+def test_write_zarr_pyramid(tmp_path: Path):
+    """Test that missing pyramid levels are computed while writing."""
+    pytest.importorskip('zarr')
+    from napari_builtins.io import write_zarr
+
+    data = np.arange(2 * 9 * 10, dtype=np.uint16).reshape(2, 9, 10)
+    path = str(tmp_path / 'pyramid.zarr')
+    write_zarr(path, data, n_levels=3, chunks=(1, 4, 4))
+
+    [(levels, *_)] = napari_get_reader(path)(path)
+    assert isinstance(levels, list)
+    assert [level.shape for level in levels] == [
+        (2, 9, 10),
+        (2, 5, 5),
+        (2, 3, 3),
+    ]
+    np.testing.assert_array_equal(levels[0], data)
+    # 2x2 block mean, with odd edges padded by repetition
+    padded = np.pad(data, ((0, 0), (0, 1), (0, 0)), mode='edge')
+    expected = padded.reshape(2, 5, 2, 5, 2).mean(axis=(2, 4)).round()
+    np.testing.assert_array_equal(levels[1], expected)
+
+
+def test_layer_save_multiscale_tiff(tmp_path: Path):
+    """Test saving multiscale image data as a BigTIFF pyramid."""
+    import tifffile
+
+    from napari.layers import Image
+
+    base = np.random.randint(0, 255, (64, 80), dtype=np.uint8)
+    layer = Image([base, base[::2, ::2], base[::4, ::4]], multiscale=True)
+    path = tmp_path / 'pyramid.tif'
+    assert layer.save(str(path))
+
+    with tifffile.TiffFile(path) as tif:
+        assert tif.is_bigtiff
+        levels = tif.series[0].levels
+        assert len(levels) == 3
+        for level, expected in zip(levels, layer.data, strict=True):
+            np.testing.assert_array_equal(level.asarray(), expected)
+
+
+def test_layer_save_lazy_tiff(tmp_path: Path, monkeypatch):
+    """Test that only large lazy data is streamed to a BigTIFF file."""
+    import dask.array as da
+    import tifffile
+
+    from napari.layers import Image
+    from napari_builtins.io import _write
+
+    base = np.random.randint(0, 255, (64, 80), dtype=np.uint8)
+    layer = Image(da.from_array(base, chunks=32))
+    path = tmp_path / 'small.tif'
+    assert layer.save(str(path))
+    with tifffile.TiffFile(path) as tif:
+        assert not tif.is_bigtiff
+        np.testing.assert_array_equal(tif.asarray(), base)
+
+    monkeypatch.setattr(_write, '_STREAMED_TIFF_BYTES', base.nbytes - 1)
+    path = tmp_path / 'large.tif'
+    assert layer.save(str(path))
+    with tifffile.TiffFile(path) as tif:
+        assert tif.is_bigtiff
+        np.testing.assert_array_equal(tif.asarray(), base)
+
+
+@pytest.mark.parametrize('ext', ['.tif', '.zarr'])
+def test_layer_save_pyramid_levels(tmp_path: Path, ext: str):
+    """Test that pyramid levels are requested with the layer metadata."""
+    pytest.importorskip('zarr')
+    from napari.layers import Image
+
+    base = np.random.randint(0, 255, (64, 80), dtype=np.uint8)
+    layer = Image(base, metadata={'n_levels': 3})
+    path = str(tmp_path / f'pyramid{ext}')
+    assert layer.save(path)
+
+    if ext == '.tif':
+        import tifffile
+
+        with tifffile.TiffFile(path) as tif:
+            levels = [level.asarray() for level in tif.series[0].levels]
+    else:
+        [(levels, *_)] = napari_get_reader(path)(path)
+    assert [level.shape for level in levels] == [
+        (64, 80),
+        (32, 40),
+        (16, 20),
+    ]
+    np.testing.assert_array_equal(levels[0], base)
+
+
+def test_layer_save_lazy_labels_zarr(tmp_path: Path):
+    """Test that lazy labels are cast per block when saving to zarr."""
+    pytest.importorskip('zarr')
+    import dask.array as da
+
+    from napari.layers import Labels
+
+    data = da.from_array(
+        np.random.randint(0, 20, (40, 50), dtype=np.uint8), chunks=16
+    )
+    layer = Labels(data)
+    path = tmp_path / 'labels.zarr'
+    assert layer.save(str(path))
+
+    [(read_data, *_)] = napari_get_reader(str(path))(str(path))
+    assert read_data.dtype == np.uint32
+    np.testing.assert_array_equal(read_data, data)
@@ -14,8 +14,10 @@ from napari_builtins.io._write import (
     napari_write_labels,
     napari_write_points,
     napari_write_shapes,
+    write_bigtiff,
     write_csv,
     write_layer_data_with_plugins,
+    write_zarr,
 )
 
 __all__ = [
@@ -32,6 +34,8 @@ __all__ = [
     'napari_write_shapes',
     'read_csv',
     'read_zarr_dataset',
+    'write_bigtiff',
     'write_csv',
     'write_layer_data_with_plugins',
+    'write_zarr',
 ]
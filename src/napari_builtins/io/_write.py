@@ -1,17 +1,33 @@
 import csv
+import itertools
+import math
 import os
 import shutil
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from tempfile import TemporaryDirectory
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
 import numpy as np
 
 from napari.utils.io import imsave
 from napari.utils.misc import abspath_or_url
+from napari.utils.progress import progress
 
 if TYPE_CHECKING:
     from napari.types import FullLayerData
 
+# extensions that are always written block by block
+_CHUNKED_EXTENSIONS = ('.zarr',)
+# extensions that are written block by block for lazy or multiscale data
+_STREAMED_TIFF_EXTENSIONS = ('.tif', '.tiff')
+# lazy data up to this size is loaded and written as a regular TIFF file
+_STREAMED_TIFF_BYTES = 2**30
+# default size of a written block / tile along each spatial axis
+_BLOCK_SIZE = 1024
+_TIFF_TILE_SIZE = 256
+
 
 def write_csv(
     filename: str,
@@ -95,38 +111,442 @@ def imsave_extensions() -> tuple[str, ...]:
     )
 
 
-def napari_write_image(path: str, data: Any, meta: dict) -> str | None:
-    """Our internal fallback image writer at the end of the plugin chain.
+def _block_slices(
+    shape: Sequence[int], chunks: Sequence[int]
+) -> Iterator[tuple[slice, ...]]:
+    """Yield the slices of a regular block grid in C order.
+
+    Parameters
+    ----------
+    shape : sequence of int
+        Shape of the array to split into blocks.
+    chunks : sequence of int
+        Shape of a single block. Blocks at the upper edges are clipped
+        to ``shape``.
+
+    Yields
+    ------
+    tuple of slice
+        Slices selecting one block of the array.
+    """
+    starts = [
+        range(0, size, chunk)
+        for size, chunk in zip(shape, chunks, strict=True)
+    ]
+    for start in itertools.product(*starts):
+        yield tuple(
+            slice(begin, min(begin + chunk, size))
+            for begin, chunk, size in zip(start, chunks, shape, strict=True)
+        )
+
+
+def _imap_bounded(
+    func: Callable[[Any], Any], items: Iterable[Any], n_workers: int
+) -> Iterator[Any]:
+    """Ordered ``map`` over a thread pool with a bounded number of tasks.
+
+    At most ``2 * n_workers`` items are in flight at any time, so the
+    results of a lazily generated block grid never accumulate in memory.
+    """
+    if n_workers <= 1:
+        yield from map(func, items)
+        return
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        pending: deque = deque()
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= 2 * n_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _spatial_axes(ndim: int, rgb: bool) -> tuple[int, int]:
+    """Return the (row, column) axes of image data."""
+    offset = 1 if rgb else 0
+    return ndim - 2 - offset, ndim - 1 - offset
+
+
+def _default_chunks(data: Any, rgb: bool) -> tuple[int, ...]:
+    """Choose a block shape for streaming ``data``.
+
+    The native chunking of dask and zarr arrays is used when available,
+    so that each block is read exactly once. Otherwise blocks span single
+    planes of at most ``_BLOCK_SIZE`` pixels along each spatial axis.
+    """
+    native = getattr(data, 'chunksize', None)  # dask
+    if native is None:
+        native = getattr(data, 'chunks', None)  # zarr
+        if native is not None and not all(
+            isinstance(c, int | np.integer) for c in native
+        ):
+            native = None
+    if native is not None and len(native) == data.ndim:
+        return tuple(max(int(c), 1) for c in native)
+    chunks = [1] * data.ndim
+    for axis in _spatial_axes(data.ndim, rgb):
+        if axis >= 0:
+            chunks[axis] = min(data.shape[axis], _BLOCK_SIZE)
+    if rgb:
+        chunks[-1] = data.shape[-1]
+    return tuple(max(c, 1) for c in chunks)
+
+
+class _DownsampledArray:
+    """Lazy 2x downsampled view of the spatial axes of an array.
+
+    Only the region of ``source`` needed for the requested block is read,
+    so pyramids can be computed on the fly while streaming to disk.
+
+    Parameters
+    ----------
+    source : array-like
+        Array to downsample. Must support ``__getitem__`` with slices.
+    rgb : bool
+        Whether the last axis of ``source`` holds color channels.
+    method : {'mean', 'nearest'}
+        ``'mean'`` averages each 2x2 block, ``'nearest'`` keeps the first
+        pixel of each block and is suitable for label images.
+    """
+
+    def __init__(
+        self,
+        source: Any,
+        rgb: bool = False,
+        method: Literal['mean', 'nearest'] = 'mean',
+    ) -> None:
+        self.source = source
+        self.method = method
+        factors = [1] * source.ndim
+        for axis in _spatial_axes(source.ndim, rgb):
+            if axis >= 0:
+                factors[axis] = 2
+        self.factors = tuple(factors)
+        self.dtype = np.dtype(source.dtype)
+        self.shape = tuple(
+            math.ceil(size / factor)
+            for size, factor in zip(source.shape, self.factors, strict=True)
+        )
+        self.ndim = len(self.shape)
+
+    def __getitem__(self, key: tuple[slice, ...]) -> np.ndarray:
+        source_key = tuple(
+            slice(
+                (k.start or 0) * f,
+                min((size if k.stop is None else k.stop) * f, src_size),
+            )
+            for k, f, size, src_size in zip(
+                key, self.factors, self.shape, self.source.shape, strict=True
+            )
+        )
+        block = np.asarray(self.source[source_key])
+        if self.method == 'nearest':
+            return block[tuple(slice(None, None, f) for f in self.factors)]
+        # pad odd edges by repeating the last pixel, then block-average
+        pad = [
+            (0, -s % f) for s, f in zip(block.shape, self.factors, strict=True)
+        ]
+        if any(p for _, p in pad):
+            block = np.pad(block, pad, mode='edge')
+        shape: list[int] = []
+        for size, factor in zip(block.shape, self.factors, strict=True):
+            shape.extend((size // factor, factor))
+        reduced = block.reshape(shape).mean(
+            axis=tuple(range(1, 2 * block.ndim, 2))
+        )
+        if np.issubdtype(self.dtype, np.integer):
+            reduced = np.round(reduced)
+        return reduced.astype(self.dtype, copy=False)
+
+
+def _pyramid_levels(
+    data: Any,
+    multiscale: bool,
+    n_levels: int,
+    rgb: bool,
+    downsample: Literal['mean', 'nearest'],
+) -> list[Any]:
+    """Return the levels to write, appending lazily downsampled ones."""
+    levels = list(data) if multiscale else [data]
+    while len(levels) < n_levels:
+        levels.append(
+            _DownsampledArray(levels[-1], rgb=rgb, method=downsample)
+        )
+    return levels
+
+
+def write_zarr(
+    path: str,
+    data: Any,
+    *,
+    rgb: bool = False,
+    multiscale: bool = False,
+    n_levels: int = 1,
+    downsample: Literal['mean', 'nearest'] = 'mean',
+    chunks: Sequence[int] | None = None,
+    dtype: Any = None,
+    n_workers: int = 1,
+) -> str:
+    """Stream (multiscale) image data to a zarr store block by block.
+
+    Only one block per worker is held in memory at any time, so arrays
+    much larger than the available RAM (e.g. dask or zarr backed layers)
+    can be written. A single level is written as a zarr array, several
+    levels as a zarr group with one array per level named ``'0'``,
+    ``'1'``, ...
 
     Parameters
     ----------
     path : str
-        Path to file, directory, or resource (like a URL).
+        Path of the zarr store to write.
     data : array or list of array
-        Image data. Can be N dimensional. If meta['rgb'] is ``True`` then the
-        data should be interpreted as RGB or RGBA. If ``meta['multiscale']`` is
-        ``True``, then the data should be interpreted as a multiscale image.
-    meta : dict
-        Image metadata.
+        Image data, or the levels of multiscale image data.
+    rgb : bool
+        Whether the last axis of ``data`` holds color channels.
+    multiscale : bool
+        Whether ``data`` is a list of levels, from larger to smaller.
+    n_levels : int
+        Minimum number of pyramid levels to write. Missing levels are
+        computed on the fly by 2x downsampling of the previous level.
+    downsample : {'mean', 'nearest'}
+        Reduction used to compute missing levels.
+    chunks : sequence of int, optional
+        Chunk shape of the written arrays. By default the chunks of
+        ``data`` are used if it is chunked, otherwise 2D tiles.
+    dtype : dtype, optional
+        dtype of the written arrays, by default the dtype of ``data``.
+    n_workers : int
+        Number of threads reading and writing blocks concurrently.
 
     Returns
     -------
-    path : str or None
-        If data is successfully written, return the ``path`` that was written.
-        Otherwise, if nothing was done, return ``None``.
+    path : str
+        The path that was written.
+    """
+    import zarr
+
+    levels = _pyramid_levels(data, multiscale, n_levels, rgb, downsample)
+    group = zarr.open_group(path, mode='w') if len(levels) > 1 else None
+    written: list[Any] = []
+    for index, level in enumerate(levels):
+        if index > 0 and isinstance(level, _DownsampledArray):
+            # downsample from what was already written rather than
+            # recomputing the whole chain from the full resolution data
+            level = _DownsampledArray(
+                written[-1], rgb=rgb, method=level.method
+            )
+        level_chunks = tuple(
+            max(min(c, s), 1)
+            for c, s in zip(
+                chunks or _default_chunks(level, rgb), level.shape, strict=True
+            )
+        )
+        kwargs = {
+            'shape': level.shape,
+            'chunks': level_chunks,
+            'dtype': dtype or level.dtype,
+        }
+        if group is None:
+            out = zarr.open_array(path, mode='w', **kwargs)
+        else:
+            out = group.create_array(str(index), **kwargs)
+
+        def _copy_block(key, source=level, out=out):
+            out[key] = np.asarray(source[key], dtype=out.dtype)
+
+        blocks = list(_block_slices(level.shape, level_chunks))
+        for _ in progress(
+            _imap_bounded(_copy_block, blocks, n_workers),
+            total=len(blocks),
+            desc=f'Writing {os.path.basename(path)} (level {index})',
+        ):
+            pass
+        written.append(out)
+    return path
+
+
+def write_bigtiff(
+    path: str,
+    data: Any,
+    *,
+    rgb: bool = False,
+    multiscale: bool = False,
+    n_levels: int = 1,
+    downsample: Literal['mean', 'nearest'] = 'mean',
+    tile: tuple[int, int] = (_TIFF_TILE_SIZE, _TIFF_TILE_SIZE),
+    dtype: Any = None,
+    n_workers: int = 1,
+) -> str:
+    """Stream (multiscale) image data to a tiled BigTIFF file.
+
+    Tiles are read from ``data`` one at a time (or a few at a time when
+    ``n_workers > 1``) and handed to tifffile in order, so the full array
+    is never materialized. Lower resolution levels are stored as TIFF
+    SubIFDs of the full resolution pages.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file to write.
+    data : array or list of array
+        Image data, or the levels of multiscale image data.
+    rgb : bool
+        Whether the last axis of ``data`` holds color channels.
+    multiscale : bool
+        Whether ``data`` is a list of levels, from larger to smaller.
+    n_levels : int
+        Minimum number of pyramid levels to write. Missing levels are
+        computed on the fly by 2x downsampling of the previous level.
+    downsample : {'mean', 'nearest'}
+        Reduction used to compute missing levels.
+    tile : tuple of int
+        Shape of the TIFF tiles. Must be multiples of 16.
+    dtype : dtype, optional
+        dtype of the written data, by default the dtype of ``data``.
+    n_workers : int
+        Number of threads reading tiles ahead of the writer.
+
+    Returns
+    -------
+    path : str
+        The path that was written.
+    """
+    import tifffile
+
+    levels = _pyramid_levels(data, multiscale, n_levels, rgb, downsample)
+    with tifffile.TiffWriter(path, bigtiff=True) as tif:
+        for index, level in enumerate(levels):
+            out_dtype = np.dtype(dtype or level.dtype)
+            n_leading = level.ndim - 2 - rgb
+            block_shape = (1,) * n_leading + tuple(tile)
+            if rgb:
+                block_shape += (level.shape[-1],)
+
+            def _read_tile(key, source=level, dtype=out_dtype, n=n_leading):
+                block = np.asarray(source[key], dtype=dtype)
+                return block.reshape(block.shape[n:])
+
+            blocks = list(_block_slices(level.shape, block_shape))
+            pbar = progress(
+                total=len(blocks),
+                desc=f'Writing {os.path.basename(path)} (level {index})',
+            )
+
+            def _tiles(blocks=blocks, read=_read_tile, pbar=pbar):
+                for block in _imap_bounded(read, blocks, n_workers):
+                    pbar.update(1)
+                    yield block
+
+            kwargs: dict[str, Any] = {
+                'shape': level.shape,
+                'dtype': out_dtype,
+                'tile': tuple(tile),
+                'photometric': 'rgb' if rgb else 'minisblack',
+            }
+            if out_dtype.kind != 'b':
+                kwargs['compression'] = 'zlib'
+                kwargs['compressionargs'] = {'level': 1}
+            if index == 0:
+                kwargs['subifds'] = len(levels) - 1
+            else:
+                kwargs['subfiletype'] = 1
+            with pbar:
+                tif.write(_tiles(), **kwargs)
+    return path
+
+
+def _write_image_data(
+    path: str,
+    data: Any,
+    meta: dict,
+    *,
+    dtype: Any = None,
+    downsample: Literal['mean', 'nearest'] = 'mean',
+) -> str | None:
+    """Write image-like layer data, streaming when it may not fit in memory.
+
+    ``.zarr`` paths are always written block by block. TIFF paths are
+    streamed to a BigTIFF pyramid when the data is multiscale, when more
+    pyramid levels are requested, or when the data is not an in-memory
+    numpy array (e.g. dask or zarr backed) larger than
+    ``_STREAMED_TIFF_BYTES``. All other data is written in one go with
+    :func:`napari.utils.io.imsave`.
+
+    The minimum number of pyramid levels to write to zarr or TIFF is read
+    from ``meta['metadata']['n_levels']``, 1 by default.
     """
     ext = os.path.splitext(path)[1]
     if not ext:
         path += '.tif'
         ext = '.tif'
 
+    rgb = bool(meta.get('rgb', False))
+    multiscale = bool(meta.get('multiscale', False))
+    n_levels = int((meta.get('metadata') or {}).get('n_levels', 1))
+    if ext in _CHUNKED_EXTENSIONS:
+        return write_zarr(
+            path,
+            data,
+            rgb=rgb,
+            multiscale=multiscale,
+            n_levels=n_levels,
+            downsample=downsample,
+            dtype=dtype,
+        )
+    if ext in _STREAMED_TIFF_EXTENSIONS and (
+        multiscale
+        or n_levels > 1
+        or (
+            not isinstance(data, np.ndarray)
+            and math.prod(data.shape) * np.dtype(dtype or data.dtype).itemsize
+            > _STREAMED_TIFF_BYTES
+        )
+    ):
+        return write_bigtiff(
+            path,
+            data,
+            rgb=rgb,
+            multiscale=multiscale,
+            n_levels=n_levels,
+            downsample=downsample,
+            dtype=dtype,
+        )
+
     if ext in imsave_extensions():
+        # lazy data is loaded, the levels of multiscale data are left as is
+        if not multiscale or dtype is not None:
+            data = np.asarray(data, dtype=dtype)
         imsave(path, data)
         return path
 
     return None
 
 
+def napari_write_image(path: str, data: Any, meta: dict) -> str | None:
+    """Our internal fallback image writer at the end of the plugin chain.
+
+    Parameters
+    ----------
+    path : str
+        Path to file, directory, or resource (like a URL).
+    data : array or list of array
+        Image data. Can be N dimensional. If meta['rgb'] is ``True`` then the
+        data should be interpreted as RGB or RGBA. If ``meta['multiscale']`` is
+        ``True``, then the data should be interpreted as a multiscale image.
+    meta : dict
+        Image metadata. Its ``meta['metadata']['n_levels']`` is the minimum
+        number of pyramid levels written to zarr or TIFF files, see
+        `write_zarr`.
+
+    Returns
+    -------
+    path : str or None
+        If data is successfully written, return the ``path`` that was written.
+        Otherwise, if nothing was done, return ``None``.
+    """
+    return _write_image_data(path, data, meta)
+
+
 def napari_write_labels(path: str, data: Any, meta: dict) -> str | None:
     """Our internal fallback labels writer at the end of the plugin chain.
 
@@ -139,7 +559,9 @@ def napari_write_labels(path: str, data: Any, meta: dict) -> str | None:
         data should be interpreted as RGB or RGBA. If ``meta['multiscale']`` is
         ``True``, then the data should be interpreted as a multiscale image.
     meta : dict
-        Image metadata.
+        Image metadata. Its ``meta['metadata']['n_levels']`` is the minimum
+        number of pyramid levels written to zarr or TIFF files, see
+        `write_zarr`.
 
     Returns
     -------
@@ -148,7 +570,10 @@ def napari_write_labels(path: str, data: Any, meta: dict) -> str | None:
         Otherwise, if nothing was done, return ``None``.
     """
     dtype = data.dtype if data.dtype.itemsize >= 4 else np.uint32
-    return napari_write_image(path, np.asarray(data, dtype=dtype), meta)
+    # labels are cast block by block and never averaged when downsampled
+    return _write_image_data(
+        path, data, meta, dtype=dtype, downsample='nearest'
+    )
 
 
 def napari_write_points(path: str, data: Any, meta: dict) -> str | None: